@@ -0,0 +1,49 @@
+import importlib
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+
+Mortgage Analyzer package.
+
+Submodules and the commonly used classes are loaded lazily (PEP 562):
+`import mortgage_analyzer` is cheap, and a worker process that only
+needs the models never imports streamlit, altair or matplotlib.
+
+    from mortgage_analyzer import CurrentMortgage       # loads models only
+    mortgage_analyzer.engines.escrow_engine              # loads on first access
+
+The Streamlit app lives in mortgage_analyzer/app and is started with
+the `mortgage-analyzer` command or `python -m mortgage_analyzer`.
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+
+__version__ = "0.1.0"
+
+_SUBPACKAGES = ("app", "engines", "models", "utils", "visualizations")
+
+# Public name -> module that defines it
+_LAZY_ATTRS = {
+    "Mortgage": "mortgage_analyzer.models.mortgage_classes",
+    "CurrentMortgage": "mortgage_analyzer.models.mortgage_classes",
+    "NewMortgageScenario": "mortgage_analyzer.models.mortgage_classes",
+    "RefinanceScenario": "mortgage_analyzer.models.mortgage_classes",
+    "ScenarioStore": "mortgage_analyzer.utils.scenario_store",
+}
+
+__all__ = ["__version__", *_SUBPACKAGES, *_LAZY_ATTRS]
+
+
+def __getattr__(name):
+    if name in _SUBPACKAGES:
+        module = importlib.import_module(f"{__name__}.{name}")
+    elif name in _LAZY_ATTRS:
+        module = getattr(importlib.import_module(_LAZY_ATTRS[name]), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    # Cache so later lookups skip __getattr__
+    globals()[name] = module
+    return module
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,26 @@
+import streamlit as st
+
+# Import the session utility
+from mortgage_analyzer.utils.session_utils import initialize_mortgage_app_state
+from mortgage_analyzer.utils.profiling_utils import start_profiling_rerun, render_profiling_sidebar
+
+# Initialize all session state variables properly
+initialize_mortgage_app_state()
+
+home = st.Page("pages/00_🏡_Home_Page_(pun_intended).py")
+pg1 = st.Page("pages/01_💸_Current_Mortgage.py")
+pg2 = st.Page("pages/02_🆕_New_Scenario.py")
+pg3 = st.Page("pages/03_📈_Comparison.py")
+
+nav = st.navigation([home, pg1, pg2, pg3])
+
+# Reset per-rerun timings; ?profile=1 in the URL turns profiling on for this session
+if st.query_params.get("profile") == "1":
+    start_profiling_rerun(enabled=True)
+else:
+    start_profiling_rerun()
+
+nav.run()
+
+# Developer timings for everything the page just ran
+render_profiling_sidebar()
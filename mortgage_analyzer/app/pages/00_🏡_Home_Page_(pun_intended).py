@@ -1,11 +1,7 @@
-import sys
-from pathlib import Path
 import streamlit as st
 
-sys.path.append(str(Path(__file__).parent.parent.parent))
-
-from src.utils.session_utils import initialize_mortgage_app_state
-from src.utils.navigation_utils import register_page, safe_navigate
+from mortgage_analyzer.utils.session_utils import initialize_mortgage_app_state
+from mortgage_analyzer.utils.navigation_utils import register_page, safe_navigate
 
 ###############################################################
 
@@ -55,12 +51,6 @@ st.subheader("&ensp;&ensp;&ensp;&ensp;&ensp;&ensp;&ensp;&ensp;&ensp;&ensp;&ensp;
 
 col1, col2 = st.columns([2, 5])
 
-# Initialize session state for mortgage objects
-if "current_mortgage" not in st.session_state:
-    st.session_state.current_mortgage = None
-if "new_mortgage" not in st.session_state:
-    st.session_state.new_mortgage = None
-
 with col1:
     if st.button("💸 Current Mortgage", key="home_to_current_mortgage"):
         safe_navigate("pages/01_💸_Current_Mortgage.py")
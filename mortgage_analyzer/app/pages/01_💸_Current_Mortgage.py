@@ -1,17 +1,12 @@
-import sys
-from pathlib import Path
-
 import streamlit as st
 
-# Add the parent directory to the Python path
-sys.path.append(str(Path(__file__).parent.parent.parent))
-
 # Import your utility functions
-from src.utils.navigation_utils import register_page, safe_navigate
-from src.utils.mortgage_utils import update_current_mortgage, current_mortgage_persistent_storage, current_mortgage_run_calcs
+from mortgage_analyzer.utils.navigation_utils import register_page, safe_navigate
+from mortgage_analyzer.utils.mortgage_utils import inputs_record, sync_inputs_from_widgets, current_mortgage_persistent_storage, current_mortgage_run_calcs
+from mortgage_analyzer.utils.session_utils import get_scenario
 
 # Import your visualization functions
-from src.visualizations.mortgage_charts import (
+from mortgage_analyzer.visualizations.mortgage_charts import (
         create_single_mortgage_amortization_chart,
         create_interest_principal_ratio_chart,
         create_mortgage_timeline_chart,
@@ -25,6 +20,7 @@ from src.visualizations.mortgage_charts import (
 ###########################################################
 
 current_mortgage_persistent_storage()
+cm_inputs = inputs_record("current")
 
 ###########################################################
 
@@ -33,7 +29,7 @@ current_mortgage_persistent_storage()
 
 ###########################################################
 
-register_page("current_mortgage", update_current_mortgage)
+register_page("current_mortgage", lambda: sync_inputs_from_widgets("current"))
 
 ###########################################################
 
@@ -66,42 +62,42 @@ with center:
 ###########################################################
 
 def update_cm_data(field):
-    # Update permanent storage from temporary widget state
-    st.session_state.cm_data[field] = st.session_state[f"temp_cm_{field}"]
+    # Update the input record from the widget state
+    cm_inputs.pull_widget(st.session_state, field)
 
 def update_tax_values(source):
     """Update both annual and monthly tax values based on source"""
     if source == "monthly":
         # User changed monthly value, update annual
-        st.session_state.cm_data["tax_monthly"] = st.session_state["temp_cm_tax_monthly"]
-        st.session_state.cm_data["tax_annual"] = st.session_state.cm_data["tax_monthly"] * 12
+        cm_inputs.tax_monthly = st.session_state["temp_cm_tax_monthly"]
+        cm_inputs.tax_annual = cm_inputs.tax_monthly * 12
 
         # Update the temporary value as well
-        st.session_state["temp_cm_tax_annual"] = st.session_state.cm_data["tax_annual"]
+        st.session_state["temp_cm_tax_annual"] = cm_inputs.tax_annual
     else:
         # User changed annual value, update monthly
-        st.session_state.cm_data["tax_annual"] = st.session_state["temp_cm_tax_annual"]
-        st.session_state.cm_data["tax_monthly"] = st.session_state.cm_data["tax_annual"] / 12
+        cm_inputs.tax_annual = st.session_state["temp_cm_tax_annual"]
+        cm_inputs.tax_monthly = cm_inputs.tax_annual / 12
 
         # Update the temporary value as well
-        st.session_state["temp_cm_tax_monthly"] = st.session_state.cm_data["tax_monthly"]
+        st.session_state["temp_cm_tax_monthly"] = cm_inputs.tax_monthly
 
 def update_insurance_values(source):
     """Update both annual and monthly insurance values based on source"""
     if source == "monthly":
         # User changed monthly value, update annual
-        st.session_state.cm_data["ins_monthly"] = st.session_state["temp_cm_ins_monthly"]
-        st.session_state.cm_data["ins_annual"] = st.session_state.cm_data["ins_monthly"] * 12
+        cm_inputs.ins_monthly = st.session_state["temp_cm_ins_monthly"]
+        cm_inputs.ins_annual = cm_inputs.ins_monthly * 12
 
         # Update the temporary value as well
-        st.session_state["temp_cm_ins_annual"] = st.session_state.cm_data["ins_annual"]
+        st.session_state["temp_cm_ins_annual"] = cm_inputs.ins_annual
     else:
         # User changed annual value, update monthly
-        st.session_state.cm_data["ins_annual"] = st.session_state["temp_cm_ins_annual"]
-        st.session_state.cm_data["ins_monthly"] = st.session_state.cm_data["ins_annual"] / 12
+        cm_inputs.ins_annual = st.session_state["temp_cm_ins_annual"]
+        cm_inputs.ins_monthly = cm_inputs.ins_annual / 12
 
         # Update the temporary value as well
-        st.session_state["temp_cm_ins_monthly"] = st.session_state.cm_data["ins_monthly"]
+        st.session_state["temp_cm_ins_monthly"] = cm_inputs.ins_monthly
 
 ###########################################################
 
@@ -211,7 +207,7 @@ with col3:
         )
         # Set both values to ensure they stay in sync
         annual_tax = st.session_state["temp_cm_tax_monthly"] * 12
-        st.session_state.cm_data["tax_annual"] = annual_tax
+        cm_inputs.tax_annual = annual_tax
     else:
         annual_tax = tax_col2.number_input(
             "**Annual Tax ($)**",
@@ -222,7 +218,7 @@ with col3:
         )
         # Set both values to ensure they stay in sync
         monthly_tax = st.session_state["temp_cm_tax_annual"] / 12
-        st.session_state.cm_data["tax_monthly"] = monthly_tax
+        cm_inputs.tax_monthly = monthly_tax
 
     ins_col1, ins_col2 = st.columns([9, 8])
 
@@ -242,7 +238,7 @@ with col3:
         )
         # Set both values to ensure they stay in sync
         annual_ins = st.session_state["temp_cm_ins_monthly"] * 12
-        st.session_state.cm_data["ins_annual"] = annual_ins
+        cm_inputs.ins_annual = annual_ins
     else:
         annual_ins = ins_col2.number_input(
             "**Annual Insurance ($)**",
@@ -253,7 +249,7 @@ with col3:
         )
         # Set both values to ensure they stay in sync
         monthly_ins = st.session_state["temp_cm_ins_annual"] / 12
-        st.session_state.cm_data["ins_monthly"] = monthly_ins
+        cm_inputs.ins_monthly = monthly_ins
 
     # Additional payment details
     prin = st.number_input(
@@ -272,6 +268,13 @@ with col3:
         on_change=lambda: update_cm_data("prepay")
     )
 
+    exact_cents = st.toggle(
+        "Exact cents (match servicer statement)",
+        key="temp_cm_exact_cents",
+        on_change=lambda: update_cm_data("exact_cents"),
+        help="Round interest to the cent each month and true up the final payment, the way servicers post payments"
+    )
+
 ###########################################################
 
 # Display Metrics Section
@@ -282,19 +285,17 @@ st.write("")
 calc_col1, calc_col2, calc_col3 = st.columns([4, 2, 4])
 
 with calc_col2:
-    # Initialize calculation flag if it doesn't exist
-    if "show_current_mortgage_calcs" not in st.session_state:
-        st.session_state.show_current_mortgage_calcs = False
-        
     if st.button("**Calculate**", key="calculate_current_mortgage"):
 
-        # 1. update all data from temp widgets to permanent storage
-        # 2. run any necessary calculations
-        # 3. store variables in CurrentMortgage class
-        # 4. activate session_state.show_current_mortgage_calcs
+        # 1. update the input record from the widgets
+        # 2. snapshot it as the calculated inputs
+        # 3. the CurrentMortgage object is rebuilt from the snapshot below
 
         current_mortgage_run_calcs()
 
+# None until Calculate has been clicked
+currentMort = get_scenario("current")
+
 #####################################################################################
 # tabbed metrics vs visualizations
 #####################################################################################
@@ -302,120 +303,67 @@ with calc_col2:
 metrics, amort, growth, interest_breakdown, timeline = st.tabs(["Calculations","Amortization","Equity Growth","Interest Analysis","Mortgage Timeline"])
 
 with metrics:
-    if st.session_state.show_current_mortgage_calcs:
-        try:
-            # Attempt to get the current mortgage object
-            if 'currentMort' not in locals():
-                if "current_mortgage" in st.session_state and st.session_state.current_mortgage is not None:
-                    currentMort = st.session_state.current_mortgage
-                else:
-                    st.warning("Please click Calculate to update the metrics.")
-                    st.stop()
-
-            buff3, mid, buff4 = st.columns([6, 18, 6])
-            with mid:
-                st.write("")
-                st.header("&ensp;&ensp;:violet[**Mortgage Calculations**]")
-
-            values, ratios, time = st.columns([3, 3, 3])   
-            with values:
-                st.subheader("&ensp;Value Metrics", divider="violet")
-                st.metric(
-                    "**Current Value:**",
-                    value=f"${max(currentMort.price,0):,.2f}"
-                )
-                st.metric(
-                    "**Current Equity:**",
-                    value=f"${max(currentMort.equity_value,0):,.2f}"
-                )
-                st.metric(
-                    "**Value in 5 Years (3% annual growth):**",
-                    value=f"${max(currentMort.estimate_value_at_year(5),0):,.2f}",
-                    delta=f"${max((currentMort.estimate_value_at_year(5) - currentMort.price),0):,.2f}"
-                )
-
-            with ratios:
-                st.subheader("&ensp;Ratio Metrics", divider="violet")
-                st.metric(
-                    "**Loan to Value Ratio:**",
-                    value="N/A" if currentMort.loan_to_value > 100 else f"{currentMort.loan_to_value:.2%}"
-                )
-                st.metric(
-                    "**Equity Ratio:**",
-                    value="N/A" if currentMort.loan_to_value > 100 else f"{(1-currentMort.loan_to_value):.2%}"
-                )
-
-            with time:
-                st.subheader("&ensp;Time Metrics", divider="violet")
-                st.metric(
-                    "**Loan End Date:**",
-                    value=f"{currentMort.end_date}"
-                )
-                st.metric(
-                    "**Pay Periods Left:**",
-                    value=f"{currentMort.periods_remaining}"
-                )
-                st.metric(
-                    "**PMI Periods Remaining:**",
-                    value=f"{currentMort.pmi_periods_remaining()}"
-                )
-        
-        except NameError:
-            st.warning("Please click Calculate to update the metrics.")
-            st.stop()
+    if currentMort is not None:
+        buff3, mid, buff4 = st.columns([6, 18, 6])
+        with mid:
+            st.write("")
+            st.header("&ensp;&ensp;:violet[**Mortgage Calculations**]")
+
+        values, ratios, time = st.columns([3, 3, 3])   
+        with values:
+            st.subheader("&ensp;Value Metrics", divider="violet")
+            st.metric(
+                "**Current Value:**",
+                value=f"${max(currentMort.price,0):,.2f}"
+            )
+            st.metric(
+                "**Current Equity:**",
+                value=f"${max(currentMort.equity_value,0):,.2f}"
+            )
+            st.metric(
+                "**Value in 5 Years (3% annual growth):**",
+                value=f"${max(currentMort.estimate_value_at_year(5),0):,.2f}",
+                delta=f"${max((currentMort.estimate_value_at_year(5) - currentMort.price),0):,.2f}"
+            )
+
+        with ratios:
+            st.subheader("&ensp;Ratio Metrics", divider="violet")
+            st.metric(
+                "**Loan to Value Ratio:**",
+                value="N/A" if currentMort.loan_to_value > 100 else f"{currentMort.loan_to_value:.2%}"
+            )
+            st.metric(
+                "**Equity Ratio:**",
+                value="N/A" if currentMort.loan_to_value > 100 else f"{(1-currentMort.loan_to_value):.2%}"
+            )
+
+        with time:
+            st.subheader("&ensp;Time Metrics", divider="violet")
+            st.metric(
+                "**Loan End Date:**",
+                value=f"{currentMort.end_date}"
+            )
+            st.metric(
+                "**Pay Periods Left:**",
+                value=f"{currentMort.periods_remaining}"
+            )
+            st.metric(
+                "**PMI Periods Remaining:**",
+                value=f"{currentMort.pmi_periods_remaining()}"
+            )
 
 with amort:
-    if st.session_state.show_current_mortgage_calcs:
-        try:
-            if 'currentMort' not in locals():
-                if "current_mortgage" in st.session_state and st.session_state.current_mortgage is not None:
-                    currentMort = st.session_state.current_mortgage
-                else:
-                    st.warning("Please click Calculate to update the metrics.")
-                    st.stop()
-            create_single_mortgage_amortization_chart(currentMort)
-        except NameError:
-            st.warning("Please click Calculate to update the metrics.")
-            st.stop()
+    if currentMort is not None:
+        create_single_mortgage_amortization_chart(currentMort)
 
 with growth:
-    if st.session_state.show_current_mortgage_calcs:
-        try:
-            if 'currentMort' not in locals():
-                if "current_mortgage" in st.session_state and st.session_state.current_mortgage is not None:
-                    currentMort = st.session_state.current_mortgage
-                else:
-                    st.warning("Please click Calculate to update the metrics.")
-                    st.stop()
-            create_equity_growth_chart(currentMort)
-        except NameError:
-            st.warning("Please click Calculate to update the metrics.")
-            st.stop()
+    if currentMort is not None:
+        create_equity_growth_chart(currentMort)
 
 with interest_breakdown:
-    if st.session_state.show_current_mortgage_calcs:
-        try:
-            if 'currentMort' not in locals():
-                if "current_mortgage" in st.session_state and st.session_state.current_mortgage is not None:
-                    currentMort = st.session_state.current_mortgage
-                else:
-                    st.warning("Please click Calculate to update the metrics.")
-                    st.stop()
-            create_interest_principal_ratio_chart(currentMort)
-        except NameError:
-            st.warning("Please click Calculate to update the metrics.")
-            st.stop()
+    if currentMort is not None:
+        create_interest_principal_ratio_chart(currentMort)
 
 with timeline:
-    if st.session_state.show_current_mortgage_calcs:
-        try:
-            if 'currentMort' not in locals():
-                if "current_mortgage" in st.session_state and st.session_state.current_mortgage is not None:
-                    currentMort = st.session_state.current_mortgage
-                else:
-                    st.warning("Please click Calculate to update the metrics.")
-                    st.stop()
-            create_mortgage_timeline_chart(currentMort)
-        except NameError:
-            st.warning("Please click Calculate to update the metrics.")
-            st.stop()
\ No newline at end of file
+    if currentMort is not None:
+        create_mortgage_timeline_chart(currentMort)
\ No newline at end of file
@@ -0,0 +1,1155 @@
+import streamlit as st
+
+# Import your utility functions
+from mortgage_analyzer.utils.navigation_utils import register_page, safe_navigate
+from mortgage_analyzer.utils.mortgage_utils import inputs_record, sync_inputs_from_widgets, new_mortgage_persistent_storage, new_mortgage_run_calcs, refinance_persistent_storage, refinance_run_calcs
+from mortgage_analyzer.utils.mortgage_utils import get_scenario_store, save_scenario_to_store, load_scenario_from_store
+from mortgage_analyzer.utils.mortgage_utils import seed_rate_sheet_widgets, rate_sheet_for, rate_sheet_filters, best_rate_quote, apply_rate_sheet_quote, toggle_credit_score_pmi
+from mortgage_analyzer.utils.session_utils import SCENARIO_SESSION_KEYS, get_scenario
+
+# Import your visualization functions
+from mortgage_analyzer.visualizations.mortgage_charts import (
+        create_single_mortgage_payment_breakdown, 
+        create_single_mortgage_amortization_chart,
+        create_interest_principal_ratio_chart,
+        create_mortgage_timeline_chart,
+        create_equity_growth_chart,
+        create_buydown_frontier_chart,
+        create_rent_vs_buy_chart
+    )
+from mortgage_analyzer.engines.buydown_engine import build_rate_sheet
+from mortgage_analyzer.engines.rent_vs_buy_engine import RentVsBuyAssumptions
+
+###########################################################
+
+# Initialize persistent storage if not already present
+
+###########################################################
+
+new_mortgage_persistent_storage()
+refinance_persistent_storage()
+nm_inputs = inputs_record("new")
+rf_inputs = inputs_record("refinance")
+
+###########################################################
+
+# Set session and navigation functionality
+# Needed for persisting data across pages
+
+###########################################################
+
+register_page("new_mortgage", lambda: sync_inputs_from_widgets("new", "refinance"))
+
+
+###########################################################
+
+# Top of page
+
+###########################################################
+
+st.header("&ensp;&ensp;&ensp;&ensp;&ensp;&ensp;&ensp;&ensp;:star:&ensp;&ensp;&ensp;:green[**New Mortgage**]&ensp;&ensp;&ensp;:star:", divider="grey")
+
+left, center, right = st.columns([6,18,6])
+
+with left:
+    pg1 = st.Page("pages/01_💸_Current_Mortgage.py") 
+    if st.button("**💸 Current Mortgage**", key="new_mortgage_to_current_mortgage"):
+        safe_navigate(pg1)
+
+with right:
+    pg3 = st.Page("pages/03_📈_Comparison.py")
+    if st.button("**📈 Comparison**", key="new_mortgage_to_comparison"):
+        safe_navigate(pg3)
+
+with center:
+    st.write("Put in the details of the new mortgage you are evaluating to compare to your current mortgage.")
+
+###########################################################
+
+# Helper functions - only used in this script so not defined in util files
+
+###########################################################
+
+def update_nm_data(field):
+    # Update the input record from the widget state
+    nm_inputs.pull_widget(st.session_state, field)
+
+def update_downpayment_values(source):
+    # Update downpayment values based on source
+    if source == "amount":
+        # User changed amount, update percentage
+        nm_inputs.downpayment = st.session_state["temp_nm_downpayment"]
+        if nm_inputs.price > 0:
+            nm_inputs.downpayment_percent = (nm_inputs.downpayment / nm_inputs.price) * 100
+            st.session_state["temp_nm_downpayment_percent"] = nm_inputs.downpayment_percent
+
+    elif source == "percent":
+        # User changed percentage, update amount
+        nm_inputs.downpayment_percent = st.session_state["temp_nm_downpayment_percent"]
+        nm_inputs.downpayment = (nm_inputs.downpayment_percent / 100) * nm_inputs.price
+        st.session_state["temp_nm_downpayment"] = nm_inputs.downpayment
+
+    elif source == "price":
+        # Price changed, update amount based on percentage
+        if not nm_inputs.is_not_percent:
+            nm_inputs.downpayment = (nm_inputs.downpayment_percent / 100) * nm_inputs.price
+            st.session_state["temp_nm_downpayment"] = nm_inputs.downpayment
+
+    elif source == "toggle":
+        # Toggle changed, update appropriate values
+        if nm_inputs.is_not_percent:
+            # Switched to amount mode - nothing needed as the amount is already set
+            pass
+        else:
+            # Switched to percentage mode - recalculate percentage from amount
+            if nm_inputs.price > 0:
+                nm_inputs.downpayment_percent = (nm_inputs.downpayment / nm_inputs.price) * 100
+                st.session_state["temp_nm_downpayment_percent"] = nm_inputs.downpayment_percent
+
+def update_nm_tax_values(source):
+    # Update both annual and monthly tax values based on source
+    if source == "monthly":
+        # User changed monthly value, update annual
+        nm_inputs.monthly_tax = st.session_state["temp_nm_monthly_tax"]
+        nm_inputs.annual_tax = nm_inputs.monthly_tax * 12
+
+        # Update the temporary value as well
+        st.session_state["temp_nm_annual_tax"] = nm_inputs.annual_tax
+
+    elif source == "annual":
+        # User changed annual value, update monthly
+        nm_inputs.annual_tax = st.session_state["temp_nm_annual_tax"]
+        nm_inputs.monthly_tax = nm_inputs.annual_tax / 12
+
+        # Update the temporary value as well
+        st.session_state["temp_nm_monthly_tax"] = nm_inputs.monthly_tax
+
+    elif source == "toggle":
+        # Toggle changed, ensure both values are synced
+        if nm_inputs.is_monthly_tax:
+            # Switched to monthly view, make sure monthly value is set
+            st.session_state["temp_nm_monthly_tax"] = nm_inputs.monthly_tax
+        else:
+            # Switched to annual view, make sure annual value is set
+            st.session_state["temp_nm_annual_tax"] = nm_inputs.annual_tax
+
+def update_nm_insurance_values(source):
+    # Update both annual and monthly insurance values based on source
+    if source == "monthly":
+        # User changed monthly value, update annual
+        nm_inputs.monthly_ins = st.session_state["temp_nm_monthly_ins"]
+        nm_inputs.annual_ins = nm_inputs.monthly_ins * 12
+
+        # Update the temporary value as well
+        st.session_state["temp_nm_annual_ins"] = nm_inputs.annual_ins
+
+    elif source == "annual":
+        # User changed annual value, update monthly
+        nm_inputs.annual_ins = st.session_state["temp_nm_annual_ins"]
+        nm_inputs.monthly_ins = nm_inputs.annual_ins / 12
+
+        # Update the temporary value as well
+        st.session_state["temp_nm_monthly_ins"] = nm_inputs.monthly_ins
+
+    elif source == "toggle":
+        # Toggle changed, ensure both values are synced
+        if nm_inputs.is_monthly_ins:
+            # Switched to monthly view, make sure monthly value is set
+            st.session_state["temp_nm_monthly_ins"] = nm_inputs.monthly_ins
+
+        else:
+            # Switched to annual view, make sure annual value is set
+            st.session_state["temp_nm_annual_ins"] = nm_inputs.annual_ins
+
+SAVED_SCENARIO_PAGE_SIZE = 25
+
+def reset_saved_scenario_pages(kind):
+    # Start back at the newest page when the borrower changes
+    st.session_state[f"{kind}_store_cursors"] = [None]
+
+def change_saved_scenario_page(kind, next_cursor=None):
+    # Page cursors are the smallest id on each page (None = newest page)
+    cursors = st.session_state[f"{kind}_store_cursors"]
+    if next_cursor is not None:
+        cursors.append(next_cursor)
+    elif len(cursors) > 1:
+        cursors.pop()
+
+def saved_scenarios_section(kind):
+    # Save the calculated scenario and browse this borrower's history
+    if f"{kind}_store_cursors" not in st.session_state:
+        reset_saved_scenario_pages(kind)
+
+    save_col, history_col = st.columns([1, 2])
+
+    with save_col:
+        borrower = st.text_input(
+            "**Borrower**",
+            key=f"{kind}_store_borrower",
+            on_change=reset_saved_scenario_pages,
+            args=(kind,)
+        )
+        label = st.text_input("**Label (optional)**", key=f"{kind}_store_label")
+
+        calculated_key = SCENARIO_SESSION_KEYS[kind][1]
+        if st.button(
+            "**💾 Save Scenario**",
+            key=f"{kind}_store_save",
+            disabled=st.session_state.get(calculated_key) is None
+        ):
+            if not borrower.strip():
+                st.warning("Enter a borrower name to save this scenario.")
+            else:
+                try:
+                    save_scenario_to_store(kind, borrower, label)
+                    st.success("Scenario saved.")
+                except ValueError as e:
+                    st.error(f"Error saving scenario: {e}")
+
+    with history_col:
+        if not borrower.strip():
+            st.info("Enter a borrower name to see their saved scenarios.")
+            return
+
+        store = get_scenario_store()
+        cursors = st.session_state[f"{kind}_store_cursors"]
+        total = store.count_scenarios(borrower.strip(), kind)
+        history = store.list_scenarios(
+            borrower.strip(), kind, limit=SAVED_SCENARIO_PAGE_SIZE, before_id=cursors[-1]
+        )
+
+        if history.empty:
+            st.info("No saved scenarios yet.")
+            return
+
+        first = (len(cursors) - 1) * SAVED_SCENARIO_PAGE_SIZE + 1
+        st.write(f"Showing {first}-{first + len(history) - 1} of {total} saved scenarios")
+        st.dataframe(
+            history.drop(columns=["kind", "scenario_hash"]),
+            hide_index=True,
+            column_config={
+                "id": "ID",
+                "label": "Label",
+                "saved_at": "Saved",
+                "rate": st.column_config.NumberColumn("Rate", format="%.3f%%"),
+                "years": "Term",
+                "loan_amount": st.column_config.NumberColumn("Loan Amount", format="$%.2f"),
+                "principal_and_interest": st.column_config.NumberColumn("P&I", format="$%.2f"),
+                "total_pmt": st.column_config.NumberColumn("Total Payment", format="$%.2f"),
+                "total_interest": st.column_config.NumberColumn("Total Interest", format="$%.2f"),
+                "payoff_months": "Payoff Months",
+                "closing_costs": st.column_config.NumberColumn("Closing Costs", format="$%.2f"),
+            }
+        )
+
+        prev_col, next_col, pick_col, load_col = st.columns([1, 1, 2, 1])
+        with prev_col:
+            st.button(
+                "⬅️ Newer",
+                key=f"{kind}_store_newer",
+                disabled=len(cursors) == 1,
+                on_click=change_saved_scenario_page,
+                args=(kind,)
+            )
+        with next_col:
+            st.button(
+                "Older ➡️",
+                key=f"{kind}_store_older",
+                disabled=first + len(history) - 1 >= total,
+                on_click=change_saved_scenario_page,
+                args=(kind, int(history["id"].min()))
+            )
+        with pick_col:
+            scenario_id = st.selectbox(
+                "**Scenario ID**",
+                history["id"].tolist(),
+                key=f"{kind}_store_pick",
+                label_visibility="collapsed"
+            )
+        with load_col:
+            st.button(
+                "**Load**",
+                key=f"{kind}_store_load",
+                on_click=load_scenario_from_store,
+                args=(int(scenario_id),)
+            )
+
+def rate_sheet_section(kind):
+    # Look up the best rate for these inputs on a lender rate sheet CSV
+    seed_rate_sheet_widgets(kind)
+
+    with st.expander("📄 **Lender Rate Sheet**"):
+        path_col, product_col, lock_col, fico_col = st.columns([4, 2, 1, 1])
+        with path_col:
+            st.text_input(
+                "**Rate sheet CSV path**",
+                key=f"{kind}_rate_sheet_path",
+                help="Columns: term, ltv_max, fico_min, rate and optionally product, ltv_min, fico_max, lock_days, points"
+            )
+
+        try:
+            index = rate_sheet_for(kind)
+        except (OSError, ValueError) as e:
+            st.error(f"Error loading rate sheet: {e}")
+            return
+
+        if index is None:
+            st.info("Enter the path of a rate sheet CSV to look up rates.")
+            return
+
+        # A different sheet may not have the product or lock period picked before
+        for name, options in (("product", index.products), ("lock", index.lock_periods)):
+            if st.session_state[f"{kind}_rate_sheet_{name}"] not in ("Any", *options):
+                st.session_state[f"{kind}_rate_sheet_{name}"] = "Any"
+
+        with product_col:
+            st.selectbox("**Product**", ["Any", *index.products], key=f"{kind}_rate_sheet_product")
+        with lock_col:
+            st.selectbox("**Lock (days)**", ["Any", *index.lock_periods], key=f"{kind}_rate_sheet_lock")
+
+        record = inputs_record(kind)
+        with fico_col:
+            st.number_input(
+                "**Credit Score**",
+                min_value=300,
+                max_value=850,
+                step=1,
+                key=f"{kind}_rate_sheet_fico",
+                disabled=record.credit_score is not None,
+                help="Used for rate lookups unless PMI is priced by credit score, which uses the scenario's score"
+            )
+
+        quote = best_rate_quote(kind)
+        if quote is None:
+            st.warning(f"Nothing on this rate sheet ({len(index)} rows) covers {record.loan_to_value():.1f}% LTV for a {record.term} year term.")
+            return
+
+        st.write(
+            f"Best rate at {record.loan_to_value():.1f}% LTV, {rate_sheet_filters(kind)['fico']} credit score, {record.term} years: **{quote.rate:.3f}%** "
+            f"with {quote.points:+.3f} points ({quote.product}, {quote.lock_days} day lock)"
+        )
+        st.button(
+            "**Use This Rate**",
+            key=f"{kind}_rate_sheet_apply",
+            on_click=apply_rate_sheet_quote,
+            args=(kind,)
+        )
+
+def buydown_rate_sheet(kind, mortgage):
+    # Options from the lender's rate sheet when one is loaded, otherwise an illustrative sheet
+    terms = sorted({15, 30, int(mortgage.years)})
+    try:
+        index = rate_sheet_for(kind)
+    except (OSError, ValueError):
+        index = None
+
+    if index is not None:
+        filters = rate_sheet_filters(kind)
+        options = index.eligible_options(
+            mortgage.loan_amount / mortgage.price * 100,
+            filters["fico"],
+            terms=terms,
+            product=filters["product"],
+            lock_days=filters["lock_days"]
+        )
+        if not options.empty:
+            return options
+
+    return build_rate_sheet(mortgage.rate, terms=terms)
+
+###########################################################
+
+# Input Section
+
+###########################################################    
+
+st.write("")
+
+new, refinance = st.tabs(['New Mortgage', 'Refinance'])
+
+with new:
+    rate_sheet_section("new")
+
+    col1, buff1, col2, buff2, col3 = st.columns([5, 0.5, 8, 0.5, 6]) # split into thre columns with two blank buffer columns in between
+
+    # left column
+    with col1:
+        st.write("")
+        st.write("")
+        st.write("")
+        st.write("")
+        
+        rate = st.number_input(
+            "**Interest Rate (%)**",
+            min_value=0.0001,
+            step=0.005,
+            format="%0.3f",
+            key="temp_nm_rate",
+            on_change=lambda: update_nm_data("rate")
+        )
+        st.write("")
+        price = st.number_input(
+            "**House Price ($)**",
+            min_value=0.0001,
+            step=1000.0,
+            key="temp_nm_price",
+            on_change=lambda: (update_nm_data("price"), update_downpayment_values("price"))
+        )
+        st.write("")
+        start_date = st.date_input(
+            "**Loan Start Date**",
+            key="temp_nm_start_date",
+            on_change=lambda: update_nm_data("start_date")
+        )
+
+    # middle column
+    with col2:
+        st.write("")
+        st.write("")
+        st.write("")
+
+        sqft = st.number_input(
+            "**Square Footage**", 
+            min_value=0.0001,
+            step=100.0, 
+            key="temp_nm_sqft",
+            on_change=lambda: update_nm_data("sqft")
+        )
+
+        term = st.number_input(
+            "**Loan Term (years)**", 
+            min_value=1,
+            key="temp_nm_term",
+            on_change=lambda: update_nm_data("term")
+        )
+
+        # Additional payment details
+        prin = st.number_input(
+            "**Extra Monthly Principal ($)**",
+            min_value=0.0,
+            step=100.0,
+            key="temp_nm_prin",
+            on_change=lambda: update_nm_data("prin")
+        )
+
+        prepay = st.number_input(
+            "**Number of Prepay Periods (months)**",
+            min_value=0,
+            step=1,
+            key="temp_nm_prepay",
+            on_change=lambda: update_nm_data("prepay")
+        )
+
+        points = st.number_input(
+            "**Discount Points (negative = lender credit)**",
+            min_value=-5.0,
+            max_value=5.0,
+            step=0.125,
+            format="%0.3f",
+            key="temp_nm_points",
+            on_change=lambda: update_nm_data("points"),
+            help="Points paid to buy down the rate, as a percent of the loan amount"
+        )
+
+        # The toggle follows the record: PMI is priced by credit score whenever one is set
+        st.session_state["temp_nm_price_pmi_by_credit"] = nm_inputs.credit_score is not None
+        st.toggle(
+            "Price PMI by credit score",
+            key="temp_nm_price_pmi_by_credit",
+            on_change=toggle_credit_score_pmi,
+            args=("new", "temp_nm_price_pmi_by_credit"),
+            help="Price PMI by LTV and credit score band instead of the flat PMI rate"
+        )
+
+        if nm_inputs.credit_score is not None:
+            credit_score = st.number_input(
+                "**Credit Score**",
+                min_value=300,
+                max_value=850,
+                step=1,
+                key="temp_nm_credit_score",
+                on_change=lambda: update_nm_data("credit_score"),
+                help="Prices PMI by LTV and credit score band, and is used for rate sheet lookups"
+            )
+
+        exact_cents = st.toggle(
+            "Exact cents (match servicer statement)",
+            key="temp_nm_exact_cents",
+            on_change=lambda: update_nm_data("exact_cents"),
+            help="Round interest to the cent each month and true up the final payment, the way servicers post payments"
+        )
+
+    # right column
+    with col3:
+        is_not_percent = st.toggle(
+            "% / $",
+            key="temp_nm_is_not_percent",
+            on_change=lambda: (update_nm_data("is_not_percent"), update_downpayment_values("toggle"))
+        )
+
+        if is_not_percent:
+            downpayment = st.number_input(
+                "**Downpayment Amount ($)**",
+                min_value=0.0001,
+                step=1000.0,
+                key="temp_nm_downpayment",
+                on_change=lambda: update_downpayment_values("amount")
+            )
+        else:
+            downpayment_percent = st.number_input(
+                "**Downpayment (%)**",
+                min_value=0.0001,
+                step=1.0,
+                key="temp_nm_downpayment_percent",
+                on_change=lambda: update_downpayment_values("percent")
+            )
+            
+            # Force calculate the downpayment
+            nm_inputs.downpayment = (st.session_state["temp_nm_downpayment_percent"] / 100) * st.session_state["temp_nm_price"]
+            st.session_state["temp_nm_downpayment"] = nm_inputs.downpayment
+            downpayment = nm_inputs.downpayment
+
+        is_monthly_tax = st.toggle(
+            "Annual/Monthly",
+            key="temp_nm_is_monthly_tax",
+            on_change=lambda: (update_nm_data("is_monthly_tax"), update_nm_tax_values("toggle"))
+        )
+
+        if is_monthly_tax:
+            monthly_tax = st.number_input(
+                "**Monthly Tax ($)**",
+                min_value=0.0001,
+                step=10.0,
+                key="temp_nm_monthly_tax",
+                on_change=lambda: update_nm_tax_values("monthly")
+            )
+            
+            # Force update the annual tax value
+            nm_inputs.annual_tax = st.session_state["temp_nm_monthly_tax"] * 12
+            st.session_state["temp_nm_annual_tax"] = nm_inputs.annual_tax
+            tax = nm_inputs.annual_tax
+        else:
+            tax = st.number_input(
+                "**Annual Tax ($)**",
+                min_value=0.0001,
+                step=100.0,
+                key="temp_nm_annual_tax",
+                on_change=lambda: update_nm_tax_values("annual")
+            )
+            
+            # Force update the monthly tax value
+            nm_inputs.monthly_tax = st.session_state["temp_nm_annual_tax"] / 12
+            st.session_state["temp_nm_monthly_tax"] = nm_inputs.monthly_tax
+            monthly_tax = nm_inputs.monthly_tax
+
+        is_monthly_ins = st.toggle(
+            "Annual/Monthly",
+            key="temp_nm_is_monthly_ins",
+            on_change=lambda: (update_nm_data("is_monthly_ins"), update_nm_insurance_values("toggle"))
+        )
+
+        if is_monthly_ins:
+            monthly_ins = st.number_input(
+                "**Monthly Insurance ($)**",
+                min_value=0.0001,
+                step=10.0,
+                key="temp_nm_monthly_ins",
+                on_change=lambda: update_nm_insurance_values("monthly")
+            )
+            
+            # Force update the annual insurance value
+            nm_inputs.annual_ins = st.session_state["temp_nm_monthly_ins"] * 12
+            st.session_state["temp_nm_annual_ins"] = nm_inputs.annual_ins
+            insurance = nm_inputs.annual_ins
+        else:
+            insurance = st.number_input(
+                "**Annual Insurance ($)**",
+                min_value=0.0001,
+                step=100.0,
+                key="temp_nm_annual_ins",
+                on_change=lambda: update_nm_insurance_values("annual")
+            )
+            
+            # Force update the monthly insurance value
+            nm_inputs.monthly_ins = st.session_state["temp_nm_annual_ins"] / 12
+            st.session_state["temp_nm_monthly_ins"] = nm_inputs.monthly_ins
+            monthly_ins = nm_inputs.monthly_ins
+
+    ###########################################################
+    # Display Metrics Section
+    ###########################################################
+
+    st.write("")
+    calc_col1, calc_col2, calc_col3 = st.columns([4, 2, 4])
+
+    with calc_col2:
+        if st.button("**Calculate**", key="calculate_new_mortgage"):
+
+            # 1. update the input record from the widgets
+            # 2. snapshot it as the calculated inputs
+            # 3. the NewMortgageScenario object is rebuilt from the snapshot below
+
+            new_mortgage_run_calcs()
+
+    # None until Calculate has been clicked
+    NewMort = get_scenario("new")
+
+    #####################################################################################
+    # tabbed metrics vs visualizations
+    #####################################################################################
+
+    metrics, payment, amort, growth, interest_breakdown, timeline, buydown, rent_vs_buy, saved = st.tabs(["Calculations","Payment Breakdown","Amortization","Equity Growth","Interest Analysis","Mortgage Timeline","Points & Credits","Rent vs. Buy","Saved Scenarios"])
+
+    with metrics:
+        if NewMort is not None:
+            buff3, mid, buff4 = st.columns([6, 18, 6])
+
+            with mid:
+                st.write("")
+                st.header("&ensp;:green[**Mortgage Calculations**]")
+
+            loan_col, payment_col, other = st.columns([4,4,4])
+
+            with loan_col: 
+                st.subheader("**Loan Metrics:**",divider="green")
+                st.metric(
+                    "**Loan Amount Today:**",
+                    value=f"${NewMort.loan_amount:,.2f}"
+                )
+                st.metric(
+                    "**Value in 5 Years (3% Ann growth):**",
+                    value=f"${NewMort.estimate_value_at_year(5):,.2f}",
+                    delta=F"${(NewMort.estimate_value_at_year(5) - NewMort.price):,.2f}",
+                    delta_color="normal"
+                )
+                st.metric(
+                    "**Value in 10 Years (3% Ann growth):**",
+                    value=f"${NewMort.estimate_value_at_year(10):,.2f}",
+                    delta=F"${(NewMort.estimate_value_at_year(10) - NewMort.price):,.2f}",
+                    delta_color="normal"
+                )
+
+            with payment_col:
+                st.subheader("**Pmt Metrics:**",divider="green")
+                st.metric(
+                    "**Total Monthly Payment:**",
+                    value=f"${NewMort.total_pmt:,.2f}"
+                )
+                st.metric(
+                    "**Estimated Monthly PMI:**",
+                    value=f"${NewMort.monthly_pmi:,.2f}"
+                )
+                st.write("")
+                st.metric(
+                    "**Months of PMI payments:**",
+                    value=f"{NewMort.pmi_periods_remaining()}"
+                )
+
+            with other:
+                st.subheader("**Other:**",divider="green")
+                if is_monthly_tax:
+                    st.metric(
+                        "**Annual Tax Amount ($)**",
+                        value=f"${NewMort.tax:,.2f}"
+                    )
+                if is_monthly_ins:
+                    st.metric(
+                        "**Annual Ins Amount ($)**",
+                        value=f"${NewMort.ins:,.2f}"
+                    )
+                if not is_not_percent:
+                    st.metric(
+                        "**Downpayment Amount ($):**",
+                        value=f"${NewMort.downpayment_amount:,.2f}"
+                    )
+                st.metric(
+                    "**Est. Closing Costs (3% + points):**",
+                    value=f"${NewMort.closing_costs:,.2f}"
+                )
+                st.write("")
+                st.metric(
+                    "**Est. Initial Investment:**",
+                    value=f"${NewMort.initial_investment:,.2f}"
+                )
+
+    # Rest of your code for other tabs remains unchanged
+    with payment:
+        if NewMort is not None:
+            create_single_mortgage_payment_breakdown(NewMort)
+
+    with amort:
+        if NewMort is not None:
+            create_single_mortgage_amortization_chart(NewMort)
+
+    with growth:
+        if NewMort is not None:
+            create_equity_growth_chart(NewMort)
+
+    with interest_breakdown:
+        if NewMort is not None:
+            create_interest_principal_ratio_chart(NewMort)
+
+    with timeline:
+        if NewMort is not None:
+            create_mortgage_timeline_chart(NewMort)
+
+    with buydown:
+        if NewMort is not None:
+            st.write("Edit the rate sheet from your lender (positive points = discount points, negative = lender credit).")
+            nm_holding_years = st.slider(
+                "**Years you expect to keep this loan**",
+                min_value=1,
+                max_value=int(NewMort.years),
+                value=min(7, int(NewMort.years)),
+                key="nm_buydown_holding_years"
+            )
+            nm_rate_sheet = st.data_editor(
+                buydown_rate_sheet("new", NewMort),
+                num_rows="dynamic",
+                hide_index=True,
+                key="nm_rate_sheet"
+            )
+            try:
+                create_buydown_frontier_chart(NewMort, nm_rate_sheet, nm_holding_years)
+            except ValueError as e:
+                st.error(f"Error evaluating rate sheet: {e}")
+
+    with rent_vs_buy:
+        if NewMort is not None:
+            st.write("Compare buying this home against renting a comparable one and investing the down payment and closing costs instead.")
+            rent_col1, rent_col2, rent_col3 = st.columns(3)
+            with rent_col1:
+                monthly_rent = st.number_input(
+                    "**Comparable Monthly Rent ($)**",
+                    min_value=1.0,
+                    value=round(NewMort.price * 0.006, -1),
+                    step=50.0,
+                    key="nm_rent_monthly"
+                )
+                rent_growth = st.number_input(
+                    "**Annual Rent Growth (%)**",
+                    min_value=-10.0,
+                    max_value=25.0,
+                    value=3.0,
+                    step=0.5,
+                    key="nm_rent_growth"
+                )
+            with rent_col2:
+                appreciation = st.number_input(
+                    "**Annual Home Appreciation (%)**",
+                    min_value=-10.0,
+                    max_value=25.0,
+                    value=3.0,
+                    step=0.5,
+                    key="nm_rent_appreciation"
+                )
+                investment_return = st.number_input(
+                    "**Annual Investment Return (%)**",
+                    min_value=-10.0,
+                    max_value=25.0,
+                    value=6.0,
+                    step=0.5,
+                    key="nm_rent_investment_return",
+                    help="Return on money not spent on the home; also used to discount NPV"
+                )
+            with rent_col3:
+                selling_cost = st.number_input(
+                    "**Selling Costs (%)**",
+                    min_value=0.0,
+                    max_value=15.0,
+                    value=6.0,
+                    step=0.5,
+                    key="nm_rent_selling_cost"
+                )
+                maintenance = st.number_input(
+                    "**Annual Maintenance (% of value)**",
+                    min_value=0.0,
+                    max_value=10.0,
+                    value=1.0,
+                    step=0.25,
+                    key="nm_rent_maintenance"
+                )
+
+            try:
+                rent_assumptions = RentVsBuyAssumptions(
+                    monthly_rent=monthly_rent,
+                    rent_growth=rent_growth / 100,
+                    appreciation=appreciation / 100,
+                    investment_return=investment_return / 100,
+                    selling_cost_pct=selling_cost / 100,
+                    maintenance_pct=maintenance / 100
+                )
+                create_rent_vs_buy_chart(NewMort, rent_assumptions)
+            except ValueError as e:
+                st.error(f"Error running rent vs. buy analysis: {e}")
+
+    with saved:
+        saved_scenarios_section("new")
+
+with refinance:
+    # Helper functions for refinance tab
+    def update_rf_data(field):
+        rf_inputs.pull_widget(st.session_state, field)
+
+    def update_rf_tax_values(source):
+        if source == "monthly":
+            rf_inputs.monthly_tax = st.session_state["temp_rf_monthly_tax"]
+            rf_inputs.annual_tax = rf_inputs.monthly_tax * 12
+            st.session_state["temp_rf_annual_tax"] = rf_inputs.annual_tax
+        elif source == "annual":
+            rf_inputs.annual_tax = st.session_state["temp_rf_annual_tax"]
+            rf_inputs.monthly_tax = rf_inputs.annual_tax / 12
+            st.session_state["temp_rf_monthly_tax"] = rf_inputs.monthly_tax
+        elif source == "toggle":
+            if rf_inputs.is_monthly_tax:
+                st.session_state["temp_rf_monthly_tax"] = rf_inputs.monthly_tax
+            else:
+                st.session_state["temp_rf_annual_tax"] = rf_inputs.annual_tax
+
+    def update_rf_insurance_values(source):
+        if source == "monthly":
+            rf_inputs.monthly_ins = st.session_state["temp_rf_monthly_ins"]
+            rf_inputs.annual_ins = rf_inputs.monthly_ins * 12
+            st.session_state["temp_rf_annual_ins"] = rf_inputs.annual_ins
+        elif source == "annual":
+            rf_inputs.annual_ins = st.session_state["temp_rf_annual_ins"]
+            rf_inputs.monthly_ins = rf_inputs.annual_ins / 12
+            st.session_state["temp_rf_monthly_ins"] = rf_inputs.monthly_ins
+        elif source == "toggle":
+            if rf_inputs.is_monthly_ins:
+                st.session_state["temp_rf_monthly_ins"] = rf_inputs.monthly_ins
+            else:
+                st.session_state["temp_rf_annual_ins"] = rf_inputs.annual_ins
+
+    st.write("Configure your refinance scenario below. This will use your current property value and loan balance.")
+    st.write("")
+
+    rate_sheet_section("refinance")
+    
+    col1, buff1, col2, buff2, col3 = st.columns([5, 0.5, 8, 0.5, 6])
+
+    # Left column - basic loan details
+    with col1:
+        st.write("")
+        st.write("")
+        
+        rate = st.number_input(
+            "**New Interest Rate (%)**",
+            min_value=0.0001,
+            step=0.005,
+            format="%0.3f",
+            key="temp_rf_rate",
+            on_change=lambda: update_rf_data("rate"),
+            help="Interest rate for the new refinanced loan"
+        )
+        
+        st.write("")
+        
+        term = st.number_input(
+            "**New Loan Term (years)**",
+            min_value=1,
+            key="temp_rf_term",
+            on_change=lambda: update_rf_data("term"),
+            help="Length of the new loan term"
+        )
+        
+        st.write("")
+        
+        current_balance = st.number_input(
+            "**Current Loan Balance ($)**",
+            min_value=0.0,
+            step=1000.0,
+            key="temp_rf_current_loan_balance",
+            on_change=lambda: update_rf_data("current_loan_balance"),
+            help="Your current mortgage balance that will be paid off"
+        )
+
+    # Middle column - property and cash out
+    with col2:
+        st.write("")
+        st.write("")
+        
+        current_value = st.number_input(
+            "**Current Property Value ($)**",
+            min_value=0.0001,
+            step=5000.0,
+            key="temp_rf_current_property_value",
+            on_change=lambda: update_rf_data("current_property_value"),
+            help="Current estimated value of your property"
+        )
+        
+        st.write("")
+        
+        cash_out = st.number_input(
+            "**Cash Out Amount ($)**",
+            min_value=0.0,
+            step=1000.0,
+            key="temp_rf_cash_out_amount",
+            on_change=lambda: update_rf_data("cash_out_amount"),
+            help="Additional cash to borrow (0 for rate-and-term refinance)"
+        )
+        
+        st.write("")
+        
+        closing_cost_pct = st.number_input(
+            "**Closing Costs (%)**",
+            min_value=1.0,
+            max_value=10.0,
+            step=0.1,
+            format="%.1f",
+            key="temp_rf_closing_cost_percentage",
+            on_change=lambda: update_rf_data("closing_cost_percentage"),
+            help="Estimated closing costs as percentage of new loan amount"
+        )
+
+        st.write("")
+
+        points = st.number_input(
+            "**Discount Points (negative = lender credit)**",
+            min_value=-5.0,
+            max_value=5.0,
+            step=0.125,
+            format="%0.3f",
+            key="temp_rf_points",
+            on_change=lambda: update_rf_data("points"),
+            help="Points paid to buy down the rate, as a percent of the new loan amount"
+        )
+
+        st.write("")
+
+        # The toggle follows the record: PMI is priced by credit score whenever one is set
+        st.session_state["temp_rf_price_pmi_by_credit"] = rf_inputs.credit_score is not None
+        st.toggle(
+            "Price PMI by credit score",
+            key="temp_rf_price_pmi_by_credit",
+            on_change=toggle_credit_score_pmi,
+            args=("refinance", "temp_rf_price_pmi_by_credit"),
+            help="Price PMI by LTV and credit score band instead of the flat PMI rate"
+        )
+
+        if rf_inputs.credit_score is not None:
+            credit_score = st.number_input(
+                "**Credit Score**",
+                min_value=300,
+                max_value=850,
+                step=1,
+                key="temp_rf_credit_score",
+                on_change=lambda: update_rf_data("credit_score"),
+                help="Prices PMI by LTV and credit score band, and is used for rate sheet lookups"
+            )
+        
+        st.write("")
+        
+        sqft = st.number_input(
+            "**Square Footage**",
+            min_value=0.0001,
+            step=100.0,
+            key="temp_rf_sqft",
+            on_change=lambda: update_rf_data("sqft"),
+            help="Property square footage (typically same as current)"
+        )
+
+    # Right column - taxes and insurance
+    with col3:
+        st.write("")
+        
+        is_monthly_tax = st.toggle(
+            "Annual/Monthly Tax",
+            key="temp_rf_is_monthly_tax",
+            on_change=lambda: (update_rf_data("is_monthly_tax"), update_rf_tax_values("toggle"))
+        )
+
+        if is_monthly_tax:
+            monthly_tax = st.number_input(
+                "**Monthly Tax ($)**",
+                min_value=0.0,
+                step=10.0,
+                key="temp_rf_monthly_tax",
+                on_change=lambda: update_rf_tax_values("monthly")
+            )
+            rf_inputs.annual_tax = st.session_state["temp_rf_monthly_tax"] * 12
+            tax = rf_inputs.annual_tax
+        else:
+            tax = st.number_input(
+                "**Annual Tax ($)**",
+                min_value=0.0,
+                step=100.0,
+                key="temp_rf_annual_tax",
+                on_change=lambda: update_rf_tax_values("annual")
+            )
+            rf_inputs.monthly_tax = st.session_state["temp_rf_annual_tax"] / 12
+
+        is_monthly_ins = st.toggle(
+            "Annual/Monthly Ins",
+            key="temp_rf_is_monthly_ins",
+            on_change=lambda: (update_rf_data("is_monthly_ins"), update_rf_insurance_values("toggle"))
+        )
+
+        if is_monthly_ins:
+            monthly_ins = st.number_input(
+                "**Monthly Insurance ($)**",
+                min_value=0.0,
+                step=10.0,
+                key="temp_rf_monthly_ins",
+                on_change=lambda: update_rf_insurance_values("monthly")
+            )
+            rf_inputs.annual_ins = st.session_state["temp_rf_monthly_ins"] * 12
+            insurance = rf_inputs.annual_ins
+        else:
+            insurance = st.number_input(
+                "**Annual Insurance ($)**",
+                min_value=0.0,
+                step=100.0,
+                key="temp_rf_annual_ins",
+                on_change=lambda: update_rf_insurance_values("annual")
+            )
+            rf_inputs.monthly_ins = st.session_state["temp_rf_annual_ins"] / 12
+        
+        st.write("")
+        
+        prin = st.number_input(
+            "**Extra Monthly Principal ($)**",
+            min_value=0.0,
+            step=100.0,
+            key="temp_rf_prin",
+            on_change=lambda: update_rf_data("prin")
+        )
+        
+        prepay = st.number_input(
+            "**Prepay Periods (months)**",
+            min_value=0,
+            step=1,
+            key="temp_rf_prepay",
+            on_change=lambda: update_rf_data("prepay")
+        )
+
+        exact_cents = st.toggle(
+            "Exact cents (match servicer statement)",
+            key="temp_rf_exact_cents",
+            on_change=lambda: update_rf_data("exact_cents"),
+            help="Round interest to the cent each month and true up the final payment, the way servicers post payments"
+        )
+
+    ###########################################################
+    # Calculate Button and Results
+    ###########################################################
+    
+    st.write("")
+    calc_col1, calc_col2, calc_col3 = st.columns([4, 2, 4])
+
+    with calc_col2:
+        if st.button("**Calculate Refinance**", key="calculate_refinance"):
+            refinance_run_calcs()
+
+    RefinanceScen = get_scenario("refinance")
+
+    ###########################################################
+    # Display Refinance Results
+    ###########################################################
+
+    metrics, payment, amort, growth, interest_breakdown, timeline, buydown, saved = st.tabs([
+        "Calculations", "Payment Breakdown", "Amortization", 
+        "Equity Growth", "Interest Analysis", "Mortgage Timeline", "Points & Credits",
+        "Saved Scenarios"
+    ])
+
+    with metrics:
+        if RefinanceScen is not None:
+            buff3, mid, buff4 = st.columns([6, 18, 6])
+
+            with mid:
+                st.write("")
+                st.header("&ensp;:green[**Refinance Calculations**]")
+
+            loan_col, payment_col, other = st.columns([4, 4, 4])
+
+            with loan_col: 
+                st.subheader("**Loan Metrics:**", divider="green")
+                st.metric(
+                    "**New Loan Amount:**",
+                    value=f"${RefinanceScen.loan_amount:,.2f}"
+                )
+                st.metric(
+                    "**Loan-to-Value Ratio:**",
+                    value=f"{RefinanceScen.loan_to_value:.1%}"
+                )
+                st.metric(
+                    "**Equity After Refinance:**",
+                    value=f"${RefinanceScen.equity_after_refinance:,.2f}"
+                )
+
+            with payment_col:
+                st.subheader("**Payment Metrics:**", divider="green")
+                st.metric(
+                    "**New Monthly Payment:**",
+                    value=f"${RefinanceScen.total_pmt:,.2f}"
+                )
+                st.metric(
+                    "**Estimated Monthly PMI:**",
+                    value=f"${RefinanceScen.monthly_pmi:,.2f}"
+                )
+                st.metric(
+                    "**PMI Payment Months:**",
+                    value=f"{RefinanceScen.pmi_periods_remaining()}"
+                )
+
+            with other:
+                st.subheader("**Financial Impact:**", divider="green")
+                st.metric(
+                    "**Closing Costs:**",
+                    value=f"${RefinanceScen.closing_costs:,.2f}"
+                )
+                if RefinanceScen.cash_out_amount > 0:
+                    st.metric(
+                        "**Net Cash to You:**",
+                        value=f"${RefinanceScen.net_cash_to_borrower:,.2f}"
+                    )
+                st.metric(
+                    "**Property Value/SqFt:**",
+                    value=f"${RefinanceScen.price_per_sqft:,.0f}"
+                )
+
+    # Other tabs use the same visualization functions as new mortgage
+    with payment:
+        if RefinanceScen is not None:
+            create_single_mortgage_payment_breakdown(RefinanceScen)
+
+    with amort:
+        if RefinanceScen is not None:
+            create_single_mortgage_amortization_chart(RefinanceScen)
+
+    with growth:
+        if RefinanceScen is not None:
+            create_equity_growth_chart(RefinanceScen)
+
+    with interest_breakdown:
+        if RefinanceScen is not None:
+            create_interest_principal_ratio_chart(RefinanceScen)
+
+    with timeline:
+        if RefinanceScen is not None:
+            create_mortgage_timeline_chart(RefinanceScen)
+
+    with buydown:
+        if RefinanceScen is not None:
+            st.write("Edit the rate sheet from your lender (positive points = discount points, negative = lender credit).")
+            rf_holding_years = st.slider(
+                "**Years you expect to keep this loan**",
+                min_value=1,
+                max_value=int(RefinanceScen.years),
+                value=min(7, int(RefinanceScen.years)),
+                key="rf_buydown_holding_years"
+            )
+            rf_rate_sheet = st.data_editor(
+                buydown_rate_sheet("refinance", RefinanceScen),
+                num_rows="dynamic",
+                hide_index=True,
+                key="rf_rate_sheet"
+            )
+            try:
+                create_buydown_frontier_chart(RefinanceScen, rf_rate_sheet, rf_holding_years)
+            except ValueError as e:
+                st.error(f"Error evaluating rate sheet: {e}")
+
+    with saved:
+        saved_scenarios_section("refinance")
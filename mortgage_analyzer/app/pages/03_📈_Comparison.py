@@ -0,0 +1,641 @@
+import streamlit as st
+
+# Import your utility functions
+from mortgage_analyzer.utils.navigation_utils import register_page, safe_navigate
+from mortgage_analyzer.utils.session_utils import initialize_mortgage_app_state, get_scenario
+from mortgage_analyzer.utils.mortgage_utils import (
+    COMPARISON_ESCROW_DEFAULTS,
+    COMPARISON_ESCROW_KEYS,
+    aligned_comparison,
+    cached_interest_paid_comparison,
+    cached_monthly_payment_comparison,
+    cached_tornado_chart,
+    comparison_breakeven,
+    comparison_escrow_assumptions,
+    comparison_metrics_table,
+    equity_curves,
+    finish_comparison_precompute,
+    payment_comparison_png,
+    rate_history_context,
+    refinance_backtest,
+    schedule_table
+)
+from mortgage_analyzer.visualizations.mortgage_charts import create_equity_buildup_chart
+from mortgage_analyzer.utils.profiling_utils import profiled
+
+###############################################################
+
+# Session state management
+
+###############################################################
+
+# Initialize all session state variables properly
+initialize_mortgage_app_state()
+
+# Register this page (without an update function since there's nothing to save)
+register_page("comparison_page", None)
+
+###############################################################
+
+# Top of page
+
+###############################################################
+
+st.header("&ensp;&ensp;&ensp;&ensp;&ensp;:chart_with_upwards_trend:&ensp;&ensp;&ensp;:blue[**Mortgage Comparison**]&ensp;&ensp;&ensp;:chart_with_upwards_trend:", divider="grey")
+
+left, center, right = st.columns([6,18,6])
+
+with left:
+    pg1 = st.Page("pages/01_💸_Current_Mortgage.py")
+    if st.button("**💸 Current Mortgage**", key="comparison_to_current_mortgage"):
+        safe_navigate(pg1)
+
+with right:
+    pg2 = st.Page("pages/02_🆕_New_Scenario.py")
+    if st.button("**🆕 New Scenario**", key="comparison_to_new_mortgage"):
+        safe_navigate(pg2)
+
+with center:    
+    st.write("This page compares your current mortgage to the new mortgage scenario to help you make an informed decision.")
+
+###############################################################
+
+# Check if mortgage data is available
+
+###############################################################
+
+# Scenario objects are rebuilt from each page's calculated inputs
+currentMort = get_scenario("current")
+new_mortgage = get_scenario("new")
+refinance_scenario = get_scenario("refinance")
+
+# Check if current mortgage exists and at least one scenario is available
+if currentMort is None:
+    st.warning("Please fill out your current mortgage details first.")
+    st.stop()
+
+# Check if at least one scenario exists
+has_new_mortgage = new_mortgage is not None
+has_refinance = refinance_scenario is not None
+
+if not (has_new_mortgage or has_refinance):
+    st.warning("Please fill out either a new mortgage scenario or refinance scenario before viewing comparisons.")
+    st.stop()
+
+# Determine which scenario to compare
+if has_new_mortgage and has_refinance:
+    # Both scenarios exist - let user choose
+    scenario_choice = st.radio(
+        "**Choose scenario to compare with your current mortgage:**",
+        ["New Purchase", "Refinance"],
+        horizontal=True,
+        key="comparison_scenario_choice",
+        help="Select which scenario you want to compare against your current mortgage"
+    )
+    
+    if scenario_choice == "New Purchase":
+        newMort = new_mortgage
+        scenario_type = "new_purchase"
+    else:
+        newMort = refinance_scenario
+        scenario_type = "refinance"
+        
+elif has_new_mortgage:
+    newMort = new_mortgage
+    scenario_type = "new_purchase"
+else:
+    newMort = refinance_scenario
+    scenario_type = "refinance"
+
+# Pick up the results computed in the background since the last Calculate
+finish_comparison_precompute()
+
+# Each section below is a fragment: a widget inside one reruns only that
+# section, and a full rerun (e.g. switching scenarios) replays cached tables
+# and charts for any section whose scenarios and inputs haven't changed.
+# Escrow growth is the one input shared across sections (payment chart and
+# refinance break-even), so changing it reruns the whole page.
+st.session_state["comparison_rendered_escrow"] = comparison_escrow_assumptions()
+
+###############################################################
+
+# Key Metrics Summary
+
+###############################################################
+
+st.subheader("Key Decision Factors", divider="blue")
+
+
+@st.fragment
+@profiled()
+def key_metrics_section(currentMort, newMort, scenario_type):
+    # Create three columns for better visual layout
+    col1, col2, col3 = st.columns(3)
+
+    # Monthly payment and savings comparison
+    with col1:
+        monthly_diff = newMort.total_pmt - currentMort.total_pmt
+        monthly_diff_text = "Increase" if monthly_diff > 0 else "Savings"
+
+        st.metric(
+            "New Monthly Payment",
+            f"${newMort.total_pmt:,.2f}",
+            f"${monthly_diff:,.2f}" if monthly_diff >= 0 else f"-${abs(monthly_diff):,.2f}",
+            delta_color="inverse"
+        )
+
+        # Interest rate comparison
+        interest_diff = newMort.rate - currentMort.rate
+        interest_diff_text = "Higher" if interest_diff > 0 else "Lower"
+
+        st.metric(
+            "New Interest Rate",
+            f"{newMort.rate:.3f}%",
+            f"{interest_diff:+.3f}%",
+            delta_color="inverse"
+        )
+
+        # Where the new rate sits against recent market history (when a rate history is set up)
+        try:
+            history = rate_history_context(newMort.rate, newMort.years)
+            if history is not None:
+                st.caption(
+                    f"Lower than {history['share_above']:.0%} of weekly {history['series']} rates over the last "
+                    f"5 years ({history['min']:.2f}%–{history['max']:.2f}%, latest {history['latest']:.2f}% "
+                    f"on {history['as_of']:%m/%d/%Y})"
+                )
+        except Exception as e:
+            st.error(f"Error reading rate history: {e}")
+
+    # Home value and equity comparison
+    with col2:
+        equity_current = currentMort.equity_value
+
+        if scenario_type == "refinance":
+            equity_new = newMort.equity_after_refinance
+            equity_diff = equity_new - equity_current
+
+            st.metric(
+                "Property Value",
+                f"${newMort.current_property_value:,.2f}",
+                "Same property" if abs(newMort.current_property_value - currentMort.price) < 1000 else f"${newMort.current_property_value - currentMort.price:,.2f} difference",
+                delta_color="normal"
+            )
+
+            st.metric(
+                "Equity After Refinance",
+                f"${equity_new:,.2f}",
+                f"${equity_diff:,.0f}" if equity_diff >= 0 else f"-${abs(equity_diff):,.0f}",
+                delta_color="normal"
+            )
+        else:
+            equity_new = newMort.price - newMort.loan_amount
+            equity_diff = equity_new - equity_current
+
+            st.metric(
+                "New Property Value",
+                f"${newMort.price:,.2f}",
+                f"${newMort.price - currentMort.price:,.2f} difference",
+                delta_color="normal"
+            )
+
+            st.metric(
+                "New Equity Position",
+                f"${equity_new:,.2f}",
+                f"${equity_diff:,.0f}" if equity_diff >= 0 else f"-${abs(equity_diff):,.0f}",
+                delta_color="normal"
+            )
+
+    # Loan details comparison
+    with col3:
+        # Loan term comparison
+        term_diff = (newMort.periods_remaining / 12) - (currentMort.periods_remaining / 12)
+        term_diff_text = "Longer" if term_diff > 0 else "Shorter"
+
+        if scenario_type == "refinance":
+            st.metric(
+                "Closing Costs",
+                f"${newMort.closing_costs:,.2f}",
+                help="Estimated closing costs for refinance"
+            )
+            if hasattr(newMort, 'cash_out_amount') and newMort.cash_out_amount > 0:
+                st.metric(
+                    "Net Cash to You",
+                    f"${newMort.net_cash_to_borrower:,.2f}",
+                    help="Cash you receive after closing costs"
+                )
+        else:
+            st.metric(
+                "Total Initial Investment",
+                f"${newMort.initial_investment:,.2f}"
+            )
+
+        # PMI comparison
+        pmi_diff = newMort.monthly_pmi - currentMort.monthly_pmi
+        pmi_diff_text = "Higher" if pmi_diff > 0 else "Lower"
+
+        st.write("")
+
+        st.metric(
+            "New Monthly PMI",
+            f"${newMort.monthly_pmi:,.2f}",
+            f"${pmi_diff:,.2f}" if pmi_diff >= 0 else f"-${abs(pmi_diff):,.2f}",
+            delta_color="inverse" if pmi_diff > 0 else "normal"
+        )
+
+    # Show detailed metric table with expandable section (only built while open)
+    detail_expander = st.expander("View Detailed Metrics Comparison", key="comparison_metrics_expander", on_change="rerun")
+    with detail_expander:
+        if detail_expander.open:
+            st.table(comparison_metrics_table(currentMort, newMort))
+
+
+key_metrics_section(currentMort, newMort, scenario_type)
+
+###############################################################
+
+# Visual Comparisons
+
+###############################################################
+
+st.subheader("Visual Comparisons", divider="blue")
+
+
+@st.fragment
+@profiled()
+def visual_comparisons_section(currentMort, newMort):
+    # Only the selected tab's chart is computed; switching tabs reruns just this section
+    tab1, tab2, tab3, tab4 = st.tabs(
+        ["Monthly Payments", "Equity Growth Projections", "Interest Analysis", "Sensitivity"],
+        key="comparison_visual_tabs",
+        on_change="rerun"
+    )
+
+    with tab1:
+
+        growth_col1, growth_col2 = st.columns(2)
+        with growth_col1:
+            st.number_input(
+                "**Annual Property Tax Growth (%)**",
+                min_value=-10.0,
+                max_value=25.0,
+                value=COMPARISON_ESCROW_DEFAULTS["tax_growth"],
+                step=0.5,
+                key=COMPARISON_ESCROW_KEYS["tax_growth"],
+                help="Used to project escrow changes at each annual escrow analysis"
+            )
+        with growth_col2:
+            st.number_input(
+                "**Annual Insurance Growth (%)**",
+                min_value=-10.0,
+                max_value=25.0,
+                value=COMPARISON_ESCROW_DEFAULTS["ins_growth"],
+                step=0.5,
+                key=COMPARISON_ESCROW_KEYS["ins_growth"],
+                help="Used to project escrow changes at each annual escrow analysis"
+            )
+
+        escrow_assumptions = comparison_escrow_assumptions()
+        if escrow_assumptions != st.session_state.get("comparison_rendered_escrow"):
+            # The recommendation's break-even also uses escrow growth
+            st.rerun(scope="app")
+
+        # One month-aligned schedule pair shared by every chart below
+        aligned = aligned_comparison(currentMort, newMort, escrow_assumptions)
+
+        if tab1.open:
+            cached_monthly_payment_comparison(
+                currentMort,
+                newMort,
+                escrow_assumptions,
+                figure_png=payment_comparison_png(currentMort, newMort),
+                aligned=aligned
+            )
+
+        # st.info("""
+        # These ccomparisons:
+        # - **Loan Balance**: Shows how quickly you'll pay down each loan
+        # - **Equity Growth**: Includes both loan paydown and estimated 3% annual property appreciation
+        # """)
+    with tab2:
+
+        if tab2.open:
+            create_equity_buildup_chart(currentMort, newMort, equity_data=equity_curves(currentMort, newMort, escrow_assumptions))
+
+        st.info("""
+        This chart shows how much your equity will increase over time:
+        - **Equity Growth**: Includes both loan paydown and estimated 3% annual property appreciation
+                * currently no support for changing this assumption
+        """)
+
+    with tab3:
+
+        if tab3.open:
+            cached_interest_paid_comparison(currentMort, newMort, aligned=aligned)
+
+        st.info("""
+        These chart compares the total interest you will pay on each mortgage:
+        - **Total Interest**: The total interest paid over the life of each loan
+        - **Interest to Principal Ratio**: How much interest you will pay for each $1 of principal paid
+        """)
+
+    with tab4:
+
+        sens_col1, sens_col2 = st.columns(2)
+        with sens_col1:
+            sensitivity_output = st.selectbox(
+                "**Result to analyze**",
+                ["net_benefit", "monthly_savings", "breakeven_months"],
+                format_func=lambda x: {"net_benefit": "Net Benefit", "monthly_savings": "Monthly Savings",
+                                       "breakeven_months": "Breakeven (months)"}[x],
+                key="comparison_sensitivity_output"
+            )
+        with sens_col2:
+            sensitivity_years = st.number_input(
+                "**Holding Period (years)**",
+                min_value=1,
+                max_value=30,
+                value=7,
+                step=1,
+                key="comparison_sensitivity_years",
+                help="Years until the decision is evaluated"
+            )
+
+        if tab4.open:
+            try:
+                cached_tornado_chart(currentMort, newMort, sensitivity_output, sensitivity_years)
+            except ValueError as e:
+                st.error(f"Error running sensitivity analysis: {e}")
+
+        st.info("""
+        Each input is moved down and up one at a time while everything else stays at its base value:
+        - **Net Benefit**: Cash at the start + payment savings through the holding period + equity difference at the end
+        - **Wider bars**: Inputs that matter most to your decision
+        """)
+
+
+visual_comparisons_section(currentMort, newMort)
+
+# with tab4:
+#     st.subheader("Refinance Breakeven Analysis")
+#     st.altair_chart(create_breakeven_chart(currentMort, newMort), use_container_width=True)
+    
+#     st.info("""
+#     This analysis shows when refinancing would break even, including estimated closing costs:
+#     - **Above zero line**: You're still paying for the cost of refinancing
+#     - **Below zero line**: You've recovered costs and are saving money
+#     - **Where line crosses zero**: Your breakeven point
+    
+#     *Assumes approximately 3% closing costs on the new loan amount.*
+#     """)
+
+###############################################################
+
+# Amortization Schedule Comparison
+
+###############################################################
+
+SCHEDULE_COLUMN_CONFIG = {
+    "month": "Month",
+    "date": st.column_config.DateColumn("Payment Date", format="MM/DD/YYYY"),
+    "payment": st.column_config.NumberColumn("Payment", format="$%.2f"),
+    "principal": st.column_config.NumberColumn("Principal", format="$%.2f"),
+    "interest": st.column_config.NumberColumn("Interest", format="$%.2f"),
+    "principal_paydown": st.column_config.NumberColumn("Extra Principal", format="$%.2f"),
+    "balance": st.column_config.NumberColumn("Remaining Balance", format="$%.2f"),
+    "Year": "Year"
+}
+
+
+@st.fragment
+@profiled()
+def amortization_section(currentMort, newMort):
+    # Schedules are only built while the expander (and their tab) is open
+    schedule_expander = st.expander("View Amortization Schedules", key="comparison_schedule_expander", on_change="rerun")
+    with schedule_expander:
+        if not schedule_expander.open:
+            return
+
+        amort_tab1, amort_tab2 = st.tabs(
+            ["Current Mortgage", "New Mortgage"], key="comparison_schedule_tabs", on_change="rerun"
+        )
+        for amort_tab, mortgage in ((amort_tab1, currentMort), (amort_tab2, newMort)):
+            with amort_tab:
+                if amort_tab.open:
+                    st.dataframe(
+                        schedule_table(mortgage),
+                        hide_index=True,
+                        column_config=SCHEDULE_COLUMN_CONFIG,
+                        width="stretch"
+                    )
+
+
+amortization_section(currentMort, newMort)
+
+###############################################################
+
+# Recommendation Section
+
+###############################################################
+
+st.subheader("Mortgage Recommendation", divider="blue")
+
+# Calculate key decision factors
+monthly_savings = currentMort.total_pmt - newMort.total_pmt
+interest_rate_diff = currentMort.rate - newMort.rate
+term_diff = (newMort.periods_remaining / 12) - (currentMort.periods_remaining / 12)
+
+if scenario_type == "refinance":
+    equity_position_change = newMort.equity_after_refinance - currentMort.equity_value
+    closing_costs = newMort.closing_costs
+else:
+    equity_position_change = (newMort.price - newMort.loan_amount) - currentMort.equity_value
+    closing_costs = getattr(newMort, 'closing_costs', newMort.price * 0.03)
+
+# Recommendation logic based on scenario type
+if scenario_type == "refinance":
+    # Refinance-specific recommendations
+    if monthly_savings > 0 and interest_rate_diff > 0:
+        # Break-even calculation for refinance, using projected payments with escrow growth
+        break_even_months = comparison_breakeven(
+            currentMort, newMort, st.session_state["comparison_rendered_escrow"]
+        )
+        if break_even_months is None:
+            break_even_months = float('inf')
+        
+        recommendation = "✅ **FAVORABLE REFINANCE**: This refinance appears beneficial."
+        details = f"""
+        **Key benefits:**
+        - Monthly savings of ${monthly_savings:.2f}
+        - Interest rate reduction of {interest_rate_diff:.3f}%
+        - Break-even point: {break_even_months:.0f} months
+        - {'Maintains' if abs(equity_position_change) < 1000 else 'Changes'} equity position by ${abs(equity_position_change):,.2f}
+        """
+        
+        if hasattr(newMort, 'cash_out_amount') and newMort.cash_out_amount > 0:
+            details += f"\n- Cash-out amount: ${newMort.cash_out_amount:,.2f} (net: ${newMort.net_cash_to_borrower:,.2f})"
+            
+    elif monthly_savings > 0 and interest_rate_diff <= 0:
+        recommendation = "⚠️ **REVIEW CAREFULLY**: Monthly savings without rate improvement may indicate longer term."
+        details = f"""
+        **Considerations:**
+        - Monthly savings of ${monthly_savings:.2f}
+        - {'No rate improvement' if interest_rate_diff == 0 else f'Rate increase of {abs(interest_rate_diff):.3f}%'}
+        - {'Term extended by' if term_diff > 0 else 'Term reduced by'} {abs(term_diff):.1f} years
+        - Closing costs: ${closing_costs:,.2f}
+        """
+        
+    elif monthly_savings <= 0 and interest_rate_diff > 0:
+        recommendation = "⚠️ **MIXED REFINANCE**: Rate improvement but higher payments."
+        details = f"""
+        **Considerations:**
+        - Interest rate reduction of {interest_rate_diff:.3f}%
+        - Higher monthly payment of ${abs(monthly_savings):.2f}
+        - May benefit from faster equity building
+        - Closing costs: ${closing_costs:,.2f}
+        """
+        
+    else:
+        recommendation = "❌ **NOT RECOMMENDED**: This refinance increases both payment and rate."
+        details = f"""
+        **Concerns:**
+        - Monthly payment increase of ${abs(monthly_savings):.2f}
+        - Interest rate increase of {abs(interest_rate_diff):.3f}%
+        - Closing costs: ${closing_costs:,.2f}
+        """
+        
+else:
+    # New purchase recommendations (existing logic)
+    if monthly_savings > 0 and interest_rate_diff > 0:
+        recommendation = "✅ **FAVORABLE**: The new mortgage scenario appears favorable. You'll save on monthly payments and have a lower interest rate."
+        details = f"""
+        **Key benefits:**
+        - Monthly savings of ${monthly_savings:.2f}
+        - Interest rate reduction of {interest_rate_diff:.3f}%
+        - {'Increased equity position' if equity_position_change > 0 else 'Consider impact on equity position'}
+        """
+    elif monthly_savings > 0 and interest_rate_diff <= 0:
+        recommendation = "⚠️ **POTENTIALLY FAVORABLE**: The new scenario offers monthly savings but not from a rate reduction. Consider the full term cost."
+        details = f"""
+        **Considerations:**
+        - Monthly savings of ${monthly_savings:.2f} may be from a longer term rather than better rate
+        - {'Term extended by' if term_diff > 0 else 'Term reduced by'} {abs(term_diff):.1f} years
+        - Review total interest paid over the life of the loan
+        """
+    elif monthly_savings <= 0 and interest_rate_diff > 0:
+        recommendation = "⚠️ **MIXED SCENARIO**: Lower rate but higher monthly payment. May be beneficial for long-term interest savings or building equity faster."
+        details = f"""
+        **Considerations:**
+        - Interest rate reduction of {interest_rate_diff:.3f}%
+        - Higher monthly payment of ${abs(monthly_savings):.2f}
+        - {'Term reduced by' if term_diff < 0 else 'Term extended by'} {abs(term_diff):.1f} years
+        - {'Higher equity position' if equity_position_change > 0 else 'Lower equity position'} of ${abs(equity_position_change):.2f}
+        """
+    else:
+        recommendation = "❌ **NOT RECOMMENDED**: This scenario increases both your monthly payment and interest rate."
+        details = f"""
+        **Concerns:**
+        - Monthly payment increase of ${abs(monthly_savings):.2f}
+        - Interest rate increase of {abs(interest_rate_diff):.3f}%
+        - {'Term extended by' if term_diff > 0 else 'Term reduced by'} {abs(term_diff):.1f} years
+        """
+
+# Display recommendation
+st.markdown(recommendation)
+st.markdown(details)
+
+
+@st.fragment
+@profiled()
+def refinance_backtest_section(currentMort, newMort):
+    # Only built while open; needs a rate history (MORTGAGE_ANALYZER_RATE_HISTORY)
+    backtest_expander = st.expander(
+        "Refinance Timing Backtest", key="comparison_backtest_expander", on_change="rerun"
+    )
+    with backtest_expander:
+        if not backtest_expander.open:
+            return
+        try:
+            result = refinance_backtest(currentMort, newMort)
+            if result is None:
+                st.info("Set MORTGAGE_ANALYZER_RATE_HISTORY to a weekly mortgage rate CSV to backtest refinance timing.")
+                return
+            if len(result) == 0:
+                st.info("The rate history does not cover any month of this loan's life.")
+                return
+
+            st.write(
+                "What refinancing on this scenario's terms (closing costs, points, cash out) would have been "
+                "worth after each past payment, at that week's market rate, through the current loan's payoff."
+            )
+            best = result.best().iloc[0]
+            spread = result.distribution().iloc[0]
+            col1, col2, col3 = st.columns(3)
+            col1.metric("Best Month", f"{best['date']:%m/%Y}", f"${best['net_benefit']:,.0f}", delta_color="normal")
+            col2.metric("Months That Would Have Paid Off", f"{spread['share_beneficial']:.0%}")
+            col3.metric("Median Net Benefit", f"${spread['p50']:,.0f}")
+
+            top = result.ranked(top=10)[
+                ["date", "market_rate", "balance", "closing_costs", "monthly_savings", "breakeven_months", "net_benefit"]
+            ]
+            st.dataframe(
+                top,
+                hide_index=True,
+                column_config={
+                    "date": st.column_config.DateColumn("Refinance Date", format="MM/YYYY"),
+                    "market_rate": st.column_config.NumberColumn("Market Rate", format="%.2f%%"),
+                    "balance": st.column_config.NumberColumn("Balance", format="$%.0f"),
+                    "closing_costs": st.column_config.NumberColumn("Closing Costs", format="$%.0f"),
+                    "monthly_savings": st.column_config.NumberColumn("Monthly Savings", format="$%.2f"),
+                    "breakeven_months": st.column_config.NumberColumn("Breakeven (months)", format="%.0f"),
+                    "net_benefit": st.column_config.NumberColumn("Net Benefit", format="$%.0f"),
+                },
+            )
+        except Exception as e:
+            st.error(f"Error running refinance backtest: {e}")
+
+
+if scenario_type == "refinance":
+    refinance_backtest_section(currentMort, newMort)
+
+# Additional considerations
+st.write("**Additional considerations:**")
+consideration_col1, consideration_col2 = st.columns(2)
+
+if scenario_type == "refinance":
+    with consideration_col1:
+        st.markdown("""
+        - **Break-even analysis**: Factor in how long you'll stay in the home
+        - **Rate timing**: Consider if rates might drop further before refinancing
+        - **Cash-out usage**: If borrowing extra cash, have a clear plan for use
+        """)
+
+    with consideration_col2:
+        st.markdown("""
+        - **PMI impact**: Refinancing might add/remove PMI based on new LTV
+        - **Tax implications**: Interest deduction may change with new loan amount
+        - **Appraisal requirement**: Property value may need professional appraisal
+        """)
+else:
+    with consideration_col1:
+        st.markdown("""
+        - **Closing costs**: Typical costs range from 2-3% of home price
+        - **Down payment source**: Consider impact on other financial goals
+        - **Market conditions**: Factor in local real estate trends
+        """)
+
+    with consideration_col2:
+        st.markdown("""
+        - **PMI**: Consider 20% down payment to avoid PMI
+        - **Future rates**: Lock in rate if favorable compared to trends
+        - **Total housing costs**: Include HOA, utilities, maintenance
+        """)
+
+###############################################################
+
+# Footer - recommended by ClaudeAI
+
+###############################################################
+
+st.markdown("---")
+st.caption("This comparison is for informational purposes only and does not constitute financial advice. Consult with a mortgage professional before making financial decisions.")
\ No newline at end of file
@@ -0,0 +1,30 @@
+import sys
+from pathlib import Path
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+
+Console entry point. `mortgage-analyzer [streamlit options]` runs the
+installed app's home page through Streamlit's own CLI, so the app is
+launched the same way from any working directory.
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+
+HOME_PAGE = Path(__file__).parent / "app" / "home_page.py"
+
+
+def main(argv=None):
+    """
+    Launch the Streamlit app.
+
+    Args:
+        argv: Extra arguments passed to `streamlit run` (defaults to sys.argv[1:])
+
+    Returns:
+        int: Streamlit's exit code
+    """
+    # Streamlit is only needed to serve the app, not to use the package
+    from streamlit.web import cli as stcli
+
+    args = sys.argv[1:] if argv is None else list(argv)
+    sys.argv = ["streamlit", "run", str(HOME_PAGE), *args]
+    return stcli.main()
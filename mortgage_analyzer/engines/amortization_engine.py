@@ -0,0 +1,267 @@
+import numpy as np
+
+########################################################
+"""
+Amortization engine documentation:
+
+Closed-form, array based versions of the loan math used by the
+Mortgage dataclasses. Every function accepts scalars or numpy arrays
+and broadcasts, so a whole rate sheet or portfolio can be evaluated
+in one call instead of building one Mortgage object per row.
+
+Conventions:
+    rate - annual interest rate as a percentage (e.g. 4.5 for 4.5%),
+    monthly_rate - rate / 100 / 12,
+    periods - number of monthly payments on the loan,
+    elapsed - number of monthly payments already made
+
+    functions:
+        monthly_rate_from_annual - convert percentage rates to monthly decimal rates
+        annuity_payment - principal and interest payment for a fully amortizing loan
+        balance_after - remaining balance after a number of scheduled payments
+        interest_paid_through - cumulative interest paid after a number of payments
+        lifetime_interest - total interest over the full term
+        exact_cents_schedule - amortization schedule kept in integer cents, rounded like a servicer
+
+"""
+
+# Rates are held as integer millionths of a percent so per-period interest
+# can be rounded in exact integer arithmetic: cents * rate_micro / RATE_DENOMINATOR
+RATE_SCALE = 1_000_000
+RATE_DENOMINATOR = 100 * 12 * RATE_SCALE
+
+
+def monthly_rate_from_annual(rate):
+    """
+    Convert an annual percentage rate to a monthly decimal rate.
+
+    Args:
+        rate: Annual rate(s) as a percentage, e.g. 4.5 for 4.5%
+
+    Returns:
+        numpy.ndarray or float: Monthly decimal rate(s)
+    """
+    return np.asarray(rate, dtype=float) / 100 / 12
+
+
+def annuity_payment(principal, monthly_rate, periods):
+    """
+    Calculate the level principal and interest payment for a fully amortizing loan.
+    Matches Mortgage.principal_and_interest, including the zero-rate case.
+
+    Args:
+        principal: Loan amount(s)
+        monthly_rate: Monthly decimal rate(s)
+        periods: Number of monthly payments
+
+    Returns:
+        numpy.ndarray or float: Monthly principal and interest payment(s)
+    """
+    principal = np.asarray(principal, dtype=float)
+    monthly_rate = np.asarray(monthly_rate, dtype=float)
+    periods = np.asarray(periods, dtype=float)
+
+    # (1 + r) ** n is computed once and reused for numerator and denominator
+    growth = np.power(1 + monthly_rate, periods)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        payment = np.where(
+            monthly_rate == 0,
+            principal / periods,
+            principal * monthly_rate * growth / (growth - 1),
+        )
+    return payment[()] if payment.ndim == 0 else payment
+
+
+def balance_after(principal, monthly_rate, payment, elapsed):
+    """
+    Calculate the remaining balance after a number of scheduled payments.
+    Balances are floored at zero once the loan is paid off.
+
+    Args:
+        principal: Starting loan amount(s)
+        monthly_rate: Monthly decimal rate(s)
+        payment: Monthly principal and interest payment(s)
+        elapsed: Number of payments made
+
+    Returns:
+        numpy.ndarray or float: Remaining balance(s)
+    """
+    principal = np.asarray(principal, dtype=float)
+    monthly_rate = np.asarray(monthly_rate, dtype=float)
+    payment = np.asarray(payment, dtype=float)
+    elapsed = np.asarray(elapsed, dtype=float)
+
+    growth = np.power(1 + monthly_rate, elapsed)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        balance = np.where(
+            monthly_rate == 0,
+            principal - payment * elapsed,
+            principal * growth - payment * (growth - 1) / monthly_rate,
+        )
+    balance = np.maximum(balance, 0.0)
+    return balance[()] if balance.ndim == 0 else balance
+
+
+def interest_paid_through(principal, monthly_rate, payment, elapsed):
+    """
+    Calculate cumulative interest paid after a number of scheduled payments.
+
+    Args:
+        principal: Starting loan amount(s)
+        monthly_rate: Monthly decimal rate(s)
+        payment: Monthly principal and interest payment(s)
+        elapsed: Number of payments made
+
+    Returns:
+        numpy.ndarray or float: Cumulative interest paid
+    """
+    principal = np.asarray(principal, dtype=float)
+    balance = balance_after(principal, monthly_rate, payment, elapsed)
+    # Everything paid that did not reduce the balance was interest
+    interest = np.asarray(payment, dtype=float) * np.asarray(elapsed, dtype=float) - (principal - balance)
+    return interest[()] if np.ndim(interest) == 0 else interest
+
+
+def lifetime_interest(principal, monthly_rate, periods):
+    """
+    Calculate total interest paid over the full term of a fully amortizing loan.
+
+    Args:
+        principal: Loan amount(s)
+        monthly_rate: Monthly decimal rate(s)
+        periods: Number of monthly payments
+
+    Returns:
+        numpy.ndarray or float: Total interest over the life of the loan(s)
+    """
+    payment = annuity_payment(principal, monthly_rate, periods)
+    return payment * np.asarray(periods, dtype=float) - np.asarray(principal, dtype=float)
+
+
+def _round_half_up_div(numerator, denominator):
+    """Integer division rounded half up (numerators here are never negative)"""
+    return (2 * numerator + denominator) // (2 * denominator)
+
+
+def _monthly_interest_cents(balance_cents, rate_micro):
+    return _round_half_up_div(balance_cents * rate_micro, RATE_DENOMINATOR)
+
+
+def exact_cents_schedule(
+    principal: float,
+    rate: float,
+    periods: int,
+    payment: float = None,
+    extra_principal: float = 0.0,
+    chunk_size: int = 120,
+    prepay_periods: int = 0,
+) -> dict:
+    """
+    Build an amortization schedule in integer cents the way servicers post it:
+    interest is rounded to the cent every month, the payment is a whole number
+    of cents and the final payment is trued up to exactly clear the balance.
+
+    Rounding each month makes the balance recursion non-linear, so there is no
+    closed form. Each chunk of months starts from the float closed-form balances
+    as a guess for the rounded interest, rebuilds the balances exactly with an
+    int64 cumulative sum, and re-rounds the interest from those balances until
+    nothing changes. Every pass fixes at least the first wrong month, and in
+    practice one or two passes are enough because the float guess is already
+    within a fraction of a cent.
+
+    Args:
+        principal: Starting loan amount in dollars
+        rate: Annual rate as a percentage, e.g. 4.5 for 4.5%
+        periods: Number of monthly payments
+        payment: Scheduled principal and interest payment in dollars
+                 (defaults to the annuity payment rounded to the cent)
+        extra_principal: Extra principal paid each month in dollars
+        chunk_size: Months solved per vectorized pass
+        prepay_periods: Months extra principal is paid for (0 = every month)
+
+    Returns:
+        dict: int64 cent arrays for month, payment, principal, interest,
+              principal_paydown and balance
+    """
+    periods = int(periods)
+    balance = int(round(principal * 100))
+    rate_micro = int(round(rate * RATE_SCALE))
+    monthly_rate = rate_micro / RATE_DENOMINATOR
+
+    if payment is None:
+        payment = annuity_payment(principal, monthly_rate, periods)
+    pmt = int(np.floor(payment * 100 + 0.5))
+    extra = int(np.floor(extra_principal * 100 + 0.5))
+
+    interest_parts, principal_parts, extra_parts, balance_parts = [], [], [], []
+    month = 0
+
+    prepay_periods = int(prepay_periods)
+    scheduled_extra = extra
+
+    # Regular months: full payment plus full extra principal, balance stays positive
+    while month < periods - 1 and balance > 0:
+        n = min(chunk_size, periods - 1 - month)
+        # A chunk never straddles the end of the prepay window
+        if prepay_periods and month < prepay_periods:
+            n = min(n, prepay_periods - month)
+        extra = scheduled_extra if not prepay_periods or month < prepay_periods else 0
+
+        # Float closed-form guess for the balance entering each month
+        start_balances = np.rint(balance_after(balance, monthly_rate, pmt + extra, np.arange(n)))
+        interest = _monthly_interest_cents(start_balances.astype(np.int64), rate_micro)
+
+        for _ in range(n):
+            ending = balance - np.cumsum(pmt + extra - interest)
+            starting = np.concatenate(([balance], ending[:-1]))
+            new_interest = _monthly_interest_cents(starting, rate_micro)
+            if np.array_equal(new_interest, interest):
+                break
+            interest = new_interest
+
+        # Stop the chunk where the payment would no longer be regular
+        # (payment covers the balance, or extra principal would overshoot)
+        irregular = starting - (pmt - interest) <= extra
+        if irregular.any():
+            n = int(np.argmax(irregular))
+            interest, ending = interest[:n], ending[:n]
+
+        interest_parts.append(interest)
+        principal_parts.append(pmt - interest)
+        extra_parts.append(np.full(n, extra, dtype=np.int64))
+        balance_parts.append(ending)
+        month += n
+        if n:
+            balance = int(ending[-1])
+        if irregular.any():
+            break
+
+    # Remaining months run one at a time: at most a few months near payoff
+    while month < periods and balance > 0:
+        extra = scheduled_extra if not prepay_periods or month < prepay_periods else 0
+        interest = int(_monthly_interest_cents(balance, rate_micro))
+        if month == periods - 1:
+            # Final payment true-up clears whatever is left
+            principal_pmt, extra_pmt = balance, 0
+        else:
+            principal_pmt = min(pmt - interest, balance)
+            extra_pmt = min(extra, balance - principal_pmt)
+        balance -= principal_pmt + extra_pmt
+
+        interest_parts.append(np.array([interest], dtype=np.int64))
+        principal_parts.append(np.array([principal_pmt], dtype=np.int64))
+        extra_parts.append(np.array([extra_pmt], dtype=np.int64))
+        balance_parts.append(np.array([balance], dtype=np.int64))
+        month += 1
+
+    interest = np.concatenate(interest_parts) if interest_parts else np.zeros(0, dtype=np.int64)
+    principal_pmts = np.concatenate(principal_parts) if principal_parts else np.zeros(0, dtype=np.int64)
+
+    return {
+        "month": np.arange(1, len(interest) + 1),
+        "payment": principal_pmts + interest,
+        "principal": principal_pmts,
+        "interest": interest,
+        "principal_paydown": np.concatenate(extra_parts) if extra_parts else np.zeros(0, dtype=np.int64),
+        "balance": np.concatenate(balance_parts) if balance_parts else np.zeros(0, dtype=np.int64),
+    }
@@ -0,0 +1,222 @@
+from dataclasses import dataclass, field
+from typing import Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+from mortgage_analyzer.engines.amortization_engine import (
+    annuity_payment,
+    interest_paid_through,
+    monthly_rate_from_annual,
+)
+from mortgage_analyzer.utils.profiling_utils import profiled
+
+########################################################
+"""
+Buy-down engine documentation:
+
+Compares discount points and lender credits against rate for every
+row of a rate sheet in a single batched pass. The rate sheet is a
+DataFrame with one row per (term, rate) option:
+
+    term - loan term in years,
+    rate - note rate as a percentage (e.g. 6.25 for 6.25%),
+    points - cost as a percent of the loan amount
+             (positive = discount points paid, negative = lender credit)
+
+All options are evaluated as numpy columns; no Mortgage objects are
+built per row.
+
+    functions:
+        build_rate_sheet - generate an illustrative rate sheet around a par rate
+        evaluate_buydown_options - payment, interest, breakeven and frontier for a rate sheet
+        analyze_mortgage_buydown - evaluate a rate sheet against an existing scenario's loan
+
+"""
+
+RATE_SHEET_COLUMNS = ["term", "rate", "points"]
+
+
+@dataclass
+class BuydownAnalysis:
+    """
+    Result of a buy-down evaluation.
+
+    options - one row per rate sheet option with payment, cost and breakeven columns
+    breakeven_matrix - months for option i (row) to recoup its extra upfront cost over
+                       option j (column); NaN where the pair is not comparable
+    """
+
+    options: pd.DataFrame
+    breakeven_matrix: np.ndarray = field(repr=False)
+
+    @property
+    def frontier(self) -> pd.DataFrame:
+        """Options on the efficient frontier (not beaten on both upfront cost and payment)"""
+        return self.options[self.options["on_frontier"]]
+
+
+def build_rate_sheet(
+    par_rate: float,
+    terms: Iterable[int] = (30,),
+    rate_step: float = 0.125,
+    steps_below: int = 8,
+    steps_above: int = 6,
+    points_per_percent: float = 4.0,
+) -> pd.DataFrame:
+    """
+    Generate an illustrative rate sheet around a par (zero point) rate.
+    Uses the rule of thumb that one point buys roughly 0.25% of rate.
+
+    Args:
+        par_rate: Rate (as a percentage) available with no points or credits
+        terms: Loan terms in years to include
+        rate_step: Rate increment between rows (percentage points)
+        steps_below: Number of bought-down rates below par
+        steps_above: Number of lender-credit rates above par
+        points_per_percent: Points charged per 1% of rate reduction
+
+    Returns:
+        pandas.DataFrame: Rate sheet with term, rate and points columns
+    """
+    offsets = np.arange(-steps_below, steps_above + 1) * rate_step
+    term_grid, offset_grid = np.meshgrid(np.asarray(list(terms), dtype=int), offsets, indexing="ij")
+
+    rates = par_rate + offset_grid.ravel()
+    valid = rates > 0
+
+    return pd.DataFrame({
+        "term": term_grid.ravel()[valid],
+        "rate": np.round(rates[valid], 3),
+        # Adding 0.0 turns the par row's -0.0 into 0.0
+        "points": np.round(-offset_grid.ravel()[valid] * points_per_percent, 3) + 0.0,
+    })
+
+
+def _validate_rate_sheet(rate_sheet: pd.DataFrame) -> pd.DataFrame:
+    missing = [col for col in RATE_SHEET_COLUMNS if col not in rate_sheet.columns]
+    if missing:
+        raise ValueError(f"Rate sheet is missing columns: {', '.join(missing)}")
+
+    sheet = rate_sheet[RATE_SHEET_COLUMNS].dropna().astype({"term": int, "rate": float, "points": float})
+    if sheet.empty:
+        raise ValueError("Rate sheet has no complete rows")
+    if (sheet["rate"] <= 0).any():
+        raise ValueError("Rate sheet rates must be positive")
+    if (sheet["term"] <= 0).any():
+        raise ValueError("Rate sheet terms must be positive")
+
+    return sheet.sort_values(["term", "points"]).reset_index(drop=True)
+
+
+@profiled()
+def evaluate_buydown_options(
+    loan_amount: float,
+    rate_sheet: pd.DataFrame,
+    holding_period_years: Optional[float] = None,
+    base_closing_costs: float = 0.0,
+) -> BuydownAnalysis:
+    """
+    Evaluate every rate sheet option against the others in one batched pass.
+
+    Args:
+        loan_amount: Loan amount the points are charged against
+        rate_sheet: DataFrame with term, rate and points columns
+        holding_period_years: Years you expect to keep the loan (defaults to the full term)
+        base_closing_costs: Closing costs paid regardless of option chosen
+
+    Returns:
+        BuydownAnalysis: Per-option metrics and the pairwise breakeven matrix
+    """
+    if loan_amount <= 0:
+        raise ValueError("Loan amount must be positive")
+    if holding_period_years is not None and holding_period_years <= 0:
+        raise ValueError("Holding period must be positive")
+
+    sheet = _validate_rate_sheet(rate_sheet)
+
+    terms = sheet["term"].to_numpy()
+    points = sheet["points"].to_numpy()
+    periods = terms * 12
+    monthly_rate = monthly_rate_from_annual(sheet["rate"].to_numpy())
+
+    # Payment and cost columns for every option at once
+    payment = annuity_payment(loan_amount, monthly_rate, periods)
+    points_cost = loan_amount * points / 100
+    upfront_cost = base_closing_costs + points_cost
+    total_interest = payment * periods - loan_amount
+
+    if holding_period_years is None:
+        horizon = periods
+    else:
+        horizon = np.minimum(int(round(holding_period_years * 12)), periods)
+    horizon_cost = upfront_cost + interest_paid_through(loan_amount, monthly_rate, payment, horizon)
+
+    # Par option per term is the row closest to zero points
+    par_index = sheet.assign(abs_points=np.abs(points)).groupby("term")["abs_points"].idxmin()
+    par_row = par_index.reindex(terms).to_numpy()
+    par_payment = payment[par_row]
+    par_cost = upfront_cost[par_row]
+
+    # Months to recoup points over par (or to use up a lender credit)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        breakeven_vs_par = (upfront_cost - par_cost) / (par_payment - payment)
+    breakeven_vs_par = np.where(np.isfinite(breakeven_vs_par) & (breakeven_vs_par > 0), breakeven_vs_par, np.nan)
+
+    # Pairwise comparisons are only meaningful within the same term
+    same_term = terms[:, None] == terms[None, :]
+    extra_cost = upfront_cost[:, None] - upfront_cost[None, :]
+    monthly_saving = payment[None, :] - payment[:, None]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        breakeven_matrix = np.where(
+            same_term & (extra_cost > 0) & (monthly_saving > 0),
+            extra_cost / monthly_saving,
+            np.nan,
+        )
+
+    # An option is dominated if another option of the same term is no worse on
+    # upfront cost and payment and strictly better on at least one of them
+    no_worse = (upfront_cost[None, :] <= upfront_cost[:, None]) & (payment[None, :] <= payment[:, None])
+    strictly_better = (upfront_cost[None, :] < upfront_cost[:, None]) | (payment[None, :] < payment[:, None])
+    dominated = (same_term & no_worse & strictly_better).any(axis=1)
+
+    options = sheet.assign(
+        payment=payment,
+        points_cost=points_cost,
+        upfront_cost=upfront_cost,
+        lifetime_interest=total_interest,
+        horizon_months=np.broadcast_to(horizon, terms.shape),
+        horizon_cost=horizon_cost,
+        breakeven_months=breakeven_vs_par,
+        is_par=np.arange(len(sheet)) == par_row,
+        on_frontier=~dominated,
+    )
+
+    return BuydownAnalysis(options=options, breakeven_matrix=breakeven_matrix)
+
+
+def analyze_mortgage_buydown(
+    mortgage,
+    rate_sheet: pd.DataFrame,
+    holding_period_years: Optional[float] = None,
+) -> BuydownAnalysis:
+    """
+    Evaluate a rate sheet against the loan amount of an existing scenario.
+
+    Args:
+        mortgage: NewMortgageScenario or RefinanceScenario object
+        rate_sheet: DataFrame with term, rate and points columns
+        holding_period_years: Years you expect to keep the loan (defaults to the full term)
+
+    Returns:
+        BuydownAnalysis: Per-option metrics and the pairwise breakeven matrix
+    """
+    # Points already on the scenario are replaced by each rate sheet option
+    base_closing_costs = mortgage.base_closing_costs
+
+    return evaluate_buydown_options(
+        mortgage.loan_amount,
+        rate_sheet,
+        holding_period_years=holding_period_years,
+        base_closing_costs=base_closing_costs,
+    )
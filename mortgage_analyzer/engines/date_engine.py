@@ -0,0 +1,143 @@
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+########################################################
+"""
+Date engine documentation:
+
+Calendar math for payment dates on numpy datetime64 arrays, so ages,
+remaining terms and payment dates for a whole portfolio come from a few
+array operations instead of per-loan datetime / relativedelta calls.
+Every function accepts scalars or arrays and broadcasts.
+
+Conventions:
+    dates - datetime64[D] (days); strings in DATE_FORMAT ("MM/DD/YYYY",
+            how the Mortgage classes store dates), date/datetime objects
+            and datetime64 values are all accepted,
+    months - whole calendar months; adding months keeps the day of the
+             month and clamps to the month's last day (Jan 31 + 1 month
+             is Feb 28/29) the same way relativedelta does,
+    anchor - date payments are counted from (origination for a current
+             loan, today for a new one); payment k falls k months after it
+
+    functions:
+        today - today's date as datetime64[D]
+        as_days - convert dates to datetime64[D]
+        add_months - dates moved by whole calendar months
+        months_between - whole calendar months from one date to another
+        loan_age_months - payments made since origination
+        remaining_months - payments left before the loan's term ends
+        payment_dates - due date of each scheduled payment
+
+"""
+
+DATE_FORMAT = "%m/%d/%Y"
+
+
+def today() -> np.datetime64:
+    """Today's local date as datetime64[D]"""
+    return np.datetime64(date.today(), "D")
+
+
+def as_days(dates) -> np.ndarray:
+    """
+    Convert dates to datetime64[D].
+
+    Args:
+        dates: Date(s) as DATE_FORMAT strings, date/datetime objects or datetime64
+
+    Returns:
+        numpy.ndarray: datetime64[D] array (0-d for a scalar)
+    """
+    values = np.asarray(dates)
+    if values.dtype.kind in "OUS":
+        if values.dtype.kind != "O" or (values.size and isinstance(values.flat[0], str)):
+            parsed = pd.to_datetime(values.ravel(), format=DATE_FORMAT)
+            return parsed.to_numpy().astype("datetime64[D]").reshape(values.shape)
+    return values.astype("datetime64[D]")
+
+
+def add_months(dates, months) -> np.ndarray:
+    """
+    Move dates by whole calendar months, clamping to the end of short months.
+
+    Args:
+        dates: Date(s) to move
+        months: Number of months to add (may be negative)
+
+    Returns:
+        numpy.ndarray: datetime64[D] dates
+    """
+    days = as_days(dates)
+    month_start = days.astype("datetime64[M]")
+    day_offset = days - month_start.astype("datetime64[D]")
+
+    target = month_start + np.asarray(months, dtype=np.int64)
+    month_length = (target + 1).astype("datetime64[D]") - target.astype("datetime64[D]")
+    return target.astype("datetime64[D]") + np.minimum(day_offset, month_length - 1)
+
+
+def months_between(start, end) -> np.ndarray:
+    """
+    Whole calendar months from start to end: the largest n with
+    add_months(start, n) <= end (negative when end is before start).
+
+    Args:
+        start: Starting date(s)
+        end: Ending date(s)
+
+    Returns:
+        numpy.ndarray: Whole months as int64
+    """
+    start, end = as_days(start), as_days(end)
+    months = (end.astype("datetime64[M]") - start.astype("datetime64[M]")).astype(np.int64)
+    return months - (add_months(start, months) > end)
+
+
+def loan_age_months(start_dates, as_of=None) -> np.ndarray:
+    """
+    Monthly payments made since origination, one per month anniversary.
+
+    Args:
+        start_dates: Loan origination date(s)
+        as_of: Date to measure at (defaults to today)
+
+    Returns:
+        numpy.ndarray: Payments made as int64
+    """
+    return months_between(start_dates, today() if as_of is None else as_of)
+
+
+def remaining_months(start_dates, term_months, as_of=None) -> np.ndarray:
+    """
+    Monthly payments left before each loan's term ends.
+
+    Args:
+        start_dates: Loan origination date(s)
+        term_months: Loan term(s) in months
+        as_of: Date to measure at (defaults to today)
+
+    Returns:
+        numpy.ndarray: Payments remaining as int64
+    """
+    end_dates = add_months(start_dates, term_months)
+    return months_between(today() if as_of is None else as_of, end_dates)
+
+
+def payment_dates(anchor, first, periods: int) -> np.ndarray:
+    """
+    Due dates of scheduled payments, payment k falling k months after the anchor.
+
+    Args:
+        anchor: Date(s) payments are counted from
+        first: Number of the first payment to date (1 = one month after the anchor)
+        periods: Number of payments
+
+    Returns:
+        numpy.ndarray: datetime64[D] dates, shape anchor's shape + (periods,)
+    """
+    anchor = as_days(anchor)
+    offsets = np.asarray(first, dtype=np.int64)[..., None] + np.arange(int(periods))
+    return add_months(anchor[..., None], offsets)
@@ -0,0 +1,266 @@
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from mortgage_analyzer.utils.profiling_utils import profiled
+
+########################################################
+"""
+Escrow engine documentation:
+
+Projects the servicer's annual escrow analysis over the life of a loan
+as arrays. Each analysis year the servicer:
+
+    1. sets the base escrow payment from the most recent tax and insurance
+       bills (so growth in the bills is always collected one year late),
+    2. holds a cushion of up to two months of disbursements (RESPA limit),
+    3. spreads any shortage over the following months, and
+    4. refunds surpluses at or above the refund threshold, crediting
+       smaller surpluses against the next year's payments.
+
+EscrowAssumptions:
+    tax_growth - annual growth rate of property tax (0.02 = 2%),
+    ins_growth - annual growth rate of homeowners insurance,
+    cushion_months - months of disbursements held as a cushion (0-2),
+    shortage_spread_months - months a shortage is spread over (1-12),
+    surplus_refund_threshold - surpluses at or above this are refunded
+
+    functions:
+        project_escrow - annual escrow analyses plus a monthly escrow payment vector
+        escrow_payment_matrix - monthly escrow payments for many rows with their own growth rates
+        total_payment_vector - monthly total payment for a Mortgage with time-varying escrow
+        breakeven_month - first month cumulative savings recover an upfront cost
+
+"""
+
+
+@dataclass
+class EscrowAssumptions:
+    tax_growth: float = 0.02
+    ins_growth: float = 0.04
+    cushion_months: int = 2
+    shortage_spread_months: int = 12
+    surplus_refund_threshold: float = 50.0
+
+    def __post_init__(self):
+        if self.tax_growth <= -1 or self.ins_growth <= -1:
+            raise ValueError("Growth rates must be greater than -100%")
+        if not 0 <= self.cushion_months <= 2:
+            raise ValueError("Escrow cushion must be between 0 and 2 months")
+        if not 1 <= self.shortage_spread_months <= 12:
+            raise ValueError("Shortage spread must be between 1 and 12 months")
+        if self.surplus_refund_threshold < 0:
+            raise ValueError("Surplus refund threshold cannot be negative")
+
+
+@dataclass
+class EscrowProjection:
+    """
+    Result of an escrow projection.
+
+    analyses - one row per analysis year
+    monthly_escrow - escrow portion of the payment for every month of the projection
+    """
+
+    analyses: pd.DataFrame
+    monthly_escrow: np.ndarray
+
+
+def _escrow_analyses(disbursements: np.ndarray, assumptions: EscrowAssumptions) -> dict:
+    """Annual analyses for (..., years) disbursements, plus the (..., months) escrow payment"""
+    # Servicer projects each year from the prior year's bills
+    projected = np.concatenate((disbursements[..., :1], disbursements[..., :-1]), axis=-1)
+    cushion = projected * assumptions.cushion_months / 12
+
+    # Deficiency found at the analysis that opens each year: last year's
+    # under-collection plus the cushion top-up for the new projection
+    first_year = np.zeros_like(disbursements[..., :1])
+    under_collected = np.concatenate((first_year, disbursements[..., :-1] - projected[..., :-1]), axis=-1)
+    cushion_change = np.concatenate((first_year, np.diff(cushion, axis=-1)), axis=-1)
+    deficiency = under_collected + cushion_change
+
+    shortage = np.maximum(deficiency, 0.0)
+    surplus = np.maximum(-deficiency, 0.0)
+    refund = np.where(surplus >= assumptions.surplus_refund_threshold, surplus, 0.0)
+    credit = surplus - refund
+
+    base_pmt = projected / 12
+    shortage_pmt = shortage / assumptions.shortage_spread_months
+    credit_pmt = credit / 12
+
+    # Expand annual figures to months without looping
+    month_in_year = np.tile(np.arange(12), disbursements.shape[-1])
+    monthly_escrow = (
+        np.repeat(base_pmt - credit_pmt, 12, axis=-1)
+        + np.repeat(shortage_pmt, 12, axis=-1) * (month_in_year < assumptions.shortage_spread_months)
+    )
+
+    return {
+        "projected": projected,
+        "cushion": cushion,
+        "shortage": shortage,
+        "refund": refund,
+        "credit": credit,
+        "base_pmt": base_pmt,
+        "shortage_pmt": shortage_pmt,
+        "monthly_escrow": monthly_escrow,
+    }
+
+
+@profiled()
+def project_escrow(
+    annual_tax: float,
+    annual_ins: float,
+    years: int,
+    assumptions: Optional[EscrowAssumptions] = None,
+    initial_shortage_pmt: float = 0.0,
+) -> EscrowProjection:
+    """
+    Project annual escrow analyses with growing tax and insurance bills.
+
+    Args:
+        annual_tax: Current annual property tax bill
+        annual_ins: Current annual insurance premium
+        years: Number of years to project
+        assumptions: Growth, cushion and shortage rules (defaults to EscrowAssumptions())
+        initial_shortage_pmt: Shortage payment already being collected in year one
+
+    Returns:
+        EscrowProjection: Annual analyses and the monthly escrow payment vector
+    """
+    if years <= 0:
+        raise ValueError("Projection years must be positive")
+    if annual_tax < 0 or annual_ins < 0:
+        raise ValueError("Tax and insurance cannot be negative")
+
+    assumptions = assumptions or EscrowAssumptions()
+    year = np.arange(years)
+
+    # Actual bills paid out of escrow each year
+    tax_bills = annual_tax * (1 + assumptions.tax_growth) ** year
+    ins_bills = annual_ins * (1 + assumptions.ins_growth) ** year
+    disbursements = tax_bills + ins_bills
+
+    analysis = _escrow_analyses(disbursements, assumptions)
+    monthly_escrow = analysis["monthly_escrow"]
+    monthly_escrow[:12] += initial_shortage_pmt
+
+    analyses = pd.DataFrame({
+        "year": year + 1,
+        "tax": tax_bills,
+        "insurance": ins_bills,
+        "disbursements": disbursements,
+        "projected_disbursements": analysis["projected"],
+        "cushion": analysis["cushion"],
+        "shortage": analysis["shortage"],
+        "surplus_refund": analysis["refund"],
+        "surplus_credit": analysis["credit"],
+        "base_escrow_pmt": analysis["base_pmt"],
+        "shortage_pmt": analysis["shortage_pmt"],
+        "monthly_escrow_pmt": monthly_escrow.reshape(years, 12).mean(axis=1),
+    })
+
+    return EscrowProjection(analyses=analyses, monthly_escrow=monthly_escrow)
+
+
+def escrow_payment_matrix(
+    annual_tax,
+    annual_ins,
+    months: int,
+    tax_growth,
+    ins_growth,
+    assumptions: Optional[EscrowAssumptions] = None,
+    initial_shortage_pmt=0.0,
+) -> np.ndarray:
+    """
+    Monthly escrow payments for many rows at once, each with its own bills
+    and growth rates; every row follows the same rules as project_escrow.
+
+    Args:
+        annual_tax: Current annual property tax bill of each row
+        annual_ins: Current annual insurance premium of each row
+        months: Number of months to project
+        tax_growth: Annual property tax growth of each row
+        ins_growth: Annual insurance growth of each row
+        assumptions: Cushion and shortage rules (their growth rates are not used)
+        initial_shortage_pmt: Shortage payment already being collected in year one
+
+    Returns:
+        numpy.ndarray: Escrow payment for each (row, month)
+    """
+    assumptions = assumptions or EscrowAssumptions()
+    year = np.arange(int(np.ceil(months / 12)))
+
+    tax = np.asarray(annual_tax, dtype=float)[:, None] * (1 + np.asarray(tax_growth, dtype=float)[:, None]) ** year
+    ins = np.asarray(annual_ins, dtype=float)[:, None] * (1 + np.asarray(ins_growth, dtype=float)[:, None]) ** year
+
+    monthly_escrow = _escrow_analyses(tax + ins, assumptions)["monthly_escrow"][:, :months]
+    monthly_escrow[:, :12] += np.asarray(initial_shortage_pmt, dtype=float).reshape(-1, 1)
+    return monthly_escrow
+
+
+@profiled()
+def total_payment_vector(
+    mortgage,
+    months: int,
+    assumptions: Optional[EscrowAssumptions] = None,
+    schedule: Optional[pd.DataFrame] = None,
+) -> np.ndarray:
+    """
+    Build the monthly total payment for a mortgage with time-varying escrow.
+    Principal, interest and extra principal come from the amortization schedule
+    (so they stop at payoff and extra principal follows the prepay window), PMI
+    follows the mortgage's pmi_schedule and escrow continues for the full projection.
+
+    Args:
+        mortgage: CurrentMortgage, NewMortgageScenario or RefinanceScenario object
+        months: Number of months to project
+        assumptions: Escrow growth, cushion and shortage rules
+        schedule: The mortgage's amortization_schedule, if the caller already has it
+
+    Returns:
+        numpy.ndarray: Total monthly payment for each month of the projection
+    """
+    years = int(np.ceil(months / 12))
+    initial_shortage = max(0.0, getattr(mortgage, "monthly_escrow_shortage_pmt", 0.0))
+    escrow = project_escrow(
+        mortgage.tax, mortgage.ins, years, assumptions, initial_shortage
+    ).monthly_escrow[:months]
+
+    if schedule is None:
+        schedule = mortgage.amortization_schedule()
+
+    # Loan payments per month from the schedule (zero after payoff)
+    loan_paid = (
+        schedule["principal"].to_numpy() + schedule["interest"].to_numpy() + schedule["principal_paydown"].to_numpy()
+    )[:months]
+    loan = np.zeros(months)
+    loan[:len(loan_paid)] = loan_paid
+
+    # PMI per month from the schedule (already zero from the removal month on)
+    pmi = np.zeros(months)
+    pmi_paid = mortgage.pmi_schedule()[:months]
+    pmi[:len(pmi_paid)] = pmi_paid
+
+    return loan + pmi + escrow
+
+
+def breakeven_month(upfront_cost: float, current_payments, new_payments) -> Optional[int]:
+    """
+    Find the first month cumulative payment savings recover an upfront cost.
+
+    Args:
+        upfront_cost: Cost paid up front to switch (e.g. closing costs)
+        current_payments: Monthly payments if you keep the current loan
+        new_payments: Monthly payments under the new scenario
+
+    Returns:
+        int or None: 1-based month of breakeven, or None if never reached
+    """
+    savings = np.cumsum(np.asarray(current_payments) - np.asarray(new_payments))
+    recovered = savings >= upfront_cost
+    if not recovered.any():
+        return None
+    return int(np.argmax(recovered)) + 1
@@ -0,0 +1,161 @@
+import os
+
+import numpy as np
+
+try:
+    # Set MORTGAGE_ANALYZER_JIT=0 to force the pure Python kernels
+    if os.environ.get("MORTGAGE_ANALYZER_JIT", "1") == "0":
+        raise ImportError("JIT disabled by MORTGAGE_ANALYZER_JIT=0")
+    from numba import njit
+
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that returns the function unchanged"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+########################################################
+"""
+Loop kernels documentation:
+
+Per-period loops that can't be vectorized because each month depends on
+the balance left by the one before (capped extra principal, PMI cutoff,
+prepay windows). Each kernel takes plain floats/ints and fills typed
+numpy arrays, so numba (optional, `pip install mortgage-analyzer[jit]`)
+can compile it to machine code. Without numba the same functions run
+as ordinary Python; results are identical either way.
+
+Conventions:
+    loan_amount - starting principal balance,
+    monthly_rate - monthly decimal rate (rate / 100 / 12),
+    payment - level principal and interest payment,
+    extra_principal - extra principal paid each month,
+    periods - number of monthly payments to run,
+    prepay_periods - months extra principal is paid for (0 = every month)
+
+    functions:
+        amortization_arrays - principal/interest/paydown/balance arrays for each month until payoff
+        balance_after_months - remaining balance after a number of months
+        months_until_balance - months until the balance drops to a target (e.g. 80% LTV for PMI)
+
+    BACKEND - "numba" or "python", whichever is running the kernels
+
+"""
+
+BACKEND = "numba" if HAS_NUMBA else "python"
+
+
+@njit(cache=True)
+def _period_split(balance, monthly_rate, payment, extra_principal, pay_extra):
+    """Split one month's payment into interest, principal and capped extra principal"""
+    interest_pmt = balance * monthly_rate
+    principal_pmt = min(payment - interest_pmt, balance)
+    extra_pmt = 0.0
+    if pay_extra and balance > principal_pmt:
+        extra_pmt = min(extra_principal, balance - principal_pmt)
+    return interest_pmt, principal_pmt, extra_pmt
+
+
+@njit(cache=True)
+def amortization_arrays(loan_amount, monthly_rate, payment, extra_principal, periods, prepay_periods):
+    """
+    Run the amortization loop until payoff or the end of the term.
+
+    Args:
+        loan_amount: Starting balance
+        monthly_rate: Monthly decimal rate
+        payment: Principal and interest payment
+        extra_principal: Extra principal paid each month
+        periods: Number of months in the term
+        prepay_periods: Months extra principal is paid for (0 = every month)
+
+    Returns:
+        tuple: (principal, interest, principal_paydown, balance) arrays, one
+            entry per month actually paid
+    """
+    periods = max(periods, 0)
+    principal = np.zeros(periods)
+    interest = np.zeros(periods)
+    paydown = np.zeros(periods)
+    balance = np.zeros(periods)
+
+    remaining_balance = loan_amount
+    n = 0
+    for period in range(periods):
+        if remaining_balance <= 0:
+            break
+
+        pay_extra = prepay_periods == 0 or period < prepay_periods
+        interest_pmt, principal_pmt, extra_pmt = _period_split(
+            remaining_balance, monthly_rate, payment, extra_principal, pay_extra
+        )
+        remaining_balance -= principal_pmt + extra_pmt
+
+        principal[n] = principal_pmt
+        interest[n] = interest_pmt
+        paydown[n] = extra_pmt
+        balance[n] = max(0.0, remaining_balance)
+        n += 1
+
+    return principal[:n], interest[:n], paydown[:n], balance[:n]
+
+
+@njit(cache=True)
+def balance_after_months(loan_amount, monthly_rate, payment, extra_principal, months, prepay_periods):
+    """
+    Remaining balance after a number of months.
+
+    Args:
+        loan_amount: Starting balance
+        monthly_rate: Monthly decimal rate
+        payment: Principal and interest payment
+        extra_principal: Extra principal paid each month
+        months: Number of months to run
+        prepay_periods: Months extra principal is paid for (0 = every month)
+
+    Returns:
+        float: Remaining balance, never negative
+    """
+    remaining_balance = loan_amount
+    for month in range(months):
+        pay_extra = prepay_periods == 0 or month < prepay_periods
+        interest_pmt, principal_pmt, extra_pmt = _period_split(
+            remaining_balance, monthly_rate, payment, extra_principal, pay_extra
+        )
+        remaining_balance -= principal_pmt + extra_pmt
+
+    return max(0.0, remaining_balance)
+
+
+@njit(cache=True)
+def months_until_balance(loan_amount, target_balance, monthly_rate, payment, extra_principal, periods, prepay_periods):
+    """
+    Months until the balance is at or below a target balance.
+
+    Args:
+        loan_amount: Starting balance
+        target_balance: Balance to reach (e.g. 80% of the property value)
+        monthly_rate: Monthly decimal rate
+        payment: Principal and interest payment
+        extra_principal: Extra principal paid each month
+        periods: Months left in the term; the search stops there
+        prepay_periods: Months extra principal is paid for (0 = every month)
+
+    Returns:
+        int: Months needed, 0 if already at the target or it isn't reached within the term
+    """
+    remaining_balance = loan_amount
+    months = 0
+    while remaining_balance > target_balance and months < periods:
+        pay_extra = prepay_periods == 0 or months < prepay_periods
+        interest_pmt, principal_pmt, extra_pmt = _period_split(
+            remaining_balance, monthly_rate, payment, extra_principal, pay_extra
+        )
+        remaining_balance -= principal_pmt + extra_pmt
+        months += 1
+
+    return months if remaining_balance <= target_balance else 0
@@ -0,0 +1,337 @@
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from multiprocessing import shared_memory
+from typing import Dict, Iterator, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from mortgage_analyzer.utils.profiling_utils import profiled
+
+########################################################
+"""
+Monte Carlo engine documentation:
+
+Simulates home values, market rates and prepayment for one mortgage or a
+portfolio of them, year by year over the longest loan term:
+
+    value - each home follows Mortgage.estimate_value_at_year at the mean
+            appreciation, scaled by a lognormal market shock shared by
+            every home on the path,
+    market_rate - a random walk from the portfolio's average note rate,
+    prepaid - each loan pays off early with a yearly probability of
+              base_prepay plus refi_sensitivity per point the market rate
+              sits below its note rate; its balance is zero from then on,
+    balance - otherwise the scheduled balance from
+              Mortgage._calculate_remaining_balance_at_year,
+    equity - value minus balance
+
+Paths are simulated in blocks of paths_per_block (PATHS_PER_BLOCK by default). Block i always draws
+from child i of np.random.SeedSequence(seed), so every path - and every
+percentile - is the same whatever the number of workers. Within a block,
+loans are simulated loans_per_chunk at a time and only portfolio totals
+are kept, so memory does not grow with the portfolio; chunk j draws its
+prepayments from child j of the block's seed. The per-loan
+input arrays and the (metric x path x year) output array live in shared
+memory: workers attach by name and write their block's rows in place,
+so nothing but the block number is pickled.
+
+    functions:
+        iter_simulation - yield partial percentiles as blocks finish
+        run_simulation - run every block and return the final percentiles
+
+"""
+
+SIMULATION_METRICS = ["value", "balance", "equity", "market_rate", "prepaid"]
+
+DEFAULT_PERCENTILES = (5, 25, 50, 75, 95)
+
+# Paths per block; a block is the unit of seeding and of work sent to a worker
+PATHS_PER_BLOCK = 2_000
+
+# Loans per (paths x loans x years) pass within a block; keeps each array to tens of MB
+LOANS_PER_CHUNK = 100
+
+
+@dataclass
+class MonteCarloAssumptions:
+    appreciation: float = 0.03
+    appreciation_vol: float = 0.08
+    rate_vol: float = 0.75
+    base_prepay: float = 0.05
+    refi_sensitivity: float = 0.10
+
+    def __post_init__(self):
+        if self.appreciation <= -1:
+            raise ValueError("Appreciation must be greater than -100%")
+        if self.appreciation_vol < 0 or self.rate_vol < 0:
+            raise ValueError("Volatilities cannot be negative")
+        if not 0 <= self.base_prepay <= 1:
+            raise ValueError("Base prepayment probability must be between 0 and 1")
+        if self.refi_sensitivity < 0:
+            raise ValueError("Refinance sensitivity cannot be negative")
+
+
+@dataclass
+class MonteCarloResult:
+    """
+    Percentiles of a (possibly partial) simulation.
+
+    paths - number of simulated paths the percentiles cover
+    percentiles - one row per (year, metric) with a column per percentile;
+                  value, balance and equity are portfolio totals
+    prepaid_share - share of loans paid off early by each year
+    """
+
+    paths: int
+    percentiles: pd.DataFrame
+    prepaid_share: pd.Series = field(repr=False)
+
+
+def _simulation_inputs(mortgages: Sequence, assumptions: MonteCarloAssumptions) -> Dict[str, np.ndarray]:
+    """Per-loan, per-year arrays taken from the Mortgage objects"""
+    years = int(max(m.periods_remaining for m in mortgages) // 12) + 1
+    year = np.arange(1, years + 1)
+
+    expected_value = np.array([
+        [m.estimate_value_at_year(int(y), assumptions.appreciation) for y in year] for m in mortgages
+    ])
+    scheduled_balance = np.array([
+        [m._calculate_remaining_balance_at_year(int(y)) for y in year] for m in mortgages
+    ])
+    note_rate = np.array([float(m.rate) for m in mortgages])
+
+    return {
+        "expected_value": expected_value,
+        "scheduled_balance": scheduled_balance,
+        "note_rate": note_rate,
+    }
+
+
+class _SharedArrays:
+    """Named numpy arrays backed by shared memory blocks"""
+
+    def __init__(self, specs: Dict[str, tuple], create: bool = False):
+        # specs: name -> (shared memory name or None, shape)
+        self._blocks = {}
+        self.arrays = {}
+        for name, (shm_name, shape) in specs.items():
+            if create:
+                size = max(int(np.prod(shape)) * 8, 1)
+                block = shared_memory.SharedMemory(create=True, size=size)
+            else:
+                block = shared_memory.SharedMemory(name=shm_name)
+            self._blocks[name] = block
+            self.arrays[name] = np.ndarray(shape, dtype=np.float64, buffer=block.buf)
+
+    @property
+    def specs(self) -> Dict[str, tuple]:
+        return {name: (self._blocks[name].name, array.shape) for name, array in self.arrays.items()}
+
+    def close(self, unlink: bool = False):
+        self.arrays.clear()
+        for block in self._blocks.values():
+            block.close()
+            if unlink:
+                block.unlink()
+
+
+def _simulate_block(
+    inputs: Dict[str, np.ndarray],
+    out: np.ndarray,
+    block: int,
+    seed: np.random.SeedSequence,
+    assumptions: MonteCarloAssumptions,
+    paths_per_block: int = PATHS_PER_BLOCK,
+    loans_per_chunk: int = LOANS_PER_CHUNK,
+):
+    """Simulate one block of paths into its rows of out (metric x path x year)"""
+    lo = block * paths_per_block
+    hi = min(lo + paths_per_block, out.shape[1])
+    paths = hi - lo
+    expected_value = inputs["expected_value"]
+    scheduled_balance = inputs["scheduled_balance"]
+    note_rate = inputs["note_rate"]
+    loans, years = expected_value.shape
+    year = np.arange(1, years + 1)
+
+    rng = np.random.Generator(np.random.PCG64(seed))
+    value_shocks = rng.standard_normal((paths, years))
+    rate_shocks = rng.standard_normal((paths, years))
+
+    # Mean-preserving lognormal shock around the expected appreciation path;
+    # the shock is shared by every home, so the total scales the summed values
+    vol = assumptions.appreciation_vol
+    market = np.exp(vol * np.cumsum(value_shocks, axis=1) - 0.5 * vol ** 2 * year)
+    value = expected_value.sum(axis=0)[None, :] * market
+
+    market_rate = np.maximum(note_rate.mean() + assumptions.rate_vol * np.cumsum(rate_shocks, axis=1), 0.0)
+
+    balance = np.zeros((paths, years))
+    prepaid_loans = np.zeros((paths, years))
+    for chunk, start in enumerate(range(0, loans, loans_per_chunk)):
+        stop = min(start + loans_per_chunk, loans)
+        # Child seeds built directly, so the draws do not depend on spawn() state
+        chunk_seed = np.random.SeedSequence(seed.entropy, spawn_key=seed.spawn_key + (chunk,))
+        prepay_draws = np.random.Generator(np.random.PCG64(chunk_seed)).random((paths, stop - start, years))
+
+        # Early payoff: yearly probability rises with the refinance incentive
+        incentive = np.maximum(note_rate[None, start:stop, None] - market_rate[:, None, :], 0.0)
+        probability = np.minimum(assumptions.base_prepay + assumptions.refi_sensitivity * incentive, 1.0)
+        prepaid = np.maximum.accumulate(prepay_draws < probability, axis=2)
+        del prepay_draws, incentive, probability
+
+        balance += np.where(prepaid, 0.0, scheduled_balance[None, start:stop, :]).sum(axis=1)
+        prepaid_loans += prepaid.sum(axis=1)
+
+    out[0, lo:hi] = value
+    out[1, lo:hi] = balance
+    out[2, lo:hi] = value - balance
+    out[3, lo:hi] = market_rate
+    out[4, lo:hi] = prepaid_loans / loans
+
+
+def _run_shared_block(
+    specs: Dict[str, tuple],
+    block: int,
+    seed: np.random.SeedSequence,
+    assumptions,
+    paths_per_block: int,
+    loans_per_chunk: int,
+) -> int:
+    # Worker entry point: attach to the parent's shared arrays by name. Block sizes
+    # come in as arguments, since spawned workers re-import the module constants
+    shared = _SharedArrays(specs)
+    try:
+        out = shared.arrays.pop("out")
+        _simulate_block(shared.arrays, out, block, seed, assumptions, paths_per_block, loans_per_chunk)
+        del out
+    finally:
+        shared.close()
+    return block
+
+
+def _summarize(
+    out: np.ndarray, done: np.ndarray, percentiles: Sequence[float], paths_per_block: int = PATHS_PER_BLOCK
+) -> MonteCarloResult:
+    """Percentiles over the paths of the finished blocks"""
+    rows = np.flatnonzero(np.repeat(done, paths_per_block)[:out.shape[1]])
+    paths = out[:, rows, :]
+    years = out.shape[2]
+
+    frames = []
+    for i, metric in enumerate(SIMULATION_METRICS[:-1]):
+        values = np.percentile(paths[i], percentiles, axis=0)
+        frame = pd.DataFrame(values.T, columns=[f"p{p:g}" for p in percentiles])
+        frame.insert(0, "metric", metric)
+        frame.insert(0, "year", np.arange(1, years + 1))
+        frames.append(frame)
+
+    return MonteCarloResult(
+        paths=len(rows),
+        percentiles=pd.concat(frames, ignore_index=True),
+        prepaid_share=pd.Series(paths[-1].mean(axis=0), index=pd.RangeIndex(1, years + 1, name="year"), name="prepaid_share"),
+    )
+
+
+def iter_simulation(
+    mortgages,
+    paths: int = 10_000,
+    seed: int = 0,
+    assumptions: Optional[MonteCarloAssumptions] = None,
+    percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+    max_workers: Optional[int] = None,
+    paths_per_block: int = PATHS_PER_BLOCK,
+    loans_per_chunk: int = LOANS_PER_CHUNK,
+) -> Iterator[MonteCarloResult]:
+    """
+    Run a simulation block by block, yielding percentiles over the paths
+    finished so far after each block. The last result covers every path and
+    is identical for any max_workers.
+
+    Args:
+        mortgages: One Mortgage object or a sequence of them (a portfolio)
+        paths: Number of simulated paths
+        seed: Root seed; the same seed always gives the same paths
+        assumptions: Appreciation, rate and prepayment assumptions
+        percentiles: Percentiles to report (0-100)
+        max_workers: Worker processes (1 keeps everything in-process)
+        paths_per_block: Paths per block, the unit of seeding and of work per worker
+                         (the paths themselves depend on it, the worker count does not)
+        loans_per_chunk: Loans simulated together within a block
+
+    Yields:
+        MonteCarloResult: Partial results, then the final one
+    """
+    if not isinstance(mortgages, (list, tuple)):
+        mortgages = [mortgages]
+    if not mortgages:
+        raise ValueError("Simulation needs at least one mortgage")
+    if paths <= 0:
+        raise ValueError("Number of paths must be positive")
+    if paths_per_block <= 0 or loans_per_chunk <= 0:
+        raise ValueError("Block and chunk sizes must be positive")
+
+    assumptions = assumptions or MonteCarloAssumptions()
+    inputs = _simulation_inputs(mortgages, assumptions)
+    years = inputs["expected_value"].shape[1]
+
+    blocks = -(-paths // paths_per_block)
+    seeds = np.random.SeedSequence(seed).spawn(blocks)
+    done = np.zeros(blocks, dtype=bool)
+
+    workers = min(max_workers or os.cpu_count() or 1, blocks)
+    if workers == 1:
+        out = np.empty((len(SIMULATION_METRICS), paths, years))
+        for block in range(blocks):
+            _simulate_block(inputs, out, block, seeds[block], assumptions, paths_per_block, loans_per_chunk)
+            done[block] = True
+            yield _summarize(out, done, percentiles, paths_per_block)
+        return
+
+    specs = {name: (None, array.shape) for name, array in inputs.items()}
+    specs["out"] = (None, (len(SIMULATION_METRICS), paths, years))
+    shared = _SharedArrays(specs, create=True)
+    try:
+        for name, array in inputs.items():
+            shared.arrays[name][...] = array
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(
+                    _run_shared_block,
+                    shared.specs, block, seeds[block], assumptions, paths_per_block, loans_per_chunk,
+                )
+                for block in range(blocks)
+            ]
+            for future in as_completed(futures):
+                done[future.result()] = True
+                yield _summarize(shared.arrays["out"], done, percentiles, paths_per_block)
+    finally:
+        shared.close(unlink=True)
+
+
+@profiled()
+def run_simulation(
+    mortgages,
+    paths: int = 10_000,
+    seed: int = 0,
+    assumptions: Optional[MonteCarloAssumptions] = None,
+    percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+    max_workers: Optional[int] = None,
+    paths_per_block: int = PATHS_PER_BLOCK,
+    loans_per_chunk: int = LOANS_PER_CHUNK,
+) -> MonteCarloResult:
+    """
+    Run a simulation to completion (see iter_simulation).
+
+    Returns:
+        MonteCarloResult: Percentiles over every path
+    """
+    result = None
+    for result in iter_simulation(
+        mortgages, paths, seed, assumptions, percentiles, max_workers, paths_per_block, loans_per_chunk
+    ):
+        pass
+    return result
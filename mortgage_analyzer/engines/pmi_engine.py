@@ -0,0 +1,205 @@
+from dataclasses import dataclass, field
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+########################################################
+"""
+PMI engine documentation:
+
+Prices private mortgage insurance from a rate card instead of one flat
+rate. The card is a grid of annual premium rates by:
+
+    LTV band - (previous edge, ltv_edges[i]] as a percentage; loans at or
+               below 80% LTV pay no PMI,
+    FICO band - [fico_edges[j], fico_edges[j + 1]) credit score ranges,
+    coverage - insurer coverage level as a percent of the loan
+               (standard coverage depends on the LTV band)
+
+Lookups are np.searchsorted calls on the band edges, so a whole vector of
+LTVs (one per month of a schedule) is priced in one pass.
+
+    functions:
+        pmi_payment_schedule - PMI paid each month as the balance amortizes,
+                               zero from the removal month on
+
+    DEFAULT_PMI_TABLE - illustrative borrower-paid monthly premium card;
+                        use PMITable.from_frame for an insurer's actual card
+
+"""
+
+# PMI is not charged at or below this LTV (percent)
+PMI_LTV_THRESHOLD = 80.0
+
+PMI_TABLE_COLUMNS = ["ltv_max", "fico_min", "coverage", "annual_rate"]
+
+
+@dataclass
+class PMITable:
+    """
+    PMI rate card.
+
+    ltv_edges - upper edge of each LTV band, increasing (e.g. 85, 90, 95, 97)
+    fico_edges - lower edge of each FICO band, increasing
+    coverage_levels - coverage percentages the card prices, increasing
+    rates - annual premium as a decimal of the loan amount,
+            shape (coverage level, LTV band, FICO band)
+    standard_coverage - coverage used for each LTV band when none is given
+    """
+
+    ltv_edges: np.ndarray
+    fico_edges: np.ndarray
+    coverage_levels: np.ndarray
+    rates: np.ndarray = field(repr=False)
+    standard_coverage: np.ndarray = field(repr=False)
+
+    def __post_init__(self):
+        self.ltv_edges = np.asarray(self.ltv_edges, dtype=float)
+        self.fico_edges = np.asarray(self.fico_edges, dtype=float)
+        self.coverage_levels = np.asarray(self.coverage_levels, dtype=float)
+        self.rates = np.asarray(self.rates, dtype=float)
+        self.standard_coverage = np.asarray(self.standard_coverage, dtype=float)
+
+        expected = (len(self.coverage_levels), len(self.ltv_edges), len(self.fico_edges))
+        if self.rates.shape != expected:
+            raise ValueError(f"PMI rates must have shape {expected}, got {self.rates.shape}")
+        if self.standard_coverage.shape != (len(self.ltv_edges),):
+            raise ValueError("PMI table needs one standard coverage level per LTV band")
+        for name in ("ltv_edges", "fico_edges", "coverage_levels"):
+            if np.any(np.diff(getattr(self, name)) <= 0):
+                raise ValueError(f"PMI table {name} must be strictly increasing")
+        if np.any(self.ltv_edges <= PMI_LTV_THRESHOLD):
+            raise ValueError(f"PMI table LTV bands must be above {PMI_LTV_THRESHOLD:.0f}%")
+        if np.any(self.rates < 0):
+            raise ValueError("PMI rates cannot be negative")
+
+    @classmethod
+    def from_frame(cls, rate_card: pd.DataFrame, standard_coverage: Optional[dict] = None) -> "PMITable":
+        """
+        Build a table from a long-format rate card.
+
+        Args:
+            rate_card: DataFrame with ltv_max, fico_min, coverage and annual_rate
+                       (decimal, e.g. 0.0055) columns; every combination must be priced
+            standard_coverage: ltv_max -> coverage used when none is given
+                               (defaults to the lowest coverage priced for each band)
+
+        Returns:
+            PMITable
+        """
+        missing = [col for col in PMI_TABLE_COLUMNS if col not in rate_card.columns]
+        if missing:
+            raise ValueError(f"PMI rate card is missing columns: {', '.join(missing)}")
+
+        card = rate_card[PMI_TABLE_COLUMNS].dropna().astype(float)
+        grid = card.pivot_table(
+            index=["coverage", "ltv_max"], columns="fico_min", values="annual_rate", aggfunc="first"
+        )
+        coverage_levels = np.sort(card["coverage"].unique())
+        ltv_edges = np.sort(card["ltv_max"].unique())
+        fico_edges = np.sort(card["fico_min"].unique())
+
+        full_index = pd.MultiIndex.from_product([coverage_levels, ltv_edges])
+        grid = grid.reindex(index=full_index, columns=fico_edges)
+        if grid.isna().any().any():
+            raise ValueError("PMI rate card must price every coverage / LTV / FICO combination")
+
+        if standard_coverage is None:
+            standard_coverage = card.groupby("ltv_max")["coverage"].min().to_dict()
+
+        return cls(
+            ltv_edges=ltv_edges,
+            fico_edges=fico_edges,
+            coverage_levels=coverage_levels,
+            rates=grid.to_numpy().reshape(len(coverage_levels), len(ltv_edges), len(fico_edges)),
+            standard_coverage=[standard_coverage[edge] for edge in ltv_edges],
+        )
+
+    def annual_rate(self, ltv, credit_score, coverage: Optional[float] = None):
+        """
+        Annual PMI rate for one or many LTVs.
+
+        Args:
+            ltv: Loan-to-value as a percentage (scalar or array)
+            credit_score: Borrower credit score(s); scores below the card's lowest
+                          band are priced in that band
+            coverage: Coverage percent (None = standard coverage for the LTV band);
+                      rounded up to the next level the card prices
+
+        Returns:
+            numpy.ndarray or float: Annual rate as a decimal, 0 at or below 80% LTV
+        """
+        ltv = np.asarray(ltv, dtype=float)
+
+        # LTVs above the top band are priced in the top band
+        ltv_band = np.minimum(np.searchsorted(self.ltv_edges, ltv, side="left"), len(self.ltv_edges) - 1)
+        fico_band = np.maximum(np.searchsorted(self.fico_edges, credit_score, side="right") - 1, 0)
+
+        if coverage is None:
+            coverage = self.standard_coverage[ltv_band]
+        coverage_band = np.minimum(
+            np.searchsorted(self.coverage_levels, coverage, side="left"), len(self.coverage_levels) - 1
+        )
+
+        rate = np.where(ltv > PMI_LTV_THRESHOLD, self.rates[coverage_band, ltv_band, fico_band], 0.0)
+        return rate if rate.ndim else float(rate)
+
+
+def _default_pmi_table() -> PMITable:
+    # Annual premium (%) at standard coverage; rows are LTV bands, columns FICO bands
+    standard_rates = np.array([
+        [0.59, 0.52, 0.44, 0.36, 0.28, 0.24, 0.19, 0.15],  # 80.01-85% LTV, 12% coverage
+        [1.02, 0.90, 0.75, 0.63, 0.52, 0.44, 0.38, 0.28],  # 85.01-90% LTV, 25% coverage
+        [1.46, 1.30, 1.10, 0.93, 0.77, 0.66, 0.55, 0.41],  # 90.01-95% LTV, 30% coverage
+        [1.86, 1.65, 1.40, 1.24, 0.96, 0.82, 0.70, 0.58],  # 95.01-97% LTV, 35% coverage
+    ]) / 100
+    standard_coverage = np.array([12.0, 25.0, 30.0, 35.0])
+    coverage_levels = np.array([6.0, 12.0, 16.0, 25.0, 30.0, 35.0])
+
+    # Other coverage levels scale the premium with the insurer's share of the loss
+    scale = (coverage_levels[:, None] / standard_coverage[None, :]) ** 0.75
+    return PMITable(
+        ltv_edges=[85.0, 90.0, 95.0, 97.0],
+        fico_edges=[620, 640, 660, 680, 700, 720, 740, 760],
+        coverage_levels=coverage_levels,
+        rates=np.round(scale[:, :, None] * standard_rates[None, :, :], 5),
+        standard_coverage=standard_coverage,
+    )
+
+
+DEFAULT_PMI_TABLE = _default_pmi_table()
+
+
+def pmi_payment_schedule(
+    opening_balances,
+    property_value: float,
+    credit_score: int,
+    removal_month: int,
+    table: Optional[PMITable] = None,
+    coverage: Optional[float] = None,
+) -> np.ndarray:
+    """
+    PMI paid each month of a schedule. Each month is priced from the LTV
+    band of that month's opening balance, so the premium steps down as
+    the loan moves into lower bands, and stops at the removal month.
+
+    Args:
+        opening_balances: Balance at the start of each month of the schedule
+        property_value: Value the LTV is measured against
+        credit_score: Borrower credit score
+        removal_month: Number of months PMI is paid (see Mortgage.pmi_periods_remaining)
+        table: PMI rate card (defaults to DEFAULT_PMI_TABLE)
+        coverage: Coverage percent (None = standard coverage for each band)
+
+    Returns:
+        numpy.ndarray: PMI paid each month
+    """
+    table = table or DEFAULT_PMI_TABLE
+    opening_balances = np.asarray(opening_balances, dtype=float)
+
+    ltv = opening_balances / property_value * 100
+    rate = np.asarray(table.annual_rate(ltv, credit_score, coverage), dtype=float)
+    active = np.arange(len(opening_balances)) < removal_month
+
+    return opening_balances * rate / 12 * active
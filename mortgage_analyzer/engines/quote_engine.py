@@ -0,0 +1,263 @@
+from functools import lru_cache
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from mortgage_analyzer.engines.amortization_engine import monthly_rate_from_annual
+from mortgage_analyzer.engines.pmi_engine import DEFAULT_PMI_TABLE, PMI_LTV_THRESHOLD, PMITable
+from mortgage_analyzer.utils.profiling_utils import profiled
+
+########################################################
+"""
+Quote engine documentation:
+
+Answers payment quotes (P&I, PITI, PMI) for batches of loan requests
+without raising (1 + r) to a power per request. Every quote reduces to the
+discount factor v ** n, v = 1 / (1 + monthly rate):
+
+    payment factor - monthly_rate / (1 - v ** n), 1 / n at a zero rate,
+    balance factor - (1 - v ** (n - k)) / (1 - v ** n), the share of the
+                     loan still owed after k scheduled payments
+
+The factor table precomputes v ** (12 * years) and v ** months (0-11) for
+every rate on a QUOTE_RATE_STEP grid (a thousandth of a percent, the
+precision rate sheets and the app quote to), so v ** n for any term up to
+QUOTE_MAX_MONTHS is two lookups and one multiply. Rates off the grid or
+terms past the table are computed directly for just those requests rather
+than interpolated between grid points - linear interpolation of the
+factors would miss by cents on large loans. Either way quotes agree with
+Mortgage.principal_and_interest to well under a cent.
+
+The table is built once per process (get_factor_table) and is read-only,
+so every session and request shares the same arrays.
+
+    functions:
+        get_factor_table - the shared AnnuityFactorTable
+        quote_payments - P&I, PMI and PITI for a batch of requests
+        quote_payment - one request, as plain floats
+
+"""
+
+# Rate grid in percentage points, and the largest rate and term tabulated
+QUOTE_RATE_STEP = 0.001
+QUOTE_MAX_RATE = 20.0
+QUOTE_MAX_MONTHS = 480
+
+QUOTE_COLUMNS = ["principal_and_interest", "monthly_pmi", "monthly_tax", "monthly_ins", "piti"]
+
+
+class AnnuityFactorTable:
+    """
+    Discount factors v ** n on a rate grid, split by whole years and months.
+
+    discount_years - v ** (12 * y), shape (rates, QUOTE_MAX_MONTHS // 12 + 1)
+    discount_months - v ** m for m = 0..11, shape (rates, 12)
+    """
+
+    def __init__(
+        self,
+        rate_step: float = QUOTE_RATE_STEP,
+        max_rate: float = QUOTE_MAX_RATE,
+        max_months: int = QUOTE_MAX_MONTHS,
+    ):
+        if rate_step <= 0 or max_rate <= 0 or max_months <= 0:
+            raise ValueError("Factor table step, max rate and max months must be positive")
+
+        self.steps_per_point = int(round(1 / rate_step))
+        self.max_months = int(max_months)
+        self.rates = np.arange(int(round(max_rate * self.steps_per_point)) + 1) / self.steps_per_point
+        self.monthly_rate = monthly_rate_from_annual(self.rates)
+
+        discount = 1 / (1 + self.monthly_rate)
+        self.discount_years = discount[:, None] ** (12 * np.arange(self.max_months // 12 + 1))[None, :]
+        self.discount_months = discount[:, None] ** np.arange(12)[None, :]
+
+        for array in (self.rates, self.monthly_rate, self.discount_years, self.discount_months):
+            array.setflags(write=False)
+
+    @property
+    def nbytes(self) -> int:
+        return self.discount_years.nbytes + self.discount_months.nbytes
+
+    def discount(self, rate, months) -> np.ndarray:
+        """
+        Discount factor v ** months for each (rate, months) pair.
+
+        Args:
+            rate: Annual rate(s) as a percentage
+            months: Number of monthly payments (non-negative)
+
+        Returns:
+            numpy.ndarray: v ** months
+        """
+        rate, months = np.broadcast_arrays(np.asarray(rate, dtype=float), np.asarray(months, dtype=np.int64))
+        scaled = rate * self.steps_per_point
+        index = np.rint(scaled).astype(np.int64)
+        tabulated = (
+            (np.abs(scaled - index) < 1e-6)
+            & (index >= 0)
+            & (index < len(self.rates))
+            & (months >= 0)
+            & (months <= self.max_months)
+        )
+
+        result = np.empty(rate.shape)
+        i, n = index[tabulated], months[tabulated]
+        result[tabulated] = self.discount_years[i, n // 12] * self.discount_months[i, n % 12]
+
+        direct = ~tabulated
+        if direct.any():
+            result[direct] = (1 + monthly_rate_from_annual(rate[direct])) ** -months[direct].astype(float)
+        return result
+
+    def payment_factor(self, rate, months) -> np.ndarray:
+        """
+        Level payment per dollar of loan.
+
+        Args:
+            rate: Annual rate(s) as a percentage
+            months: Term(s) in months (positive)
+
+        Returns:
+            numpy.ndarray: Monthly P&I per dollar borrowed
+        """
+        rate, months = np.broadcast_arrays(np.asarray(rate, dtype=float), np.asarray(months, dtype=np.int64))
+        if (months <= 0).any():
+            raise ValueError("Quote terms must be at least one month")
+
+        monthly_rate = monthly_rate_from_annual(rate)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            factor = monthly_rate / (1 - self.discount(rate, months))
+        return np.where(monthly_rate == 0, 1 / months, factor)
+
+    def balance_factor(self, rate, months, elapsed) -> np.ndarray:
+        """
+        Share of the loan still owed after a number of scheduled payments.
+
+        Args:
+            rate: Annual rate(s) as a percentage
+            months: Term(s) in months (positive)
+            elapsed: Payments made; clipped to the term
+
+        Returns:
+            numpy.ndarray: Remaining balance per dollar borrowed
+        """
+        rate, months, elapsed = np.broadcast_arrays(
+            np.asarray(rate, dtype=float), np.asarray(months, dtype=np.int64), np.asarray(elapsed, dtype=np.int64)
+        )
+        if (months <= 0).any():
+            raise ValueError("Quote terms must be at least one month")
+
+        remaining = months - np.clip(elapsed, 0, months)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            factor = (1 - self.discount(rate, remaining)) / (1 - self.discount(rate, months))
+        return np.where(rate == 0, remaining / months, factor)
+
+
+@lru_cache(maxsize=None)
+def get_factor_table() -> AnnuityFactorTable:
+    """
+    The process-wide factor table, built on first use (about 8.5 MB).
+
+    Returns:
+        AnnuityFactorTable
+    """
+    return AnnuityFactorTable()
+
+
+@profiled()
+def quote_payments(
+    loan_amount,
+    rate,
+    months,
+    tax=0.0,
+    ins=0.0,
+    property_value=None,
+    credit_score=None,
+    pmi_rate=0.005,
+    pmi_table: Optional[PMITable] = None,
+) -> pd.DataFrame:
+    """
+    Quote monthly payments for a batch of requests. Every argument broadcasts,
+    so one loan can be quoted across a rate/term grid or many loans at once.
+
+    Args:
+        loan_amount: Loan amount(s)
+        rate: Annual rate(s) as a percentage
+        months: Term(s) in months
+        tax: Annual property tax
+        ins: Annual homeowners insurance
+        property_value: Price or appraised value for PMI (None = no PMI)
+        credit_score: Credit score(s) to price PMI from the PMI table;
+                      None uses the flat pmi_rate like the Mortgage classes
+        pmi_rate: Flat annual PMI rate as a decimal
+        pmi_table: PMI rate card (defaults to DEFAULT_PMI_TABLE)
+
+    Returns:
+        pandas.DataFrame: One row per request with QUOTE_COLUMNS
+    """
+    loan_amount, rate, months, tax, ins = np.broadcast_arrays(
+        np.asarray(loan_amount, dtype=float),
+        np.asarray(rate, dtype=float),
+        np.asarray(months, dtype=np.int64),
+        np.asarray(tax, dtype=float),
+        np.asarray(ins, dtype=float),
+    )
+
+    principal_and_interest = loan_amount * get_factor_table().payment_factor(rate, months)
+
+    if property_value is None:
+        monthly_pmi = np.zeros(loan_amount.shape)
+    else:
+        ltv = loan_amount / np.asarray(property_value, dtype=float) * 100
+        if credit_score is None:
+            annual_pmi = np.where(ltv > PMI_LTV_THRESHOLD, pmi_rate, 0.0)
+        else:
+            annual_pmi = (pmi_table or DEFAULT_PMI_TABLE).annual_rate(ltv, credit_score)
+        monthly_pmi = np.broadcast_to(loan_amount * annual_pmi / 12, loan_amount.shape)
+
+    quotes = pd.DataFrame({
+        "principal_and_interest": principal_and_interest.ravel(),
+        "monthly_pmi": monthly_pmi.ravel(),
+        "monthly_tax": tax.ravel() / 12,
+        "monthly_ins": ins.ravel() / 12,
+    })
+    quotes["piti"] = quotes[QUOTE_COLUMNS[:-1]].sum(axis=1)
+    return quotes
+
+
+def quote_payment(
+    loan_amount: float,
+    rate: float,
+    months: int,
+    tax: float = 0.0,
+    ins: float = 0.0,
+    property_value: Optional[float] = None,
+    credit_score: Optional[int] = None,
+    pmi_rate: float = 0.005,
+) -> dict:
+    """
+    Quote one request (see quote_payments) without building a DataFrame.
+
+    Returns:
+        dict: QUOTE_COLUMNS -> float
+    """
+    principal_and_interest = loan_amount * float(get_factor_table().payment_factor(rate, months))
+
+    monthly_pmi = 0.0
+    if property_value is not None:
+        ltv = loan_amount / property_value * 100
+        if credit_score is not None:
+            monthly_pmi = loan_amount * DEFAULT_PMI_TABLE.annual_rate(ltv, credit_score) / 12
+        elif ltv > PMI_LTV_THRESHOLD:
+            monthly_pmi = loan_amount * pmi_rate / 12
+
+    quote = {
+        "principal_and_interest": principal_and_interest,
+        "monthly_pmi": monthly_pmi,
+        "monthly_tax": tax / 12,
+        "monthly_ins": ins / 12,
+    }
+    quote["piti"] = sum(quote.values())
+    return quote
@@ -0,0 +1,364 @@
+import functools
+import os
+import re
+import warnings
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from mortgage_analyzer.engines.date_engine import as_days
+from mortgage_analyzer.utils.profiling_utils import profiled
+
+########################################################
+"""
+Rate history engine documentation:
+
+Local store for weekly mortgage rate series (e.g. Freddie Mac PMMS or the
+FRED MORTGAGE30US / MORTGAGE15US exports). The CSV is converted once into a
+compact binary file that is memory-mapped, never read in whole: a lookup
+touches one row and a window touches only its own weeks, so every worker
+of a backtest maps the same file instead of holding its own copy.
+
+Rate history CSV columns:
+
+    date - observation date (MM/DD/YYYY or YYYY-MM-DD; DATE and
+           observation_date, as FRED names it, also work),
+    one column per rate series - annual rate as a percentage (e.g. 6.85);
+        blanks and "." mean no observation
+
+Binary layout:
+    A .npy file holding one record per week on a regular 7-day grid from
+    the first observation: "day" (int32 days since 1970-01-01) and one
+    float32 field per series, named after the CSV column in lower case.
+    Observations are moved to the nearest grid week (the last one wins),
+    weeks with no observation carry the previous week's rate, and weeks
+    before a series starts are NaN. Because the grid is regular, the week
+    containing any date is (date - start) // 7: an O(1) lookup.
+
+The store lives at ~/.mortgage_analyzer/rate_history.npy unless the
+MORTGAGE_ANALYZER_RATE_HISTORY environment variable points elsewhere.
+Pointing it at a CSV builds the .npy next to it (and rebuilds it when
+the CSV changes).
+
+    functions:
+        read_rate_history - parse a rate history CSV onto the weekly grid
+        write_rate_history - write a rate history CSV or DataFrame to the binary store
+        load_rate_history - cached memory-mapped RateHistory for a path
+
+    RateHistory methods:
+        index_of - grid row of the week containing each date
+        rate_at - rate in effect on each date
+        window - the weeks between two dates as a DataFrame
+        window_stats - trailing mean / min / max / std and percentile at each date
+        series_for_term - series name whose term is closest to a loan term
+
+"""
+
+RATE_HISTORY_ENV_VAR = "MORTGAGE_ANALYZER_RATE_HISTORY"
+DEFAULT_RATE_HISTORY_PATH = Path.home() / ".mortgage_analyzer" / "rate_history.npy"
+
+RATE_HISTORY_DATE_COLUMNS = ("date", "observation_date")
+RATE_HISTORY_WINDOW_COLUMNS = ["date", "rate", "mean", "min", "max", "std", "percentile"]
+
+DAYS_PER_WEEK = 7
+
+# Rates are stored as float32 and rounded back to this many decimals when read
+RATE_DECIMALS = 3
+
+# Rate histories kept mapped at once (one per path/file version)
+RATE_HISTORY_CACHE_SIZE = 4
+
+
+def read_rate_history(source) -> pd.DataFrame:
+    """
+    Parse a rate history CSV and move it onto a regular weekly grid.
+
+    Args:
+        source: File path or file-like object
+
+    Returns:
+        pandas.DataFrame: date column (datetime64) plus one float column per series
+    """
+    raw = pd.read_csv(source)
+    raw.columns = [str(col).strip().lower() for col in raw.columns]
+
+    date_column = next((col for col in RATE_HISTORY_DATE_COLUMNS if col in raw.columns), None)
+    if date_column is None:
+        raise ValueError("Rate history needs a date column")
+    series = [col for col in raw.columns if col != date_column]
+    if not series:
+        raise ValueError("Rate history has no rate series columns")
+    invalid = [col for col in series if not re.fullmatch(r"[a-z_][a-z0-9_]*", col)]
+    if invalid:
+        raise ValueError(f"Rate series names must be letters, digits and underscores: {', '.join(invalid)}")
+
+    days = pd.to_datetime(raw[date_column], errors="coerce").to_numpy().astype("datetime64[D]")
+    rates = raw[series].apply(pd.to_numeric, errors="coerce")
+    keep = ~np.isnat(days)
+    if not keep.any():
+        raise ValueError("Rate history has no valid dates")
+    days, rates = days[keep], rates[keep]
+
+    observed = rates.to_numpy(dtype=float)
+    if ((observed <= 0) | (observed > 25)).any():
+        raise ValueError("Rate history rates must be between 0% and 25%")
+
+    # Observations go to the nearest grid week (holiday releases shift by a day or
+    # two); the last one in a week wins and empty weeks carry the previous rate
+    start = days.min()
+    offset = (days - start).astype(np.int64)
+    week = (offset + DAYS_PER_WEEK // 2) // DAYS_PER_WEEK
+    weekly = rates.assign(week=week).sort_values("week", kind="stable").groupby("week").last()
+    weekly = weekly.reindex(np.arange(week.max() + 1)).ffill()
+
+    frame = pd.DataFrame({"date": start + weekly.index.to_numpy() * np.timedelta64(DAYS_PER_WEEK, "D")})
+    for col in series:
+        frame[col] = weekly[col].to_numpy()
+    return frame
+
+
+def write_rate_history(source, path=None) -> Path:
+    """
+    Write a rate history to the memory-mappable binary store.
+    The file is replaced atomically, so readers never see a half-written store.
+
+    Args:
+        source: Rate history CSV (path or file-like) or a read_rate_history DataFrame
+        path: Destination .npy path (defaults to the store path)
+
+    Returns:
+        pathlib.Path: The written file
+    """
+    frame = source if isinstance(source, pd.DataFrame) else read_rate_history(source)
+    path = Path(os.path.expanduser(path or os.environ.get(RATE_HISTORY_ENV_VAR) or DEFAULT_RATE_HISTORY_PATH))
+    if path.suffix != ".npy":
+        raise ValueError("Rate history store path must end in .npy")
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    series = [col for col in frame.columns if col != "date"]
+    dtype = np.dtype([("day", "<i4")] + [(col, "<f4") for col in series])
+    records = np.empty(len(frame), dtype=dtype)
+    records["day"] = frame["date"].to_numpy().astype("datetime64[D]").astype(np.int64)
+    for col in series:
+        records[col] = frame[col].to_numpy(dtype=float)
+
+    partial = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with open(partial, "wb") as f:
+        np.save(f, records)
+    os.replace(partial, path)
+    return path
+
+
+class RateHistory:
+    """
+    Memory-mapped weekly rate history with O(1) date lookups.
+
+    Pickles as its path, so process-pool workers map the file themselves
+    instead of receiving the whole history.
+
+    Args:
+        path: Binary store written by write_rate_history
+    """
+
+    def __init__(self, path):
+        self.path = str(path)
+        self._records = np.load(self.path, mmap_mode="r")
+        names = self._records.dtype.names or ()
+        if not names or names[0] != "day" or len(self._records) == 0:
+            raise ValueError(f"{self.path} is not a rate history store")
+
+        self.series = names[1:]
+        self.start = np.datetime64(int(self._records["day"][0]), "D")
+        self.end = np.datetime64(int(self._records["day"][-1]), "D")
+        self._prefix_sums = {}
+
+    def __reduce__(self):
+        return load_rate_history, (self.path,)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    @property
+    def dates(self) -> np.ndarray:
+        return self._records["day"].astype("datetime64[D]")
+
+    def _rates(self, series: str, rows=slice(None)) -> np.ndarray:
+        return np.round(self._records[series][rows].astype(float), RATE_DECIMALS)
+
+    def _series(self, series: Optional[str]) -> str:
+        if series is None:
+            return self.series[0]
+        if series not in self.series:
+            raise ValueError(f"No rate series named {series!r} (have {', '.join(self.series)})")
+        return series
+
+    def series_for_term(self, years: int) -> str:
+        """
+        Series whose term (the number in its name, e.g. mortgage15us) is closest to a loan term.
+
+        Args:
+            years: Loan term in years
+
+        Returns:
+            str: Series name (the first series if none has a term in its name)
+        """
+        terms = {name: int(m.group()) for name in self.series if (m := re.search(r"\d+", name))}
+        if not terms:
+            return self.series[0]
+        return min(terms, key=lambda name: abs(terms[name] - years))
+
+    def index_of(self, dates) -> np.ndarray:
+        """
+        Grid row of the week containing each date; dates after the last week
+        map to the last week (its rate is the latest known).
+
+        Args:
+            dates: Date(s) as DATE_FORMAT strings, date objects or datetime64
+
+        Returns:
+            numpy.ndarray: Row positions as int64
+        """
+        days = as_days(dates)
+        if (days < self.start).any():
+            raise ValueError(f"Rate history starts on {self.start}")
+        rows = (days - self.start) // np.timedelta64(DAYS_PER_WEEK, "D")
+        return np.minimum(rows.astype(np.int64), len(self) - 1)
+
+    def rate_at(self, dates, series: Optional[str] = None):
+        """
+        Rate in effect on each date (NaN before the series starts).
+
+        Args:
+            dates: Date(s) to look up
+            series: Series name (defaults to the first series)
+
+        Returns:
+            numpy.ndarray or float: Rates as percentages
+        """
+        rates = self._rates(self._series(series), self.index_of(dates))
+        return rates[()] if rates.ndim == 0 else rates
+
+    def window(self, start=None, end=None, series: Optional[str] = None) -> pd.DataFrame:
+        """
+        The weeks from the one containing start through the one containing end.
+
+        Args:
+            start: First date (defaults to the start of the history)
+            end: Last date (defaults to the end of the history)
+            series: One series to include (defaults to all of them)
+
+        Returns:
+            pandas.DataFrame: date column plus the rate series
+        """
+        first = 0 if start is None else int(self.index_of(start))
+        last = len(self) - 1 if end is None else int(self.index_of(end))
+        records = self._records[first:last + 1]
+
+        frame = pd.DataFrame({"date": records["day"].astype("datetime64[D]").astype("datetime64[ns]")})
+        for name in self.series if series is None else [self._series(series)]:
+            frame[name] = np.round(records[name].astype(float), RATE_DECIMALS)
+        return frame
+
+    def _sums(self, series: str) -> tuple:
+        # Running count, sum and sum of squares of the observed weeks (built once per series)
+        if series not in self._prefix_sums:
+            values = self._rates(series)
+            observed = ~np.isnan(values)
+            filled = np.where(observed, values, 0.0)
+            zero = np.zeros(1)
+            self._prefix_sums[series] = (
+                np.concatenate((zero, np.cumsum(observed))),
+                np.concatenate((zero, np.cumsum(filled))),
+                np.concatenate((zero, np.cumsum(filled * filled))),
+            )
+        return self._prefix_sums[series]
+
+    def window_stats(self, dates, weeks: int = 52, series: Optional[str] = None) -> pd.DataFrame:
+        """
+        Statistics of the trailing window of weeks ending at each date.
+        Mean and std come from prefix sums (O(1) per date); min, max and the
+        percentile read only the window's own rows.
+
+        Args:
+            dates: Date(s) the windows end on (inclusive)
+            weeks: Window length in weeks (shorter near the start of the history)
+            series: Series name (defaults to the first series)
+
+        Returns:
+            pandas.DataFrame: date, rate, mean, min, max, std and percentile
+                              (share of the window's weeks at or below the rate)
+        """
+        if weeks <= 0:
+            raise ValueError("Window must be at least one week")
+        series = self._series(series)
+        last = np.atleast_1d(self.index_of(dates))
+        first = np.maximum(last - weeks + 1, 0)
+
+        count, total, squares = self._sums(series)
+        n = count[last + 1] - count[first]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            mean = (total[last + 1] - total[first]) / n
+            variance = (squares[last + 1] - squares[first]) / n - mean * mean
+        std = np.sqrt(np.maximum(variance, 0.0))
+
+        lo, hi = int(first.min()), int(last.max())
+        span = self._rates(series, slice(lo, hi + 1))
+        # Rows of each window relative to the span, NaN outside the window
+        offsets = np.arange(weeks)[None, :] + (last - weeks + 1 - lo)[:, None]
+        inside = offsets >= first[:, None] - lo
+        values = np.where(inside, span[np.clip(offsets, 0, None)], np.nan)
+        rate = span[last - lo]
+
+        with warnings.catch_warnings(), np.errstate(divide="ignore", invalid="ignore"):
+            # Windows entirely before a series starts are all NaN
+            warnings.simplefilter("ignore", RuntimeWarning)
+            low, high = np.nanmin(values, axis=1), np.nanmax(values, axis=1)
+            percentile = np.where(np.isnan(rate), np.nan, np.sum(values <= rate[:, None], axis=1) / n)
+
+        return pd.DataFrame(
+            {
+                "date": self._records["day"][last].astype("datetime64[D]").astype("datetime64[ns]"),
+                "rate": rate,
+                "mean": mean,
+                "min": low,
+                "max": high,
+                "std": std,
+                "percentile": percentile,
+            },
+            columns=RATE_HISTORY_WINDOW_COLUMNS,
+        )
+
+
+@functools.lru_cache(maxsize=RATE_HISTORY_CACHE_SIZE)
+def _load_rate_history(path: str, mtime_ns: int, size: int) -> RateHistory:
+    # The file's mtime and size are part of the key, so a rewritten store misses the cache
+    return RateHistory(path)
+
+
+@profiled()
+def load_rate_history(path: Optional[str] = None) -> RateHistory:
+    """
+    Memory-mapped rate history, mapped again only when the file changes.
+    A CSV path is converted to a .npy store next to it first (again
+    whenever the CSV is newer than its store).
+
+    Args:
+        path: .npy store or CSV path (defaults to MORTGAGE_ANALYZER_RATE_HISTORY,
+              then ~/.mortgage_analyzer/rate_history.npy)
+
+    Returns:
+        RateHistory
+    """
+    path = Path(os.path.abspath(os.path.expanduser(
+        path or os.environ.get(RATE_HISTORY_ENV_VAR) or DEFAULT_RATE_HISTORY_PATH
+    )))
+    if path.suffix.lower() == ".csv":
+        store = path.with_suffix(".npy")
+        if not store.exists() or store.stat().st_mtime_ns < path.stat().st_mtime_ns:
+            write_rate_history(path, store)
+        path = store
+
+    stat = os.stat(path)
+    return _load_rate_history(str(path), stat.st_mtime_ns, stat.st_size)
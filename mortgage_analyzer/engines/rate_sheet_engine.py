@@ -0,0 +1,393 @@
+import functools
+import os
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from mortgage_analyzer.utils.profiling_utils import profiled
+
+########################################################
+"""
+Rate sheet engine documentation:
+
+Loads a lender's daily rate sheet (CSV) into a compact columnar index
+and answers "best rate for this LTV / FICO / term" with two binary
+searches instead of a scan over every row.
+
+Rate sheet CSV columns (one row per priced option):
+
+    term - loan term in years,
+    ltv_max - top of the LTV band as a percentage (loan qualifies if ltv_min < LTV <= ltv_max),
+    fico_min - bottom of the FICO band (loan qualifies if fico_min <= FICO <= fico_max),
+    rate - note rate as a percentage (e.g. 6.25 for 6.25%),
+
+    Optional:
+        product - product name (defaults to "Conventional"),
+        ltv_min - bottom of the LTV band, exclusive (defaults to 0),
+        fico_max - top of the FICO band, inclusive (defaults to 850),
+        lock_days - rate lock period in days (defaults to 30),
+        points - cost as a percent of the loan amount
+                 (positive = discount points paid, negative = lender credit; defaults to 0)
+
+Index layout:
+    Rows are stored as typed numpy columns. For every (term, product, lock)
+    combination - and for "any product" / "any lock" - the LTV and FICO band
+    edges split the sheet into a grid of cells, and each cell holds the row
+    of the best qualifying option (lowest rate, then fewest points, among
+    options costing at most max_points). A lookup is a dict hit plus one
+    np.searchsorted per axis: O(log n).
+
+    functions:
+        read_rate_sheet - parse and validate a rate sheet CSV into a DataFrame
+        load_rate_sheet - cached RateSheetIndex for a CSV path, rebuilt only when the file changes
+
+    RateSheetIndex methods:
+        best_rate - best option for one LTV / FICO / term
+        best_rates - best rate for arrays of LTVs and FICOs (NaN where nothing qualifies)
+        eligible_options - every term/rate/points option a borrower qualifies for,
+                           ready for buydown_engine.evaluate_buydown_options
+
+"""
+
+RATE_SHEET_ENV_VAR = "MORTGAGE_ANALYZER_RATE_SHEET"
+
+RATE_SHEET_REQUIRED_COLUMNS = ["term", "ltv_max", "fico_min", "rate"]
+RATE_SHEET_DEFAULTS = {
+    "product": "Conventional",
+    "ltv_min": 0.0,
+    "fico_max": 850,
+    "lock_days": 30,
+    "points": 0.0,
+}
+RATE_SHEET_DTYPES = {
+    "product": "string",
+    "term": "int16",
+    "ltv_min": "float64",
+    "ltv_max": "float64",
+    "fico_min": "int16",
+    "fico_max": "int16",
+    "lock_days": "int16",
+    "rate": "float64",
+    "points": "float64",
+}
+
+# Sentinel for "any product" / "any lock period" in the grid keys
+ANY = -1
+
+# Rate sheets kept in memory at once (one per path/file version)
+RATE_SHEET_CACHE_SIZE = 8
+
+
+@dataclass
+class RateQuote:
+    """One priced option from a rate sheet"""
+
+    product: str
+    term: int
+    lock_days: int
+    rate: float
+    points: float
+    ltv_band: Tuple[float, float]
+    fico_band: Tuple[int, int]
+
+
+@dataclass
+class _BandGrid:
+    # Band edges for one (term, product, lock) key and the best row per cell
+    ltv_edges: np.ndarray
+    fico_edges: np.ndarray
+    best_row: np.ndarray = field(repr=False)
+
+    def cells(self, ltv, fico):
+        """Row index of the best option for each LTV/FICO pair (-1 = none)"""
+        ltv = np.asarray(ltv, dtype=float)
+        fico = np.asarray(fico, dtype=float)
+
+        # LTV bands are (low, high]; FICO bands are [low, high + 1)
+        ltv_cell = np.searchsorted(self.ltv_edges, ltv, side="left") - 1
+        fico_cell = np.searchsorted(self.fico_edges, fico, side="right") - 1
+
+        inside = (
+            (ltv_cell >= 0) & (ltv_cell < self.best_row.shape[0])
+            & (fico_cell >= 0) & (fico_cell < self.best_row.shape[1])
+        )
+        rows = np.full(np.broadcast(ltv_cell, fico_cell).shape, -1, dtype=np.int32)
+        rows[inside] = self.best_row[
+            np.broadcast_to(ltv_cell, rows.shape)[inside],
+            np.broadcast_to(fico_cell, rows.shape)[inside],
+        ]
+        return rows
+
+
+class RateSheetIndex:
+    """
+    Columnar rate sheet with O(log n) best-rate lookups.
+
+    Args:
+        rate_sheet: DataFrame in the rate sheet CSV layout (see read_rate_sheet)
+        max_points: Most points an option may cost to count as a "best rate"
+                    (0 = no discount points; lender credits always qualify)
+    """
+
+    def __init__(self, rate_sheet: pd.DataFrame, max_points: float = 0.0):
+        sheet = _validate_rate_sheet(rate_sheet)
+
+        self.max_points = float(max_points)
+        self.products = tuple(sorted(sheet["product"].unique()))
+        product_codes = {name: code for code, name in enumerate(self.products)}
+
+        # Typed columns; products are stored as small integer codes
+        self.product_code = sheet["product"].map(product_codes).to_numpy(dtype=np.int16)
+        self.term = sheet["term"].to_numpy(dtype=np.int16)
+        self.lock_days = sheet["lock_days"].to_numpy(dtype=np.int16)
+        self.ltv_min = sheet["ltv_min"].to_numpy(dtype=np.float64)
+        self.ltv_max = sheet["ltv_max"].to_numpy(dtype=np.float64)
+        self.fico_min = sheet["fico_min"].to_numpy(dtype=np.int16)
+        self.fico_max = sheet["fico_max"].to_numpy(dtype=np.int16)
+        self.rate = sheet["rate"].to_numpy(dtype=np.float64)
+        self.points = sheet["points"].to_numpy(dtype=np.float64)
+
+        self._grids = self._build_grids()
+
+    def __len__(self) -> int:
+        return len(self.rate)
+
+    @property
+    def terms(self) -> tuple:
+        return tuple(int(t) for t in np.unique(self.term))
+
+    @property
+    def lock_periods(self) -> tuple:
+        return tuple(int(d) for d in np.unique(self.lock_days))
+
+    def _build_grids(self) -> Dict[tuple, _BandGrid]:
+        eligible = np.flatnonzero(self.points <= self.max_points)
+
+        # Later rows overwrite earlier ones, so walk from worst to best
+        order = eligible[np.lexsort((-self.points[eligible], -self.rate[eligible]))]
+
+        grids = {}
+        keys = np.stack([self.term[order], self.product_code[order], self.lock_days[order]], axis=1)
+        for term in np.unique(keys[:, 0]):
+            in_term = keys[:, 0] == term
+            for product in [ANY, *np.unique(keys[in_term, 1])]:
+                for lock in [ANY, *np.unique(keys[in_term, 2])]:
+                    selected = in_term.copy()
+                    if product != ANY:
+                        selected &= keys[:, 1] == product
+                    if lock != ANY:
+                        selected &= keys[:, 2] == lock
+                    if selected.any():
+                        grids[(int(term), int(product), int(lock))] = self._grid_for_rows(order[selected])
+
+        return grids
+
+    def _grid_for_rows(self, rows: np.ndarray) -> _BandGrid:
+        ltv_edges = np.unique(np.concatenate([self.ltv_min[rows], self.ltv_max[rows]]))
+        fico_upper = self.fico_max[rows].astype(float) + 1
+        fico_edges = np.unique(np.concatenate([self.fico_min[rows].astype(float), fico_upper]))
+
+        ltv_lo = np.searchsorted(ltv_edges, self.ltv_min[rows])
+        ltv_hi = np.searchsorted(ltv_edges, self.ltv_max[rows])
+        fico_lo = np.searchsorted(fico_edges, self.fico_min[rows])
+        fico_hi = np.searchsorted(fico_edges, fico_upper)
+
+        best_row = np.full((len(ltv_edges) - 1, len(fico_edges) - 1), -1, dtype=np.int32)
+        for row, a, b, c, d in zip(rows, ltv_lo, ltv_hi, fico_lo, fico_hi):
+            best_row[a:b, c:d] = row
+
+        return _BandGrid(ltv_edges, fico_edges, best_row)
+
+    def _grid(self, term: int, product: Optional[str], lock_days: Optional[int]) -> Optional[_BandGrid]:
+        if product is None:
+            product_code = ANY
+        elif product in self.products:
+            product_code = self.products.index(product)
+        else:
+            return None
+        return self._grids.get((int(term), product_code, ANY if lock_days is None else int(lock_days)))
+
+    def _quote(self, row: int) -> RateQuote:
+        return RateQuote(
+            product=self.products[self.product_code[row]],
+            term=int(self.term[row]),
+            lock_days=int(self.lock_days[row]),
+            rate=float(self.rate[row]),
+            points=float(self.points[row]),
+            ltv_band=(float(self.ltv_min[row]), float(self.ltv_max[row])),
+            fico_band=(int(self.fico_min[row]), int(self.fico_max[row])),
+        )
+
+    def best_rate(
+        self,
+        ltv: float,
+        fico: int,
+        term: int,
+        product: Optional[str] = None,
+        lock_days: Optional[int] = None,
+    ) -> Optional[RateQuote]:
+        """
+        Best option a borrower qualifies for.
+
+        Args:
+            ltv: Loan-to-value as a percentage (e.g. 80 for 80%)
+            fico: Credit score
+            term: Loan term in years
+            product: Restrict to one product (None = any)
+            lock_days: Restrict to one lock period (None = any)
+
+        Returns:
+            RateQuote or None if no option on the sheet covers the borrower
+        """
+        grid = self._grid(term, product, lock_days)
+        if grid is None:
+            return None
+
+        row = int(grid.cells(ltv, fico))
+        return None if row < 0 else self._quote(row)
+
+    def best_rates(
+        self,
+        ltv,
+        fico,
+        term: int,
+        product: Optional[str] = None,
+        lock_days: Optional[int] = None,
+    ) -> np.ndarray:
+        """
+        Best rate for many borrowers at once.
+
+        Args:
+            ltv: LTV percentage(s), broadcast against fico
+            fico: Credit score(s)
+            term: Loan term in years
+            product: Restrict to one product (None = any)
+            lock_days: Restrict to one lock period (None = any)
+
+        Returns:
+            numpy.ndarray: Best rate per borrower, NaN where nothing qualifies
+        """
+        shape = np.broadcast(np.asarray(ltv), np.asarray(fico)).shape
+        grid = self._grid(term, product, lock_days)
+        if grid is None:
+            return np.full(shape, np.nan)
+
+        rows = grid.cells(ltv, fico)
+        return np.where(rows >= 0, self.rate[np.maximum(rows, 0)], np.nan)
+
+    def eligible_options(
+        self,
+        ltv: float,
+        fico: int,
+        terms: Optional[Iterable[int]] = None,
+        product: Optional[str] = None,
+        lock_days: Optional[int] = None,
+    ) -> pd.DataFrame:
+        """
+        Every priced option a borrower qualifies for, in the buy-down engine's
+        rate sheet layout. Where several rows offer the same term and rate the
+        cheapest one is kept.
+
+        Args:
+            ltv: Loan-to-value as a percentage
+            fico: Credit score
+            terms: Loan terms in years to include (None = all)
+            product: Restrict to one product (None = any)
+            lock_days: Restrict to one lock period (None = any)
+
+        Returns:
+            pandas.DataFrame: term, rate and points columns
+        """
+        mask = (
+            (self.ltv_min < ltv) & (ltv <= self.ltv_max)
+            & (self.fico_min <= fico) & (fico <= self.fico_max)
+        )
+        if terms is not None:
+            mask &= np.isin(self.term, np.asarray(list(terms), dtype=np.int16))
+        if product is not None:
+            mask &= self.product_code == (self.products.index(product) if product in self.products else ANY)
+        if lock_days is not None:
+            mask &= self.lock_days == lock_days
+
+        options = pd.DataFrame({
+            "term": self.term[mask].astype(int),
+            "rate": self.rate[mask],
+            "points": self.points[mask],
+        })
+        return (
+            options.sort_values(["term", "rate", "points"])
+            .drop_duplicates(["term", "rate"])
+            .reset_index(drop=True)
+        )
+
+
+def _validate_rate_sheet(rate_sheet: pd.DataFrame) -> pd.DataFrame:
+    missing = [col for col in RATE_SHEET_REQUIRED_COLUMNS if col not in rate_sheet.columns]
+    if missing:
+        raise ValueError(f"Rate sheet is missing columns: {', '.join(missing)}")
+
+    sheet = rate_sheet.assign(**{
+        col: default for col, default in RATE_SHEET_DEFAULTS.items() if col not in rate_sheet.columns
+    })
+    sheet = sheet[list(RATE_SHEET_DTYPES)].dropna()
+    if sheet.empty:
+        raise ValueError("Rate sheet has no complete rows")
+
+    sheet = sheet.astype(RATE_SHEET_DTYPES)
+    if (sheet["rate"] <= 0).any():
+        raise ValueError("Rate sheet rates must be positive")
+    if (sheet["term"] <= 0).any():
+        raise ValueError("Rate sheet terms must be positive")
+    if (sheet["ltv_min"] >= sheet["ltv_max"]).any():
+        raise ValueError("Rate sheet LTV bands must have ltv_min below ltv_max")
+    if (sheet["fico_min"] > sheet["fico_max"]).any():
+        raise ValueError("Rate sheet FICO bands must have fico_min at or below fico_max")
+
+    return sheet.reset_index(drop=True)
+
+
+def read_rate_sheet(source) -> pd.DataFrame:
+    """
+    Parse a rate sheet CSV.
+
+    Args:
+        source: File path or file-like object
+
+    Returns:
+        pandas.DataFrame: Validated rate sheet with every column filled in
+    """
+    sheet = pd.read_csv(
+        source,
+        usecols=lambda col: col in RATE_SHEET_DTYPES,
+        dtype={"product": "string"},
+    )
+    return _validate_rate_sheet(sheet)
+
+
+@functools.lru_cache(maxsize=RATE_SHEET_CACHE_SIZE)
+def _load_rate_sheet(path: str, mtime_ns: int, size: int, max_points: float) -> RateSheetIndex:
+    # The file's mtime and size are part of the key, so an edited file misses the cache
+    return RateSheetIndex(read_rate_sheet(path), max_points=max_points)
+
+
+@profiled()
+def load_rate_sheet(path: Optional[str] = None, max_points: float = 0.0) -> RateSheetIndex:
+    """
+    Rate sheet index for a CSV file, parsed again only when the file changes.
+
+    Args:
+        path: CSV path (defaults to the MORTGAGE_ANALYZER_RATE_SHEET environment variable)
+        max_points: Most points an option may cost to count as a "best rate"
+
+    Returns:
+        RateSheetIndex
+    """
+    path = path or os.environ.get(RATE_SHEET_ENV_VAR)
+    if not path:
+        raise ValueError(f"No rate sheet path given and {RATE_SHEET_ENV_VAR} is not set")
+
+    path = os.path.abspath(os.path.expanduser(path))
+    stat = os.stat(path)
+    return _load_rate_sheet(path, stat.st_mtime_ns, stat.st_size, float(max_points))
@@ -0,0 +1,325 @@
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from mortgage_analyzer.engines.amortization_engine import annuity_payment, balance_after, monthly_rate_from_annual
+from mortgage_analyzer.engines.date_engine import add_months, as_days
+from mortgage_analyzer.engines.rate_history_engine import RateHistory, load_rate_history
+from mortgage_analyzer.utils.profiling_utils import profiled
+
+########################################################
+"""
+Refinance backtest engine documentation:
+
+Replays a current mortgage's life against historical market rates: for
+every month the loan was outstanding and the rate history covers, what
+would refinancing right after that month's payment have been worth?
+Every (loan, month) pair is one row of a vectorized batch; nothing is
+looped month by month and no Mortgage objects are built per candidate.
+
+For a candidate refinance after payment m of a loan:
+    balance - scheduled balance of the original loan after m payments
+              (the loan as written: original amount, note rate and term),
+    market_rate - weekly survey rate in effect on that payment's date,
+                  from the rate series closest to the new term,
+    new_rate - market_rate plus the borrower's spread over the survey,
+    new_loan - balance plus cash out, as RefinanceScenario.loan_amount,
+    closing_costs - new_loan x (closing_cost_percentage + points / 100),
+                    floored at zero, as RefinanceScenario.closing_costs,
+    monthly_savings - old minus new principal and interest payment,
+    breakeven_months - months of savings needed to recover closing costs
+                       not covered by cash out (0 if cash out covers them,
+                       NaN if never within both loans' remaining terms),
+    net_benefit - cash out - closing costs + payments avoided - payments made
+                  + old balance - new balance, all at the end of the holding
+                  period (the old loan's scheduled payoff unless set)
+
+Loans are split into chunks of BACKTEST_CHUNK_LOANS and chunks are
+spread across a process pool. The RateHistory pickles as its file path,
+so each worker memory-maps the history instead of receiving a copy.
+
+    functions:
+        backtest_refinance - BacktestResult for one or many current mortgages
+
+"""
+
+BACKTEST_COLUMNS = [
+    "loan",
+    "month",
+    "date",
+    "market_rate",
+    "new_rate",
+    "balance",
+    "new_loan",
+    "closing_costs",
+    "old_payment",
+    "new_payment",
+    "monthly_savings",
+    "breakeven_months",
+    "net_benefit",
+]
+
+DEFAULT_PERCENTILES = (5, 25, 50, 75, 95)
+
+# Loans evaluated per (loans x months) pass and per task sent to a worker
+BACKTEST_CHUNK_LOANS = 1_000
+
+
+@dataclass
+class RefinanceAssumptions:
+    """
+    Terms of the hypothetical refinance, as on a RefinanceScenario.
+
+    years - new loan term in years
+    closing_cost_percentage - base closing costs as a share of the new loan
+    cash_out_amount - cash taken out on top of the balance
+    discount_points - points paid (negative = lender credit)
+    rate_spread - borrower's rate over the survey rate, in percentage points
+    holding_years - years the borrower keeps the loan (None = until the
+                    current loan's scheduled payoff)
+    series - rate history series (defaults to the one closest to years)
+    """
+
+    years: int = 30
+    closing_cost_percentage: float = 0.025
+    cash_out_amount: float = 0.0
+    discount_points: float = 0.0
+    rate_spread: float = 0.0
+    holding_years: Optional[float] = None
+    series: Optional[str] = None
+
+    def __post_init__(self):
+        if self.years <= 0:
+            raise ValueError("Loan term must be positive")
+        if self.years > 50:
+            raise ValueError("Loan term exceeds 50 years")
+        if self.closing_cost_percentage < 0:
+            raise ValueError("Closing cost percentage cannot be negative")
+        if self.closing_cost_percentage > 0.1:
+            raise ValueError("Closing cost percentage is unreasonably high (>10%)")
+        if self.cash_out_amount < 0:
+            raise ValueError("Cash out amount cannot be negative")
+        if self.discount_points < -5:
+            raise ValueError("Lender credit is unreasonably high (>5 points)")
+        if self.discount_points > 5:
+            raise ValueError("Discount points are unreasonably high (>5 points)")
+        if self.holding_years is not None and self.holding_years <= 0:
+            raise ValueError("Holding period must be positive")
+
+    @classmethod
+    def from_refinance(cls, scenario, **overrides) -> "RefinanceAssumptions":
+        """
+        Refinance terms taken from a RefinanceScenario.
+
+        Args:
+            scenario: RefinanceScenario object
+            overrides: Any field to set differently (e.g. rate_spread=0.25)
+
+        Returns:
+            RefinanceAssumptions
+        """
+        terms = dict(
+            years=scenario.years,
+            closing_cost_percentage=scenario.closing_cost_percentage,
+            cash_out_amount=scenario.cash_out_amount,
+            discount_points=scenario.discount_points,
+        )
+        terms.update(overrides)
+        return cls(**terms)
+
+
+@dataclass
+class BacktestResult:
+    """
+    Result of backtest_refinance.
+
+    outcomes - one row per (loan, refinance month), columns BACKTEST_COLUMNS;
+               loan is the position in the mortgages passed in
+    """
+
+    outcomes: pd.DataFrame
+
+    def __len__(self) -> int:
+        return len(self.outcomes)
+
+    def ranked(self, top: Optional[int] = None, per_loan: Optional[int] = None) -> pd.DataFrame:
+        """
+        Refinance months from most to least net benefit.
+
+        Args:
+            top: Keep only this many rows overall
+            per_loan: Keep only this many rows for each loan
+
+        Returns:
+            pandas.DataFrame: Outcome rows, best first
+        """
+        ranked = self.outcomes.sort_values(["net_benefit", "month"], ascending=[False, True], kind="stable")
+        if per_loan is not None:
+            ranked = ranked.groupby("loan", sort=False).head(per_loan)
+        return ranked.head(top) if top is not None else ranked
+
+    def best(self) -> pd.DataFrame:
+        """Each loan's best refinance month, in loan order"""
+        return self.ranked(per_loan=1).sort_values("loan").reset_index(drop=True)
+
+    def distribution(self, percentiles: Sequence[float] = DEFAULT_PERCENTILES, by_loan: bool = False) -> pd.DataFrame:
+        """
+        Distribution of net benefit over the candidate months.
+
+        Args:
+            percentiles: Percentiles to report (0-100)
+            by_loan: One row per loan instead of one row for every candidate
+
+        Returns:
+            pandas.DataFrame: months, share_beneficial (net benefit above zero),
+                              mean and one column per percentile
+        """
+        outcomes = self.outcomes if by_loan else self.outcomes.assign(loan=0)
+        outcomes = outcomes.assign(beneficial=outcomes["net_benefit"] > 0)
+        groups = outcomes.groupby("loan")
+        benefit = groups["net_benefit"]
+        summary = pd.DataFrame({
+            "months": benefit.size(),
+            "share_beneficial": groups["beneficial"].mean(),
+            "mean": benefit.mean(),
+        })
+        quantiles = benefit.quantile([p / 100 for p in percentiles]).unstack()
+        quantiles.columns = [f"p{p:g}" for p in percentiles]
+        summary = summary.join(quantiles)
+        return summary if by_loan else summary.reset_index(drop=True)
+
+
+def _loan_arrays(mortgages) -> dict:
+    """Original terms of CurrentMortgage objects as parallel arrays"""
+    return {
+        "loan": np.arange(len(mortgages)),
+        "original_loan": np.array([m.original_loan for m in mortgages], dtype=float),
+        "rate": np.array([m.rate for m in mortgages], dtype=float),
+        "periods": np.array([m.total_periods for m in mortgages], dtype=np.int64),
+        "start": as_days([m.start_date for m in mortgages]),
+    }
+
+
+def _backtest_chunk(loans: dict, history: RateHistory, assumptions: RefinanceAssumptions) -> dict:
+    """Every refinance candidate for a chunk of loans as flat output columns"""
+    series = assumptions.series or history.series_for_term(assumptions.years)
+    months = np.arange(1, int(loans["periods"].max()))
+    dates = add_months(loans["start"][:, None], months[None, :])
+
+    # Candidates: a balance is still owed and the history has a rate for the date
+    last_day = history.end + np.timedelta64(6, "D")
+    candidate = (months[None, :] < loans["periods"][:, None]) & (dates >= history.start) & (dates <= last_day)
+    rows, cols = np.nonzero(candidate)
+    month, date = months[cols], dates[rows, cols]
+    market_rate = history.rate_at(date, series) if len(date) else np.zeros(0)
+
+    quoted = ~np.isnan(market_rate)
+    rows, month, date, market_rate = rows[quoted], month[quoted], date[quoted], market_rate[quoted]
+
+    old_rate = monthly_rate_from_annual(loans["rate"][rows])
+    original, periods = loans["original_loan"][rows], loans["periods"][rows]
+    old_payment = annuity_payment(original, old_rate, periods)
+    balance = balance_after(original, old_rate, old_payment, month)
+
+    new_rate = market_rate + assumptions.rate_spread
+    new_periods = assumptions.years * 12
+    new_loan = balance + assumptions.cash_out_amount
+    closing_costs = np.maximum(
+        new_loan * (assumptions.closing_cost_percentage + assumptions.discount_points / 100), 0.0
+    )
+    new_payment = annuity_payment(new_loan, monthly_rate_from_annual(new_rate), new_periods)
+    monthly_savings = old_payment - new_payment
+
+    # Breakeven: savings recover the closing costs cash out did not cover
+    remaining = periods - month
+    shortfall = closing_costs - assumptions.cash_out_amount
+    with np.errstate(divide="ignore", invalid="ignore"):
+        needed = np.ceil(shortfall / monthly_savings)
+    recovered = (monthly_savings > 0) & (needed <= np.minimum(remaining, new_periods))
+    breakeven = np.where(shortfall <= 0, 0.0, np.where(recovered, needed, np.nan))
+
+    # Net benefit over the holding period; each loan stops costing anything once paid off
+    if assumptions.holding_years is None:
+        horizon = remaining
+    else:
+        horizon = np.full(len(rows), int(round(assumptions.holding_years * 12)))
+    old_months, new_months = np.minimum(horizon, remaining), np.minimum(horizon, new_periods)
+    old_balance = balance_after(original, old_rate, old_payment, month + old_months)
+    new_balance = balance_after(new_loan, monthly_rate_from_annual(new_rate), new_payment, new_months)
+    net_benefit = (
+        -shortfall
+        + old_payment * old_months
+        - new_payment * new_months
+        + old_balance
+        - new_balance
+    )
+
+    return {
+        "loan": loans["loan"][rows],
+        "month": month,
+        "date": date,
+        "market_rate": market_rate,
+        "new_rate": new_rate,
+        "balance": balance,
+        "new_loan": new_loan,
+        "closing_costs": closing_costs,
+        "old_payment": old_payment,
+        "new_payment": new_payment,
+        "monthly_savings": monthly_savings,
+        "breakeven_months": breakeven,
+        "net_benefit": net_benefit,
+    }
+
+
+@profiled()
+def backtest_refinance(
+    mortgages,
+    history: Optional[RateHistory] = None,
+    assumptions: Optional[RefinanceAssumptions] = None,
+    max_workers: Optional[int] = None,
+) -> BacktestResult:
+    """
+    Evaluate refinancing in every historical month of each mortgage's life.
+
+    Args:
+        mortgages: One CurrentMortgage object or a sequence of them
+        history: Rate history (defaults to load_rate_history())
+        assumptions: Refinance terms (defaults to RefinanceAssumptions())
+        max_workers: Worker processes for more than one chunk of loans
+                     (1 keeps everything in-process)
+
+    Returns:
+        BacktestResult
+    """
+    if not isinstance(mortgages, (list, tuple)):
+        mortgages = [mortgages]
+    if not mortgages:
+        raise ValueError("Backtest needs at least one mortgage")
+
+    history = history or load_rate_history()
+    assumptions = assumptions or RefinanceAssumptions()
+    loans = _loan_arrays(mortgages)
+
+    starts = range(0, len(mortgages), BACKTEST_CHUNK_LOANS)
+    chunks = [{k: v[lo:lo + BACKTEST_CHUNK_LOANS] for k, v in loans.items()} for lo in starts]
+
+    workers = min(max_workers or os.cpu_count() or 1, len(chunks))
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = list(pool.map(
+                _backtest_chunk, chunks, itertools.repeat(history, len(chunks)), itertools.repeat(assumptions, len(chunks))
+            ))
+    else:
+        parts = [_backtest_chunk(chunk, history, assumptions) for chunk in chunks]
+
+    outcomes = pd.DataFrame(
+        {name: np.concatenate([part[name] for part in parts]) for name in BACKTEST_COLUMNS},
+        columns=BACKTEST_COLUMNS,
+    )
+    outcomes["date"] = outcomes["date"].astype("datetime64[ns]")
+    return BacktestResult(outcomes=outcomes)
@@ -0,0 +1,219 @@
+from dataclasses import dataclass, field
+from typing import Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+from mortgage_analyzer.engines.escrow_engine import EscrowAssumptions, total_payment_vector
+from mortgage_analyzer.utils.profiling_utils import profiled
+
+########################################################
+"""
+Rent vs. buy engine documentation:
+
+Compares buying with a NewMortgageScenario against renting and investing
+the money that would have gone into the purchase. Cash flows are built
+as monthly vectors and every holding period is evaluated at once as a
+(holding periods x months) matrix.
+
+RentVsBuyAssumptions:
+    monthly_rent - rent for a comparable home today,
+    rent_growth - annual rent increase (0.03 = 3%),
+    appreciation - annual home value appreciation,
+    investment_return - annual return on invested savings (also the NPV discount rate),
+    selling_cost_pct - agent and closing costs when selling, as a share of sale price,
+    maintenance_pct - annual maintenance as a share of home value,
+    escrow - tax and insurance growth assumptions for the owner's payment
+
+Buying's cash flows are measured relative to renting: month 0 is the
+initial investment (down payment + closing costs), each month adds rent
+avoided minus owning costs, and the final month adds net sale proceeds.
+NPV > 0 or IRR > investment_return means buying comes out ahead.
+
+    functions:
+        solve_irr - vectorized Newton/bisection IRR for rows of cash flows
+        analyze_rent_vs_buy - NPV, IRR and terminal wealth for each holding period
+
+"""
+
+
+@dataclass
+class RentVsBuyAssumptions:
+    monthly_rent: float
+    rent_growth: float = 0.03
+    appreciation: float = 0.03
+    investment_return: float = 0.06
+    selling_cost_pct: float = 0.06
+    maintenance_pct: float = 0.01
+    escrow: EscrowAssumptions = field(default_factory=EscrowAssumptions)
+
+    def __post_init__(self):
+        if self.monthly_rent <= 0:
+            raise ValueError("Monthly rent must be positive")
+        if self.investment_return <= -1:
+            raise ValueError("Investment return must be greater than -100%")
+        if not 0 <= self.selling_cost_pct <= 0.15:
+            raise ValueError("Selling costs must be between 0% and 15%")
+        if not 0 <= self.maintenance_pct <= 0.1:
+            raise ValueError("Maintenance must be between 0% and 10% of home value")
+
+
+@dataclass
+class RentVsBuyAnalysis:
+    """
+    Result of a rent vs. buy analysis.
+
+    summary - one row per holding period with NPV, IRR and terminal wealth
+    own_costs - owner's monthly housing cost (payment + maintenance)
+    rent_costs - renter's monthly rent
+    cash_flows - buy-minus-rent cash flows, one row per holding period
+    """
+
+    summary: pd.DataFrame
+    own_costs: np.ndarray = field(repr=False)
+    rent_costs: np.ndarray = field(repr=False)
+    cash_flows: np.ndarray = field(repr=False)
+
+    @property
+    def breakeven_years(self) -> Optional[int]:
+        """Shortest holding period where buying beats renting, if any"""
+        ahead = self.summary[self.summary["npv"] > 0]
+        return None if ahead.empty else int(ahead["holding_years"].iloc[0])
+
+
+@profiled()
+def solve_irr(cash_flows, tol: float = 1e-10, max_iter: int = 100) -> np.ndarray:
+    """
+    Solve the periodic IRR for each row of a cash flow matrix at once.
+    Newton steps are used while they stay inside a sign-change bracket;
+    otherwise the bracket is bisected, so every row converges or is NaN.
+
+    Args:
+        cash_flows: Array of shape (rows, periods), period 0 first
+        tol: Convergence tolerance on the rate
+        max_iter: Maximum iterations
+
+    Returns:
+        numpy.ndarray: Periodic IRR per row (NaN where no sign change exists)
+    """
+    cf = np.atleast_2d(np.asarray(cash_flows, dtype=float))
+    t = np.arange(cf.shape[1])
+
+    def npv(rate):
+        return (cf * (1 + rate[:, None]) ** -t).sum(axis=1)
+
+    # Monthly bracket from -30% to +100% covers any realistic annual IRR
+    lo = np.full(cf.shape[0], -0.3)
+    hi = np.full(cf.shape[0], 1.0)
+    f_lo = npv(lo)
+    has_root = np.sign(f_lo) != np.sign(npv(hi))
+
+    rate = np.full(cf.shape[0], 0.005)
+    for _ in range(max_iter):
+        discount = (1 + rate[:, None]) ** -t
+        f = (cf * discount).sum(axis=1)
+        df = -(t * cf * discount / (1 + rate[:, None])).sum(axis=1)
+
+        # Shrink the bracket around the root
+        same_side = np.sign(f) == np.sign(f_lo)
+        lo = np.where(same_side, rate, lo)
+        f_lo = np.where(same_side, f, f_lo)
+        hi = np.where(same_side, hi, rate)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            newton = rate - f / df
+        in_bracket = np.isfinite(newton) & (newton > lo) & (newton < hi)
+        new_rate = np.where(in_bracket, newton, (lo + hi) / 2)
+
+        converged = np.abs(new_rate - rate) < tol
+        rate = new_rate
+        if np.all(converged | ~has_root):
+            break
+
+    return np.where(has_root, rate, np.nan)
+
+
+@profiled()
+def analyze_rent_vs_buy(
+    mortgage,
+    assumptions: RentVsBuyAssumptions,
+    holding_years: Iterable[int] = range(1, 31),
+) -> RentVsBuyAnalysis:
+    """
+    Compare buying against renting for every holding period in one pass.
+
+    Args:
+        mortgage: NewMortgageScenario object (needs initial_investment)
+        assumptions: Rent, growth, return and selling cost assumptions
+        holding_years: Holding periods in whole years to evaluate
+
+    Returns:
+        RentVsBuyAnalysis: Per-holding-period summary and the underlying cash flows
+    """
+    if not hasattr(mortgage, "initial_investment"):
+        raise ValueError("Rent vs. buy needs a purchase scenario with an initial investment")
+
+    years = np.asarray(list(holding_years), dtype=int)
+    if years.size == 0 or (years <= 0).any():
+        raise ValueError("Holding periods must be positive whole years")
+
+    months = int(years.max()) * 12
+    t = np.arange(1, months + 1)
+    year_index = (t - 1) // 12
+    monthly_return = (1 + assumptions.investment_return) ** (1 / 12) - 1
+
+    # Monthly owning and renting costs
+    value_during_year = mortgage.price * (1 + assumptions.appreciation) ** year_index
+    own_costs = (
+        total_payment_vector(mortgage, months, assumptions.escrow)
+        + value_during_year * assumptions.maintenance_pct / 12
+    )
+    rent_costs = assumptions.monthly_rent * (1 + assumptions.rent_growth) ** year_index
+    monthly_diff = rent_costs - own_costs
+
+    # Net proceeds if sold at the end of each holding period
+    schedule_balance = mortgage.amortization_schedule()["balance"].to_numpy()
+    balances = np.concatenate(([mortgage.loan_amount], schedule_balance, np.zeros(months)))
+    horizon = years * 12
+    sale_value = mortgage.estimate_value_at_year(years, assumptions.appreciation)
+    net_sale = sale_value * (1 - assumptions.selling_cost_pct) - balances[horizon]
+
+    # Buy-minus-rent cash flow matrix, one row per holding period
+    held = t[None, :] <= horizon[:, None]
+    cash_flows = np.zeros((years.size, months + 1))
+    cash_flows[:, 0] = -mortgage.initial_investment
+    cash_flows[:, 1:] = np.where(held, monthly_diff[None, :], 0.0)
+    cash_flows[np.arange(years.size), horizon] += net_sale
+
+    discount = (1 + monthly_return) ** -np.arange(months + 1)
+    npv = cash_flows @ discount
+
+    # Terminal wealth: whoever spends less each month invests the difference
+    growth_to_end = np.where(held, (1 + monthly_return) ** (horizon[:, None] - t[None, :]), 0.0)
+    owner_wealth = net_sale + growth_to_end @ np.maximum(monthly_diff, 0.0)
+    renter_wealth = (
+        mortgage.initial_investment * (1 + monthly_return) ** horizon
+        + growth_to_end @ np.maximum(-monthly_diff, 0.0)
+    )
+
+    monthly_irr = solve_irr(cash_flows)
+    annual_irr = (1 + monthly_irr) ** 12 - 1
+
+    summary = pd.DataFrame({
+        "holding_years": years,
+        "sale_value": sale_value,
+        "net_sale_proceeds": net_sale,
+        "owner_wealth": owner_wealth,
+        "renter_wealth": renter_wealth,
+        "wealth_difference": owner_wealth - renter_wealth,
+        "npv": npv,
+        "irr": annual_irr,
+        "better_choice": np.where(npv > 0, "Buy", "Rent"),
+    })
+
+    return RentVsBuyAnalysis(
+        summary=summary,
+        own_costs=own_costs,
+        rent_costs=rent_costs,
+        cash_flows=cash_flows,
+    )
@@ -0,0 +1,200 @@
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from mortgage_analyzer.engines.escrow_engine import EscrowAssumptions, breakeven_month, total_payment_vector
+from mortgage_analyzer.utils.profiling_utils import profiled
+
+########################################################
+"""
+Schedule diff engine documentation:
+
+Lines up two or more scenarios on one calendar - month 0 is today and
+month t is the t-th payment from now for every scenario - and stacks
+their schedules into (scenario x month) arrays, so comparisons are
+column arithmetic instead of per-schedule rebuilds, groupbys and reindexes.
+Each scenario's amortization schedule is built once.
+
+Per month (column 0 holds the opening position, before any payment):
+    payment - total payment with escrow growth (see total_payment_vector),
+    interest - interest paid,
+    principal - scheduled plus extra principal paid,
+    balance - balance after the payment (zero once paid off),
+    value - property value at the assumed appreciation,
+    equity - value minus balance
+
+Balances and equity agree with Mortgage._calculate_remaining_balance_at_year
+and estimate_equity_at_year to within a cent at every whole year.
+
+    functions:
+        align_schedules - build AlignedSchedules for a dict of mortgages
+
+"""
+
+SCHEDULE_DIFF_COLUMNS = ["cumulative_payment", "cumulative_interest", "balance", "equity"]
+
+
+@dataclass
+class AlignedSchedules:
+    """
+    Scenarios' schedules on a shared monthly calendar.
+
+    names - scenario names, one row of each array per name
+    payment, interest, principal, balance, value - arrays of shape
+        (scenarios, months + 1), column 0 being today
+    """
+
+    names: List[str]
+    payment: np.ndarray
+    interest: np.ndarray
+    principal: np.ndarray
+    balance: np.ndarray
+    value: np.ndarray
+
+    @property
+    def months(self) -> int:
+        return self.payment.shape[1] - 1
+
+    @property
+    def cumulative_payment(self) -> np.ndarray:
+        return np.cumsum(self.payment, axis=1)
+
+    @property
+    def cumulative_interest(self) -> np.ndarray:
+        return np.cumsum(self.interest, axis=1)
+
+    @property
+    def equity(self) -> np.ndarray:
+        return self.value - self.balance
+
+    def _row(self, name: str) -> int:
+        try:
+            return self.names.index(name)
+        except ValueError:
+            raise ValueError(f"No aligned schedule named {name!r}") from None
+
+    def frame(self, metric: str, periods_per_year: int = 12) -> pd.DataFrame:
+        """
+        One metric for every scenario, indexed by years from today.
+
+        Args:
+            metric: payment, interest, principal, balance, value, equity,
+                    cumulative_payment or cumulative_interest
+            periods_per_year: Months per index unit (12 = years)
+
+        Returns:
+            pandas.DataFrame: One column per scenario
+        """
+        values = getattr(self, metric)
+        index = pd.Index(np.arange(self.months + 1) / periods_per_year, name="Year")
+        return pd.DataFrame(values.T, index=index, columns=self.names)
+
+    def diff(self, base: str, other: str) -> pd.DataFrame:
+        """
+        Month-by-month differences of other minus base.
+
+        Args:
+            base: Scenario compared against (e.g. the current mortgage)
+            other: Scenario being evaluated
+
+        Returns:
+            pandas.DataFrame: SCHEDULE_DIFF_COLUMNS indexed by month (0 = today)
+        """
+        i, j = self._row(base), self._row(other)
+        stacked = {
+            "cumulative_payment": self.cumulative_payment,
+            "cumulative_interest": self.cumulative_interest,
+            "balance": self.balance,
+            "equity": self.equity,
+        }
+        return pd.DataFrame(
+            {column: values[j] - values[i] for column, values in stacked.items()},
+            index=pd.RangeIndex(self.months + 1, name="month"),
+        )
+
+    def totals(self) -> pd.DataFrame:
+        """Total payments, interest and principal over the aligned horizon, one row per scenario"""
+        return pd.DataFrame(
+            {
+                "total_payment": self.payment.sum(axis=1),
+                "total_interest": self.interest.sum(axis=1),
+                "total_principal": self.principal.sum(axis=1),
+            },
+            index=pd.Index(self.names, name="scenario"),
+        )
+
+    def breakeven_month(self, base: str, other: str, upfront_cost: float, months: Optional[int] = None) -> Optional[int]:
+        """
+        First month other's cumulative payment savings over base recover an upfront cost.
+
+        Args:
+            base: Scenario compared against (e.g. the current mortgage)
+            other: Scenario paying the upfront cost
+            upfront_cost: Cost paid up front to switch (e.g. closing costs)
+            months: Only look this many months ahead (defaults to the whole horizon)
+
+        Returns:
+            int or None: 1-based month of breakeven, or None if never reached
+        """
+        i, j = self._row(base), self._row(other)
+        end = self.months if months is None else min(int(months), self.months)
+        return breakeven_month(upfront_cost, self.payment[i, 1:end + 1], self.payment[j, 1:end + 1])
+
+
+@profiled()
+def align_schedules(
+    mortgages: Dict[str, object],
+    months: Optional[int] = None,
+    escrow_assumptions: Optional[EscrowAssumptions] = None,
+    appreciation: float = 0.03,
+) -> AlignedSchedules:
+    """
+    Build each scenario's schedule once and line them all up month by month.
+
+    Args:
+        mortgages: Scenario name -> Mortgage object (CurrentMortgage,
+                   NewMortgageScenario or RefinanceScenario)
+        months: Months to align (defaults to the longest payoff)
+        escrow_assumptions: Tax and insurance growth for the payments
+        appreciation: Annual home value appreciation
+
+    Returns:
+        AlignedSchedules
+    """
+    if not mortgages:
+        raise ValueError("Aligning schedules needs at least one mortgage")
+
+    names = list(mortgages)
+    schedules = [mortgage.amortization_schedule() for mortgage in mortgages.values()]
+    months = max(len(schedule) for schedule in schedules) if months is None else int(months)
+    if months < 0:
+        raise ValueError("Months to align cannot be negative")
+
+    shape = (len(names), months + 1)
+    payment = np.zeros(shape)
+    interest = np.zeros(shape)
+    principal = np.zeros(shape)
+    balance = np.zeros(shape)
+
+    for row, (mortgage, schedule) in enumerate(zip(mortgages.values(), schedules)):
+        paid = min(len(schedule), months)
+        interest[row, 1:paid + 1] = schedule["interest"].to_numpy()[:paid]
+        principal[row, 1:paid + 1] = (schedule["principal"] + schedule["principal_paydown"]).to_numpy()[:paid]
+        balance[row, 0] = mortgage.loan_amount
+        balance[row, 1:paid + 1] = schedule["balance"].to_numpy()[:paid]
+        payment[row, 1:] = total_payment_vector(mortgage, months, escrow_assumptions, schedule=schedule)
+
+    price = np.array([float(mortgage.price) for mortgage in mortgages.values()])
+    growth = (1 + appreciation) ** (np.arange(months + 1) / 12)
+    value = price[:, None] * growth[None, :]
+
+    return AlignedSchedules(
+        names=names,
+        payment=payment,
+        interest=interest,
+        principal=principal,
+        balance=balance,
+        value=value,
+    )
@@ -0,0 +1,322 @@
+from dataclasses import dataclass
+from typing import Sequence
+
+import numpy as np
+import pandas as pd
+
+from mortgage_analyzer.engines.amortization_engine import annuity_payment, monthly_rate_from_annual
+from mortgage_analyzer.utils.profiling_utils import profiled
+
+########################################################
+"""
+Segment engine documentation:
+
+Schedules for loans whose payment rules change over the term, built from
+a list of segments that run back to back. Inside a segment the balance
+follows the closed-form recursion
+
+    balance_k = balance_0 * (1 + r) ** k - payment * ((1 + r) ** k - 1) / r
+
+so every month of every segment is one array expression over a
+(loans x months) grid. A three-segment loan costs three grid passes,
+whatever the term, and a batch of loans costs the same passes as one loan.
+
+Segment kinds:
+    interest_only - payment is the month's interest; the balance stays level,
+    amortizing - level payment that clears the balance over the rest of
+                 the loan's term (recomputed at the start of the segment),
+    negative_amortization - fixed payment below the interest due; unpaid
+                            interest is added to the balance until it would
+                            pass cap x the original loan amount, when the loan
+                            recasts to an amortizing payment over the rest of
+                            the term (the month of the recast is solved in
+                            closed form too)
+
+The loan's term is the sum of its segments' months. Segment fields may be
+arrays (one value per loan) to run a batch of loans with the same segment
+layout but different rates, payments, caps or lengths. A balance left at
+the end of the term (a final negative amortization segment, say) is
+reported as the balloon.
+
+    functions:
+        segment_schedule - SegmentSchedule for one loan or a batch of loans
+        interest_only_segments - interest-only period followed by amortization
+
+"""
+
+INTEREST_ONLY = "interest_only"
+AMORTIZING = "amortizing"
+NEGATIVE_AMORTIZATION = "negative_amortization"
+SEGMENT_KINDS = (INTEREST_ONLY, AMORTIZING, NEGATIVE_AMORTIZATION)
+
+SEGMENT_SUMMARY_COLUMNS = [
+    "total_paid",
+    "total_interest",
+    "peak_balance",
+    "first_payment",
+    "max_payment",
+    "recast_month",
+    "balloon",
+]
+
+
+@dataclass(frozen=True)
+class Segment:
+    """
+    One stretch of a loan with a single payment rule.
+
+    kind - interest_only, amortizing or negative_amortization
+    months - number of monthly payments in the segment
+    rate - annual rate as a percentage (e.g. 6.5 for 6.5%)
+    payment - fixed payment (negative_amortization only)
+    cap - highest balance allowed, as a multiple of the original loan amount
+          (negative_amortization only)
+    """
+
+    kind: str
+    months: object
+    rate: object
+    payment: object = None
+    cap: object = 1.10
+
+    def __post_init__(self):
+        if self.kind not in SEGMENT_KINDS:
+            raise ValueError(f"Unknown segment kind: {self.kind}")
+        if np.any(np.asarray(self.months) < 0):
+            raise ValueError("Segment months cannot be negative")
+        if np.any(np.asarray(self.rate) < 0):
+            raise ValueError("Segment rate cannot be negative")
+        if self.kind == NEGATIVE_AMORTIZATION:
+            if self.payment is None:
+                raise ValueError("Negative amortization segments need a payment")
+            if np.any(np.asarray(self.payment) < 0):
+                raise ValueError("Segment payment cannot be negative")
+            if np.any(np.asarray(self.cap) < 1):
+                raise ValueError("Negative amortization cap must be at least 1x the loan amount")
+
+
+@dataclass
+class SegmentSchedule:
+    """
+    Result of segment_schedule.
+
+    payment, interest, principal, balance - arrays of shape (loans, months);
+        balance is after the month's payment, principal is negative while
+        interest is being deferred, and months past a loan's term are zero
+    segment - index of the segment each month belongs to (-1 past the term)
+    recast_month - 1-based month of each loan's first cap recast (0 = none)
+    term - each loan's term in months
+    """
+
+    payment: np.ndarray
+    interest: np.ndarray
+    principal: np.ndarray
+    balance: np.ndarray
+    segment: np.ndarray
+    recast_month: np.ndarray
+    term: np.ndarray
+
+    def __len__(self) -> int:
+        return self.payment.shape[0]
+
+    @property
+    def balloon(self) -> np.ndarray:
+        """Balance left after each loan's last scheduled payment"""
+        return self.balance[np.arange(len(self)), np.maximum(self.term - 1, 0)] * (self.term > 0)
+
+    def frame(self, loan: int = 0) -> pd.DataFrame:
+        """
+        One loan's schedule with the amortization_schedule columns.
+
+        Args:
+            loan: Row of the batch
+
+        Returns:
+            pandas.DataFrame: month, payment, principal, interest,
+                              principal_paydown, balance and segment columns
+        """
+        months = int(self.term[loan])
+        df = pd.DataFrame(
+            {
+                "month": np.arange(1, months + 1),
+                "payment": self.payment[loan, :months],
+                "principal": self.principal[loan, :months],
+                "interest": self.interest[loan, :months],
+                "principal_paydown": np.zeros(months),
+                "balance": self.balance[loan, :months],
+            }
+        ).round(2)
+        df["segment"] = self.segment[loan, :months]
+        return df
+
+    def summary(self) -> pd.DataFrame:
+        """Per-loan totals, peak balance, payment shock and balloon"""
+        first = self.payment[:, 0] if self.payment.shape[1] else np.zeros(len(self))
+        return pd.DataFrame(
+            {
+                "total_paid": self.payment.sum(axis=1),
+                "total_interest": self.interest.sum(axis=1),
+                "peak_balance": self.balance.max(axis=1, initial=0.0),
+                "first_payment": first,
+                "max_payment": self.payment.max(axis=1, initial=0.0),
+                "recast_month": self.recast_month,
+                "balloon": self.balloon,
+            },
+            columns=SEGMENT_SUMMARY_COLUMNS,
+        )
+
+
+def _balance_after(balance, monthly_rate, payment, elapsed):
+    """Closed-form balance after elapsed level payments, not floored at zero"""
+    growth = np.power(1 + monthly_rate, elapsed)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(
+            monthly_rate == 0,
+            balance - payment * elapsed,
+            balance * growth - payment * (growth - 1) / monthly_rate,
+        )
+
+
+def _amortizing_payment(balance, monthly_rate, periods):
+    """Level payment clearing balance over periods (zero when no periods are left)"""
+    safe_periods = np.maximum(periods, 1)
+    return np.where(periods > 0, annuity_payment(balance, monthly_rate, safe_periods), 0.0)
+
+
+def _recast_offset(balance, monthly_rate, payment, cap_balance, months):
+    """
+    Month within a negative amortization segment (0-based) whose payment
+    would first push the balance past the cap, or months when it never does.
+    Solves balance_j > cap_balance for the smallest j with logarithms.
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        level = payment / monthly_rate
+        ratio = (cap_balance - level) / (balance - level)
+        offset = np.floor(np.log(ratio) / np.log1p(monthly_rate))
+    # Only a payment below the interest due makes the balance grow
+    growing = (monthly_rate > 0) & (payment < balance * monthly_rate)
+    offset = np.where(growing, np.where(balance > cap_balance, 0, offset), months)
+    return np.clip(np.nan_to_num(offset, nan=months, posinf=months), 0, months).astype(np.int64)
+
+
+@profiled()
+def segment_schedule(principal, segments: Sequence[Segment]) -> SegmentSchedule:
+    """
+    Build monthly schedules for loans made of back-to-back payment segments.
+
+    Args:
+        principal: Original loan amount(s)
+        segments: Segments in the order they run; fields broadcast against principal
+
+    Returns:
+        SegmentSchedule: one row per loan
+    """
+    if not segments:
+        raise ValueError("A segmented loan needs at least one segment")
+
+    original = np.atleast_1d(np.asarray(principal, dtype=float))
+    loans = np.broadcast_shapes(
+        original.shape,
+        *(np.shape(value) for s in segments for value in (s.months, s.rate, s.payment, s.cap) if value is not None),
+    )
+    original = np.broadcast_to(original, loans).astype(float).ravel()
+    n = len(original)
+
+    def per_loan(value):
+        return np.broadcast_to(np.asarray(value, dtype=float), loans).ravel()
+
+    months = [per_loan(s.months).astype(np.int64) for s in segments]
+    term = np.sum(months, axis=0)
+    horizon = int(term.max()) if n else 0
+
+    payment = np.zeros((n, horizon))
+    interest = np.zeros((n, horizon))
+    balance = np.zeros((n, horizon))
+    segment_index = np.full((n, horizon), -1, dtype=np.int64)
+    recast_month = np.zeros(n, dtype=np.int64)
+
+    opening = original.copy()
+    start = np.zeros(n, dtype=np.int64)
+
+    for index, (seg, length) in enumerate(zip(segments, months)):
+        end = start + length
+        if not n or not length.any():
+            continue
+        rate = monthly_rate_from_annual(per_loan(seg.rate))
+        remaining = term - start
+
+        # Only the columns some loan spends in this segment are touched
+        column = np.arange(start.min(), end.max())
+        active = (column >= start[:, None]) & (column < end[:, None])
+        offset = np.clip(column - start[:, None], 0, np.maximum(length - 1, 0)[:, None])
+
+        if seg.kind == INTEREST_ONLY:
+            level = opening * rate
+        elif seg.kind == AMORTIZING:
+            level = _amortizing_payment(opening, rate, remaining)
+        else:
+            level = per_loan(seg.payment)
+        entering = _balance_after(opening[:, None], rate[:, None], level[:, None], offset)
+        scheduled = np.broadcast_to(level[:, None], entering.shape)
+
+        if seg.kind == NEGATIVE_AMORTIZATION:
+            # From the recast on, the rest of the segment amortizes over the rest of the term
+            recast_at = _recast_offset(opening, rate, level, per_loan(seg.cap) * original, length)
+            recast_balance = _balance_after(opening, rate, level, recast_at)
+            recast_level = _amortizing_payment(recast_balance, rate, remaining - recast_at)
+            after = offset >= recast_at[:, None]
+            entering = np.where(
+                after,
+                _balance_after(
+                    recast_balance[:, None], rate[:, None], recast_level[:, None],
+                    np.maximum(offset - recast_at[:, None], 0),
+                ),
+                entering,
+            )
+            scheduled = np.where(after, recast_level[:, None], scheduled)
+            recast_month = np.where((recast_month == 0) & (recast_at < length), start + recast_at + 1, recast_month)
+
+        entering = np.maximum(entering, 0.0)
+        owed = entering * rate[:, None]
+        # A payment never exceeds what is owed, so an overpaid loan stops at zero
+        paid = np.minimum(scheduled, entering + owed)
+
+        window = slice(column[0], column[-1] + 1)
+        payment[:, window] = np.where(active, paid, payment[:, window])
+        interest[:, window] = np.where(active, owed, interest[:, window])
+        balance[:, window] = np.where(active, entering + owed - paid, balance[:, window])
+        segment_index[:, window] = np.where(active, index, segment_index[:, window])
+
+        rows = np.flatnonzero(length > 0)
+        opening[rows] = balance[rows, end[rows] - 1]
+        start = end
+
+    return SegmentSchedule(
+        payment=payment,
+        interest=interest,
+        principal=payment - interest,
+        balance=balance,
+        segment=segment_index,
+        recast_month=recast_month,
+        term=term,
+    )
+
+
+def interest_only_segments(rate, years, interest_only_years) -> list:
+    """
+    Segments for an interest-only loan: interest-only payments, then a level
+    payment that clears the balance over the rest of the term.
+
+    Args:
+        rate: Annual rate(s) as a percentage
+        years: Full loan term(s) in years
+        interest_only_years: Length of the interest-only period in years
+
+    Returns:
+        list: [interest_only Segment, amortizing Segment]
+    """
+    io_months = np.asarray(interest_only_years) * 12
+    return [
+        Segment(INTEREST_ONLY, io_months, rate),
+        Segment(AMORTIZING, np.asarray(years) * 12 - io_months, rate),
+    ]
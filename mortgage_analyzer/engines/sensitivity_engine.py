@@ -0,0 +1,393 @@
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+from mortgage_analyzer.engines.amortization_engine import annuity_payment, balance_after, monthly_rate_from_annual
+from mortgage_analyzer.engines.escrow_engine import escrow_payment_matrix
+from mortgage_analyzer.engines.pmi_engine import DEFAULT_PMI_TABLE, PMI_LTV_THRESHOLD
+from mortgage_analyzer.utils.profiling_utils import profiled
+
+########################################################
+"""
+Sensitivity engine documentation:
+
+Measures how much each input moves the current-vs-scenario decision.
+Every perturbed input set is one row of a batch; the batch is evaluated
+as (rows x months) arrays, and large grids are split into chunks that
+are spread across a process pool.
+
+Drivers (inputs that can be perturbed):
+    rate - scenario note rate as a percentage,
+    points - scenario discount points (negative = lender credit),
+    closing_cost_pct - base closing costs as a share of the loan (refinance)
+                       or price (new purchase),
+    appreciation - annual home value appreciation for both homes,
+    tax_growth - annual property tax growth,
+    ins_growth - annual insurance growth,
+    holding_years - years until the decision is evaluated
+
+Outputs:
+    monthly_savings - current minus scenario total payment in the first month,
+    breakeven_months - first month cumulative savings recover the cash needed
+                       to switch (NaN if never within the loan terms),
+    net_benefit - cash at the start + payment savings through the holding
+                  period + scenario equity minus current equity at the end
+
+"Cash at the start" is cash out minus closing costs for a refinance, and
+the current home's equity minus the down payment and closing costs for a
+new purchase (i.e. sell and move vs. stay). Payments follow the same rules
+as escrow_engine.total_payment_vector, so the unperturbed case agrees with
+the Comparison page: extra principal stops after each loan's prepay window,
+PMI follows the loan's pmi_schedule (re-priced by LTV band when a credit
+score is given), and escrow is the servicer's annual analysis including
+the current loan's shortage payment.
+
+    functions:
+        comparison_inputs - base drivers and fixed loan terms for a comparison
+        evaluate_comparisons - vectorized outputs for a batch of driver rows
+        tornado_analysis - low/high swing of every output for each driver
+        sensitivity_grid - outputs for every combination of driver values
+
+"""
+
+SENSITIVITY_DRIVERS = [
+    "rate",
+    "points",
+    "closing_cost_pct",
+    "appreciation",
+    "tax_growth",
+    "ins_growth",
+    "holding_years",
+]
+
+SENSITIVITY_OUTPUTS = ["monthly_savings", "breakeven_months", "net_benefit"]
+
+# Default distance from the base value for the low and high cases
+DEFAULT_SWINGS = {
+    "rate": 0.5,
+    "points": 1.0,
+    "closing_cost_pct": 0.01,
+    "appreciation": 0.02,
+    "tax_growth": 0.02,
+    "ins_growth": 0.03,
+    "holding_years": 3,
+}
+
+# Rows evaluated per (rows x months) pass; keeps each array to a few MB.
+# Batches with more than one chunk are spread across worker processes.
+BATCH_CHUNK_ROWS = 5_000
+
+
+def comparison_inputs(current_mortgage, scenario, holding_years: int = 7) -> tuple:
+    """
+    Pull the base driver values and fixed loan terms out of a comparison.
+
+    Args:
+        current_mortgage: CurrentMortgage object
+        scenario: NewMortgageScenario or RefinanceScenario object
+        holding_years: Base holding period in years
+
+    Returns:
+        tuple: (base drivers dict, fixed terms dict) of plain floats
+    """
+    is_refinance = hasattr(scenario, "closing_cost_percentage")
+
+    base = {
+        "rate": scenario.rate,
+        "points": scenario.discount_points,
+        "closing_cost_pct": scenario.closing_cost_percentage if is_refinance else 0.03,
+        "appreciation": 0.03,
+        "tax_growth": 0.02,
+        "ins_growth": 0.04,
+        "holding_years": holding_years,
+    }
+
+    fixed = {
+        "is_refinance": is_refinance,
+        # Current loan
+        "cur_balance": current_mortgage.loan_amount,
+        "cur_rate": current_mortgage.rate,
+        "cur_periods": current_mortgage.periods_remaining,
+        "cur_extra": current_mortgage.extra_principal,
+        "cur_prepay": current_mortgage.prepay_periods,
+        "cur_pmi": current_mortgage.monthly_pmi,
+        "cur_credit_score": getattr(current_mortgage, "credit_score", None),
+        "cur_value": current_mortgage.price,
+        "cur_tax": current_mortgage.tax,
+        "cur_ins": current_mortgage.ins,
+        "cur_shortage": max(0.0, getattr(current_mortgage, "monthly_escrow_shortage_pmt", 0.0)),
+        # Scenario loan
+        "new_loan": scenario.loan_amount,
+        "new_periods": scenario.periods_remaining,
+        "new_extra": scenario.extra_principal,
+        "new_prepay": scenario.prepay_periods,
+        "new_pmi": scenario.monthly_pmi,
+        "new_credit_score": getattr(scenario, "credit_score", None),
+        "new_value": scenario.price,
+        "new_tax": scenario.tax,
+        "new_ins": scenario.ins,
+        "new_shortage": max(0.0, getattr(scenario, "monthly_escrow_shortage_pmt", 0.0)),
+        "cash_out": getattr(scenario, "cash_out_amount", 0.0),
+        "down_payment": getattr(scenario, "downpayment_amount", 0.0),
+    }
+
+    return base, fixed
+
+
+def _loan_arrays(principal, monthly_rate, periods, extra, prepay, pmi, credit_score, value, months):
+    """Balance and P&I + extra + PMI paid for each row and month"""
+    payment = annuity_payment(principal, monthly_rate, periods)
+    t = np.arange(months + 1)
+
+    # Extra principal shortens the loan like a larger level payment until the
+    # prepay window closes (0 = every month), then the scheduled payment runs on
+    window = np.where(prepay > 0, prepay, months + 1)[:, None]
+    at_window = balance_after(principal, monthly_rate, payment + extra, np.minimum(window[:, 0], months + 1))
+    balances = np.where(
+        t[None, :] <= window,
+        balance_after(principal[:, None], monthly_rate[:, None], (payment + extra)[:, None], t[None, :]),
+        balance_after(at_window[:, None], monthly_rate[:, None], payment[:, None], np.maximum(t[None, :] - window, 0)),
+    )
+    opening = balances[:, :-1]
+    scheduled = payment[:, None] + extra[:, None] * (t[None, :-1] < window)
+    paid = np.where(opening > 0, np.minimum(scheduled, opening * (1 + monthly_rate[:, None])), 0.0)
+
+    # PMI until the balance reaches 80% of the value, as Mortgage.pmi_schedule;
+    # with a credit score each month is priced from its opening LTV band
+    active = opening > PMI_LTV_THRESHOLD / 100 * value[:, None]
+    if credit_score is None:
+        pmi_paid = np.where(active, pmi[:, None], 0.0)
+    else:
+        rate = DEFAULT_PMI_TABLE.annual_rate(opening / value[:, None] * 100, credit_score)
+        pmi_paid = np.where(active & (pmi[:, None] > 0), opening * rate / 12, 0.0)
+    return balances, paid + pmi_paid
+
+
+def _evaluate_batch(fixed: dict, batch: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    rows = len(batch["rate"])
+    months = int(max(fixed["cur_periods"], fixed["new_periods"]))
+    ones = np.ones(rows)
+
+    # Current loan does not depend on the scenario drivers
+    cur_balances, cur_paid = _loan_arrays(
+        fixed["cur_balance"] * ones,
+        monthly_rate_from_annual(fixed["cur_rate"]) * ones,
+        fixed["cur_periods"] * ones,
+        fixed["cur_extra"] * ones,
+        fixed["cur_prepay"] * ones,
+        fixed["cur_pmi"] * ones,
+        fixed["cur_credit_score"],
+        fixed["cur_value"] * ones,
+        months,
+    )
+    new_balances, new_paid = _loan_arrays(
+        fixed["new_loan"] * ones,
+        monthly_rate_from_annual(batch["rate"]),
+        fixed["new_periods"] * ones,
+        fixed["new_extra"] * ones,
+        fixed["new_prepay"] * ones,
+        fixed["new_pmi"] * ones,
+        fixed["new_credit_score"],
+        fixed["new_value"] * ones,
+        months,
+    )
+
+    cur_payments = cur_paid + escrow_payment_matrix(
+        fixed["cur_tax"] * ones, fixed["cur_ins"] * ones, months, batch["tax_growth"], batch["ins_growth"],
+        initial_shortage_pmt=fixed["cur_shortage"],
+    )
+    new_payments = new_paid + escrow_payment_matrix(
+        fixed["new_tax"] * ones, fixed["new_ins"] * ones, months, batch["tax_growth"], batch["ins_growth"],
+        initial_shortage_pmt=fixed["new_shortage"],
+    )
+    savings = cur_payments - new_payments
+    cumulative = np.cumsum(savings, axis=1)
+
+    # Cash needed (negative) or freed (positive) by switching today
+    if fixed["is_refinance"]:
+        closing = fixed["new_loan"] * batch["closing_cost_pct"]
+    else:
+        closing = fixed["new_value"] * batch["closing_cost_pct"]
+    closing = np.maximum(closing + fixed["new_loan"] * batch["points"] / 100, 0.0)
+
+    if fixed["is_refinance"]:
+        cash_at_start = fixed["cash_out"] - closing
+    else:
+        cur_equity_now = fixed["cur_value"] - fixed["cur_balance"]
+        cash_at_start = cur_equity_now - fixed["down_payment"] - closing
+
+    recovered = cumulative + cash_at_start[:, None] >= 0
+    breakeven = np.where(
+        cash_at_start >= 0,
+        0.0,
+        np.where(recovered.any(axis=1), np.argmax(recovered, axis=1) + 1.0, np.nan),
+    )
+
+    # Net benefit at the end of each row's holding period
+    horizon = np.clip(np.rint(batch["holding_years"] * 12).astype(int), 1, months)
+    row = np.arange(rows)
+    growth = (1 + batch["appreciation"]) ** (horizon / 12)
+    equity_gap = (
+        (fixed["new_value"] * growth - new_balances[row, horizon])
+        - (fixed["cur_value"] * growth - cur_balances[row, horizon])
+    )
+    net_benefit = cash_at_start + cumulative[row, horizon - 1] + equity_gap
+
+    return {
+        "monthly_savings": savings[:, 0],
+        "breakeven_months": breakeven,
+        "net_benefit": net_benefit,
+    }
+
+
+@profiled()
+def evaluate_comparisons(
+    fixed: dict,
+    batch: Dict[str, Iterable[float]],
+    max_workers: Optional[int] = None,
+) -> pd.DataFrame:
+    """
+    Evaluate every row of a driver batch with vectorized passes of up to
+    BATCH_CHUNK_ROWS rows; multiple chunks are spread across a process pool.
+
+    Args:
+        fixed: Fixed loan terms from comparison_inputs
+        batch: One array per driver in SENSITIVITY_DRIVERS, all the same length
+        max_workers: Worker processes for large batches (1 keeps everything in-process)
+
+    Returns:
+        pandas.DataFrame: Driver columns followed by SENSITIVITY_OUTPUTS
+    """
+    missing = [name for name in SENSITIVITY_DRIVERS if name not in batch]
+    if missing:
+        raise ValueError(f"Sensitivity batch is missing drivers: {', '.join(missing)}")
+
+    batch = {name: np.asarray(batch[name], dtype=float) for name in SENSITIVITY_DRIVERS}
+    rows = len(batch["rate"])
+    if any(len(values) != rows for values in batch.values()):
+        raise ValueError("Sensitivity drivers must all have the same number of rows")
+    if (batch["rate"] < 0).any():
+        raise ValueError("Rates cannot be negative")
+    if (batch["holding_years"] <= 0).any():
+        raise ValueError("Holding periods must be positive")
+
+    starts = range(0, rows, BATCH_CHUNK_ROWS)
+    chunks = [{k: v[lo:lo + BATCH_CHUNK_ROWS] for k, v in batch.items()} for lo in starts]
+
+    workers = min(max_workers or os.cpu_count() or 1, len(chunks))
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = list(pool.map(_evaluate_batch, itertools.repeat(fixed, len(chunks)), chunks))
+    else:
+        parts = [_evaluate_batch(fixed, chunk) for chunk in chunks]
+    outputs = {name: np.concatenate([p[name] for p in parts]) for name in SENSITIVITY_OUTPUTS}
+
+    return pd.DataFrame({**batch, **outputs})
+
+
+def tornado_analysis(
+    current_mortgage,
+    scenario,
+    holding_years: int = 7,
+    swings: Optional[dict] = None,
+    base_overrides: Optional[dict] = None,
+) -> pd.DataFrame:
+    """
+    Swing each driver to a low and a high value, one at a time, and measure
+    how far every output moves. All cases are evaluated in a single batch.
+
+    Args:
+        current_mortgage: CurrentMortgage object
+        scenario: NewMortgageScenario or RefinanceScenario object
+        holding_years: Base holding period in years
+        swings: Distance from base for each driver (defaults to DEFAULT_SWINGS)
+        base_overrides: Replace base driver values (e.g. {"appreciation": 0.04})
+
+    Returns:
+        pandas.DataFrame: One row per (driver, output) with base, low and high
+                          inputs and outputs plus the swing, widest swing first
+    """
+    base, fixed = comparison_inputs(current_mortgage, scenario, holding_years)
+    base.update(base_overrides or {})
+    swings = {**DEFAULT_SWINGS, **(swings or {})}
+
+    # Row 0 is the base case, then a low and a high row per driver
+    cases = [dict(base)]
+    ranges = {}
+    for name in SENSITIVITY_DRIVERS:
+        low = base[name] - swings[name]
+        high = base[name] + swings[name]
+        if name == "rate":
+            low = max(low, 0.0)
+        elif name == "points":
+            low, high = max(low, -5.0), min(high, 5.0)
+        elif name == "closing_cost_pct":
+            low = max(low, 0.0)
+        elif name == "holding_years":
+            low = max(low, 1)
+        ranges[name] = (low, high)
+        cases.append({**base, name: low})
+        cases.append({**base, name: high})
+
+    batch = {name: [case[name] for case in cases] for name in SENSITIVITY_DRIVERS}
+    results = evaluate_comparisons(fixed, batch, max_workers=1)
+
+    records = []
+    for i, name in enumerate(SENSITIVITY_DRIVERS):
+        low_row, high_row = results.iloc[1 + 2 * i], results.iloc[2 + 2 * i]
+        for output in SENSITIVITY_OUTPUTS:
+            records.append({
+                "driver": name,
+                "output": output,
+                "base_input": base[name],
+                "low_input": ranges[name][0],
+                "high_input": ranges[name][1],
+                "base_output": results[output].iloc[0],
+                "low_output": low_row[output],
+                "high_output": high_row[output],
+            })
+
+    tornado = pd.DataFrame(records)
+    tornado["swing"] = (tornado["high_output"] - tornado["low_output"]).abs()
+    return tornado.sort_values(["output", "swing"], ascending=[True, False], na_position="last").reset_index(drop=True)
+
+
+def sensitivity_grid(
+    current_mortgage,
+    scenario,
+    grid: Dict[str, Iterable[float]],
+    holding_years: int = 7,
+    max_workers: Optional[int] = None,
+) -> pd.DataFrame:
+    """
+    Evaluate every combination of the given driver values; drivers not in the
+    grid stay at their base values. Large grids fan out across processes.
+
+    Args:
+        current_mortgage: CurrentMortgage object
+        scenario: NewMortgageScenario or RefinanceScenario object
+        grid: Values to try for each varied driver
+        holding_years: Base holding period in years
+        max_workers: Worker processes for large grids
+
+    Returns:
+        pandas.DataFrame: One row per combination with driver and output columns
+    """
+    unknown = [name for name in grid if name not in SENSITIVITY_DRIVERS]
+    if unknown:
+        raise ValueError(f"Unknown sensitivity drivers: {', '.join(unknown)}")
+
+    base, fixed = comparison_inputs(current_mortgage, scenario, holding_years)
+    names = list(grid)
+    mesh = np.meshgrid(*[np.asarray(list(grid[name]), dtype=float) for name in names], indexing="ij")
+
+    rows = mesh[0].size if mesh else 1
+    batch = {name: np.full(rows, float(base[name])) for name in SENSITIVITY_DRIVERS}
+    for name, values in zip(names, mesh):
+        batch[name] = values.ravel()
+
+    return evaluate_comparisons(fixed, batch, max_workers=max_workers)
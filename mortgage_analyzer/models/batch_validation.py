@@ -0,0 +1,240 @@
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from mortgage_analyzer.engines.date_engine import DATE_FORMAT
+from mortgage_analyzer.utils.profiling_utils import profiled
+
+########################################################
+"""
+Batch validation documentation:
+
+Checks a whole loan tape (one row per loan, one column per field) against
+the same rules the Mortgage dataclass validators (_set_*) enforce, one array
+comparison per rule instead of one object per row. Every failing rule is
+reported, not just the first, so a tape can be fixed in one pass and the
+valid rows handed straight to the batch engines (LoanPool.from_report,
+quote_payments, ...).
+
+Columns are the dataclass fields without their leading underscore
+(rate, years, tax, ...). Optional fields may be left out or blank and take
+the dataclass defaults; blank credit_score and downpayment columns mean
+None, as they do on the classes. Messages are the validators' own, so a row
+reported here fails the object build with the same message.
+
+Kinds follow the session scenario kinds:
+    current - CurrentMortgage
+    new - NewMortgageScenario
+    refinance - RefinanceScenario
+
+    functions:
+        validate_tape - ValidationReport for a loan tape
+
+"""
+
+# (field, message, failing-rows test over the tape's column arrays), in validator order
+Rule = Tuple[str, str, Callable[[Dict[str, np.ndarray]], np.ndarray]]
+
+MORTGAGE_RULES: List[Rule] = [
+    ("rate", "Interest rate must be positive", lambda c: c["rate"] <= 0),
+    ("rate", "Interest rate is unreasonably high (>25%)", lambda c: c["rate"] > 25),
+    ("years", "Loan term must be positive", lambda c: c["years"] <= 0),
+    ("years", "Loan term exceeds 50 years", lambda c: c["years"] > 50),
+    ("tax", "Property tax cannot be negative", lambda c: c["tax"] < 0),
+    ("ins", "Insurance cannot be negative", lambda c: c["ins"] < 0),
+    ("sqft", "Square footage must be positive", lambda c: c["sqft"] <= 0),
+    ("extra_principal", "Extra principal payment cannot be negative", lambda c: c["extra_principal"] < 0),
+    ("prepay_periods", "Prepay periods cannot be negative", lambda c: c["prepay_periods"] < 0),
+]
+
+CURRENT_RULES: List[Rule] = [
+    ("original_loan", "Original loan amount must be positive", lambda c: c["original_loan"] <= 0),
+    ("loan_amount", "Current loan amount cannot be negative", lambda c: c["loan_amount"] < 0),
+    ("loan_amount", "Current loan amount cannot exceed original loan", lambda c: c["loan_amount"] > c["original_loan"]),
+    ("price_per_sqft", "Price per square foot must be positive", lambda c: c["price_per_sqft"] <= 0),
+    ("monthly_pmi", "Monthly PMI cannot be negative", lambda c: c["monthly_pmi"] < 0),
+    ("total_pmt", "Total payment must be positive", lambda c: c["total_pmt"] <= 0),
+]
+
+_PMI_AND_POINTS_RULES: List[Rule] = [
+    ("pmi_rate", "PMI rate cannot be negative", lambda c: c["pmi_rate"] < 0),
+    ("pmi_rate", "PMI rate is unreasonably high (>5%)", lambda c: c["pmi_rate"] > 0.05),
+    ("discount_points", "Lender credit is unreasonably high (>5 points)", lambda c: c["discount_points"] < -5),
+    ("discount_points", "Discount points are unreasonably high (>5 points)", lambda c: c["discount_points"] > 5),
+    (
+        "credit_score",
+        "Credit score must be between 300 and 850",
+        lambda c: ~np.isnan(c["credit_score"]) & ((c["credit_score"] < 300) | (c["credit_score"] > 850)),
+    ),
+]
+
+NEW_RULES: List[Rule] = [
+    ("price", "Price must be positive", lambda c: c["price"] <= 0),
+    *_PMI_AND_POINTS_RULES,
+    # Percent takes precedence; the amount is only checked when no percent is given
+    ("downpayment_percent", "Downpayment percentage cannot be negative", lambda c: c["downpayment_percent"] < 0),
+    ("downpayment_percent", "Downpayment percentage cannot exceed 100%", lambda c: c["downpayment_percent"] > 1),
+    (
+        "downpayment_amount",
+        "Downpayment amount cannot be negative",
+        lambda c: np.isnan(c["downpayment_percent"]) & (c["downpayment_amount"] < 0),
+    ),
+    (
+        "downpayment_amount",
+        "Downpayment amount cannot exceed price",
+        lambda c: np.isnan(c["downpayment_percent"]) & (c["downpayment_amount"] > c["price"]),
+    ),
+]
+
+REFINANCE_RULES: List[Rule] = [
+    ("current_loan_balance", "Current loan balance cannot be negative", lambda c: c["current_loan_balance"] < 0),
+    ("current_property_value", "Current property value must be positive", lambda c: c["current_property_value"] <= 0),
+    ("cash_out_amount", "Cash out amount cannot be negative", lambda c: c["cash_out_amount"] < 0),
+    ("closing_cost_percentage", "Closing cost percentage cannot be negative", lambda c: c["closing_cost_percentage"] < 0),
+    (
+        "closing_cost_percentage",
+        "Closing cost percentage is unreasonably high (>10%)",
+        lambda c: c["closing_cost_percentage"] > 0.1,
+    ),
+    *_PMI_AND_POINTS_RULES,
+]
+
+# Required columns, and optional columns with their dataclass defaults (NaN = None)
+_MORTGAGE_COLUMNS = (["rate", "years", "tax", "ins", "sqft"], {"extra_principal": 0.0, "prepay_periods": 0})
+
+TAPE_SCHEMAS = {
+    "current": (
+        _MORTGAGE_COLUMNS[0] + ["original_loan", "loan_amount", "start_date", "price_per_sqft", "monthly_pmi", "total_pmt"],
+        dict(_MORTGAGE_COLUMNS[1]),
+        MORTGAGE_RULES + CURRENT_RULES,
+    ),
+    "new": (
+        _MORTGAGE_COLUMNS[0] + ["price"],
+        {
+            **_MORTGAGE_COLUMNS[1],
+            "downpayment_percent": np.nan,
+            "downpayment_amount": np.nan,
+            "pmi_rate": 0.005,
+            "discount_points": 0.0,
+            "credit_score": np.nan,
+        },
+        MORTGAGE_RULES + NEW_RULES,
+    ),
+    "refinance": (
+        _MORTGAGE_COLUMNS[0] + ["current_loan_balance", "current_property_value"],
+        {
+            **_MORTGAGE_COLUMNS[1],
+            "cash_out_amount": 0.0,
+            "pmi_rate": 0.005,
+            "closing_cost_percentage": 0.025,
+            "discount_points": 0.0,
+            "credit_score": np.nan,
+        },
+        MORTGAGE_RULES + REFINANCE_RULES,
+    ),
+}
+
+ERROR_COLUMNS = ["row", "field", "message"]
+
+
+@dataclass
+class ValidationReport:
+    """
+    Outcome of validate_tape.
+
+    kind - scenario kind the tape was checked as
+    rows - the tape with optional columns filled in and numbers parsed
+    valid - True for each row that passes every rule
+    errors - one row per failure: tape row label, field and validator message
+    """
+
+    kind: str
+    rows: pd.DataFrame
+    valid: np.ndarray
+    errors: pd.DataFrame
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    @property
+    def valid_rows(self) -> pd.DataFrame:
+        return self.rows[self.valid]
+
+    @property
+    def invalid_rows(self) -> pd.DataFrame:
+        return self.rows[~self.valid]
+
+    def summary(self) -> pd.DataFrame:
+        """Number of rows failing each rule, most common first"""
+        counts = self.errors.groupby(["field", "message"], sort=False).size()
+        return counts.sort_values(ascending=False, kind="stable").rename("rows").reset_index()
+
+
+@profiled()
+def validate_tape(tape: pd.DataFrame, kind: str) -> ValidationReport:
+    """
+    Validate every row of a loan tape against the scenario class's field rules.
+
+    Args:
+        tape: One row per loan, columns named after the dataclass fields
+        kind: "current", "new" or "refinance"
+
+    Returns:
+        ValidationReport
+    """
+    if kind not in TAPE_SCHEMAS:
+        raise ValueError(f"Unknown scenario kind: {kind}")
+    required, defaults, rules = TAPE_SCHEMAS[kind]
+
+    missing = [column for column in required if column not in tape]
+    if missing:
+        raise ValueError(f"Loan tape is missing columns: {', '.join(missing)}")
+
+    rows = tape.copy()
+    failures = []
+
+    def fail(field: str, message: str, mask: np.ndarray):
+        failures.append((np.flatnonzero(mask), field, message))
+
+    # Numbers are parsed column-wise; blanks and text in required columns are errors,
+    # optional columns take their default only where the cell is blank or absent
+    columns = {}
+    for column in required + list(defaults):
+        if column == "start_date":
+            continue
+        if column in rows:
+            values = pd.to_numeric(rows[column], errors="coerce").to_numpy(dtype=float)
+            blank = rows[column].isna().to_numpy()
+            if rows[column].dtype == object:
+                blank = blank | rows[column].astype(str).str.strip().eq("").to_numpy()
+        else:
+            values = np.full(len(rows), np.nan)
+            blank = np.ones(len(rows), dtype=bool)
+        if column in defaults:
+            fail(column, f"{column} is not a number", np.isnan(values) & ~blank)
+            if not np.isnan(defaults[column]):
+                values = np.where(blank, defaults[column], values)
+        else:
+            fail(column, f"{column} is missing or not a number", np.isnan(values))
+        rows[column] = columns[column] = values
+
+    if "start_date" in required:
+        parsed = pd.to_datetime(rows["start_date"].astype(str), format=DATE_FORMAT, errors="coerce")
+        fail("start_date", "Start date must be in format 'MM/DD/YYYY'", parsed.isna().to_numpy())
+
+    for field, message, test in rules:
+        fail(field, message, test(columns))
+
+    positions = np.concatenate([position for position, _, _ in failures] + [np.empty(0, dtype=np.int64)])
+    order = np.argsort(positions, kind="stable")
+    errors = pd.DataFrame({
+        "row": rows.index.to_numpy()[positions[order]],
+        "field": np.repeat([field for _, field, _ in failures], [len(p) for p, _, _ in failures])[order],
+        "message": np.repeat([message for _, _, message in failures], [len(p) for p, _, _ in failures])[order],
+    }, columns=ERROR_COLUMNS)
+
+    valid = np.ones(len(rows), dtype=bool)
+    valid[positions] = False
+    return ValidationReport(kind=kind, rows=rows, valid=valid, errors=errors)
@@ -1,12 +1,22 @@
-import math
+import functools
+import hashlib
+import operator
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from datetime import datetime as dt
-from typing import Optional
+from numbers import Real
+from typing import ClassVar, Optional
 
+import numpy as np
 import pandas as pd
 from dateutil.relativedelta import relativedelta
 
+from mortgage_analyzer.engines.amortization_engine import exact_cents_schedule
+from mortgage_analyzer.engines.date_engine import as_days, loan_age_months, payment_dates, remaining_months, today
+from mortgage_analyzer.engines.loop_kernels import amortization_arrays, balance_after_months, months_until_balance
+from mortgage_analyzer.engines.pmi_engine import DEFAULT_PMI_TABLE, pmi_payment_schedule
+from mortgage_analyzer.utils.profiling_utils import profiled
+
 ########################################################
 """
 Mortgage dataclass documentation: 
@@ -14,6 +24,12 @@ Mortgage dataclass documentation:
 Abstract mortgage dataclass to house the CurrentMortgage class
 and NewMortgageScenario dataclasses for comparisons.
 
+Scenarios are frozen, slotted value objects: each field is checked by its
+_set_* validator while the object is built and never changes afterwards.
+Variants are derived with with_changes (or with_rate, ...), which shares the
+unchanged fields and validates only what changed, and equal scenarios
+hash alike in every process, so caches can key on the objects themselves.
+
 Properties:
     rate - interest rate on mortgage (as a percentage, e.g. 4.5 for 4.5%),
     years - years on loan term,
@@ -29,6 +45,8 @@ Properties:
     optional:
         extra_principal - amount of monthly extra principal you are paying
         prepay_periods - number of periods you expect to pay the extra principal
+        exact_cents - build schedules in integer cents with interest rounded each
+                      month and a final-payment true-up, matching servicer statements
 
     methods:
         price - house price (calc'd or given based on subclass),
@@ -36,13 +54,26 @@ Properties:
         monthly_pmi - amount of pmi paid monthly (calc'd or given based on subclass),
         periods_remaining - number of periods based on loan term or remaining term,
         end_date - calc'd from start_date and years or now() and years
+        payment_anchor - (date, first payment number) the schedule's payments are dated from
+        payment_dates - due date of each scheduled payment as datetime64[D]
         amortization_schedule - create a pandas dataframe of an amortization schedule
+        pmi_schedule - pmi paid each period of the amortization schedule, zero from the removal month on
         estimate_equity_at_year - estimate equity after a certain number of years (assumed appreciation = 3%)
+        stable_hash - hash of the type and field values, the same in every process (used by hash())
+        with_changes - copy with some fields changed (with_rate, with_years, with_extra_principal)
 
 """
 
 
-@dataclass
+@functools.lru_cache(maxsize=None)
+def _init_fields(cls) -> tuple:
+    # Names of a scenario class's init fields, a getter for all of their values
+    # and their slot setters (writing slots directly skips the frozen __setattr__)
+    names = tuple(f.name for f in fields(cls) if f.init)
+    return names, operator.attrgetter(*names), tuple(getattr(cls, name).__set__ for name in names)
+
+
+@dataclass(frozen=True, slots=True)
 class Mortgage(ABC):
     _rate: float = field(repr=True)
     _years: int = field(repr=True)
@@ -51,6 +82,12 @@ class Mortgage(ABC):
     _sqft: int = field(repr=True)
     _extra_principal: Optional[float] = field(default=0.0, repr=True)  # optional
     _prepay_periods: Optional[int] = field(default=0, repr=True)  # optional
+    _exact_cents: bool = field(default=False, repr=True)  # optional
+    # Content hash, filled in on first use (see stable_hash)
+    _stable_hash: Optional[int] = field(default=None, init=False, repr=False, compare=False)
+
+    # Fields whose validation reads another field: changed field -> fields re-validated with it
+    _DEPENDENT_FIELDS: ClassVar[dict] = {}
 
     def __post_init__(self):
         # Store initial values
@@ -61,69 +98,132 @@ class Mortgage(ABC):
         sqft = self._sqft
         extra_principal = self._extra_principal
         prepay_periods = self._prepay_periods
+        exact_cents = self._exact_cents
+
+        # Apply validation through the field validators
+        self._set_rate(rate)
+        self._set_years(years)
+        self._set_tax(tax)
+        self._set_ins(ins)
+        self._set_sqft(sqft)
+        self._set_extra_principal(extra_principal)
+        self._set_prepay_periods(prepay_periods)
+        self._set_exact_cents(exact_cents)
+
+    def _assign(self, name: str, value):
+        # Scenarios are frozen; fields are only written while one is being built
+        object.__setattr__(self, name, value)
+
+    @property
+    def stable_hash(self) -> int:
+        """
+        Hash of the scenario's type and field values that is the same in every
+        process (unlike hash() of strings), so caches and worker processes can
+        key on it. Numbers are compared as floats, matching ==.
+        """
+        if self._stable_hash is None:
+            values = (type(self).__name__,) + tuple(
+                float(value) if isinstance(value, Real) and not isinstance(value, bool) else value
+                for value in (getattr(self, f.name) for f in fields(self) if f.compare)
+            )
+            digest = hashlib.blake2b(repr(values).encode(), digest_size=8).digest()
+            self._assign("_stable_hash", int.from_bytes(digest, "big", signed=True))
+        return self._stable_hash
+
+    def __hash__(self) -> int:
+        return self.stable_hash
 
-        # Apply validation through setters
-        self.rate = rate
-        self.years = years
-        self.tax = tax
-        self.ins = ins
-        self.sqft = sqft
-        self.extra_principal = extra_principal
-        self.prepay_periods = prepay_periods
+    def with_changes(self, **changes) -> "Mortgage":
+        """
+        Copy of the scenario with some fields changed, e.g. with_changes(rate=5.5).
+        Unchanged fields are shared with this scenario and only the changed
+        fields (and any whose rules read them) are validated again.
+
+        Args:
+            **changes: New values by field name without the leading underscore
+
+        Returns:
+            Mortgage: A new scenario of the same type
+        """
+        field_names, field_values, field_setters = _init_fields(type(self))
+        changes = {f"_{name}": value for name, value in changes.items()}
+        unknown = [name for name in changes if name not in field_names]
+        if unknown:
+            raise TypeError(f"{type(self).__name__} has no fields {', '.join(sorted(n[1:] for n in unknown))}")
+
+        derived = object.__new__(type(self))
+        for set_field, value in zip(field_setters, field_values(self)):
+            set_field(derived, value)
+        derived._assign("_stable_hash", None)
+
+        # Validate in field order, like __post_init__
+        revalidate = set(changes)
+        for name in changes:
+            revalidate.update(self._DEPENDENT_FIELDS.get(name, ()))
+        for name in field_names:
+            if name in revalidate:
+                getattr(derived, f"_set{name}")(changes.get(name, getattr(derived, name)))
+        return derived
+
+    def with_rate(self, rate: float) -> "Mortgage":
+        return self.with_changes(rate=rate)
+
+    def with_years(self, years: int) -> "Mortgage":
+        return self.with_changes(years=years)
+
+    def with_extra_principal(self, extra_principal: float, prepay_periods: Optional[int] = None) -> "Mortgage":
+        if prepay_periods is None:
+            return self.with_changes(extra_principal=extra_principal)
+        return self.with_changes(extra_principal=extra_principal, prepay_periods=prepay_periods)
 
     @property
     def rate(self) -> float:
         return self._rate
 
-    @rate.setter
-    def rate(self, value: float):
+    def _set_rate(self, value: float):
         if value <= 0:
             raise ValueError("Interest rate must be positive")
         if value > 25:
             raise ValueError("Interest rate is unreasonably high (>25%)")
-        self._rate = value
+        self._assign("_rate", value)
 
     @property
     def years(self) -> int:
         return self._years
 
-    @years.setter
-    def years(self, value: int):
+    def _set_years(self, value: int):
         if value <= 0:
             raise ValueError("Loan term must be positive")
         if value > 50:
             raise ValueError("Loan term exceeds 50 years")
-        self._years = value
+        self._assign("_years", value)
 
     @property
     def tax(self) -> float:
         return self._tax
 
-    @tax.setter
-    def tax(self, value: float):
+    def _set_tax(self, value: float):
         if value < 0:
             raise ValueError("Property tax cannot be negative")
-        self._tax = value
+        self._assign("_tax", value)
 
     @property
     def ins(self) -> float:
         return self._ins
 
-    @ins.setter
-    def ins(self, value: float):
+    def _set_ins(self, value: float):
         if value < 0:
             raise ValueError("Insurance cannot be negative")
-        self._ins = value
+        self._assign("_ins", value)
 
     @property
     def sqft(self) -> int:
         return self._sqft
 
-    @sqft.setter
-    def sqft(self, value: int):
+    def _set_sqft(self, value: int):
         if value <= 0:
             raise ValueError("Square footage must be positive")
-        self._sqft = value
+        self._assign("_sqft", value)
 
     @property
     def monthly_tax(self) -> float:
@@ -141,37 +241,56 @@ class Mortgage(ABC):
     def extra_principal(self) -> float:
         return self._extra_principal
 
-    @extra_principal.setter
-    def extra_principal(self, value: float):
+    def _set_extra_principal(self, value: float):
         if value < 0:
             raise ValueError("Extra principal payment cannot be negative")
-        self._extra_principal = value
+        self._assign("_extra_principal", value)
 
     @property
     def prepay_periods(self) -> int:
         return self._prepay_periods
 
-    @prepay_periods.setter
-    def prepay_periods(self, value: int):
+    def _set_prepay_periods(self, value: int):
         if value < 0:
             raise ValueError("Prepay periods cannot be negative")
-        self._prepay_periods = value
+        self._assign("_prepay_periods", value)
+
+    @property
+    def exact_cents(self) -> bool:
+        return self._exact_cents
+
+    def _set_exact_cents(self, value: bool):
+        # Stored as a real bool so values read back from storage (0/1) compare equal
+        self._assign("_exact_cents", bool(value))
 
     @property
     def monthly_interest(self) -> float:
         return self.rate / 100 / 12
 
     @property
+    @profiled()
     def principal_and_interest(self) -> float:
         if self.monthly_interest == 0:
             return self.loan_amount / self.periods_remaining
 
-        # calculate principal_and_interest
-        return self.loan_amount * (
-            self.monthly_interest
-            * (1 + self.monthly_interest) ** self.periods_remaining
-            / ((1 + self.monthly_interest) ** self.periods_remaining - 1)
-        )
+        # calculate principal_and_interest (growth factor computed once)
+        growth = (1 + self.monthly_interest) ** self.periods_remaining
+        return self.loan_amount * (self.monthly_interest * growth / (growth - 1))
+
+    @property
+    def payment_anchor(self) -> tuple:
+        # New loans make their first payment a month from today
+        return today(), 1
+
+    def payment_dates(self, periods: Optional[int] = None) -> np.ndarray:
+        """
+        Due dates of the scheduled payments (see date_engine.payment_dates).
+
+        Args:
+            periods: Number of payments to date (defaults to periods_remaining)
+        """
+        anchor, first = self.payment_anchor
+        return payment_dates(anchor, first, self.periods_remaining if periods is None else periods)
 
     """
     These abstract methods need to be implemented at the sub class level
@@ -205,48 +324,65 @@ class Mortgage(ABC):
 
     # Calculation methods
 
+    @profiled()
     def amortization_schedule(self) -> pd.DataFrame:
         """
         Create an amortization shcedule that can be used for visualizing loan
         payoff. Can be affected by extra pricinpal payments.
         """
-        schedule = []
-        remaining_balance = self.loan_amount
+        if self.exact_cents:
+            return self._exact_amortization_schedule()
+
+        # Extra principal is paid for prepay_periods months (0 = every month)
+        principal, interest, paydown, balance = amortization_arrays(
+            float(self.loan_amount),
+            self.monthly_interest,
+            self.principal_and_interest,
+            float(self.extra_principal),
+            int(self.periods_remaining),
+            int(self.prepay_periods),
+        )
 
-        for period in range(1, self.periods_remaining + 1):
-            if remaining_balance <= 0:
-                break
+        df = pd.DataFrame(
+            {
+                "month": np.arange(1, len(balance) + 1),
+                "payment": np.full(len(balance), self.principal_and_interest),
+                "principal": principal,
+                "interest": interest,
+                "principal_paydown": paydown,
+                "balance": balance,
+            }
+        )
 
-            interest_pmt = remaining_balance * self.monthly_interest
-            principal_pmt = min(
-                self.principal_and_interest - interest_pmt, remaining_balance
-            )
-            extra_principal = (
-                min(self.extra_principal, remaining_balance - principal_pmt)
-                if remaining_balance > principal_pmt
-                else 0
-            )
-            remaining_balance -= principal_pmt + extra_principal
-
-            schedule.append(
-                {
-                    "month": period,
-                    "payment": self.principal_and_interest,
-                    "principal": principal_pmt,
-                    "interest": interest_pmt,
-                    "principal_paydown": extra_principal,
-                    "balance": max(0, remaining_balance),
-                }
-            )
+        # Round monetary values to 2 decimal places
+        for col in df.columns:
+            df[col] = df[col].round(2)
 
-            df = pd.DataFrame(schedule)
+        df["date"] = self.payment_dates(len(df))
+        return df
 
-            # Round monetary values to 2 decimal places
-            for col in df.columns:
-                df[col] = df[col].round(2)
+    def _exact_amortization_schedule(self) -> pd.DataFrame:
+        """
+        Amortization schedule kept in integer cents (see exact_cents_schedule).
+        Same columns as amortization_schedule; the last payment is trued up.
+        """
+        cents = exact_cents_schedule(
+            self.loan_amount,
+            self.rate,
+            self.periods_remaining,
+            payment=self.principal_and_interest,
+            extra_principal=self.extra_principal,
+            prepay_periods=self.prepay_periods,
+        )
 
+        df = pd.DataFrame({"month": cents["month"]})
+        for col in ["payment", "principal", "interest", "principal_paydown", "balance"]:
+            df[col] = cents[col] / 100
+
+        df["date"] = self.payment_dates(len(df))
         return df
 
+    @profiled()
     def _calculate_remaining_balance_at_year(self, loan_year: int) -> float:
         """
         Helper method to calculate the remaining loan balance after a given number of years
@@ -258,22 +394,23 @@ class Mortgage(ABC):
         - Remaining balance in dollars
         """
 
-        remaining_balance = self.loan_amount
-
-        for month in range(loan_year * 12):
-            interest_pmt = remaining_balance * self.monthly_interest
-            principal_pmt = min(
-                self.principal_and_interest - interest_pmt, remaining_balance
-            )
-            extra_principal = (
-                min(self.extra_principal, remaining_balance - principal_pmt)
-                if remaining_balance > principal_pmt
-                else 0
-            )
-            remaining_balance -= principal_pmt + extra_principal
-
-        return max(0, remaining_balance)  # Ensure we don't return negative balance
+        if self.exact_cents:
+            balances = self.amortization_schedule()["balance"].to_numpy()
+            months = loan_year * 12
+            if months == 0:
+                return self.loan_amount
+            return float(balances[months - 1]) if months <= len(balances) else 0.0
+
+        return balance_after_months(
+            float(self.loan_amount),
+            self.monthly_interest,
+            self.principal_and_interest,
+            float(self.extra_principal),
+            int(loan_year * 12),
+            int(self.prepay_periods),
+        )
 
+    @profiled()
     def estimate_value_at_year(
         self, loan_year: int, annual_appreciation: float = 0.03
     ) -> float:
@@ -290,6 +427,7 @@ class Mortgage(ABC):
 
         return self.price * ((1 + annual_appreciation) ** loan_year)
 
+    @profiled()
     def estimate_equity_at_year(
         self, loan_year: int, annual_appreciation: float = 0.03
     ) -> float:
@@ -309,6 +447,7 @@ class Mortgage(ABC):
 
         return future_value - remaining_balance
     
+    @profiled()
     def pmi_periods_remaining(self) -> int:
         """
         Calculate how many months of PMI payments remain until reaching 80% LTV ratio.
@@ -321,36 +460,34 @@ class Mortgage(ABC):
         if self.loan_amount / self.price <= 0.8:
             return 0
             
-        # Start with current loan amount
-        current_balance = self.loan_amount
-        target_balance = self.price * 0.8  # 80% of property value is the threshold
-        periods = 0
-        
-        # Continue until reaching target balance or loan is paid off
-        while current_balance > target_balance and periods < self.periods_remaining:
-            # Calculate interest for this period
-            interest = current_balance * self.monthly_interest
-            
-            # Calculate principal payment
-            principal_payment = min(
-                self.principal_and_interest - interest, 
-                current_balance
-            )
-            
-            # Calculate any extra principal
-            extra_principal = (
-                min(self.extra_principal, current_balance - principal_payment)
-                if (current_balance > principal_payment and 
-                    (self.prepay_periods == 0 or periods < self.prepay_periods))
-                else 0
-            )
-            
-            # Update the current balance
-            current_balance -= (principal_payment + extra_principal)
-            periods += 1
-            
-        # Return the number of periods calculated (or 0 if we didn't reach the target)
-        return periods if current_balance <= target_balance else 0
+        # Months until the balance reaches 80% of property value
+        return int(months_until_balance(
+            float(self.loan_amount),
+            self.price * 0.8,
+            self.monthly_interest,
+            self.principal_and_interest,
+            float(self.extra_principal),
+            int(self.periods_remaining),
+            int(self.prepay_periods),
+        ))
+
+    @profiled()
+    def pmi_schedule(self) -> np.ndarray:
+        """
+        PMI paid each period of the amortization schedule, stopping at the
+        removal month. Priced at a flat monthly_pmi unless a subclass prices
+        it from a PMI table.
+
+        Returns:
+            numpy.ndarray: PMI per period, aligned with amortization_schedule rows
+        """
+        periods = len(self.amortization_schedule())
+        return self.monthly_pmi * (np.arange(periods) < self.pmi_periods_remaining())
+
+    def _opening_balances(self) -> np.ndarray:
+        # Balance at the start of each period of the amortization schedule
+        balances = self.amortization_schedule()["balance"].to_numpy()
+        return np.concatenate(([float(self.loan_amount)], balances[:-1]))[:len(balances)]
         
 
 
@@ -385,12 +522,13 @@ CurrentMortgage Class
 
     Calculated:
         loan_age_days - age of loan in days calculated using datetime functions,
-        periods_passed - convert loan_age_days to number of periods passed,
+        periods_passed - payments made since origination, counted in calendar months,
         end_date - date when mortgage is paid off based on start_date and years
         loan_begin_date - datetime object of the loan start date
         loan_end_date - datetime object of the loan end date
         days_remaining - number of days until the loan is paid off
         periods_remaining - number of payment periods remaining until the loan is paid off
+        payment_anchor - origination date and next payment number, for dating the schedule
         loan_to_value - ratio of current loan amount to property value
         equity_value - difference between property value and current loan amount
         monthly_escrow_shortage_pmt - amount of total_pmt allocated to recovering escrow deficit
@@ -398,8 +536,11 @@ CurrentMortgage Class
 """
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, frozen=True, slots=True)
 class CurrentMortgage(Mortgage):
+    # Keep the precomputed stable hash rather than a generated field-tuple hash
+    __hash__ = Mortgage.__hash__
+
     _original_loan: float = field(repr=True)
     _loan_amount: float = field(repr=True)
     _start_date: str = field(repr=True)
@@ -407,9 +548,11 @@ class CurrentMortgage(Mortgage):
     _monthly_pmi: float = field(repr=True)
     _total_pmt: float = field(repr=True)
 
+    _DEPENDENT_FIELDS: ClassVar[dict] = {"_original_loan": ("_loan_amount",)}
+
     def __post_init__(self):
         # Call parent validation
-        super().__post_init__()
+        Mortgage.__post_init__(self)
 
         # Store initial values
         original_loan = self._original_loan
@@ -419,78 +562,72 @@ class CurrentMortgage(Mortgage):
         monthly_pmi = self._monthly_pmi
         total_pmt = self._total_pmt
 
-        # Apply validation through setters
-        self.original_loan = original_loan
-        self.loan_amount = loan_amount
-        self.start_date = start_date
-        self.price_per_sqft = price_per_sqft
-        self.monthly_pmi = monthly_pmi
-        self.total_pmt = total_pmt
+        # Apply validation through the field validators
+        self._set_original_loan(original_loan)
+        self._set_loan_amount(loan_amount)
+        self._set_start_date(start_date)
+        self._set_price_per_sqft(price_per_sqft)
+        self._set_monthly_pmi(monthly_pmi)
+        self._set_total_pmt(total_pmt)
 
     @property
     def original_loan(self) -> float:
         return self._original_loan
 
-    @original_loan.setter
-    def original_loan(self, value: float):
+    def _set_original_loan(self, value: float):
         if value <= 0:
             raise ValueError("Original loan amount must be positive")
-        self._original_loan = value
+        self._assign("_original_loan", value)
 
     @property
     def loan_amount(self) -> float:
         return self._loan_amount
 
-    @loan_amount.setter
-    def loan_amount(self, value: float):
+    def _set_loan_amount(self, value: float):
         if value < 0:
             raise ValueError("Current loan amount cannot be negative")
         if value > self.original_loan:
             raise ValueError("Current loan amount cannot exceed original loan")
-        self._loan_amount = value
+        self._assign("_loan_amount", value)
 
     @property
     def start_date(self) -> str:
         return self._start_date
 
-    @start_date.setter
-    def start_date(self, value: str):
+    def _set_start_date(self, value: str):
         # Basic format validation
         try:
             dt.strptime(value, "%m/%d/%Y")
         except ValueError:
             raise ValueError("Start date must be in format 'MM/DD/YYYY'")
-        self._start_date = value
+        self._assign("_start_date", value)
 
     @property
     def price_per_sqft(self) -> float:
         return self._price_per_sqft
 
-    @price_per_sqft.setter
-    def price_per_sqft(self, value: float):
+    def _set_price_per_sqft(self, value: float):
         if value <= 0:
             raise ValueError("Price per square foot must be positive")
-        self._price_per_sqft = value
+        self._assign("_price_per_sqft", value)
 
     @property
     def monthly_pmi(self) -> float:
         return self._monthly_pmi
 
-    @monthly_pmi.setter
-    def monthly_pmi(self, value: float):
+    def _set_monthly_pmi(self, value: float):
         if value < 0:
             raise ValueError("Monthly PMI cannot be negative")
-        self._monthly_pmi = value
+        self._assign("_monthly_pmi", value)
 
     @property
     def total_pmt(self) -> float:
         return self._total_pmt
 
-    @total_pmt.setter
-    def total_pmt(self, value: float):
+    def _set_total_pmt(self, value: float):
         if value <= 0:
             raise ValueError("Total payment must be positive")
-        self._total_pmt = value
+        self._assign("_total_pmt", value)
 
     @property
     def price(self) -> float:
@@ -506,7 +643,7 @@ class CurrentMortgage(Mortgage):
 
     @property
     def periods_passed(self) -> int:
-        return math.ceil(self.loan_age_days / 30.4) - 1
+        return int(loan_age_months(self.start_date))
 
     @property
     def loan_end_date(self) -> dt:
@@ -521,8 +658,14 @@ class CurrentMortgage(Mortgage):
         return (self.loan_end_date - dt.now()).days
 
     @property
+    @profiled()
     def periods_remaining(self) -> int:
-        return math.ceil(self.days_remaining / 30.4) - 1
+        return int(remaining_months(self.start_date, self.total_periods))
+
+    @property
+    def payment_anchor(self) -> tuple:
+        # Payments fall on the origination day of the month; the next one is due after periods_passed
+        return as_days(self.start_date)[()], self.periods_passed + 1
 
     @property
     def loan_to_value(self) -> float:
@@ -566,99 +709,144 @@ Mortgage Abstract Class - inherited
 NewMortgageScenario Class
 ----------------------------------------
     price - given
+    discount_points - points paid (or lender credit if negative) as a percent of loan amount
+    credit_score - optional borrower credit score; when given, PMI is priced from the
+                   tiered PMI table (LTV band x credit score band) instead of pmi_rate
 
     calculated:
         downpayment_percent - percent of purchase price expected to pay down,
         downpayment_amount - dollar amount of downpayment,
-        monthly_pmi - calculated based on assumed rate and downpayment percent,
+        monthly_pmi - first month's pmi from the PMI table (with credit_score) or pmi_rate and downpayment percent,
         total_pmt - principal_and_interest + monthly_tax + monthly_ins + monthly_pmi + extra_principal
         price_per_sqft - calculated price / sqft
         loan_amount - calculated price - downpayment_amount
+        base_closing_costs - estimated closing costs before points (3% of price)
+        points_cost - dollar cost of discount points (negative for lender credits)
+        closing_costs - base_closing_costs + points_cost (never below zero)
 
 """
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, frozen=True, slots=True)
 class NewMortgageScenario(Mortgage):
+    # Keep the precomputed stable hash rather than a generated field-tuple hash
+    __hash__ = Mortgage.__hash__
+
     _price: float = field(repr=True)
     # allow either downpayment_percent or downpayment_amount to be provided
     _downpayment_percent: Optional[float] = field(default=None, repr=True)
     _downpayment_amount: Optional[float] = field(default=None, repr=True)
     _pmi_rate: float = field(default=0.005, repr=True)
+    _discount_points: float = field(default=0.0, repr=True)
+    _credit_score: Optional[int] = field(default=None, repr=True)
+
+    # A new price keeps the downpayment percentage (as in __post_init__)
+    _DEPENDENT_FIELDS: ClassVar[dict] = {"_price": ("_downpayment_percent",)}
 
     def __post_init__(self):
         # Call parent validation
-        super().__post_init__()
+        Mortgage.__post_init__(self)
 
         # Store initial values
         price = self._price
         downpayment_percent = self._downpayment_percent
         downpayment_amount = self._downpayment_amount
         pmi_rate = self._pmi_rate
+        discount_points = self._discount_points
+        credit_score = self._credit_score
 
-        # Apply validation through setters
-        self.price = price
-        self.pmi_rate = pmi_rate
+        # Apply validation through the field validators
+        self._set_price(price)
+        self._set_pmi_rate(pmi_rate)
+        self._set_discount_points(discount_points)
+        self._set_credit_score(credit_score)
 
         # Handle downpayment logic
         if downpayment_percent is None and downpayment_amount is None:
-            self._downpayment_percent = 0.2
-            self._downpayment_amount = self.price * 0.2
+            self._assign("_downpayment_percent", 0.2)
+            self._assign("_downpayment_amount", self.price * 0.2)
         elif downpayment_percent is not None and downpayment_amount is not None:
-            self.downpayment_percent = downpayment_percent
+            self._set_downpayment_percent(downpayment_percent)
             # Percent takes precedence, so amount will be calculated from it
         elif downpayment_percent is not None:
-            self.downpayment_percent = downpayment_percent
+            self._set_downpayment_percent(downpayment_percent)
         else:  # downpayment_amount is not None
-            self.downpayment_amount = downpayment_amount
+            self._set_downpayment_amount(downpayment_amount)
+
+    def with_changes(self, **changes) -> "NewMortgageScenario":
+        # Same downpayment precedence as __post_init__: a new percent wins over
+        # a new amount, which only applies when no percent is given
+        percent = changes.pop("downpayment_percent", None)
+        amount = changes.pop("downpayment_amount", None)
+        if percent is not None:
+            changes["downpayment_percent"] = percent
+        elif amount is not None:
+            changes["downpayment_amount"] = amount
+        return Mortgage.with_changes(self, **changes)
 
     @property
     def price(self) -> float:
         return self._price
 
-    @price.setter
-    def price(self, value: float):
+    def _set_price(self, value: float):
         if value <= 0:
             raise ValueError("Price must be positive")
-        self._price = value
+        self._assign("_price", value)
 
     @property
     def pmi_rate(self) -> float:
         return self._pmi_rate
 
-    @pmi_rate.setter
-    def pmi_rate(self, value: float):
+    def _set_pmi_rate(self, value: float):
         if value < 0:
             raise ValueError("PMI rate cannot be negative")
         if value > 0.05:  # 5% would be extremely high for PMI
             raise ValueError("PMI rate is unreasonably high (>5%)")
-        self._pmi_rate = value
+        self._assign("_pmi_rate", value)
+
+    @property
+    def credit_score(self) -> Optional[int]:
+        return self._credit_score
+
+    def _set_credit_score(self, value: Optional[int]):
+        if value is not None and not 300 <= value <= 850:
+            raise ValueError("Credit score must be between 300 and 850")
+        self._assign("_credit_score", None if value is None else int(value))
+
+    @property
+    def discount_points(self) -> float:
+        return self._discount_points
+
+    def _set_discount_points(self, value: float):
+        if value < -5:
+            raise ValueError("Lender credit is unreasonably high (>5 points)")
+        if value > 5:
+            raise ValueError("Discount points are unreasonably high (>5 points)")
+        self._assign("_discount_points", value)
 
     @property
     def downpayment_percent(self) -> float:
         return self._downpayment_percent
 
-    @downpayment_percent.setter
-    def downpayment_percent(self, value: float):
+    def _set_downpayment_percent(self, value: float):
         if value < 0:
             raise ValueError("Downpayment percentage cannot be negative")
         if value > 1:
             raise ValueError("Downpayment percentage cannot exceed 100%")
-        self._downpayment_percent = value
-        self._downpayment_amount = self.price * value
+        self._assign("_downpayment_percent", value)
+        self._assign("_downpayment_amount", self.price * value)
 
     @property
     def downpayment_amount(self) -> float:
         return self._downpayment_amount
 
-    @downpayment_amount.setter
-    def downpayment_amount(self, value: float):
+    def _set_downpayment_amount(self, value: float):
         if value < 0:
             raise ValueError("Downpayment amount cannot be negative")
         if value > self.price:
             raise ValueError("Downpayment amount cannot exceed price")
-        self._downpayment_amount = value
-        self._downpayment_percent = value / self.price
+        self._assign("_downpayment_amount", value)
+        self._assign("_downpayment_percent", value / self.price)
 
     @property
     def loan_amount(self) -> float:
@@ -668,9 +856,24 @@ class NewMortgageScenario(Mortgage):
     def monthly_pmi(self) -> float:
         if self.downpayment_percent >= 0.2:
             return 0.0
+        elif self.credit_score is not None:
+            # Priced from the PMI table at the starting LTV
+            return self.loan_amount * DEFAULT_PMI_TABLE.annual_rate(
+                self.loan_amount / self.price * 100, self.credit_score
+            ) / 12
         else:
             return self.loan_amount * self.pmi_rate / 12
 
+    @profiled()
+    def pmi_schedule(self) -> np.ndarray:
+        if self.credit_score is None or self.monthly_pmi == 0:
+            return Mortgage.pmi_schedule(self)
+
+        # Re-priced each month from the LTV band of the amortizing balance
+        return pmi_payment_schedule(
+            self._opening_balances(), self.price, self.credit_score, self.pmi_periods_remaining()
+        )
+
     @property
     def periods_remaining(self) -> int:
         return self.years * 12
@@ -696,8 +899,16 @@ class NewMortgageScenario(Mortgage):
         return end_date.strftime("%m/%d/%Y")
 
     @property
-    def closing_costs(self) -> float:
+    def base_closing_costs(self) -> float:
         return self.price * 0.03
+
+    @property
+    def points_cost(self) -> float:
+        return self.loan_amount * self.discount_points / 100
+
+    @property
+    def closing_costs(self) -> float:
+        return max(0, self.base_closing_costs + self.points_cost)
     
     @property
     def initial_investment(self) -> float:
@@ -728,31 +939,41 @@ RefinanceScenario Class
     current_loan_balance - current balance of existing mortgage,
     current_property_value - current estimated property value,
     cash_out_amount - additional cash to borrow (0 for rate-and-term refi),
+    discount_points - points paid (or lender credit if negative) as a percent of loan amount,
+    credit_score - optional borrower credit score; when given, PMI is priced from the
+                   tiered PMI table (LTV band x credit score band) instead of pmi_rate,
     
     calculated:
         loan_amount - current_loan_balance + cash_out_amount,
         loan_to_value - loan_amount / current_property_value,
         price - same as current_property_value (for compatibility),
-        monthly_pmi - calculated based on LTV ratio,
+        monthly_pmi - first month's pmi from the PMI table (with credit_score) or pmi_rate and LTV ratio,
         total_pmt - principal_and_interest + monthly_tax + monthly_ins + monthly_pmi + extra_principal,
         price_per_sqft - calculated from current_property_value / sqft,
-        closing_costs - estimated refinance closing costs (typically 2-3% of loan amount),
+        base_closing_costs - estimated refinance closing costs before points (typically 2-3% of loan amount),
+        points_cost - dollar cost of discount points (negative for lender credits),
+        closing_costs - base_closing_costs + points_cost (never below zero),
         net_cash_to_borrower - cash_out_amount minus closing_costs
 
 """
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, frozen=True, slots=True)
 class RefinanceScenario(Mortgage):
+    # Keep the precomputed stable hash rather than a generated field-tuple hash
+    __hash__ = Mortgage.__hash__
+
     _current_loan_balance: float = field(repr=True)
     _current_property_value: float = field(repr=True)
     _cash_out_amount: float = field(default=0.0, repr=True)
     _pmi_rate: float = field(default=0.005, repr=True)
     _closing_cost_percentage: float = field(default=0.025, repr=True)  # 2.5% default
+    _discount_points: float = field(default=0.0, repr=True)
+    _credit_score: Optional[int] = field(default=None, repr=True)
 
     def __post_init__(self):
         # Call parent validation
-        super().__post_init__()
+        Mortgage.__post_init__(self)
 
         # Store initial values
         current_loan_balance = self._current_loan_balance
@@ -760,67 +981,86 @@ class RefinanceScenario(Mortgage):
         cash_out_amount = self._cash_out_amount
         pmi_rate = self._pmi_rate
         closing_cost_percentage = self._closing_cost_percentage
-
-        # Apply validation through setters
-        self.current_loan_balance = current_loan_balance
-        self.current_property_value = current_property_value
-        self.cash_out_amount = cash_out_amount
-        self.pmi_rate = pmi_rate
-        self.closing_cost_percentage = closing_cost_percentage
+        discount_points = self._discount_points
+        credit_score = self._credit_score
+
+        # Apply validation through the field validators
+        self._set_current_loan_balance(current_loan_balance)
+        self._set_current_property_value(current_property_value)
+        self._set_cash_out_amount(cash_out_amount)
+        self._set_pmi_rate(pmi_rate)
+        self._set_closing_cost_percentage(closing_cost_percentage)
+        self._set_discount_points(discount_points)
+        self._set_credit_score(credit_score)
 
     @property
     def current_loan_balance(self) -> float:
         return self._current_loan_balance
 
-    @current_loan_balance.setter
-    def current_loan_balance(self, value: float):
+    def _set_current_loan_balance(self, value: float):
         if value < 0:
             raise ValueError("Current loan balance cannot be negative")
-        self._current_loan_balance = value
+        self._assign("_current_loan_balance", value)
 
     @property
     def current_property_value(self) -> float:
         return self._current_property_value
 
-    @current_property_value.setter
-    def current_property_value(self, value: float):
+    def _set_current_property_value(self, value: float):
         if value <= 0:
             raise ValueError("Current property value must be positive")
-        self._current_property_value = value
+        self._assign("_current_property_value", value)
 
     @property
     def cash_out_amount(self) -> float:
         return self._cash_out_amount
 
-    @cash_out_amount.setter
-    def cash_out_amount(self, value: float):
+    def _set_cash_out_amount(self, value: float):
         if value < 0:
             raise ValueError("Cash out amount cannot be negative")
-        self._cash_out_amount = value
+        self._assign("_cash_out_amount", value)
 
     @property
     def pmi_rate(self) -> float:
         return self._pmi_rate
 
-    @pmi_rate.setter
-    def pmi_rate(self, value: float):
+    def _set_pmi_rate(self, value: float):
         if value < 0:
             raise ValueError("PMI rate cannot be negative")
         if value > 0.05:  # 5% would be extremely high for PMI
             raise ValueError("PMI rate is unreasonably high (>5%)")
-        self._pmi_rate = value
+        self._assign("_pmi_rate", value)
+
+    @property
+    def credit_score(self) -> Optional[int]:
+        return self._credit_score
+
+    def _set_credit_score(self, value: Optional[int]):
+        if value is not None and not 300 <= value <= 850:
+            raise ValueError("Credit score must be between 300 and 850")
+        self._assign("_credit_score", None if value is None else int(value))
+
+    @property
+    def discount_points(self) -> float:
+        return self._discount_points
+
+    def _set_discount_points(self, value: float):
+        if value < -5:
+            raise ValueError("Lender credit is unreasonably high (>5 points)")
+        if value > 5:
+            raise ValueError("Discount points are unreasonably high (>5 points)")
+        self._assign("_discount_points", value)
 
     @property
     def closing_cost_percentage(self) -> float:
         return self._closing_cost_percentage
 
-    @closing_cost_percentage.setter
-    def closing_cost_percentage(self, value: float):
+    def _set_closing_cost_percentage(self, value: float):
         if value < 0:
             raise ValueError("Closing cost percentage cannot be negative")
         if value > 0.1:  # 10% would be extremely high for closing costs
             raise ValueError("Closing cost percentage is unreasonably high (>10%)")
-        self._closing_cost_percentage = value
+        self._assign("_closing_cost_percentage", value)
 
     @property
     def loan_amount(self) -> float:
@@ -838,9 +1078,24 @@ class RefinanceScenario(Mortgage):
     def monthly_pmi(self) -> float:
         if self.loan_to_value <= 0.8:
             return 0.0
+        elif self.credit_score is not None:
+            # Priced from the PMI table at the starting LTV
+            return self.loan_amount * DEFAULT_PMI_TABLE.annual_rate(
+                self.loan_to_value * 100, self.credit_score
+            ) / 12
         else:
             return self.loan_amount * self.pmi_rate / 12
 
+    @profiled()
+    def pmi_schedule(self) -> np.ndarray:
+        if self.credit_score is None or self.monthly_pmi == 0:
+            return Mortgage.pmi_schedule(self)
+
+        # Re-priced each month from the LTV band of the amortizing balance
+        return pmi_payment_schedule(
+            self._opening_balances(), self.price, self.credit_score, self.pmi_periods_remaining()
+        )
+
     @property
     def periods_remaining(self) -> int:
         return self.years * 12
@@ -866,9 +1121,17 @@ class RefinanceScenario(Mortgage):
         return end_date.strftime("%m/%d/%Y")
 
     @property
-    def closing_costs(self) -> float:
+    def base_closing_costs(self) -> float:
         return self.loan_amount * self.closing_cost_percentage
 
+    @property
+    def points_cost(self) -> float:
+        return self.loan_amount * self.discount_points / 100
+
+    @property
+    def closing_costs(self) -> float:
+        return max(0, self.base_closing_costs + self.points_cost)
+
     @property
     def net_cash_to_borrower(self) -> float:
         """Amount of cash borrower receives after closing costs"""
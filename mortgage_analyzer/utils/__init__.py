@@ -0,0 +1,11 @@
+import importlib
+
+
+def __getattr__(name):
+    # Import submodules on first attribute access
+    try:
+        return importlib.import_module(f"{__name__}.{name}")
+    except ModuleNotFoundError as e:
+        if e.name != f"{__name__}.{name}":
+            raise
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
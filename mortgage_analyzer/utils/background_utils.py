@@ -0,0 +1,114 @@
+import logging
+import threading
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Callable, List, Optional, Sequence, Tuple
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+
+Background jobs for speculative precompute.
+
+A job is an ordered list of (name, function, args) steps run on a small
+worker pool shared by every session. The steps are meant to be cached,
+side-effect free functions (st.cache_data results), so running one early
+just fills the cache the page will read from. Arguments are captured on
+the script thread when the job starts; steps never touch session state.
+
+Workers deliberately run without a Streamlit script run context (a
+cached call with one would draw its spinner on whatever page the session
+is showing), so Streamlit's "missing ScriptRunContext" warning is
+filtered out for worker threads.
+
+Python threads can't be interrupted, so cancel() stops a job before its
+next step (or before it starts, if it is still queued).
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+
+# Worker threads shared by every session
+BACKGROUND_WORKERS = 2
+WORKER_THREAD_PREFIX = "mortgage-precompute"
+
+# Logger Streamlit warns on when a cached function runs outside a script thread
+_SCRIPT_RUN_CONTEXT_LOGGER = "streamlit.runtime.scriptrunner_utils.script_run_context"
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+class _WorkerThreadFilter(logging.Filter):
+    def filter(self, record: logging.LogRecord) -> bool:
+        return not threading.current_thread().name.startswith(WORKER_THREAD_PREFIX)
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            logging.getLogger(_SCRIPT_RUN_CONTEXT_LOGGER).addFilter(_WorkerThreadFilter())
+            _executor = ThreadPoolExecutor(max_workers=BACKGROUND_WORKERS, thread_name_prefix=WORKER_THREAD_PREFIX)
+    return _executor
+
+
+class BackgroundJob:
+    """Ordered steps run on a worker thread"""
+
+    def __init__(self, steps: Sequence[Tuple[str, Callable, tuple]]):
+        self.steps = list(steps)
+        self.completed: List[str] = []
+        self.error: Optional[Exception] = None
+        self._cancelled = threading.Event()
+        self._future: Optional[Future] = None
+
+    def start(self) -> "BackgroundJob":
+        self._future = _get_executor().submit(self._run)
+        return self
+
+    def _run(self):
+        for name, func, args in self.steps:
+            if self._cancelled.is_set():
+                return
+            try:
+                func(*args)
+            except Exception as e:
+                # The page recomputes the step in the foreground and reports the error there
+                self.error = e
+                return
+            self.completed.append(name)
+
+    def cancel(self):
+        """Stop the job before its next step"""
+        self._cancelled.set()
+        if self._future is not None:
+            self._future.cancel()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    @property
+    def finished(self) -> bool:
+        return len(self.completed) == len(self.steps)
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for a job that is already running. A job still queued behind
+        other sessions' jobs is cancelled instead, since the caller can
+        compute the results itself sooner.
+
+        Args:
+            timeout: Seconds to wait at most (None waits until the job ends)
+
+        Returns:
+            bool: True if every step finished
+        """
+        if self._future is None or self.cancelled:
+            return self.finished
+        if not (self._future.running() or self._future.done()):
+            self.cancel()
+            return False
+
+        try:
+            self._future.result(timeout)
+        except (CancelledError, FutureTimeoutError):
+            return False
+        return self.finished
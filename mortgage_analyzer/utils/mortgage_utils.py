@@ -0,0 +1,563 @@
+import os
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from mortgage_analyzer.engines.date_engine import today
+from mortgage_analyzer.engines.escrow_engine import EscrowAssumptions
+from mortgage_analyzer.engines.schedule_diff_engine import AlignedSchedules
+from mortgage_analyzer.engines.rate_history_engine import (
+    DEFAULT_RATE_HISTORY_PATH,
+    RATE_HISTORY_ENV_VAR,
+    RateHistory,
+    load_rate_history,
+)
+from mortgage_analyzer.engines.refinance_backtest_engine import BacktestResult, RefinanceAssumptions, backtest_refinance
+from mortgage_analyzer.engines.rate_sheet_engine import RATE_SHEET_ENV_VAR, RateQuote, RateSheetIndex, load_rate_sheet
+from mortgage_analyzer.models.mortgage_classes import CurrentMortgage, NewMortgageScenario, RefinanceScenario
+from mortgage_analyzer.utils.background_utils import BackgroundJob
+from mortgage_analyzer.utils.profiling_utils import profiled, profile_block
+from mortgage_analyzer.utils.scenario_store import ScenarioStore
+from mortgage_analyzer.utils.session_utils import (
+    SCENARIO_SESSION_KEYS,
+    CurrentMortgageInputs,
+    NewMortgageInputs,
+    RefinanceInputs,
+    ScenarioInputs,
+    get_scenario
+)
+from mortgage_analyzer.visualizations import mortgage_charts
+from mortgage_analyzer.visualizations.chart_data import schedule_years
+
+###########################################################
+
+# Input records and calculations
+
+###########################################################
+
+def inputs_record(kind: str) -> ScenarioInputs:
+    """
+    Live input record for the given scenario kind, created with defaults on first use.
+
+    Args:
+        kind: "current", "new" or "refinance"
+
+    Returns:
+        ScenarioInputs: The session's record (widgets write into it directly)
+    """
+    inputs_key, _ = SCENARIO_SESSION_KEYS[kind]
+    if inputs_key not in st.session_state:
+        if kind == "current":
+            st.session_state[inputs_key] = CurrentMortgageInputs()
+        elif kind == "new":
+            st.session_state[inputs_key] = NewMortgageInputs()
+        else:
+            # Start the refinance from the current mortgage when there is one
+            st.session_state[inputs_key] = RefinanceInputs.from_current(get_scenario("current"))
+    return st.session_state[inputs_key]
+
+
+def sync_inputs_from_widgets(*kinds: str):
+    """
+    Copy any on-screen widget values into their input records.
+    Registered as the page update function so nothing is lost when navigating away.
+    """
+    for kind in kinds:
+        inputs_record(kind).pull_widgets(st.session_state)
+
+
+def current_mortgage_persistent_storage():
+    # Seed the widgets from the session's input record
+    inputs_record("current").seed_widgets(st.session_state)
+
+
+def new_mortgage_persistent_storage():
+    inputs_record("new").seed_widgets(st.session_state)
+
+
+def refinance_persistent_storage():
+    """Seed the refinance widgets from the session's input record"""
+    inputs_record("refinance").seed_widgets(st.session_state)
+
+
+def _calculate(kind: str):
+    # Snapshot the inputs; the scenario object is rebuilt from the snapshot on demand
+    record = inputs_record(kind)
+    record.pull_widgets(st.session_state)
+    calculated = record.snapshot()
+
+    # Build once so invalid inputs fail on Calculate rather than on every rerun
+    calculated.build()
+    st.session_state[SCENARIO_SESSION_KEYS[kind][1]] = calculated
+    start_comparison_precompute()
+
+@profiled()
+def current_mortgage_run_calcs():
+    _calculate("current")
+
+@profiled()
+def new_mortgage_run_calcs():
+    record = inputs_record("new")
+    record.pull_widgets(st.session_state)
+
+    # Force recalculate downpayment based on percentage if using percentage mode
+    if not record.is_not_percent:
+        record.set_value(st.session_state, "downpayment", (record.downpayment_percent / 100) * record.price)
+
+    _calculate("new")
+
+
+@profiled()
+def refinance_run_calcs():
+    """Run calculations for refinance scenario and store in session state"""
+    _calculate("refinance")
+
+
+###########################################################
+
+# Saved scenario helpers
+
+###########################################################
+
+@st.cache_resource
+def get_scenario_store() -> ScenarioStore:
+    """One SQLite connection shared by every session on this server (ScenarioStore locks around each use)"""
+    return ScenarioStore()
+
+
+def save_scenario_to_store(kind: str, borrower: str, label: str = None) -> int:
+    """
+    Save the calculated scenario of the given kind along with its page inputs.
+
+    Args:
+        kind: "current", "new" or "refinance"
+        borrower: Borrower name the scenario is filed under
+        label: Optional display label
+
+    Returns:
+        int: Row id of the saved scenario
+    """
+    calculated = st.session_state.get(SCENARIO_SESSION_KEYS[kind][1])
+    if calculated is None:
+        raise ValueError("Calculate the scenario before saving it")
+
+    return get_scenario_store().save_scenario(
+        borrower, calculated.build(), label=label or None, inputs=calculated.as_dict()
+    )
+
+
+def load_scenario_from_store(scenario_id: int):
+    """
+    Restore a saved scenario's inputs into session state and mark it calculated.
+    Meant to run as a button callback so widget keys can be set before the widgets render.
+
+    Args:
+        scenario_id: Row id of the saved scenario
+    """
+    try:
+        kind, _, inputs = get_scenario_store().load_scenario(scenario_id)
+        if not inputs:
+            raise ValueError("this scenario was saved without its page inputs")
+
+        record = inputs_record(kind)
+        record.update(inputs)
+        record.push_widgets(st.session_state)
+        st.session_state[SCENARIO_SESSION_KEYS[kind][1]] = record.snapshot()
+        start_comparison_precompute()
+
+    except Exception as e:
+        st.error(f"Error loading saved scenario: {e}")
+
+
+###########################################################
+
+# Rate sheet helpers
+
+###########################################################
+
+# Credit score for rate sheet lookups when PMI is not priced by credit score
+DEFAULT_RATE_SHEET_FICO = 740
+
+
+def rate_sheet_widget_key(kind: str, name: str) -> str:
+    return f"{kind}_rate_sheet_{name}"
+
+
+def seed_rate_sheet_widgets(kind: str):
+    """Default the rate sheet path (from MORTGAGE_ANALYZER_RATE_SHEET) and filters"""
+    st.session_state.setdefault(rate_sheet_widget_key(kind, "path"), os.environ.get(RATE_SHEET_ENV_VAR, ""))
+    st.session_state.setdefault(rate_sheet_widget_key(kind, "product"), "Any")
+    st.session_state.setdefault(rate_sheet_widget_key(kind, "lock"), "Any")
+    st.session_state.setdefault(rate_sheet_widget_key(kind, "fico"), DEFAULT_RATE_SHEET_FICO)
+
+
+def toggle_credit_score_pmi(kind: str, toggle_key: str):
+    """
+    Turn PMI pricing by credit score on or off for a scenario.
+    Meant to run as the toggle's callback: turning it on starts from the rate sheet
+    credit score, turning it off clears the score so PMI uses the flat rate again.
+
+    Args:
+        kind: "new" or "refinance"
+        toggle_key: Session state key of the toggle
+    """
+    record = inputs_record(kind)
+    if st.session_state[toggle_key]:
+        fico = st.session_state.get(rate_sheet_widget_key(kind, "fico"), DEFAULT_RATE_SHEET_FICO)
+        record.set_value(st.session_state, "credit_score", int(fico))
+    else:
+        record.set_value(st.session_state, "credit_score", None)
+
+
+def rate_sheet_for(kind: str) -> Optional[RateSheetIndex]:
+    """
+    Rate sheet chosen on the given scenario's tab.
+    The file is parsed once and shared by every session until it changes on disk.
+
+    Args:
+        kind: "new" or "refinance"
+
+    Returns:
+        RateSheetIndex, or None if no path has been entered
+    """
+    path = st.session_state.get(rate_sheet_widget_key(kind, "path"), "").strip()
+    return load_rate_sheet(path) if path else None
+
+
+def rate_sheet_filters(kind: str) -> dict:
+    """
+    Credit score, product and lock period for rate sheet lookups. The credit score
+    is the scenario's own when PMI is priced by it, otherwise the rate sheet's.
+    """
+    product = st.session_state.get(rate_sheet_widget_key(kind, "product"), "Any")
+    lock = st.session_state.get(rate_sheet_widget_key(kind, "lock"), "Any")
+    fico = inputs_record(kind).credit_score
+    if fico is None:
+        fico = st.session_state.get(rate_sheet_widget_key(kind, "fico"), DEFAULT_RATE_SHEET_FICO)
+    return {
+        "fico": fico,
+        "product": None if product == "Any" else product,
+        "lock_days": None if lock == "Any" else lock,
+    }
+
+
+def best_rate_quote(kind: str) -> Optional[RateQuote]:
+    """
+    Best rate sheet option for the scenario's current inputs (LTV and term).
+
+    Args:
+        kind: "new" or "refinance"
+
+    Returns:
+        RateQuote, or None if there is no rate sheet or nothing on it qualifies
+    """
+    index = rate_sheet_for(kind)
+    if index is None:
+        return None
+
+    record = inputs_record(kind)
+    return index.best_rate(record.loan_to_value(), term=record.term, **rate_sheet_filters(kind))
+
+
+def apply_rate_sheet_quote(kind: str):
+    """
+    Fill the scenario's rate and points from the best rate sheet option.
+    Meant to run as a button callback so widget keys can be set before the widgets render.
+
+    Args:
+        kind: "new" or "refinance"
+    """
+    try:
+        record = inputs_record(kind)
+        record.pull_widgets(st.session_state)
+
+        quote = best_rate_quote(kind)
+        if quote is None:
+            raise ValueError("no rate sheet option covers this LTV, credit score and term")
+
+        record.set_value(st.session_state, "rate", quote.rate)
+        record.set_value(st.session_state, "points", quote.points)
+
+    except Exception as e:
+        st.error(f"Error applying rate sheet: {e}")
+
+
+###########################################################
+
+# Rate history helpers
+
+###########################################################
+
+# Trailing window the Comparison page puts a scenario's rate against
+RATE_HISTORY_CONTEXT_WEEKS = 5 * 52
+
+
+def rate_history() -> Optional[RateHistory]:
+    """
+    Historical rate store (MORTGAGE_ANALYZER_RATE_HISTORY, then the default path).
+    The file is memory-mapped once and shared by every session until it changes.
+
+    Returns:
+        RateHistory, or None if no rate history has been set up
+    """
+    path = os.environ.get(RATE_HISTORY_ENV_VAR) or str(DEFAULT_RATE_HISTORY_PATH)
+    return load_rate_history(path) if os.path.exists(os.path.expanduser(path)) else None
+
+
+def rate_history_context(rate: float, years: int, weeks: int = RATE_HISTORY_CONTEXT_WEEKS) -> Optional[dict]:
+    """
+    Where a rate sits against the trailing weeks of the closest-term rate series.
+
+    Args:
+        rate: Scenario rate as a percentage
+        years: Scenario term in years (picks the series)
+        weeks: Length of the trailing window
+
+    Returns:
+        dict with series, as_of, latest, mean, min, max and share_above (share of
+        the window's weeks with a higher rate), or None without a rate history
+    """
+    history = rate_history()
+    if history is None:
+        return None
+
+    series = history.series_for_term(years)
+    stats = history.window_stats(history.end, weeks, series).iloc[0]
+    start = max(history.end - np.timedelta64((weeks - 1) * 7, "D"), history.start)
+    rates = history.window(start, history.end, series)[series].dropna()
+    return {
+        "series": series,
+        "as_of": stats["date"],
+        "latest": stats["rate"],
+        "mean": stats["mean"],
+        "min": stats["min"],
+        "max": stats["max"],
+        "share_above": float((rates > rate).mean()) if len(rates) else float("nan"),
+    }
+
+
+def refinance_backtest(current_mortgage, refinance) -> Optional[BacktestResult]:
+    """
+    What refinancing on the refinance scenario's terms would have been worth
+    in each month of the current loan's life, at historical market rates.
+
+    Args:
+        current_mortgage: CurrentMortgage object
+        refinance: RefinanceScenario object (term, closing costs, points, cash out)
+
+    Returns:
+        BacktestResult, or None without a rate history
+    """
+    history = rate_history()
+    if history is None:
+        return None
+    # One loan is a single small batch; no worker processes
+    return backtest_refinance(
+        current_mortgage, history, RefinanceAssumptions.from_refinance(refinance), max_workers=1
+    )
+
+
+###########################################################
+
+# Comparison page helpers
+
+###########################################################
+
+# Escrow growth inputs on the Comparison page (percent) and their defaults;
+# the payment chart and the refinance break-even both depend on them
+COMPARISON_ESCROW_KEYS = {"tax_growth": "comparison_tax_growth", "ins_growth": "comparison_ins_growth"}
+COMPARISON_ESCROW_DEFAULTS = {"tax_growth": 2.0, "ins_growth": 4.0}
+
+
+def scenario_cache_key(mortgage) -> tuple:
+    """
+    Key identifying a scenario for st.cache_data: its content hash (scenarios are
+    frozen, so it is computed once) and today's date, since a current loan's remaining
+    term and every scenario's payment dates are counted from today
+    """
+    return mortgage.stable_hash, str(today())
+
+
+_SCENARIO_HASH_FUNCS = {cls: scenario_cache_key for cls in (CurrentMortgage, NewMortgageScenario, RefinanceScenario)}
+
+
+def comparison_escrow_assumptions() -> EscrowAssumptions:
+    """Escrow growth from the Comparison page inputs (defaults before they first render)"""
+    growth = {
+        name: st.session_state.get(key, COMPARISON_ESCROW_DEFAULTS[name]) / 100
+        for name, key in COMPARISON_ESCROW_KEYS.items()
+    }
+    return EscrowAssumptions(**growth)
+
+
+def _format_difference(row) -> str:
+    diff_value = row["Difference"]
+    if row["Better"] == "lower":
+        indicator = "✅" if diff_value < 0 else "❌" if diff_value > 0 else "➖"
+    elif row["Better"] == "higher":
+        indicator = "✅" if diff_value > 0 else "❌" if diff_value < 0 else "➖"
+    else:  # "context" or other
+        indicator = ""
+
+    # Special handling for currency formatting to fix dollar sign placement
+    if row["Format"] == "${:,.2f}":
+        formatted_diff = f"+${diff_value:,.2f}" if diff_value >= 0 else f"-${abs(diff_value):,.2f}"
+    else:
+        formatted_diff = row["Format"].format(diff_value)
+        if diff_value > 0 and not formatted_diff.startswith('+'):
+            formatted_diff = "+" + formatted_diff
+
+    return f"{formatted_diff} {indicator}"
+
+
+@st.cache_data(hash_funcs=_SCENARIO_HASH_FUNCS, max_entries=64)
+def comparison_metrics_table(current_mortgage, new_mortgage) -> pd.DataFrame:
+    """
+    Formatted key metrics table (Metric, Current, New, Difference) for two scenarios.
+
+    Args:
+        current_mortgage: CurrentMortgage object
+        new_mortgage: NewMortgageScenario or RefinanceScenario object
+
+    Returns:
+        pandas.DataFrame: Display-ready table
+    """
+    comparison_df = mortgage_charts.create_mortgage_comparison_dashboard(current_mortgage, new_mortgage)
+
+    with profile_block("comparison.format_metrics_table"):
+        display_df = pd.DataFrame({
+            "Metric": comparison_df["Metric"],
+            "Current": [fmt.format(value) for fmt, value in zip(comparison_df["Format"], comparison_df["Current"])],
+            "New": [fmt.format(value) for fmt, value in zip(comparison_df["Format"], comparison_df["New"])],
+            "Difference": [_format_difference(row) for _, row in comparison_df.iterrows()],
+        })
+    return display_df
+
+
+@st.cache_data(hash_funcs=_SCENARIO_HASH_FUNCS, max_entries=64)
+def schedule_table(mortgage) -> pd.DataFrame:
+    """Amortization schedule with a fractional Year column, shared across reruns"""
+    schedule = mortgage.amortization_schedule()
+    schedule["Year"] = schedule_years(schedule["month"], decimals=1)
+    return schedule
+
+
+# Shortest horizon the aligned comparison covers (the equity chart's 30 years)
+COMPARISON_HORIZON_MONTHS = 30 * 12
+
+
+@st.cache_data(hash_funcs=_SCENARIO_HASH_FUNCS, max_entries=64)
+def aligned_comparison(current_mortgage, new_mortgage, escrow_assumptions: EscrowAssumptions) -> AlignedSchedules:
+    """
+    Both scenarios aligned month by month, shared by every comparison chart
+    and the break-even. Covers both full terms and at least
+    COMPARISON_HORIZON_MONTHS.
+
+    Args:
+        current_mortgage: CurrentMortgage object
+        new_mortgage: NewMortgageScenario or RefinanceScenario object
+        escrow_assumptions: Tax and insurance growth
+
+    Returns:
+        AlignedSchedules: Rows named per mortgage_charts.COMPARISON_SCENARIOS
+    """
+    months = max(COMPARISON_HORIZON_MONTHS, current_mortgage.periods_remaining, new_mortgage.periods_remaining)
+    return mortgage_charts.comparison_schedules(current_mortgage, new_mortgage, months, escrow_assumptions)
+
+
+@st.cache_data(hash_funcs=_SCENARIO_HASH_FUNCS, max_entries=64)
+def equity_curves(current_mortgage, new_mortgage, escrow_assumptions: EscrowAssumptions, years: int = 30) -> pd.DataFrame:
+    """Projected equity by year for both scenarios (see equity_buildup_data)"""
+    aligned = aligned_comparison(current_mortgage, new_mortgage, escrow_assumptions)
+    return mortgage_charts.equity_buildup_data(current_mortgage, new_mortgage, years, aligned=aligned)
+
+
+@st.cache_data(hash_funcs=_SCENARIO_HASH_FUNCS, max_entries=64)
+def comparison_breakeven(current_mortgage, new_mortgage, escrow_assumptions: EscrowAssumptions) -> Optional[int]:
+    """
+    Months until the new scenario's payment savings, with escrow growth,
+    recover its closing costs.
+
+    Args:
+        current_mortgage: CurrentMortgage object
+        new_mortgage: NewMortgageScenario or RefinanceScenario object
+        escrow_assumptions: Tax and insurance growth
+
+    Returns:
+        int, or None if the costs are never recovered within the new term
+    """
+    closing_costs = getattr(new_mortgage, 'closing_costs', new_mortgage.price * 0.03)
+    aligned = aligned_comparison(current_mortgage, new_mortgage, escrow_assumptions)
+    return aligned.breakeven_month(
+        *mortgage_charts.COMPARISON_SCENARIOS, closing_costs, months=new_mortgage.periods_remaining
+    )
+
+
+@st.cache_data(hash_funcs=_SCENARIO_HASH_FUNCS, max_entries=64)
+def payment_comparison_png(current_mortgage, new_mortgage) -> bytes:
+    """Rendered monthly payment comparison chart (see payment_comparison_figure_png)"""
+    return mortgage_charts.payment_comparison_figure_png(current_mortgage, new_mortgage)
+
+
+# Chart sections replayed from cache (elements and all) when their inputs are unchanged
+cached_monthly_payment_comparison = st.cache_data(
+    mortgage_charts.create_monthly_payment_comparison, hash_funcs=_SCENARIO_HASH_FUNCS, max_entries=64
+)
+cached_interest_paid_comparison = st.cache_data(
+    mortgage_charts.create_interest_paid_comparison, hash_funcs=_SCENARIO_HASH_FUNCS, max_entries=64
+)
+cached_tornado_chart = st.cache_data(
+    mortgage_charts.create_tornado_chart, hash_funcs=_SCENARIO_HASH_FUNCS, max_entries=64
+)
+
+
+# Session key of this session's background comparison precompute (a BackgroundJob)
+COMPARISON_PRECOMPUTE_KEY = "comparison_precompute_job"
+
+
+def cancel_comparison_precompute():
+    job = st.session_state.pop(COMPARISON_PRECOMPUTE_KEY, None)
+    if job is not None:
+        job.cancel()
+
+
+def start_comparison_precompute():
+    """
+    Start filling the Comparison page caches in the background once the current
+    mortgage and at least one new or refinance scenario are calculated.
+    Any job started for earlier inputs is cancelled first.
+    """
+    cancel_comparison_precompute()
+
+    current = get_scenario("current")
+    others = [(kind, get_scenario(kind)) for kind in ("new", "refinance")]
+    others = [(kind, scenario) for kind, scenario in others if scenario is not None]
+    if current is None or not others:
+        return
+
+    # Same order the page needs them: metrics, payment chart and break-even on arrival,
+    # then the other tabs and the schedules
+    escrow_assumptions = comparison_escrow_assumptions()
+    steps = []
+    for kind, scenario in others:
+        steps.append((f"{kind}.metrics", comparison_metrics_table, (current, scenario)))
+        steps.append((f"{kind}.aligned", aligned_comparison, (current, scenario, escrow_assumptions)))
+        steps.append((f"{kind}.payment_chart", payment_comparison_png, (current, scenario)))
+        if kind == "refinance":
+            steps.append((f"{kind}.breakeven", comparison_breakeven, (current, scenario, escrow_assumptions)))
+    for kind, scenario in others:
+        steps.append((f"{kind}.equity", equity_curves, (current, scenario, escrow_assumptions)))
+    steps.append(("current.schedule", schedule_table, (current,)))
+    for kind, scenario in others:
+        steps.append((f"{kind}.schedule", schedule_table, (scenario,)))
+
+    st.session_state[COMPARISON_PRECOMPUTE_KEY] = BackgroundJob(steps).start()
+
+
+def finish_comparison_precompute():
+    """Let a running precompute finish rather than repeat its work on the page"""
+    job = st.session_state.get(COMPARISON_PRECOMPUTE_KEY)
+    if job is not None and not job.finished:
+        job.wait()
@@ -0,0 +1,187 @@
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Callable, Optional
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+
+Lightweight timing instrumentation for model, utils and chart functions.
+
+Timings are collected per rerun and per session: Streamlit runs each
+rerun of a session's script on a script thread, so the collector lives in
+a thread-local that start_profiling_rerun resets. The rerun count has to
+outlive the thread, so it is kept in the session state instead. When
+profiling is off, a wrapped call costs one thread-local lookup and a
+branch before calling straight through.
+
+Enable with the MORTGAGE_ANALYZER_PROFILING=1 environment variable or
+by opening the app with ?profile=1 in the URL.
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+
+PROFILING_ENV_VAR = "MORTGAGE_ANALYZER_PROFILING"
+
+_DEFAULT_ENABLED = os.environ.get(PROFILING_ENV_VAR, "").lower() in ("1", "true", "yes")
+_local = threading.local()
+
+# Session state key counting the session's reruns
+RERUN_COUNT_KEY = "profiling_rerun_count"
+
+
+def is_profiling_enabled() -> bool:
+    return getattr(_local, "enabled", _DEFAULT_ENABLED)
+
+
+def _record(name: str, elapsed: float):
+    timings = getattr(_local, "timings", None)
+    if timings is None:
+        timings = _local.timings = {}
+
+    entry = timings.get(name)
+    if entry is None:
+        timings[name] = [1, elapsed, elapsed]
+    else:
+        entry[0] += 1
+        entry[1] += elapsed
+        if elapsed > entry[2]:
+            entry[2] = elapsed
+
+
+def start_profiling_rerun(enabled: Optional[bool] = None):
+    """
+    Reset the collected timings at the start of a rerun and count the rerun.
+
+    Args:
+        enabled: Turn profiling on or off for this rerun
+                 (None keeps the environment variable default)
+    """
+    import streamlit as st
+
+    _local.enabled = _DEFAULT_ENABLED if enabled is None else enabled
+    _local.timings = {}
+    _local.rerun_started = time.perf_counter()
+    _local.rerun_count = st.session_state.get(RERUN_COUNT_KEY, 0) + 1
+    st.session_state[RERUN_COUNT_KEY] = _local.rerun_count
+
+
+def profiled(name: Optional[str] = None) -> Callable:
+    """
+    Decorator that records call counts and wall time for a function.
+
+    Args:
+        name: Label for the timings (defaults to module.qualname)
+    """
+    def decorator(func: Callable) -> Callable:
+        label = name or f"{func.__module__.rsplit('.', 1)[-1]}.{func.__qualname__}"
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not getattr(_local, "enabled", _DEFAULT_ENABLED):
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _record(label, time.perf_counter() - start)
+
+        return wrapper
+
+    return decorator
+
+
+@contextmanager
+def profile_block(name: str):
+    """
+    Context manager that records wall time for a block of code.
+
+    Args:
+        name: Label for the timings
+    """
+    if not getattr(_local, "enabled", _DEFAULT_ENABLED):
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _record(name, time.perf_counter() - start)
+
+
+def get_profile_summary() -> list:
+    """
+    Summarize this rerun's timings, slowest total time first.
+
+    Returns:
+        list: One dict per instrumented name with calls and millisecond timings
+    """
+    timings = getattr(_local, "timings", {}) or {}
+    summary = [
+        {
+            "name": label,
+            "calls": calls,
+            "total_ms": total * 1000,
+            "mean_ms": total / calls * 1000,
+            "max_ms": longest * 1000,
+        }
+        for label, (calls, total, longest) in timings.items()
+    ]
+    return sorted(summary, key=lambda row: row["total_ms"], reverse=True)
+
+
+def export_profile_json() -> str:
+    """
+    Export this rerun's timings as JSON for offline analysis.
+
+    Returns:
+        str: JSON document with rerun metadata and per-function timings
+    """
+    started = getattr(_local, "rerun_started", None)
+    return json.dumps({
+        "exported_at": datetime.now().isoformat(),
+        "rerun": getattr(_local, "rerun_count", 0),
+        "rerun_ms": (time.perf_counter() - started) * 1000 if started is not None else None,
+        "functions": get_profile_summary(),
+    }, indent=2)
+
+
+def render_profiling_sidebar():
+    """
+    Show this rerun's timings in a developer section of the sidebar.
+    Does nothing unless profiling is enabled.
+    """
+    if not is_profiling_enabled():
+        return
+
+    import pandas as pd
+    import streamlit as st
+
+    summary = get_profile_summary()
+    with st.sidebar.expander("🛠️ Developer: Rerun Profile", expanded=False):
+        if not summary:
+            st.write("No instrumented calls in this rerun.")
+            return
+
+        started = getattr(_local, "rerun_started", time.perf_counter())
+        rerun_ms = (time.perf_counter() - started) * 1000
+        st.metric("Rerun Time", f"{rerun_ms:,.1f} ms")
+        st.dataframe(
+            pd.DataFrame(summary),
+            hide_index=True,
+            column_config={
+                "name": "Function",
+                "calls": "Calls",
+                "total_ms": st.column_config.NumberColumn("Total (ms)", format="%.2f"),
+                "mean_ms": st.column_config.NumberColumn("Mean (ms)", format="%.3f"),
+                "max_ms": st.column_config.NumberColumn("Max (ms)", format="%.2f"),
+            },
+        )
+        st.download_button(
+            "Export JSON",
+            data=export_profile_json(),
+            file_name=f"rerun_profile_{datetime.now():%Y%m%d_%H%M%S}.json",
+            mime="application/json",
+        )
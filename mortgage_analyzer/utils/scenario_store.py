@@ -0,0 +1,393 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from dataclasses import fields
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, Optional, get_args
+
+import pandas as pd
+
+from mortgage_analyzer.models.mortgage_classes import CurrentMortgage, NewMortgageScenario, RefinanceScenario
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+
+Local SQLite store for mortgage scenarios.
+
+Each row holds one scenario's dataclass fields (one column per field,
+leading underscore dropped), the page inputs it was built from, and
+summary metrics computed once at save time so a borrower's history can
+be listed without rebuilding any amortization schedules.
+
+Rows are indexed by (borrower, id) for paging and by scenario_hash so
+saving the same inputs twice updates the existing row instead of
+adding a duplicate.
+
+The database lives at ~/.mortgage_analyzer/scenarios.db unless the
+MORTGAGE_ANALYZER_DB environment variable points elsewhere.
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+
+DB_ENV_VAR = "MORTGAGE_ANALYZER_DB"
+DEFAULT_DB_PATH = Path.home() / ".mortgage_analyzer" / "scenarios.db"
+
+SCENARIO_KINDS = {
+    "current": CurrentMortgage,
+    "new": NewMortgageScenario,
+    "refinance": RefinanceScenario,
+}
+
+# Precomputed metrics stored next to the inputs; loan_amount and total_pmt
+# share the CurrentMortgage field columns, which hold the same values
+SUMMARY_COLUMNS = {
+    "loan_amount": "REAL",
+    "principal_and_interest": "REAL",
+    "total_pmt": "REAL",
+    "total_interest": "REAL",
+    "payoff_months": "INTEGER",
+    "closing_costs": "REAL",
+}
+
+_SQL_TYPES = {float: "REAL", int: "INTEGER", bool: "INTEGER", str: "TEXT"}
+
+
+def _field_columns() -> dict:
+    """Map every dataclass field across the scenario classes to a SQL column"""
+    columns = {}
+    for cls in SCENARIO_KINDS.values():
+        for f in fields(cls):
+            if not f.init:
+                continue
+            # Optional[float] -> float
+            py_type = next((t for t in get_args(f.type) if t is not type(None)), f.type)
+            columns.setdefault(f.name.lstrip("_"), _SQL_TYPES.get(py_type, "TEXT"))
+    return columns
+
+
+FIELD_COLUMNS = _field_columns()
+
+
+def _kind_of(mortgage) -> str:
+    for kind, cls in SCENARIO_KINDS.items():
+        if type(mortgage) is cls:
+            return kind
+    raise ValueError(f"Unsupported scenario type: {type(mortgage).__name__}")
+
+
+def scenario_fields(mortgage) -> dict:
+    """
+    Get a scenario's dataclass fields as column values.
+
+    Args:
+        mortgage: CurrentMortgage, NewMortgageScenario or RefinanceScenario object
+
+    Returns:
+        dict: Column name (without leading underscore) to value
+    """
+    return {f.name.lstrip("_"): getattr(mortgage, f.name) for f in fields(mortgage) if f.init}
+
+
+def scenario_hash(mortgage) -> str:
+    """
+    Hash a scenario's inputs so identical scenarios map to the same row.
+
+    Args:
+        mortgage: CurrentMortgage, NewMortgageScenario or RefinanceScenario object
+
+    Returns:
+        str: Hex SHA-256 digest of the scenario type and field values
+    """
+    # Numbers are normalized so 30 vs 30.0, or float noise from recomputed
+    # fields (e.g. downpayment percent), don't change the hash
+    values = {
+        name: round(float(value), 6) if isinstance(value, (int, float)) and not isinstance(value, bool) else value
+        for name, value in scenario_fields(mortgage).items()
+    }
+    payload = json.dumps([_kind_of(mortgage), values], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def scenario_summary(mortgage) -> dict:
+    """
+    Compute the summary metrics stored with a scenario.
+
+    Args:
+        mortgage: CurrentMortgage, NewMortgageScenario or RefinanceScenario object
+
+    Returns:
+        dict: Values for SUMMARY_COLUMNS
+    """
+    schedule = mortgage.amortization_schedule()
+    return {
+        "loan_amount": mortgage.loan_amount,
+        "principal_and_interest": mortgage.principal_and_interest,
+        "total_pmt": mortgage.total_pmt,
+        "total_interest": float(schedule["interest"].sum()) if not schedule.empty else 0.0,
+        "payoff_months": len(schedule),
+        "closing_costs": getattr(mortgage, "closing_costs", None),
+    }
+
+
+def _encode_inputs(inputs: Optional[dict]) -> Optional[str]:
+    if inputs is None:
+        return None
+    return json.dumps(inputs, default=lambda v: v.isoformat() if hasattr(v, "isoformat") else str(v))
+
+
+def _decode_inputs(raw: Optional[str]) -> Optional[dict]:
+    if raw is None:
+        return None
+    inputs = json.loads(raw)
+    # Dates come back as ISO strings; the date widgets expect datetimes
+    for key, value in inputs.items():
+        if key.endswith("date") and isinstance(value, str):
+            try:
+                inputs[key] = datetime.fromisoformat(value)
+            except ValueError:
+                pass
+    return inputs
+
+
+class ScenarioStore:
+    """
+    SQLite-backed history of saved scenarios.
+
+    Args:
+        path: Database file (defaults to MORTGAGE_ANALYZER_DB or ~/.mortgage_analyzer/scenarios.db);
+              ":memory:" gives a throwaway store
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        path = path or os.environ.get(DB_ENV_VAR) or str(DEFAULT_DB_PATH)
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+
+        self.path = path
+        # One connection serves every Streamlit session thread; sqlite3
+        # connections are not safe to use concurrently, so each statement
+        # (and each save with its follow-up lookup) runs under the lock
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.RLock()
+        self._create_schema()
+
+    def _create_schema(self):
+        field_defs = ",\n".join(f"    {name} {sql_type}" for name, sql_type in FIELD_COLUMNS.items())
+        summary_defs = ",\n".join(
+            f"    {name} {sql_type}" for name, sql_type in SUMMARY_COLUMNS.items() if name not in FIELD_COLUMNS
+        )
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(f"""
+                CREATE TABLE IF NOT EXISTS scenarios (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    borrower TEXT NOT NULL,
+                    kind TEXT NOT NULL,
+                    scenario_hash TEXT NOT NULL,
+                    label TEXT,
+                    saved_at TEXT NOT NULL,
+                    inputs TEXT,
+                {field_defs},
+                {summary_defs},
+                    UNIQUE (borrower, scenario_hash)
+                )
+            """)
+            # Fields added to the dataclasses after a database was created
+            existing = {row["name"] for row in self._conn.execute("PRAGMA table_info(scenarios)")}
+            for name, sql_type in {**FIELD_COLUMNS, **SUMMARY_COLUMNS}.items():
+                if name not in existing:
+                    self._conn.execute(f"ALTER TABLE scenarios ADD COLUMN {name} {sql_type}")
+
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_scenarios_borrower ON scenarios (borrower, id DESC)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_scenarios_hash ON scenarios (scenario_hash)"
+            )
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _row_values(self, borrower: str, mortgage, label: Optional[str], inputs: Optional[dict]) -> dict:
+        if not borrower or not borrower.strip():
+            raise ValueError("Borrower name is required to save a scenario")
+
+        values = dict.fromkeys(FIELD_COLUMNS)
+        values.update(scenario_fields(mortgage))
+        values.update(scenario_summary(mortgage))
+        values.update({
+            "borrower": borrower.strip(),
+            "kind": _kind_of(mortgage),
+            "scenario_hash": scenario_hash(mortgage),
+            "label": label,
+            "saved_at": datetime.now().isoformat(timespec="seconds"),
+            "inputs": _encode_inputs(inputs),
+        })
+        return values
+
+    def save_scenarios(
+        self,
+        borrower: str,
+        mortgages: Iterable,
+        labels: Optional[Iterable[Optional[str]]] = None,
+        inputs: Optional[Iterable[Optional[dict]]] = None,
+    ) -> int:
+        """
+        Save many scenarios for a borrower in a single transaction.
+        Re-saving an existing scenario refreshes its label, inputs and timestamp.
+
+        Args:
+            borrower: Borrower the scenarios belong to
+            mortgages: Scenario objects to save
+            labels: Optional label per scenario
+            inputs: Optional page inputs (ScenarioInputs.as_dict()) per scenario
+
+        Returns:
+            int: Number of scenarios written
+        """
+        mortgages = list(mortgages)
+        labels = list(labels) if labels is not None else [None] * len(mortgages)
+        inputs = list(inputs) if inputs is not None else [None] * len(mortgages)
+        if not len(mortgages) == len(labels) == len(inputs):
+            raise ValueError("Labels and inputs must match the number of scenarios")
+
+        rows = [self._row_values(borrower, m, lbl, inp) for m, lbl, inp in zip(mortgages, labels, inputs)]
+        if not rows:
+            return 0
+
+        columns = list(rows[0])
+        updates = ", ".join(f"{c} = excluded.{c}" for c in ("label", "saved_at", "inputs"))
+        sql = (
+            f"INSERT INTO scenarios ({', '.join(columns)}) "
+            f"VALUES ({', '.join(':' + c for c in columns)}) "
+            f"ON CONFLICT (borrower, scenario_hash) DO UPDATE SET {updates}"
+        )
+        with self._lock, self._conn:
+            self._conn.executemany(sql, rows)
+        return len(rows)
+
+    def save_scenario(
+        self,
+        borrower: str,
+        mortgage,
+        label: Optional[str] = None,
+        inputs: Optional[dict] = None,
+    ) -> int:
+        """
+        Save one scenario for a borrower.
+
+        Args:
+            borrower: Borrower the scenario belongs to
+            mortgage: Scenario object to save
+            label: Optional display label
+            inputs: Optional page inputs (ScenarioInputs.as_dict()) used to restore the widgets
+
+        Returns:
+            int: Row id of the saved scenario
+        """
+        with self._lock:
+            self.save_scenarios(borrower, [mortgage], [label], [inputs])
+            row = self._conn.execute(
+                "SELECT id FROM scenarios WHERE borrower = ? AND scenario_hash = ?",
+                (borrower.strip(), scenario_hash(mortgage)),
+            ).fetchone()
+        return row["id"]
+
+    def count_scenarios(self, borrower: str, kind: Optional[str] = None) -> int:
+        sql = "SELECT COUNT(*) FROM scenarios WHERE borrower = ?"
+        params = [borrower]
+        if kind:
+            sql += " AND kind = ?"
+            params.append(kind)
+        with self._lock:
+            return self._conn.execute(sql, params).fetchone()[0]
+
+    def list_scenarios(
+        self,
+        borrower: str,
+        kind: Optional[str] = None,
+        limit: int = 50,
+        before_id: Optional[int] = None,
+    ) -> pd.DataFrame:
+        """
+        Page through a borrower's saved scenarios, newest first.
+        Pass the smallest id of the previous page as before_id to get the next page;
+        this walks the (borrower, id) index instead of counting skipped rows.
+
+        Args:
+            borrower: Borrower to list
+            kind: Optional filter ("current", "new" or "refinance")
+            limit: Page size
+            before_id: Only return scenarios older than this id
+
+        Returns:
+            pandas.DataFrame: One row per scenario with summary columns (no stored inputs)
+        """
+        if limit <= 0:
+            raise ValueError("Page size must be positive")
+
+        columns = ["id", "kind", "label", "saved_at", "rate", "years", *SUMMARY_COLUMNS, "scenario_hash"]
+        sql = f"SELECT {', '.join(columns)} FROM scenarios WHERE borrower = ?"
+        params = [borrower]
+        if kind:
+            sql += " AND kind = ?"
+            params.append(kind)
+        if before_id is not None:
+            sql += " AND id < ?"
+            params.append(before_id)
+        sql += " ORDER BY id DESC LIMIT ?"
+        params.append(limit)
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return pd.DataFrame([tuple(r) for r in rows], columns=columns)
+
+    def find_by_hash(self, borrower: str, hash_value: str) -> Optional[int]:
+        """
+        Look up a saved scenario id by its scenario hash.
+
+        Args:
+            borrower: Borrower the scenario belongs to
+            hash_value: Value from scenario_hash()
+
+        Returns:
+            int or None: Row id if the scenario has been saved
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT id FROM scenarios WHERE borrower = ? AND scenario_hash = ?",
+                (borrower, hash_value),
+            ).fetchone()
+        return None if row is None else row["id"]
+
+    def load_scenario(self, scenario_id: int):
+        """
+        Rebuild a saved scenario.
+
+        Args:
+            scenario_id: Row id of the scenario
+
+        Returns:
+            tuple: (kind, scenario object, page inputs or None)
+        """
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM scenarios WHERE id = ?", (scenario_id,)).fetchone()
+        if row is None:
+            raise ValueError(f"No saved scenario with id {scenario_id}")
+
+        cls = SCENARIO_KINDS[row["kind"]]
+        kwargs = {f.name: row[f.name.lstrip("_")] for f in fields(cls) if f.init}
+        return row["kind"], cls(**kwargs), _decode_inputs(row["inputs"])
+
+    def delete_scenario(self, scenario_id: int):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM scenarios WHERE id = ?", (scenario_id,))
@@ -0,0 +1,292 @@
+import functools
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field, fields, replace
+from datetime import date, datetime
+from typing import ClassVar, Optional
+
+import streamlit as st
+
+from mortgage_analyzer.models.mortgage_classes import CurrentMortgage, NewMortgageScenario, RefinanceScenario
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+
+Session state is kept to one typed, slotted input record per scenario:
+
+    cm_inputs / nm_inputs / rf_inputs - live page inputs; every widget's
+        on_change writes straight into its field
+    cm_calculated / nm_calculated / rf_calculated - copy of the inputs taken
+        when Calculate was last clicked (None until then)
+
+Widget keys (temp_cm_rate, ...) are owned by Streamlit and only live while
+their page is on screen; seed_widgets() refills them from the record when
+a page loads. Mortgage objects are not kept per session at all: build()
+rebuilds them from the calculated inputs through a bounded cache that is
+shared by every session, so identical inputs share one object.
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+
+# Scenario objects kept across all sessions (each is a few hundred bytes)
+SCENARIO_CACHE_SIZE = 512
+
+
+class ScenarioInputs(ABC):
+    """Shared behaviour for the per-scenario input records"""
+
+    __slots__ = ()
+
+    PREFIX: ClassVar[str] = ""
+    # Toggles are always reset from the record so they survive page changes
+    TOGGLES: ClassVar[tuple] = ()
+
+    def widget_key(self, name: str) -> str:
+        return f"{self.PREFIX}{name}"
+
+    def seed_widgets(self, state):
+        """Give each widget its value from the record before the widgets render"""
+        for f in fields(self):
+            key = self.widget_key(f.name)
+            if f.name in self.TOGGLES or key not in state:
+                state[key] = getattr(self, f.name)
+
+    def push_widgets(self, state):
+        """Overwrite every widget value with the record (e.g. after loading a saved scenario)"""
+        for f in fields(self):
+            state[self.widget_key(f.name)] = getattr(self, f.name)
+
+    def pull_widget(self, state, name: str):
+        """Copy one widget's value into the record (used as the widget's on_change)"""
+        setattr(self, name, state[self.widget_key(name)])
+
+    def pull_widgets(self, state):
+        """Copy every widget currently on screen into the record"""
+        for f in fields(self):
+            key = self.widget_key(f.name)
+            if key in state:
+                setattr(self, f.name, state[key])
+
+    def set_value(self, state, name: str, value):
+        """Set a derived field and the widget showing it"""
+        setattr(self, name, value)
+        state[self.widget_key(name)] = value
+
+    def as_dict(self) -> dict:
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
+    def update(self, values: dict):
+        """
+        Update fields from a dict, e.g. saved scenario inputs.
+        Unknown keys (from older saves) are ignored.
+        """
+        names = {f.name for f in fields(self)}
+        for name, value in values.items():
+            if name not in names:
+                continue
+            if isinstance(value, datetime):
+                value = value.date()
+            setattr(self, name, value)
+
+    def snapshot(self):
+        """Copy of the inputs as they are now"""
+        return replace(self)
+
+    def build(self):
+        """Scenario object for these inputs (shared with identical inputs in other sessions)"""
+        return _build_scenario(type(self), tuple(getattr(self, f.name) for f in fields(self)))
+
+    @abstractmethod
+    def _build(self):
+        """Scenario object built from these inputs (implemented per record type)"""
+        pass
+
+
+@functools.lru_cache(maxsize=SCENARIO_CACHE_SIZE)
+def _build_scenario(cls, values: tuple):
+    return cls(*values)._build()
+
+
+@dataclass(slots=True)
+class CurrentMortgageInputs(ScenarioInputs):
+    PREFIX: ClassVar[str] = "temp_cm_"
+    TOGGLES: ClassVar[tuple] = ("is_monthly_tax", "is_monthly_ins", "exact_cents")
+
+    rate: float = 4.5
+    balance: float = 200000.0
+    origin: float = 250000.0
+    start_date: date = field(default_factory=date.today)
+    sqft: float = 2000.0
+    ppsqft: float = 150.0
+    pmt: float = 1500.0
+    pmi: float = 100.0
+    term: int = 30
+    is_monthly_tax: bool = False
+    tax_annual: float = 2400.0
+    tax_monthly: float = 200.0
+    is_monthly_ins: bool = False
+    ins_annual: float = 1200.0
+    ins_monthly: float = 100.0
+    prin: float = 0.0
+    prepay: int = 0
+    exact_cents: bool = False
+
+    def _build(self) -> CurrentMortgage:
+        return CurrentMortgage(
+            _rate=self.rate,
+            _years=self.term,
+            _tax=self.tax_annual,
+            _ins=self.ins_annual,
+            _sqft=self.sqft,
+            _extra_principal=self.prin,
+            _prepay_periods=self.prepay,
+            _original_loan=self.origin,
+            _loan_amount=self.balance,
+            _start_date=self.start_date.strftime("%m/%d/%Y"),
+            _price_per_sqft=self.ppsqft,
+            _monthly_pmi=self.pmi,
+            _total_pmt=self.pmt,
+            _exact_cents=self.exact_cents
+        )
+
+
+@dataclass(slots=True)
+class NewMortgageInputs(ScenarioInputs):
+    PREFIX: ClassVar[str] = "temp_nm_"
+    TOGGLES: ClassVar[tuple] = ("is_not_percent", "is_monthly_tax", "is_monthly_ins", "exact_cents")
+
+    rate: float = 4.5
+    price: float = 300000.0
+    start_date: date = field(default_factory=date.today)
+    sqft: float = 2000.0
+    term: int = 30
+    prin: float = 0.0
+    prepay: int = 0
+    is_not_percent: bool = False
+    downpayment: float = 60000.0
+    downpayment_percent: float = 20.0
+    is_monthly_tax: bool = False
+    annual_tax: float = 3000.0
+    monthly_tax: float = 250.0
+    is_monthly_ins: bool = False
+    annual_ins: float = 1200.0
+    monthly_ins: float = 100.0
+    points: float = 0.0
+    credit_score: Optional[int] = None  # None prices PMI from the flat PMI rate
+    exact_cents: bool = False
+
+    def loan_to_value(self) -> float:
+        """LTV of these inputs as a percentage (downpayment follows the percent toggle)"""
+        if self.price <= 0:
+            return 0.0
+        downpayment = self.downpayment if self.is_not_percent else self.downpayment_percent / 100 * self.price
+        return (self.price - downpayment) / self.price * 100
+
+    def _build(self) -> NewMortgageScenario:
+        return NewMortgageScenario(
+            _rate=self.rate,
+            _years=self.term,
+            _tax=self.annual_tax,
+            _ins=self.annual_ins,
+            _sqft=self.sqft,
+            _extra_principal=self.prin,
+            _prepay_periods=self.prepay,
+            _price=self.price,
+            _downpayment_amount=self.downpayment,
+            _discount_points=self.points,
+            _credit_score=self.credit_score,
+            _exact_cents=self.exact_cents
+        )
+
+
+@dataclass(slots=True)
+class RefinanceInputs(ScenarioInputs):
+    PREFIX: ClassVar[str] = "temp_rf_"
+    TOGGLES: ClassVar[tuple] = ("is_monthly_tax", "is_monthly_ins", "exact_cents")
+
+    rate: float = 4.0  # Typically refinancing for better rate
+    term: int = 30
+    current_loan_balance: float = 200000.0
+    current_property_value: float = 300000.0
+    cash_out_amount: float = 0.0
+    closing_cost_percentage: float = 2.5  # 2.5% default
+    sqft: float = 2000.0
+    annual_tax: float = 3000.0
+    monthly_tax: float = 250.0
+    annual_ins: float = 1200.0
+    monthly_ins: float = 100.0
+    is_monthly_tax: bool = False
+    is_monthly_ins: bool = False
+    prin: float = 0.0
+    prepay: int = 0
+    points: float = 0.0
+    credit_score: Optional[int] = None  # None prices PMI from the flat PMI rate
+    exact_cents: bool = False
+
+    @classmethod
+    def from_current(cls, current_mortgage: Optional[CurrentMortgage]) -> "RefinanceInputs":
+        """Default refinance inputs, starting from the current mortgage when there is one"""
+        if current_mortgage is None:
+            return cls()
+        return cls(
+            current_loan_balance=current_mortgage.loan_amount,
+            current_property_value=current_mortgage.price,
+            sqft=current_mortgage.sqft,
+            annual_tax=current_mortgage.tax,
+            monthly_tax=current_mortgage.tax / 12,
+            annual_ins=current_mortgage.ins,
+            monthly_ins=current_mortgage.ins / 12
+        )
+
+    def loan_to_value(self) -> float:
+        """LTV of the new loan (balance plus cash out) as a percentage"""
+        if self.current_property_value <= 0:
+            return 0.0
+        return (self.current_loan_balance + self.cash_out_amount) / self.current_property_value * 100
+
+    def _build(self) -> RefinanceScenario:
+        return RefinanceScenario(
+            _rate=self.rate,
+            _years=self.term,
+            _tax=self.annual_tax,
+            _ins=self.annual_ins,
+            _sqft=self.sqft,
+            _extra_principal=self.prin,
+            _prepay_periods=self.prepay,
+            _current_loan_balance=self.current_loan_balance,
+            _current_property_value=self.current_property_value,
+            _cash_out_amount=self.cash_out_amount,
+            _closing_cost_percentage=self.closing_cost_percentage / 100,
+            _discount_points=self.points,
+            _credit_score=self.credit_score,
+            _exact_cents=self.exact_cents
+        )
+
+
+# kind -> (live inputs key, calculated inputs key)
+SCENARIO_SESSION_KEYS = {
+    "current": ("cm_inputs", "cm_calculated"),
+    "new": ("nm_inputs", "nm_calculated"),
+    "refinance": ("rf_inputs", "rf_calculated"),
+}
+
+
+def initialize_mortgage_app_state():
+    """
+    Initialize minimal session state variables needed for the mortgage app.
+    """
+    # Nothing is calculated until the user clicks Calculate
+    for _, calculated_key in SCENARIO_SESSION_KEYS.values():
+        if calculated_key not in st.session_state:
+            st.session_state[calculated_key] = None
+
+
+def get_scenario(kind: str):
+    """
+    Scenario object for the last calculated inputs of the given kind.
+
+    Args:
+        kind: "current", "new" or "refinance"
+
+    Returns:
+        Mortgage object, or None if that scenario hasn't been calculated
+    """
+    calculated = st.session_state.get(SCENARIO_SESSION_KEYS[kind][1])
+    return None if calculated is None else calculated.build()
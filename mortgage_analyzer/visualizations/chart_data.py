@@ -0,0 +1,200 @@
+from typing import Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+########################################################
+"""
+Chart data documentation:
+
+Server-side shaping of chart data so the payload sent to the browser
+stays bounded however long the schedule is (40-year, biweekly, or
+several scenarios on one chart). Everything works on numpy arrays;
+there are no per-row Python callbacks.
+
+    MAX_CHART_POINTS - default point budget per series (about one point
+                       per horizontal pixel pair on a wide chart)
+
+    functions:
+        schedule_years - payment number to fractional years
+        aggregate_schedule - yearly or quarterly totals / ending balances
+        lttb_indices - Largest-Triangle-Three-Buckets point selection
+        downsample_frame - bound a multi-series frame to a point budget
+        balance_on_grid - balances of several schedules on one shared year grid
+
+"""
+
+MAX_CHART_POINTS = 400
+
+# Aggregation buckets per year
+_BUCKETS_PER_YEAR = {"yearly": 1, "quarterly": 4}
+
+
+def schedule_years(periods, periods_per_year: int = 12, decimals: Optional[int] = None) -> np.ndarray:
+    """
+    Convert payment numbers to years.
+
+    Args:
+        periods: Payment numbers (1-based)
+        periods_per_year: 12 for monthly, 26 for biweekly
+        decimals: Round to this many decimals (None keeps exact fractions)
+
+    Returns:
+        numpy.ndarray: Years elapsed at each payment
+    """
+    years = np.asarray(periods, dtype=float) / periods_per_year
+    return years if decimals is None else np.round(years, decimals)
+
+
+def aggregate_schedule(
+    schedule: pd.DataFrame,
+    freq: str = "yearly",
+    sum_columns: Iterable[str] = ("payment", "principal", "interest", "principal_paydown"),
+    last_columns: Iterable[str] = ("balance",),
+    periods_per_year: int = 12,
+) -> pd.DataFrame:
+    """
+    Aggregate an amortization schedule to yearly or quarterly buckets.
+    Flow columns are summed; stock columns (balances) keep the bucket's last value.
+    Payment n falls in bucket floor((n - 1) * buckets per year / periods_per_year),
+    so quarters of a biweekly schedule hold 7 or 6 payments and never drift.
+
+    Args:
+        schedule: Amortization schedule with a 1-based "month" column
+        freq: "yearly" or "quarterly"
+        sum_columns: Columns summed within each bucket
+        last_columns: Columns that take the last value in each bucket
+        periods_per_year: Payments per year in the schedule
+
+    Returns:
+        pandas.DataFrame: One row per bucket, indexed by bucket number (1-based)
+    """
+    if freq not in _BUCKETS_PER_YEAR:
+        raise ValueError(f"Unsupported aggregation: {freq}")
+    if schedule.empty:
+        return schedule.iloc[:0]
+
+    bucket = (schedule["month"].to_numpy() - 1) * _BUCKETS_PER_YEAR[freq] // periods_per_year
+
+    # Start of each bucket in the (sorted) schedule
+    starts = np.flatnonzero(np.r_[True, bucket[1:] != bucket[:-1]])
+    ends = np.r_[starts[1:], len(bucket)] - 1
+
+    data = {}
+    for col in sum_columns:
+        if col in schedule:
+            data[col] = np.add.reduceat(schedule[col].to_numpy(), starts)
+    for col in last_columns:
+        if col in schedule:
+            data[col] = schedule[col].to_numpy()[ends]
+
+    index = pd.Index(bucket[starts] + 1, name="Year" if freq == "yearly" else "Quarter")
+    return pd.DataFrame(data, index=index)
+
+
+def lttb_indices(x, y, threshold: int) -> np.ndarray:
+    """
+    Pick the indices of points that best preserve a line's shape
+    (Largest-Triangle-Three-Buckets). The first and last points are kept.
+    Triangle areas within each bucket are computed as one array operation.
+
+    Args:
+        x: Sorted x values
+        y: y values
+        threshold: Number of points to keep
+
+    Returns:
+        numpy.ndarray: Sorted indices of the points to keep
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    # Interior points split into threshold - 2 buckets
+    edges = np.linspace(1, n - 1, threshold - 1).astype(int)
+    # Average of each bucket, used as the third triangle point for the bucket before it
+    sums_x = np.add.reduceat(x[1:n - 1], edges[:-1] - 1)
+    sums_y = np.add.reduceat(y[1:n - 1], edges[:-1] - 1)
+    counts = np.diff(edges)
+    avg_x = np.r_[sums_x / counts, x[-1]]
+    avg_y = np.r_[sums_y / counts, y[-1]]
+
+    selected = np.empty(threshold, dtype=int)
+    selected[0], selected[-1] = 0, n - 1
+    a = 0
+    for b in range(threshold - 2):
+        lo, hi = edges[b], edges[b + 1]
+        # Twice the triangle area between the last pick, each candidate and the next bucket's average
+        area = np.abs(
+            (x[a] - avg_x[b + 1]) * (y[lo:hi] - y[a])
+            - (x[a] - x[lo:hi]) * (avg_y[b + 1] - y[a])
+        )
+        a = lo + int(np.argmax(area))
+        selected[b + 1] = a
+
+    return selected
+
+
+def downsample_frame(df: pd.DataFrame, max_points: int = MAX_CHART_POINTS) -> pd.DataFrame:
+    """
+    Bound a chart frame (numeric index, one column per series) to a point budget.
+    Each series keeps its LTTB points and the frame keeps the union of them,
+    so no series loses its shape and the row count stays within
+    max_points x number of series.
+
+    Args:
+        df: Frame with a sorted numeric index
+        max_points: Points to keep per series
+
+    Returns:
+        pandas.DataFrame: Rows of df selected for charting
+    """
+    if len(df) <= max_points:
+        return df
+
+    x = df.index.to_numpy(dtype=float)
+    keep = np.zeros(len(df), dtype=bool)
+    for col in df.columns:
+        values = df[col].to_numpy(dtype=float)
+        valid = np.flatnonzero(~np.isnan(values))
+        keep[valid[lttb_indices(x[valid], values[valid], max_points)]] = True
+
+    return df.iloc[np.flatnonzero(keep)]
+
+
+def balance_on_grid(
+    schedules: dict,
+    max_points: int = MAX_CHART_POINTS,
+    periods_per_year: int = 12,
+) -> pd.DataFrame:
+    """
+    Line up several schedules' balances on one shared year axis, from the
+    opening balance to the longest payoff, and downsample to the point budget.
+    Balances are zero after a schedule pays off.
+
+    Args:
+        schedules: Series name -> amortization schedule
+        max_points: Points to keep per series
+        periods_per_year: Payments per year in the schedules
+
+    Returns:
+        pandas.DataFrame: One column per series, indexed by Year
+    """
+    max_period = max((len(s) for s in schedules.values()), default=0)
+    data = {}
+    for name, schedule in schedules.items():
+        balances = np.zeros(max_period + 1)
+        if len(schedule):
+            # Opening balance is the first row's balance before its principal
+            balances[0] = (
+                schedule["balance"].iloc[0]
+                + schedule["principal"].iloc[0]
+                + schedule["principal_paydown"].iloc[0]
+            )
+            balances[1:len(schedule) + 1] = schedule["balance"].to_numpy()
+        data[name] = balances
+
+    index = pd.Index(schedule_years(np.arange(max_period + 1), periods_per_year), name="Year")
+    return downsample_frame(pd.DataFrame(data, index=index), max_points)
@@ -1,117 +1,187 @@
-import sys
-from pathlib import Path
-import streamlit as st
+import io
+import threading
 
-sys.path.append(str(Path(__file__).parent.parent))
+import streamlit as st
 
 import pandas as pd
 import altair as alt
 import numpy as np
 from datetime import datetime as dt
-from dateutil.relativedelta import relativedelta
 import matplotlib.pyplot as plt
 import matplotlib.ticker as mtick
+from matplotlib.figure import Figure
+from PIL import Image
 
-from src.models.mortgage_classes import CurrentMortgage, NewMortgageScenario
+from mortgage_analyzer.models.mortgage_classes import CurrentMortgage, NewMortgageScenario
+from mortgage_analyzer.engines.buydown_engine import analyze_mortgage_buydown
+from mortgage_analyzer.engines.date_engine import as_days, today
+from mortgage_analyzer.engines.schedule_diff_engine import align_schedules
+from mortgage_analyzer.engines.rent_vs_buy_engine import analyze_rent_vs_buy
+from mortgage_analyzer.engines.sensitivity_engine import tornado_analysis
+from mortgage_analyzer.visualizations.chart_data import aggregate_schedule, balance_on_grid, downsample_frame
+from mortgage_analyzer.utils.profiling_utils import profiled, profile_block
 
 #######################################################################
 # Comparison visualizations (combination of Streamlit native and Altair)
 #######################################################################
 
-def create_monthly_payment_comparison(current_mortgage, new_mortgage):
+# Scenario names used for the aligned schedules behind the comparison charts
+COMPARISON_SCENARIOS = ("Current Mortgage", "New Mortgage")
+
+
+def comparison_schedules(current_mortgage, new_mortgage, months=None, escrow_assumptions=None):
     """
-    Creates a bar chart comparing the monthly payments of both mortgages.
-    Uses Matplotlib for more control over styling with a dark theme.
-    
+    Both mortgages aligned month by month (see schedule_diff_engine), under the
+    COMPARISON_SCENARIOS names. Comparison charts accept one of these as
+    `aligned` so a page can build it once and share it.
+    """
+    return align_schedules(
+        dict(zip(COMPARISON_SCENARIOS, (current_mortgage, new_mortgage))),
+        months=months,
+        escrow_assumptions=escrow_assumptions,
+    )
+
+PAYMENT_COMPONENTS = ["Principal & Interest", "Taxes", "Insurance", "PMI", "Extra Principal", "Total Payment"]
+
+# pyplot styles are global state; figures built off the script thread (background
+# precompute) take this lock so they don't interleave with each other
+_FIGURE_LOCK = threading.Lock()
+
+# Widest image st.image sends without rescaling (Streamlit's maximum content width)
+MAX_IMAGE_WIDTH = 1460
+
+
+def _payment_component_values(mortgage):
+    return [
+        mortgage.principal_and_interest,
+        mortgage.monthly_tax,
+        mortgage.monthly_ins,
+        mortgage.monthly_pmi,
+        mortgage.extra_principal,
+        mortgage.total_pmt
+    ]
+
+@profiled()
+def payment_comparison_figure_png(current_mortgage, new_mortgage):
+    """
+    Renders the monthly payment comparison bar chart (Matplotlib, dark theme) to PNG.
+    Uses the Figure API rather than pyplot so it can run on a worker thread.
+
     Args:
         current_mortgage (CurrentMortgage): Current mortgage object
         new_mortgage (NewMortgageScenario): New mortgage scenario object
+
+    Returns:
+        bytes: PNG image, rendered with the same settings st.pyplot uses
     """
-    # Prepare the data
-    categories = ["Principal & Interest", "Taxes", "Insurance", "PMI", "Extra Principal", "Total Payment"]
-    current_values = [
-        current_mortgage.principal_and_interest,
-        current_mortgage.monthly_tax,
-        current_mortgage.monthly_ins,
-        current_mortgage.monthly_pmi,
-        current_mortgage.extra_principal,
-        current_mortgage.total_pmt
-    ]
-    new_values = [
-        new_mortgage.principal_and_interest,
-        new_mortgage.monthly_tax,
-        new_mortgage.monthly_ins,
-        new_mortgage.monthly_pmi,
-        new_mortgage.extra_principal,
-        new_mortgage.total_pmt
-    ]
-    
-    # Set up the matplotlib figure with dark theme
-    plt.style.use('dark_background')
-    fig, ax = plt.subplots(figsize=(12, 6), facecolor='#0E1117')
-    ax.set_facecolor('#0E1117')
-    
-    # Define bar positions
-    x = np.arange(len(categories))
-    width = 0.35
-    
-    # Create the bars
-    rects1 = ax.bar(x - width/2, current_values, width, label='Current', color='#87CEFA')  # Light blue
-    rects2 = ax.bar(x + width/2, new_values, width, label='New', color='#1E90FF')   # Darker blue
-    
-    # Add labels, title and custom x-axis tick labels
-    ax.set_xlabel('Payment Components', color='white', fontsize=14, fontweight='bold')
-    ax.set_ylabel('Amount ($)', color='white', fontsize=14, fontweight='bold')
-    ax.set_title('Monthly Payment Comparison', color='white', fontsize=18, fontweight='bold')
-    ax.set_xticks(x)
-    ax.set_xticklabels(categories, rotation=45, ha='right', color='white', fontsize=12)
-    
-    # Make y-axis ticks larger and bolder
-    ax.tick_params(axis='y', colors='white', labelsize=12)
-    
-    # Add horizontal gridlines only
-    ax.grid(axis='y', linestyle='--', alpha=0.4, color='#888888')
-    
-    # Add value labels on top of bars - make them larger and with shadow effect for visibility
-    def add_labels(rects):
-        for rect in rects:
-            height = rect.get_height()
-            # Add a slight shadow/outline effect for better visibility
-            for xoffset, yoffset in [(-0.5, -0.5), (0.5, -0.5), (-0.5, 0.5), (0.5, 0.5)]:
+    categories = PAYMENT_COMPONENTS
+    current_values = _payment_component_values(current_mortgage)
+    new_values = _payment_component_values(new_mortgage)
+
+    with _FIGURE_LOCK, plt.style.context('dark_background'):
+        # Set up the matplotlib figure with dark theme
+        fig = Figure(figsize=(12, 6), facecolor='#0E1117')
+        ax = fig.subplots()
+        ax.set_facecolor('#0E1117')
+
+        # Define bar positions
+        x = np.arange(len(categories))
+        width = 0.35
+
+        # Create the bars
+        rects1 = ax.bar(x - width/2, current_values, width, label='Current', color='#87CEFA')  # Light blue
+        rects2 = ax.bar(x + width/2, new_values, width, label='New', color='#1E90FF')   # Darker blue
+
+        # Add labels, title and custom x-axis tick labels
+        ax.set_xlabel('Payment Components', color='white', fontsize=14, fontweight='bold')
+        ax.set_ylabel('Amount ($)', color='white', fontsize=14, fontweight='bold')
+        ax.set_title('Monthly Payment Comparison', color='white', fontsize=18, fontweight='bold')
+        ax.set_xticks(x)
+        ax.set_xticklabels(categories, rotation=45, ha='right', color='white', fontsize=12)
+
+        # Make y-axis ticks larger and bolder
+        ax.tick_params(axis='y', colors='white', labelsize=12)
+
+        # Add horizontal gridlines only
+        ax.grid(axis='y', linestyle='--', alpha=0.4, color='#888888')
+
+        # Add value labels on top of bars - make them larger and with shadow effect for visibility
+        def add_labels(rects):
+            for rect in rects:
+                height = rect.get_height()
+                # Add a slight shadow/outline effect for better visibility
+                for xoffset, yoffset in [(-0.5, -0.5), (0.5, -0.5), (-0.5, 0.5), (0.5, 0.5)]:
+                    ax.annotate(f'${height:,.0f}',
+                                xy=(rect.get_x() + rect.get_width() / 2, height),
+                                xytext=(xoffset, 3 + yoffset),
+                                textcoords="offset points",
+                                ha='center', va='bottom',
+                                color='black', fontsize=11, alpha=0.7)
+
+                # Main label
                 ax.annotate(f'${height:,.0f}',
                             xy=(rect.get_x() + rect.get_width() / 2, height),
-                            xytext=(xoffset, 3 + yoffset),
+                            xytext=(0, 3),
                             textcoords="offset points",
                             ha='center', va='bottom',
-                            color='black', fontsize=11, alpha=0.7)
-            
-            # Main label
-            ax.annotate(f'${height:,.0f}',
-                        xy=(rect.get_x() + rect.get_width() / 2, height),
-                        xytext=(0, 3),
-                        textcoords="offset points",
-                        ha='center', va='bottom',
-                        color='white', fontsize=11, fontweight='bold')
-    
-    add_labels(rects1)
-    add_labels(rects2)
-    
-    # Format y-axis as currency
-    ax.yaxis.set_major_formatter(mtick.FuncFormatter(lambda x, p: f'${int(x):,}'))
-    
-    # Remove all spines (borders)
-    for spine in ax.spines.values():
-        spine.set_visible(False)
-    
-    # Add a legend with border - make it larger and more visible
-    legend = ax.legend(framealpha=0.9, facecolor='#0E1117', edgecolor='#888888', 
-                       labelcolor='white', fontsize=12, frameon=True)
-    
-    # Adjust layout
-    fig.tight_layout()
+                            color='white', fontsize=11, fontweight='bold')
+
+        add_labels(rects1)
+        add_labels(rects2)
+
+        # Format y-axis as currency
+        ax.yaxis.set_major_formatter(mtick.FuncFormatter(lambda x, p: f'${int(x):,}'))
+
+        # Remove all spines (borders)
+        for spine in ax.spines.values():
+            spine.set_visible(False)
+
+        # Add a legend with border - make it larger and more visible
+        ax.legend(framealpha=0.9, facecolor='#0E1117', edgecolor='#888888',
+                  labelcolor='white', fontsize=12, frameon=True)
+
+        # Adjust layout
+        fig.tight_layout()
+
+        with profile_block("matplotlib.render"):
+            image = io.BytesIO()
+            fig.savefig(image, format="png", bbox_inches="tight", dpi=200)
+
+    # st.image scales anything wider than its maximum width on every render;
+    # scale once here (the same way) so cached images are sent as-is
+    rendered = Image.open(image)
+    if rendered.width > MAX_IMAGE_WIDTH:
+        rendered = rendered.resize((MAX_IMAGE_WIDTH, int(rendered.height * MAX_IMAGE_WIDTH / rendered.width)), Image.BILINEAR)
+        image = io.BytesIO()
+        rendered.save(image, format="PNG")
+
+    return image.getvalue()
+
+@profiled()
+def create_monthly_payment_comparison(current_mortgage, new_mortgage, escrow_assumptions=None, years=10, figure_png=None, aligned=None):
+    """
+    Creates a bar chart comparing the monthly payments of both mortgages.
+    Uses Matplotlib for more control over styling with a dark theme.
+    Also projects total payments forward with tax and insurance growth.
     
+    Args:
+        current_mortgage (CurrentMortgage): Current mortgage object
+        new_mortgage (NewMortgageScenario): New mortgage scenario object
+        escrow_assumptions (EscrowAssumptions): Tax/insurance growth and escrow rules
+        years (int): Number of years to project total payments
+        figure_png (bytes): Pre-rendered payment_comparison_figure_png (optional)
+        aligned (AlignedSchedules): Shared comparison_schedules built with the same
+            escrow_assumptions, covering at least `years` (optional)
+    """
+    # Prepare the data
+    categories = PAYMENT_COMPONENTS
+    current_values = _payment_component_values(current_mortgage)
+    new_values = _payment_component_values(new_mortgage)
+
     # Display the chart
-    st.pyplot(fig)
+    if figure_png is None:
+        figure_png = payment_comparison_figure_png(current_mortgage, new_mortgage)
+    st.image(figure_png, width="stretch")
     
     # Calculate differences
     differences = [n - c for n, c in zip(new_values, current_values)]
@@ -143,7 +213,18 @@ def create_monthly_payment_comparison(current_mortgage, new_mortgage):
     # Display the table
     st.table(table_data)
 
-def create_amortization_comparison(current_mortgage, new_mortgage):
+    # Project total payments with escrow changing at each annual analysis
+    months = years * 12
+    if aligned is None:
+        aligned = comparison_schedules(current_mortgage, new_mortgage, months, escrow_assumptions)
+    projected = aligned.frame("payment").iloc[1:months + 1]
+
+    st.write("Projected Total Monthly Payment (with tax and insurance growth):")
+    # Payments are step functions, so LTTB keeps every step while bounding the payload
+    st.line_chart(downsample_frame(projected))
+
+@profiled()
+def create_amortization_comparison(current_mortgage, new_mortgage, aligned=None):
     """
     Creates a line chart comparing the loan balances over time.
     Streamlit's line chart works well for this visualization.
@@ -151,33 +232,13 @@ def create_amortization_comparison(current_mortgage, new_mortgage):
     Args:
         current_mortgage (CurrentMortgage): Current mortgage object
         new_mortgage (NewMortgageScenario): New mortgage scenario object
+        aligned (AlignedSchedules): Shared comparison_schedules (optional)
     """
-    # Get amortization schedules
-    current_schedule = current_mortgage.amortization_schedule()
-    new_schedule = new_mortgage.amortization_schedule()
-    
-    # Calculate years for display
-    current_schedule["Year"] = (current_schedule["month"] / 12).apply(lambda x: round(x, 1))
-    new_schedule["Year"] = (new_schedule["month"] / 12).apply(lambda x: round(x, 1))
-    
-    # Make sure we have same length if possible
-    max_years = max(current_schedule["Year"].max(), new_schedule["Year"].max())
+    if aligned is None:
+        aligned = comparison_schedules(current_mortgage, new_mortgage)
     
-    # Create the comparison dataframe with fixed points
-    years = np.arange(0, max_years + 0.1, 0.1)
-    comparison_df = pd.DataFrame(index=years)
-    
-    # Handle duplicates by aggregating (taking the last value for each Year)
-    current_data = current_schedule.groupby("Year")["balance"].last()
-    new_data = new_schedule.groupby("Year")["balance"].last()
-    
-    # Reindex to match our comparison dataframe's index
-    current_data = current_data.reindex(years, method='ffill')
-    new_data = new_data.reindex(years, method='ffill')
-    
-    # Add the data to the comparison dataframe
-    comparison_df["Current Mortgage"] = current_data
-    comparison_df["New Mortgage"] = new_data
+    # Balances on a shared year axis, downsampled server-side to a fixed point budget
+    comparison_df = downsample_frame(aligned.frame("balance"))
     
     # Display chart
     st.line_chart(comparison_df)
@@ -192,7 +253,29 @@ def create_amortization_comparison(current_mortgage, new_mortgage):
     with col2:
         st.metric("New Mortgage Term", f"{new_years:.1f} years")
 
-def create_equity_buildup_chart(current_mortgage, new_mortgage, years=30):
+@profiled()
+def equity_buildup_data(current_mortgage, new_mortgage, years=30, aligned=None):
+    """
+    Projected equity at each year for both mortgages.
+
+    Args:
+        current_mortgage (CurrentMortgage): Current mortgage object
+        new_mortgage (NewMortgageScenario): New mortgage scenario object
+        years (int): Number of years to project
+        aligned (AlignedSchedules): Shared comparison_schedules covering `years` (optional)
+
+    Returns:
+        pandas.DataFrame: Current Mortgage / New Mortgage columns indexed by year
+    """
+    if aligned is None:
+        aligned = comparison_schedules(current_mortgage, new_mortgage, years * 12)
+
+    # Yearly rows of the month-aligned equity (same as estimate_equity_at_year)
+    equity_data = pd.DataFrame(aligned.equity[:, :years * 12 + 1:12].T, columns=list(aligned.names))
+    return equity_data
+
+@profiled()
+def create_equity_buildup_chart(current_mortgage, new_mortgage, years=30, equity_data=None):
     """
     Creates a line chart showing equity buildup over time for both mortgages.
     Streamlit's line chart works well for this visualization.
@@ -201,26 +284,24 @@ def create_equity_buildup_chart(current_mortgage, new_mortgage, years=30):
         current_mortgage (CurrentMortgage): Current mortgage object
         new_mortgage (NewMortgageScenario): New mortgage scenario object
         years (int): Number of years to project
+        equity_data (pandas.DataFrame): Precomputed equity_buildup_data (optional)
     """
-    # Create data points for each year
-    equity_data = pd.DataFrame(index=range(years + 1))
-    
-    # Calculate equity for current mortgage
-    equity_data["Current Mortgage"] = [current_mortgage.estimate_equity_at_year(year) for year in range(years + 1)]
-    
-    # Calculate equity for new mortgage
-    equity_data["New Mortgage"] = [new_mortgage.estimate_equity_at_year(year) for year in range(years + 1)]
+    if equity_data is None:
+        equity_data = equity_buildup_data(current_mortgage, new_mortgage, years)
     
     # Display chart
     st.subheader("Equity Buildup Over Time (3% Annual Appreciation)")
     st.line_chart(equity_data)
     
     # Show key details
-    five_year_current = current_mortgage.estimate_equity_at_year(5)
-    five_year_new = new_mortgage.estimate_equity_at_year(5)
+    def equity_at(column, mortgage, year):
+        return equity_data[column].iloc[year] if year < len(equity_data) else mortgage.estimate_equity_at_year(year)
+
+    five_year_current = equity_at("Current Mortgage", current_mortgage, 5)
+    five_year_new = equity_at("New Mortgage", new_mortgage, 5)
     
-    ten_year_current = current_mortgage.estimate_equity_at_year(10)
-    ten_year_new = new_mortgage.estimate_equity_at_year(10)
+    ten_year_current = equity_at("Current Mortgage", current_mortgage, 10)
+    ten_year_new = equity_at("New Mortgage", new_mortgage, 10)
     
     col1, col2 = st.columns(2)
     with col1:
@@ -231,7 +312,8 @@ def create_equity_buildup_chart(current_mortgage, new_mortgage, years=30):
         st.metric("5-Year Equity (New)", f"${five_year_new:,.2f}")
         st.metric("10-Year Equity (New)", f"${ten_year_new:,.2f}")
 
-def create_interest_paid_comparison(current_mortgage, new_mortgage):
+@profiled()
+def create_interest_paid_comparison(current_mortgage, new_mortgage, aligned=None):
     """
     Creates a bar chart comparing total interest paid over the life of the loans.
     Streamlit's bar chart works well for this visualization.
@@ -239,15 +321,14 @@ def create_interest_paid_comparison(current_mortgage, new_mortgage):
     Args:
         current_mortgage (CurrentMortgage): Current mortgage object
         new_mortgage (NewMortgageScenario): New mortgage scenario object
+        aligned (AlignedSchedules): Shared comparison_schedules covering both payoffs (optional)
     """
-    # Calculate total interest for current mortgage
-    current_schedule = current_mortgage.amortization_schedule()
-    current_total_interest = current_schedule["interest"].sum()
+    if aligned is None:
+        aligned = comparison_schedules(current_mortgage, new_mortgage)
+
+    # Lifetime interest for both mortgages in one pass over the aligned schedules
+    current_total_interest, new_total_interest = aligned.totals()["total_interest"]
     current_total_principal = current_mortgage.loan_amount
-    
-    # Calculate total interest for new mortgage
-    new_schedule = new_mortgage.amortization_schedule()
-    new_total_interest = new_schedule["interest"].sum()
     new_total_principal = new_mortgage.loan_amount
     
     # Create DataFrame for the chart
@@ -313,6 +394,7 @@ def create_interest_paid_comparison(current_mortgage, new_mortgage):
             delta_color="inverse"
         )
 
+@profiled()
 def create_loan_term_comparison(current_mortgage, new_mortgage):
     """
     Creates a horizontal bar chart comparing the loan terms.
@@ -357,8 +439,10 @@ def create_loan_term_comparison(current_mortgage, new_mortgage):
     ax.set_title('Loan Term Comparison')
     
     # Display in Streamlit
-    st.pyplot(fig)
+    with profile_block("matplotlib.render"):
+        st.pyplot(fig)
 
+@profiled()
 def create_breakeven_chart(current_mortgage, new_mortgage):
     """
     Creates a line chart showing the cumulative cost difference between mortgages.
@@ -371,54 +455,32 @@ def create_breakeven_chart(current_mortgage, new_mortgage):
     # Define time period (10 years is usually sufficient to find breakeven)
     months = 10 * 12
     
-    # Calculate monthly costs for each mortgage
-    cumulative_data = []
-    
     # Assume closing costs for new mortgage (typically 2-5% of loan amount)
     closing_costs = new_mortgage.loan_amount * 0.03  # 3% of loan amount as closing costs
     
-    cumulative_difference = closing_costs  # Start with closing costs as initial difference
+    # Start with closing costs and add the new loan's cumulative extra cost
+    # (payments include escrow growth; negative means the new loan is cheaper)
+    payment_diff = comparison_schedules(current_mortgage, new_mortgage, months).diff(*COMPARISON_SCENARIOS)
+    cumulative_difference = closing_costs + payment_diff["cumulative_payment"].to_numpy()
     
-    for month in range(0, months + 1):
-        # Monthly payment for current mortgage
-        current_payment = current_mortgage.total_pmt
-        
-        # Monthly payment for new mortgage
-        new_payment = new_mortgage.total_pmt
-        
-        # Monthly savings or cost (positive means current is more expensive)
-        monthly_difference = current_payment - new_payment
-        
-        # Accumulate the difference (only after month 0)
-        if month > 0:
-            cumulative_difference -= monthly_difference
-        
-        # Get the year for display
-        year = month / 12
-        
-        cumulative_data.append({
-            "Month": month,
-            "Year": year,
-            "Cumulative Difference": cumulative_difference
-        })
-    
-    # Convert to DataFrame
-    df = pd.DataFrame(cumulative_data)
+    df = pd.DataFrame({
+        "Month": np.arange(months + 1),
+        "Year": np.arange(months + 1) / 12,
+        "Cumulative Difference": cumulative_difference
+    })
     
-    # Find breakeven point (if it exists)
+    # Find breakeven point (if it exists) at the first sign change
     breakeven_point = None
-    for i in range(1, len(df)):
-        if (df.iloc[i-1]["Cumulative Difference"] > 0 and df.iloc[i]["Cumulative Difference"] <= 0) or \
-           (df.iloc[i-1]["Cumulative Difference"] <= 0 and df.iloc[i]["Cumulative Difference"] > 0):
-            # Linear interpolation for more accurate breakeven point
-            y1 = df.iloc[i-1]["Cumulative Difference"]
-            y2 = df.iloc[i]["Cumulative Difference"]
-            x1 = df.iloc[i-1]["Year"]
-            x2 = df.iloc[i]["Year"]
-            
-            # Solving for x where y = 0
-            breakeven_point = x1 - y1 * (x2 - x1) / (y2 - y1)
-            break
+    positive = cumulative_difference > 0
+    crossings = np.flatnonzero(positive[:-1] != positive[1:])
+    if crossings.size > 0:
+        i = crossings[0] + 1
+        # Linear interpolation for more accurate breakeven point
+        y1, y2 = cumulative_difference[i - 1], cumulative_difference[i]
+        x1, x2 = df["Year"].iloc[i - 1], df["Year"].iloc[i]
+        
+        # Solving for x where y = 0
+        breakeven_point = x1 - y1 * (x2 - x1) / (y2 - y1)
     
     # Create matplotlib figure
     fig, ax = plt.subplots(figsize=(10, 6))
@@ -457,7 +519,8 @@ def create_breakeven_chart(current_mortgage, new_mortgage):
     ax.set_xlim(0, 10)
     
     # Display in Streamlit
-    st.pyplot(fig)
+    with profile_block("matplotlib.render"):
+        st.pyplot(fig)
     
     # Add explanation text
     if breakeven_point is not None and breakeven_point <= 10:
@@ -471,6 +534,7 @@ def create_breakeven_chart(current_mortgage, new_mortgage):
     else:
         st.warning("⚠️ Based on the payment difference, you may not break even within a reasonable timeframe.")
 
+@profiled()
 def create_mortgage_comparison_dashboard(current_mortgage, new_mortgage):
     """
     Creates a key metrics comparison table.
@@ -559,6 +623,7 @@ def create_mortgage_comparison_dashboard(current_mortgage, new_mortgage):
 # Single mortgage visualizations (using native Streamlit charts)
 #######################################################################
 
+@profiled()
 def create_single_mortgage_payment_breakdown(mortgage):
     """
     Creates a pie chart showing the breakdown of a single mortgage's monthly payment.
@@ -638,7 +703,8 @@ def create_single_mortgage_payment_breakdown(mortgage):
     ax.set_facecolor('#0E1117')  # Background color for the plot area
     
     # Display the chart
-    st.pyplot(fig)
+    with profile_block("matplotlib.render"):
+        st.pyplot(fig)
     
     # Reset style for other plots
     plt.style.use('default')
@@ -656,6 +722,7 @@ def create_single_mortgage_payment_breakdown(mortgage):
     breakdown_df["Amount"] = breakdown_df["Amount"].apply(lambda x: f"${x:.2f}")
     st.table(breakdown_df)
 
+@profiled()
 def create_single_mortgage_amortization_chart(mortgage):
     """
     Creates charts showing the amortization schedule for a single mortgage.
@@ -667,24 +734,18 @@ def create_single_mortgage_amortization_chart(mortgage):
     # Get amortization schedule
     schedule = mortgage.amortization_schedule()
     
-    # Add year column for improved readability
-    schedule["Year"] = (schedule["month"] / 12).apply(lambda x: round(x, 1))
-    
     # Create balance chart
     st.subheader("Loan Balance Over Time")
     
-    # Set year as index for the line chart
-    balance_data = schedule.set_index("Year")[["balance"]]
-    balance_data.columns = ["Loan Balance"]
+    # Balance by year, downsampled server-side so long schedules send a bounded payload
+    balance_data = balance_on_grid({"Loan Balance": schedule})
     st.line_chart(balance_data)
     
     # Create principal vs interest chart
     st.subheader("Principal vs Interest Payments")
     
-    # Group by year for clarity
-    yearly_data = schedule.groupby(schedule["month"] // 12)[["principal", "interest"]].sum()
-    # Keep the index numerical (add 1 to make it 1-based rather than 0-based)
-    yearly_data.index = yearly_data.index + 1
+    # Yearly totals (one bar per year)
+    yearly_data = aggregate_schedule(schedule, "yearly", sum_columns=("principal", "interest"), last_columns=())
     yearly_data.columns = ["Principal", "Interest"]
     
     st.bar_chart(yearly_data)
@@ -709,6 +770,7 @@ def create_single_mortgage_amortization_chart(mortgage):
             help="For every $1 of principal paid, you will have paid this much in interest"
         )
 
+@profiled()
 def create_equity_growth_chart(mortgage, years=30):
     """
     Creates a line chart showing equity growth for a single mortgage.
@@ -769,6 +831,7 @@ def create_equity_growth_chart(mortgage, years=30):
     with col3:
         st.metric("30-Year Equity", f"${year_30_equity:,.2f}")
     
+@profiled()
 def create_interest_principal_ratio_chart(mortgage):
     """
     Creates a horizontal bar chart showing interest vs. principal over the loan term.
@@ -826,7 +889,8 @@ def create_interest_principal_ratio_chart(mortgage):
     ax.spines['left'].set_color('#666666')
     
     # Display in Streamlit
-    st.pyplot(fig)
+    with profile_block("matplotlib.render"):
+        st.pyplot(fig)
     
     # Reset style for other plots
     plt.style.use('default')
@@ -838,6 +902,7 @@ def create_interest_principal_ratio_chart(mortgage):
         help="For every $1 of principal paid, you will have paid this much in interest"
     )
 
+@profiled()
 def create_mortgage_timeline_chart(mortgage):
     """
     Creates a timeline showing key milestones in the mortgage.
@@ -851,65 +916,53 @@ def create_mortgage_timeline_chart(mortgage):
     
     # Get start and end dates
     if hasattr(mortgage, 'loan_begin_date'):
-        start_date = mortgage.loan_begin_date
+        start_date = as_days(mortgage.start_date)[()]
     else:
         # For NewMortgageScenario, use current date
-        start_date = dt.now()
+        start_date = today()
     
     # End date is always available
-    end_date_str = mortgage.end_date
-    end_date = dt.strptime(end_date_str, "%m/%d/%Y")
+    end_date = as_days(mortgage.end_date)[()]
     
     # Add start and end milestones
     milestones.append({
         "Date": start_date,
-        "Year": 0,
         "Event": "Loan Start", 
         "Description": f"Loan amount: ${mortgage.loan_amount:,.2f}"
     })
     
     milestones.append({
         "Date": end_date,
-        "Year": (end_date - start_date).days / 365.25,
         "Event": "Loan Payoff", 
         "Description": f"After {mortgage.periods_remaining / 12:.1f} years"
     })
     
-    # Calculate when loan is 50% paid off
-    half_payoff_period = 0
-    running_balance = mortgage.loan_amount
+    # Calculate when loan is 50% paid off (schedule rows carry their payment dates)
     half_balance = mortgage.loan_amount / 2
     
     schedule = mortgage.amortization_schedule()
-    half_paid_row = schedule[schedule["balance"] <= half_balance].iloc[0] if not schedule[schedule["balance"] <= half_balance].empty else None
+    half_paid = schedule[schedule["balance"] <= half_balance]
     
-    if half_paid_row is not None:
-        half_paid_month = half_paid_row["month"]
-        half_paid_years = half_paid_month / 12
-        half_paid_date = start_date + relativedelta(months=int(half_paid_month))
-        
+    if not half_paid.empty:
         milestones.append({
-            "Date": half_paid_date,
-            "Year": half_paid_years,
+            "Date": half_paid["date"].iloc[0],
             "Event": "50% Paid Off",
-            "Description": f"After {half_paid_years:.1f} years"
+            "Description": f"After {half_paid['month'].iloc[0] / 12:.1f} years"
         })
     
-    # Add PMI removal date if applicable
+    # Add PMI removal date if applicable (due date of the first payment without PMI)
     pmi_periods = mortgage.pmi_periods_remaining()
     if pmi_periods > 0:
-        pmi_removal_date = start_date + relativedelta(months=int(pmi_periods))
-        pmi_years = pmi_periods / 12
-        
         milestones.append({
-            "Date": pmi_removal_date,
-            "Year": pmi_years,
+            "Date": mortgage.payment_dates(pmi_periods + 1)[-1],
             "Event": "PMI Removal",
-            "Description": f"After {pmi_years:.1f} years"
+            "Description": f"After {pmi_periods / 12:.1f} years"
         })
     
-    # Convert to DataFrame
+    # Convert to DataFrame, placing every milestone on one calendar axis from the loan start
     df = pd.DataFrame(milestones)
+    df["Date"] = pd.to_datetime(df["Date"])
+    df["Year"] = (df["Date"] - pd.Timestamp(start_date)).dt.days / 365.25
     
     # Sort by date
     df = df.sort_values("Date")
@@ -970,7 +1023,8 @@ def create_mortgage_timeline_chart(mortgage):
     ax.tick_params(axis='x', colors='white')
     
     # Display in Streamlit
-    st.pyplot(fig)
+    with profile_block("matplotlib.render"):
+        st.pyplot(fig)
     
     # Reset style for other plots
     plt.style.use('default')
@@ -980,6 +1034,7 @@ def create_mortgage_timeline_chart(mortgage):
     for i, row in df.iterrows():
         st.write(f"• **{row['Event']}**: {row['Date'].strftime('%m/%d/%Y')} - {row['Description']}")
 
+@profiled()
 def create_single_mortgage_dashboard(mortgage):
     """
     Creates a comprehensive dashboard for a single mortgage with multiple visualizations.
@@ -1000,4 +1055,268 @@ def create_single_mortgage_dashboard(mortgage):
     create_interest_principal_ratio_chart(mortgage)
     
     # Timeline
-    create_mortgage_timeline_chart(mortgage)
\ No newline at end of file
+    create_mortgage_timeline_chart(mortgage)
+
+#######################################################################
+# Points and lender credit visualizations
+#######################################################################
+
+@profiled()
+def create_buydown_frontier_chart(mortgage, rate_sheet, holding_period_years=None):
+    """
+    Creates a scatter chart of upfront cost vs. monthly payment for every rate sheet
+    option, with the efficient frontier drawn through the options worth considering.
+    Uses matplotlib through Streamlit with dark theme styling.
+
+    Args:
+        mortgage: Either NewMortgageScenario or RefinanceScenario object
+        rate_sheet (pandas.DataFrame): Rate sheet with term, rate and points columns
+        holding_period_years: Years you expect to keep the loan (defaults to the full term)
+    """
+    analysis = analyze_mortgage_buydown(mortgage, rate_sheet, holding_period_years)
+    options = analysis.options
+
+    # Set dark theme
+    plt.style.use('dark_background')
+    fig, ax = plt.subplots(figsize=(10, 6), facecolor='#0E1117')
+
+    term_colors = ["#1E90FF", "#32CD32", "#FF6347", "#FFD700", "#8A2BE2"]
+
+    for i, (term, group) in enumerate(options.groupby("term")):
+        color = term_colors[i % len(term_colors)]
+        ax.scatter(group["upfront_cost"], group["payment"], color=color, alpha=0.5, label=f"{term}-year options")
+
+        # Frontier line through the non-dominated options for this term
+        frontier = group[group["on_frontier"]].sort_values("upfront_cost")
+        ax.plot(frontier["upfront_cost"], frontier["payment"], color=color, linewidth=2)
+
+        # Mark the par (no points) option
+        par = group[group["is_par"]]
+        ax.scatter(par["upfront_cost"], par["payment"], color=color, edgecolor='white', s=120, zorder=3)
+
+    # Format axes as currency
+    ax.xaxis.set_major_formatter(mtick.FuncFormatter(lambda x, p: f'${int(x):,}'))
+    ax.yaxis.set_major_formatter(mtick.FuncFormatter(lambda x, p: f'${int(x):,}'))
+
+    ax.set_xlabel('Upfront Cost (closing costs + points)', color='white')
+    ax.set_ylabel('Monthly Principal & Interest', color='white')
+    ax.set_title('Points vs. Rate Efficient Frontier', color='white', fontsize=14)
+    ax.set_facecolor('#0E1117')
+    ax.tick_params(colors='white')
+    ax.grid(linestyle='--', alpha=0.4, color='#888888')
+    ax.legend(framealpha=0.9, facecolor='#0E1117', edgecolor='#888888', labelcolor='white')
+
+    # Display in Streamlit
+    with profile_block("matplotlib.render"):
+        st.pyplot(fig)
+
+    # Reset style for other plots
+    plt.style.use('default')
+
+    # Show the frontier options with the numbers behind the chart
+    horizon_label = "Lifetime" if holding_period_years is None else f"{holding_period_years:g}-Year"
+    st.write("Options on the efficient frontier:")
+    st.dataframe(
+        analysis.frontier[[
+            "term", "rate", "points", "payment", "upfront_cost",
+            "lifetime_interest", "horizon_cost", "breakeven_months"
+        ]],
+        hide_index=True,
+        column_config={
+            "term": "Term (years)",
+            "rate": st.column_config.NumberColumn("Rate", format="%.3f%%"),
+            "points": st.column_config.NumberColumn("Points", format="%.3f"),
+            "payment": st.column_config.NumberColumn("P&I Payment", format="$%.2f"),
+            "upfront_cost": st.column_config.NumberColumn("Upfront Cost", format="$%.2f"),
+            "lifetime_interest": st.column_config.NumberColumn("Lifetime Interest", format="$%.2f"),
+            "horizon_cost": st.column_config.NumberColumn(f"{horizon_label} Cost", format="$%.2f",
+                                                          help="Upfront cost plus interest paid over the holding period"),
+            "breakeven_months": st.column_config.NumberColumn("Breakeven vs. Par (months)", format="%.0f")
+        },
+        width="stretch"
+    )
+
+    # Call out the cheapest option over the holding period
+    best = options.loc[options["horizon_cost"].idxmin()]
+    horizon_text = "the life of the loan" if holding_period_years is None else f"a {holding_period_years:g}-year hold"
+    st.info(f"💡 Over {horizon_text} the lowest total cost is the {best['term']}-year "
+            f"option at {best['rate']:.3f}% with {best['points']:+.3f} points "
+            f"(${best['horizon_cost']:,.2f} in upfront cost plus interest).")
+
+#######################################################################
+# Rent vs. buy visualizations
+#######################################################################
+
+@profiled()
+def create_rent_vs_buy_chart(mortgage, assumptions):
+    """
+    Creates a line chart of owner vs. renter wealth for every holding period from
+    1 to 30 years, with NPV and IRR details for the decision.
+    Uses Streamlit's native charts for simplicity.
+
+    Args:
+        mortgage (NewMortgageScenario): New mortgage scenario object
+        assumptions (RentVsBuyAssumptions): Rent, growth, return and selling cost assumptions
+    """
+    analysis = analyze_rent_vs_buy(mortgage, assumptions)
+    summary = analysis.summary.set_index("holding_years")
+
+    # Wealth after selling (owner) vs. investing the difference (renter)
+    st.subheader("Wealth by Holding Period: Buy vs. Rent")
+    wealth_data = summary[["owner_wealth", "renter_wealth"]]
+    wealth_data.columns = ["Buy (net sale proceeds + invested savings)", "Rent (invested down payment + savings)"]
+    st.line_chart(wealth_data)
+
+    # Key decision metrics
+    breakeven = analysis.breakeven_years
+    five_year = summary.loc[5] if 5 in summary.index else summary.iloc[0]
+    ten_year = summary.loc[10] if 10 in summary.index else summary.iloc[-1]
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric(
+            "Buying Breaks Even After",
+            f"{breakeven} years" if breakeven is not None else "Not within 30 years",
+            help="Shortest holding period where buying has a positive NPV against renting"
+        )
+    with col2:
+        st.metric(
+            "10-Year NPV of Buying",
+            f"${ten_year['npv']:,.2f}",
+            help=f"Discounted at your {assumptions.investment_return:.1%} investment return"
+        )
+    with col3:
+        st.metric(
+            "10-Year IRR of Buying",
+            f"{ten_year['irr']:.2%}" if pd.notna(ten_year['irr']) else "N/A",
+            f"{ten_year['irr'] - assumptions.investment_return:+.2%} vs. investing" if pd.notna(ten_year['irr']) else None,
+            help="Annual return on the down payment and extra owning costs, compared with renting"
+        )
+
+    # Full table for every holding period
+    with st.expander("View NPV and IRR by Holding Period"):
+        st.dataframe(
+            analysis.summary[["holding_years", "net_sale_proceeds", "owner_wealth", "renter_wealth", "npv", "irr", "better_choice"]],
+            hide_index=True,
+            column_config={
+                "holding_years": "Years Held",
+                "net_sale_proceeds": st.column_config.NumberColumn("Net Sale Proceeds", format="$%.2f"),
+                "owner_wealth": st.column_config.NumberColumn("Owner Wealth", format="$%.2f"),
+                "renter_wealth": st.column_config.NumberColumn("Renter Wealth", format="$%.2f"),
+                "npv": st.column_config.NumberColumn("NPV of Buying", format="$%.2f"),
+                "irr": st.column_config.NumberColumn("IRR of Buying", format="percent"),
+                "better_choice": "Better Choice"
+            },
+            width="stretch"
+        )
+
+    if five_year["npv"] < 0:
+        st.info(f"💡 If you sell within 5 years, renting and investing comes out "
+                f"${abs(five_year['npv']):,.2f} ahead in today's dollars.")
+
+#######################################################################
+# Sensitivity visualizations
+#######################################################################
+
+SENSITIVITY_LABELS = {
+    "rate": "Interest Rate",
+    "points": "Discount Points",
+    "closing_cost_pct": "Closing Costs",
+    "appreciation": "Home Appreciation",
+    "tax_growth": "Property Tax Growth",
+    "ins_growth": "Insurance Growth",
+    "holding_years": "Holding Period",
+    "monthly_savings": "Monthly Savings",
+    "breakeven_months": "Breakeven (months)",
+    "net_benefit": "Net Benefit",
+}
+
+def _format_driver_value(driver, value):
+    # Inputs are stored in their natural units; show them the way users enter them
+    if driver == "rate":
+        return f"{value:.3f}%"
+    if driver == "points":
+        return f"{value:+.3f}"
+    if driver == "holding_years":
+        return f"{value:g} yrs"
+    return f"{value:.1%}"
+
+@profiled()
+def create_tornado_chart(current_mortgage, new_mortgage, output="net_benefit", holding_years=7):
+    """
+    Creates a tornado chart showing how far one comparison output moves when each
+    input is swung low and high, widest swing at the top.
+    Uses matplotlib through Streamlit with dark theme styling.
+
+    Args:
+        current_mortgage (CurrentMortgage): Current mortgage object
+        new_mortgage: Either NewMortgageScenario or RefinanceScenario object
+        output (str): "monthly_savings", "breakeven_months" or "net_benefit"
+        holding_years (int): Base holding period in years
+    """
+    tornado = tornado_analysis(current_mortgage, new_mortgage, holding_years=holding_years)
+    rows = tornado[tornado["output"] == output].iloc[::-1]
+    base_output = rows["base_output"].iloc[0]
+
+    # Set dark theme
+    plt.style.use('dark_background')
+    fig, ax = plt.subplots(figsize=(10, 6), facecolor='#0E1117')
+
+    y = np.arange(len(rows))
+    labels = [SENSITIVITY_LABELS[d] for d in rows["driver"]]
+
+    # Bars run from the base output to the low and high case outputs
+    ax.barh(y, rows["low_output"] - base_output, left=base_output, color="#FF6347", label="Low input")
+    ax.barh(y, rows["high_output"] - base_output, left=base_output, color="#1E90FF", label="High input")
+    ax.axvline(base_output, color='white', linewidth=1)
+
+    ax.set_yticks(y)
+    ax.set_yticklabels(labels, color='white')
+    if output == "breakeven_months":
+        ax.xaxis.set_major_formatter(mtick.FuncFormatter(lambda x, p: f'{x:,.0f}'))
+    else:
+        ax.xaxis.set_major_formatter(mtick.FuncFormatter(lambda x, p: f'${x:,.0f}'))
+
+    ax.set_xlabel(SENSITIVITY_LABELS[output], color='white')
+    ax.set_title(f'What Moves {SENSITIVITY_LABELS[output]} Most', color='white', fontsize=14)
+    ax.set_facecolor('#0E1117')
+    ax.tick_params(colors='white')
+    ax.grid(axis='x', linestyle='--', alpha=0.4, color='#888888')
+    ax.legend(framealpha=0.9, facecolor='#0E1117', edgecolor='#888888', labelcolor='white')
+
+    # Display in Streamlit
+    with profile_block("matplotlib.render"):
+        st.pyplot(fig)
+
+    # Reset style for other plots
+    plt.style.use('default')
+
+    with st.expander("View Sensitivity Table"):
+        table = tornado[tornado["output"] == output].copy()
+        table["driver"] = table["driver"].map(SENSITIVITY_LABELS)
+        for col in ["base_input", "low_input", "high_input"]:
+            table[col] = [
+                _format_driver_value(d, v)
+                for d, v in zip(tornado.loc[table.index, "driver"], table[col])
+            ]
+        number_format = "%.0f" if output == "breakeven_months" else "$%.2f"
+        st.dataframe(
+            table.drop(columns=["output"]),
+            hide_index=True,
+            column_config={
+                "driver": "Input",
+                "base_input": "Base",
+                "low_input": "Low",
+                "high_input": "High",
+                "base_output": st.column_config.NumberColumn("Base Result", format=number_format),
+                "low_output": st.column_config.NumberColumn("Low Result", format=number_format),
+                "high_output": st.column_config.NumberColumn("High Result", format=number_format),
+                "swing": st.column_config.NumberColumn("Swing", format=number_format),
+            },
+            width="stretch"
+        )
+
+    top = tornado[(tornado["output"] == output) & tornado["swing"].notna()]
+    if not top.empty:
+        st.info(f"💡 {SENSITIVITY_LABELS[top['driver'].iloc[0]]} moves "
+                f"{SENSITIVITY_LABELS[output].lower()} the most across its tested range.")
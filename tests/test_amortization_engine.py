@@ -0,0 +1,83 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from mortgage_analyzer.engines.amortization_engine import RATE_DENOMINATOR, RATE_SCALE, annuity_payment, exact_cents_schedule
+from mortgage_analyzer.models.mortgage_classes import NewMortgageScenario
+
+"""
+Parity tests for the exact-cents schedule: the chunked, vectorized solver
+must post exactly what a plain month-by-month integer-cents loop posts.
+"""
+
+
+def reference_cents(principal, rate, periods, payment, extra_principal=0.0, prepay_periods=0):
+    # One month at a time in Python ints: interest rounded half up to the cent,
+    # extra principal inside the prepay window, final payment trued up
+    balance = round(principal * 100)
+    rate_micro = round(rate * RATE_SCALE)
+    pmt = int(np.floor(payment * 100 + 0.5))
+    extra = int(np.floor(extra_principal * 100 + 0.5))
+
+    rows = []
+    for month in range(periods):
+        if balance <= 0:
+            break
+        interest = (2 * balance * rate_micro + RATE_DENOMINATOR) // (2 * RATE_DENOMINATOR)
+        if month == periods - 1:
+            principal_pmt, extra_pmt = balance, 0
+        else:
+            principal_pmt = min(pmt - interest, balance)
+            paying_extra = prepay_periods == 0 or month < prepay_periods
+            extra_pmt = min(extra, balance - principal_pmt) if paying_extra else 0
+        balance -= principal_pmt + extra_pmt
+        rows.append((principal_pmt + interest, principal_pmt, interest, extra_pmt, balance))
+    return rows
+
+
+CASES = list(itertools.product(
+    [0.0, 2.99, 6.875, 11.5],       # rate
+    [12, 180, 360],                 # periods
+    [0.0, 250.0, 1_234.56],         # extra principal
+    [0, 24],                        # prepay periods
+))
+
+
+@pytest.mark.parametrize("rate,periods,extra,prepay", CASES)
+@pytest.mark.parametrize("principal", [1_000.0, 333_333.33])
+def test_matches_month_by_month_loop(principal, rate, periods, extra, prepay):
+    payment = annuity_payment(principal, rate / 100 / 12, periods)
+    # Small chunks so regular months span several vectorized passes
+    schedule = exact_cents_schedule(principal, rate, periods, extra_principal=extra, chunk_size=50, prepay_periods=prepay)
+    expected = reference_cents(principal, rate, periods, payment, extra, prepay)
+
+    columns = ["payment", "principal", "interest", "principal_paydown", "balance"]
+    assert list(zip(*(schedule[c].tolist() for c in columns))) == expected
+    assert schedule["month"].tolist() == list(range(1, len(expected) + 1))
+
+    # Paid off exactly, and every cent borrowed was repaid as principal
+    assert schedule["balance"][-1] == 0
+    assert schedule["principal"].sum() + schedule["principal_paydown"].sum() == round(principal * 100)
+
+
+def test_payment_given_in_dollars_rounds_to_the_cent():
+    schedule = exact_cents_schedule(250_000, 5.25, 360, payment=1380.5551)
+    assert (schedule["payment"][:-1] == 138_056).all()
+    assert schedule["balance"][-1] == 0
+
+
+@pytest.mark.parametrize("extra,prepay", [(0.0, 0), (400.0, 0), (400.0, 36)])
+def test_mortgage_exact_cents_schedule(extra, prepay):
+    mortgage = NewMortgageScenario(
+        _rate=6.25, _years=30, _tax=4_000, _ins=1_500, _sqft=2_000, _price=450_000, _downpayment_amount=90_000,
+        _extra_principal=extra, _prepay_periods=prepay, _exact_cents=True,
+    )
+    schedule = mortgage.amortization_schedule()
+    expected = reference_cents(
+        mortgage.loan_amount, mortgage.rate, mortgage.periods_remaining, mortgage.principal_and_interest, extra, prepay
+    )
+
+    assert len(schedule) == len(expected)
+    np.testing.assert_array_equal(np.rint(schedule["balance"] * 100), [row[-1] for row in expected])
+    assert round((schedule["principal"] + schedule["principal_paydown"]).sum() * 100) == round(mortgage.loan_amount * 100)
@@ -0,0 +1,102 @@
+import threading
+
+import pytest
+
+from mortgage_analyzer.utils import background_utils
+from mortgage_analyzer.utils.background_utils import BACKGROUND_WORKERS, BackgroundJob
+
+"""
+Tests for background jobs: steps run in order on the shared pool, cancel()
+stops a job before its next step, and wait() gives up on a job that is
+still queued behind others instead of blocking on it.
+"""
+
+
+@pytest.fixture
+def gate():
+    # Steps that block until the test opens the gate; always opened afterwards
+    event = threading.Event()
+    yield event
+    event.set()
+
+
+def run(job: BackgroundJob) -> BackgroundJob:
+    # Start the job and let it end (wait() alone would cancel it while it is still queued)
+    job.start()._future.result(10)
+    return job
+
+
+def blocking_step(started: threading.Event, gate: threading.Event):
+    started.set()
+    assert gate.wait(10)
+
+
+def test_steps_run_in_order():
+    calls = []
+    job = run(BackgroundJob([(name, calls.append, (name,)) for name in ("metrics", "schedule", "chart")]))
+    assert job.wait()
+    assert calls == job.completed == ["metrics", "schedule", "chart"]
+    assert job.finished and job.error is None and not job.cancelled
+
+
+def test_cancel_stops_before_the_next_step(gate):
+    started = threading.Event()
+    calls = []
+    job = BackgroundJob([("slow", blocking_step, (started, gate)), ("next", calls.append, ("next",))]).start()
+    assert started.wait(10)
+
+    job.cancel()
+    gate.set()
+    job._future.result(10)
+    assert job.cancelled and job.completed == ["slow"] and calls == []
+    assert not job.finished and not job.wait()
+
+
+def test_wait_cancels_a_queued_job(gate):
+    # Occupy every worker so the next job stays queued
+    blockers = []
+    for _ in range(BACKGROUND_WORKERS):
+        started = threading.Event()
+        blockers.append(BackgroundJob([("block", blocking_step, (started, gate))]).start())
+        assert started.wait(10)
+
+    calls = []
+    queued = BackgroundJob([("step", calls.append, ("step",))]).start()
+    assert not queued.wait()
+    assert queued.cancelled and queued._future.cancelled()
+
+    gate.set()
+    for blocker in blockers:
+        assert blocker.wait(10)
+    assert calls == [] and queued.completed == []
+
+
+def test_wait_times_out_on_a_running_job(gate):
+    started = threading.Event()
+    job = BackgroundJob([("slow", blocking_step, (started, gate))]).start()
+    assert started.wait(10)
+    assert not job.wait(timeout=0.05) and not job.cancelled
+
+    gate.set()
+    assert job.wait(10)
+
+
+def test_error_stops_the_job():
+    calls = []
+
+    def fail():
+        raise ValueError("bad inputs")
+
+    job = run(BackgroundJob([("ok", calls.append, ("ok",)), ("bad", fail, ()), ("after", calls.append, ("after",))]))
+    assert not job.wait()
+    assert calls == job.completed == ["ok"]
+    assert isinstance(job.error, ValueError)
+
+
+def test_unstarted_job_and_worker_names():
+    assert not BackgroundJob([("step", print, ())]).wait()
+    assert BackgroundJob([]).wait()
+
+    names = []
+    run(BackgroundJob([("name", lambda: names.append(threading.current_thread().name), ())]))
+    assert names[0].startswith(background_utils.WORKER_THREAD_PREFIX)
@@ -0,0 +1,115 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from mortgage_analyzer.engines.prepayment_engine import LoanPool
+from mortgage_analyzer.models.batch_validation import TAPE_SCHEMAS, validate_tape
+from mortgage_analyzer.models.mortgage_classes import CurrentMortgage, NewMortgageScenario, RefinanceScenario
+
+"""
+Parity tests for batch validation: a tape row is reported invalid exactly
+when building its scenario object raises, and the object's error message
+is among the row's reported messages.
+"""
+
+CLASSES = {"current": CurrentMortgage, "new": NewMortgageScenario, "refinance": RefinanceScenario}
+
+
+def random_tape(kind, n, seed):
+    rng = np.random.default_rng(seed)
+    tape = pd.DataFrame({
+        "rate": rng.uniform(-1, 27, n),
+        "years": rng.choice([-5, 0, 15, 30, 55], n),
+        "tax": rng.uniform(-500, 10_000, n),
+        "ins": rng.uniform(-100, 3_000, n),
+        "sqft": rng.choice([0, 1_500, 2_500], n),
+        "extra_principal": rng.choice([-50.0, 0.0, 200.0], n),
+    })
+    if kind == "current":
+        tape["original_loan"] = rng.uniform(-1_000, 500_000, n)
+        tape["loan_amount"] = tape["original_loan"] * rng.uniform(-0.1, 1.1, n)
+        tape["start_date"] = rng.choice(["01/15/2019", "02/30/2020", "2021-06-01", "12/01/2022"], n)
+        tape["price_per_sqft"] = rng.choice([0.0, 250.0], n)
+        tape["monthly_pmi"] = rng.choice([-10.0, 0.0, 120.0], n)
+        tape["total_pmt"] = rng.choice([0.0, 2_800.0], n)
+    elif kind == "new":
+        tape["price"] = rng.uniform(-10_000, 900_000, n)
+        tape["downpayment_percent"] = rng.choice([np.nan, -0.1, 0.1, 0.25, 1.2], n)
+        tape["downpayment_amount"] = tape["price"] * rng.uniform(-0.1, 1.1, n)
+        tape["pmi_rate"] = rng.choice([-0.01, 0.005, 0.06], n)
+        tape["credit_score"] = rng.choice([np.nan, 250, 700, 900], n)
+    else:
+        tape["current_loan_balance"] = rng.uniform(-1_000, 500_000, n)
+        tape["current_property_value"] = rng.uniform(-1_000, 900_000, n)
+        tape["closing_cost_percentage"] = rng.choice([-0.01, 0.025, 0.12], n)
+        tape["discount_points"] = rng.choice([-6.0, 0.0, 1.0, 6.0], n)
+    return tape
+
+
+def build(kind, row):
+    kwargs = {}
+    for column, value in row.items():
+        if isinstance(value, float) and np.isnan(value):
+            value = None
+        elif column in ("years", "sqft", "prepay_periods", "credit_score"):
+            value = int(value)
+        kwargs[f"_{column}"] = value
+    return CLASSES[kind](**kwargs)
+
+
+@pytest.mark.parametrize("kind", list(CLASSES))
+def test_report_matches_validators(kind):
+    tape = random_tape(kind, 600, seed=len(kind))
+    report = validate_tape(tape, kind)
+    assert report.valid.any() and not report.valid.all()
+
+    messages = report.errors.groupby("row")["message"].apply(set)
+    for label, row in tape.iterrows():
+        try:
+            build(kind, row)
+        except ValueError as e:
+            assert label in messages.index and str(e) in messages[label]
+        else:
+            assert label not in messages.index
+
+
+def test_missing_columns_and_blanks():
+    tape = random_tape("new", 20, seed=0)
+    with pytest.raises(ValueError, match="price"):
+        validate_tape(tape.drop(columns="price"), "new")
+    with pytest.raises(ValueError):
+        validate_tape(tape, "jumbo")
+
+    tape["rate"] = tape["rate"].astype(object)
+    tape.loc[3, "rate"] = "n/a"
+    report = validate_tape(tape.drop(columns=["pmi_rate", "extra_principal"]), "new")
+    assert "rate is missing or not a number" in set(report.errors.loc[report.errors["row"] == 3, "message"])
+    assert (report.rows["pmi_rate"] == 0.005).all() and (report.rows["extra_principal"] == 0).all()
+    assert set(TAPE_SCHEMAS["new"][1]) <= set(report.rows.columns)
+
+    # Blank optional cells take the default; text in them is an error, not a default
+    cells = [("pmi_rate", None, "7%"), ("extra_principal", " ", "lots"), ("credit_score", "", "seven hundred")]
+    for column, blank, text in cells:
+        tape[column] = tape[column].astype(object)
+        tape.loc[5, column] = blank
+        tape.loc[6, column] = text
+    report = validate_tape(tape, "new")
+    messages = set(report.errors.loc[report.errors["row"] == 6, "message"])
+    assert {"pmi_rate is not a number", "extra_principal is not a number", "credit_score is not a number"} <= messages
+    assert not report.valid[6]
+    assert not set(report.errors.loc[report.errors["row"] == 5, "field"]) & {"pmi_rate", "extra_principal", "credit_score"}
+    assert report.rows.loc[5, "pmi_rate"] == 0.005 and report.rows.loc[5, "extra_principal"] == 0
+    assert np.isnan(report.rows.loc[5, "credit_score"])
+
+
+def test_pool_from_valid_rows():
+    tape = random_tape("current", 400, seed=7)
+    report = validate_tape(tape, "current")
+    pool = LoanPool.from_report(report)
+    assert len(pool) == report.valid.sum()
+
+    mortgages = [build("current", row) for _, row in report.valid_rows[tape.columns].iterrows()]
+    expected = LoanPool.from_mortgages(mortgages)
+    np.testing.assert_array_equal(pool.remaining_months, expected.remaining_months)
+    np.testing.assert_array_equal(pool.age_months, expected.age_months)
+    np.testing.assert_allclose(pool.balance, expected.balance)
@@ -0,0 +1,111 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from mortgage_analyzer.engines.buydown_engine import analyze_mortgage_buydown, build_rate_sheet, evaluate_buydown_options
+from mortgage_analyzer.models.mortgage_classes import NewMortgageScenario
+
+"""
+Tests for the buy-down engine: the batched pass must agree with a plain
+loop over the rate sheet options and with the Mortgage objects' own math.
+"""
+
+
+def random_sheet(seed=3, n=30):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "term": rng.choice([15, 30], n),
+        "rate": np.round(rng.uniform(4.5, 8.0, n), 3),
+        "points": np.round(rng.choice(np.arange(-2, 3.25, 0.25), n), 3),
+    })
+
+
+def test_rate_sheet_around_par():
+    sheet = build_rate_sheet(6.5, terms=(15, 30), steps_below=2, steps_above=1)
+    assert len(sheet) == 8
+    par = sheet[sheet["points"] == 0]
+    assert par["rate"].tolist() == [6.5, 6.5] and par["term"].tolist() == [15, 30]
+    # One point per quarter percent of rate
+    thirty = sheet[sheet["term"] == 30].set_index("rate")["points"]
+    assert thirty.to_dict() == {6.25: 1.0, 6.375: 0.5, 6.5: 0.0, 6.625: -0.5}
+
+    # Rates that would not be positive are left off
+    assert (build_rate_sheet(0.25, steps_below=8)["rate"] > 0).all()
+
+
+def test_options_match_per_option_loop():
+    loan, closing = 400_000.0, 6_000.0
+    analysis = evaluate_buydown_options(loan, random_sheet(), holding_period_years=7, base_closing_costs=closing)
+    options = analysis.options
+
+    for _, row in options.iterrows():
+        mortgage = NewMortgageScenario(
+            _rate=row["rate"], _years=int(row["term"]), _tax=0, _ins=0, _sqft=1, _price=loan, _downpayment_amount=0,
+        )
+        schedule = mortgage.amortization_schedule()
+        assert row["payment"] == pytest.approx(mortgage.principal_and_interest)
+        assert row["lifetime_interest"] == pytest.approx(schedule["interest"].sum(), abs=1.0)
+        assert row["upfront_cost"] == pytest.approx(closing + loan * row["points"] / 100)
+        assert row["horizon_months"] == 84
+        assert row["horizon_cost"] == pytest.approx(row["upfront_cost"] + schedule["interest"].iloc[:84].sum(), abs=1.0)
+
+    # Pairwise breakeven and the frontier, one pair at a time
+    cost, payment, term = (options[c].to_numpy() for c in ("upfront_cost", "payment", "term"))
+    for i in range(len(options)):
+        dominated = False
+        for j in range(len(options)):
+            if term[i] != term[j]:
+                assert np.isnan(analysis.breakeven_matrix[i, j])
+                continue
+            if cost[i] > cost[j] and payment[i] < payment[j]:
+                assert analysis.breakeven_matrix[i, j] == pytest.approx((cost[i] - cost[j]) / (payment[j] - payment[i]))
+            else:
+                assert np.isnan(analysis.breakeven_matrix[i, j])
+            if cost[j] <= cost[i] and payment[j] <= payment[i] and (cost[j] < cost[i] or payment[j] < payment[i]):
+                dominated = True
+        assert options["on_frontier"].iloc[i] == (not dominated)
+
+
+def test_par_rows_and_breakeven_vs_par():
+    sheet = build_rate_sheet(6.5, terms=(15, 30))
+    options = evaluate_buydown_options(300_000, sheet).options
+    par = options[options["is_par"]]
+    assert par["points"].tolist() == [0.0, 0.0] and sorted(par["term"]) == [15, 30]
+
+    for _, row in options.iterrows():
+        base = par[par["term"] == row["term"]].iloc[0]
+        if row["points"] > 0:
+            # Paying points: months of lower payments to recoup them
+            expected = (row["upfront_cost"] - base["upfront_cost"]) / (base["payment"] - row["payment"])
+            assert row["breakeven_months"] == pytest.approx(expected)
+        elif row["points"] < 0:
+            # Lender credit: months until the higher payment uses the credit up
+            expected = (base["upfront_cost"] - row["upfront_cost"]) / (row["payment"] - base["payment"])
+            assert row["breakeven_months"] == pytest.approx(expected)
+        else:
+            assert np.isnan(row["breakeven_months"])
+
+
+def test_rejects_bad_inputs():
+    with pytest.raises(ValueError, match="missing columns: points"):
+        evaluate_buydown_options(300_000, pd.DataFrame({"term": [30], "rate": [6.0]}))
+    with pytest.raises(ValueError, match="positive"):
+        evaluate_buydown_options(300_000, pd.DataFrame({"term": [30], "rate": [0.0], "points": [0.0]}))
+    with pytest.raises(ValueError, match="no complete rows"):
+        evaluate_buydown_options(300_000, pd.DataFrame({"term": [30], "rate": [None], "points": [0.0]}))
+    with pytest.raises(ValueError, match="Loan amount"):
+        evaluate_buydown_options(0, build_rate_sheet(6.0))
+    with pytest.raises(ValueError, match="Holding period"):
+        evaluate_buydown_options(300_000, build_rate_sheet(6.0), holding_period_years=0)
+
+
+def test_mortgage_points_are_replaced_by_the_sheet():
+    mortgage = NewMortgageScenario(
+        _rate=6.0, _years=30, _tax=4_000, _ins=1_500, _sqft=2_000, _price=500_000, _downpayment_amount=100_000,
+        _discount_points=1.5,
+    )
+    sheet = build_rate_sheet(6.5)
+    options = analyze_mortgage_buydown(mortgage, sheet).options
+    expected = evaluate_buydown_options(400_000, sheet, base_closing_costs=mortgage.base_closing_costs).options
+    pd.testing.assert_frame_equal(options, expected)
+    assert mortgage.base_closing_costs == pytest.approx(mortgage.closing_costs - 400_000 * 0.015)
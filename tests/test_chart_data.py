@@ -0,0 +1,126 @@
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from mortgage_analyzer.models.mortgage_classes import NewMortgageScenario
+from mortgage_analyzer.visualizations.chart_data import (
+    aggregate_schedule,
+    balance_on_grid,
+    downsample_frame,
+    lttb_indices,
+    schedule_years,
+)
+
+"""
+Tests for chart data shaping: the array versions must match plain loops
+(per-bucket groupby, the original per-bucket LTTB) and the point budget.
+"""
+
+
+def schedule(years=30, extra=0.0, **changes):
+    return NewMortgageScenario(
+        _rate=6.0, _years=years, _tax=4_000, _ins=1_500, _sqft=2_000, _price=500_000, _downpayment_amount=100_000,
+        _extra_principal=extra, **changes,
+    ).amortization_schedule()
+
+
+def reference_lttb(x, y, threshold):
+    # Largest-Triangle-Three-Buckets as originally written: one bucket at a time
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return list(range(n))
+    every = (n - 2) / (threshold - 2)
+    selected = [0]
+    a = 0
+    for i in range(threshold - 2):
+        start = math.floor(i * every) + 1
+        end = math.floor((i + 1) * every) + 1
+        next_start = end
+        next_end = min(math.floor((i + 2) * every) + 1, n)
+        avg_x = sum(x[next_start:next_end]) / (next_end - next_start)
+        avg_y = sum(y[next_start:next_end]) / (next_end - next_start)
+
+        best, best_area = start, -1.0
+        for j in range(start, end):
+            area = abs((x[a] - avg_x) * (y[j] - y[a]) - (x[a] - x[j]) * (avg_y - y[a]))
+            if area > best_area:
+                best, best_area = j, area
+        selected.append(best)
+        a = best
+    selected.append(n - 1)
+    return selected
+
+
+@pytest.mark.parametrize("n,threshold", [(1_000, 50), (997, 400), (360, 3), (25, 24), (10, 20), (10, 2)])
+def test_lttb_matches_reference_loop(n, threshold):
+    rng = np.random.default_rng(n + threshold)
+    x = np.sort(rng.uniform(0, 100, n))
+    y = np.cumsum(rng.normal(0, 1, n))
+    indices = lttb_indices(x, y, threshold)
+    assert indices.tolist() == reference_lttb(x.tolist(), y.tolist(), threshold)
+    assert len(indices) == (min(n, threshold) if threshold >= 3 else n)
+
+
+@pytest.mark.parametrize("freq,months", [("yearly", 12), ("quarterly", 3)])
+def test_aggregate_monthly_matches_groupby(freq, months):
+    df = schedule(extra=400)
+    result = aggregate_schedule(df, freq)
+
+    groups = df.groupby((df["month"] - 1) // months)
+    expected_sums = groups[["payment", "principal", "interest", "principal_paydown"]].sum()
+    np.testing.assert_allclose(result[expected_sums.columns].to_numpy(), expected_sums.to_numpy())
+    np.testing.assert_allclose(result["balance"].to_numpy(), groups["balance"].last().to_numpy())
+    assert result.index.tolist() == list(range(1, len(result) + 1))
+    assert result.index.name == ("Year" if freq == "yearly" else "Quarter")
+
+
+def test_aggregate_biweekly_quarters_stay_in_their_year():
+    # 26 payments a year for 10 years
+    periods = 26 * 10
+    df = pd.DataFrame({"month": np.arange(1, periods + 1), "payment": np.ones(periods), "balance": np.arange(periods)[::-1]})
+
+    quarterly = aggregate_schedule(df, "quarterly", sum_columns=("payment",), periods_per_year=26)
+    yearly = aggregate_schedule(df, "yearly", sum_columns=("payment",), periods_per_year=26)
+
+    assert len(quarterly) == 40 and len(yearly) == 10
+    # Quarters of 7 and 6 payments, and four quarters add up to each year
+    assert quarterly["payment"].tolist() == [7, 6, 7, 6] * 10
+    np.testing.assert_array_equal(quarterly["payment"].to_numpy().reshape(10, 4).sum(axis=1), yearly["payment"])
+    np.testing.assert_array_equal(quarterly["balance"].to_numpy()[3::4], yearly["balance"])
+
+
+def test_aggregate_rejects_unknown_frequency_and_keeps_empty():
+    with pytest.raises(ValueError, match="monthly"):
+        aggregate_schedule(schedule(), "monthly")
+    assert aggregate_schedule(schedule().iloc[:0]).empty
+
+
+def test_balance_on_grid():
+    long, short = schedule(), schedule(years=15, extra=500)
+    grid = balance_on_grid({"30 year": long, "15 year": short}, max_points=10_000)
+
+    # Opening balance at year 0, then each schedule's balances, then zeros after payoff
+    assert grid.index[0] == 0 and grid.index[-1] == pytest.approx(len(long) / 12)
+    np.testing.assert_allclose(grid.iloc[0], 400_000)
+    np.testing.assert_allclose(grid["30 year"].to_numpy()[1:], long["balance"])
+    np.testing.assert_allclose(grid["15 year"].to_numpy()[1:len(short) + 1], short["balance"])
+    assert (grid["15 year"].to_numpy()[len(short) + 1:] == 0).all()
+    np.testing.assert_allclose(grid.index, schedule_years(np.arange(len(long) + 1)))
+
+    # Within the point budget, keeping both ends of every series
+    small = balance_on_grid({"30 year": long, "15 year": short}, max_points=50)
+    assert len(small) <= 100
+    assert small.index[0] == 0 and small.index[-1] == grid.index[-1]
+
+
+def test_downsample_frame_keeps_short_frames_and_skips_gaps():
+    frame = pd.DataFrame({"a": np.arange(1_000.0), "b": np.r_[np.full(500, np.nan), np.arange(500.0)]},
+                         index=np.arange(1_000) / 12)
+    assert len(downsample_frame(frame.iloc[:100], 400)) == 100
+
+    small = downsample_frame(frame, 40)
+    assert 40 <= len(small) <= 80
+    # The second series' own first point (after the gap) is kept
+    assert 500 / 12 in small.index
@@ -0,0 +1,47 @@
+import random
+from datetime import date, timedelta
+
+import numpy as np
+from dateutil.relativedelta import relativedelta
+
+from mortgage_analyzer.engines import date_engine
+
+"""
+Parity tests for the date engine: vectorized month arithmetic must agree
+with relativedelta date by date, including month-end clamping.
+"""
+
+
+def random_dates(rng, n):
+    return [date(1990, 1, 1) + timedelta(days=rng.randrange(25_000)) for _ in range(n)]
+
+
+def test_add_months_matches_relativedelta():
+    rng = random.Random(0)
+    starts = random_dates(rng, 2_000) + [date(2024, 1, 31), date(2023, 1, 31), date(2020, 3, 31)]
+    months = [rng.randrange(-120, 480) for _ in starts]
+
+    expected = np.array([s + relativedelta(months=m) for s, m in zip(starts, months)], dtype="datetime64[D]")
+    np.testing.assert_array_equal(date_engine.add_months(starts, months), expected)
+    assert date_engine.add_months("01/31/2024", 1) == np.datetime64("2024-02-29")
+
+
+def test_months_between_counts_whole_months():
+    rng = random.Random(1)
+    starts, ends = random_dates(rng, 2_000), random_dates(rng, 2_000)
+    for start, end, months in zip(starts, ends, date_engine.months_between(starts, ends)):
+        months = int(months)
+        assert start + relativedelta(months=months) <= end < start + relativedelta(months=months + 1)
+
+
+def test_loan_ages_and_payment_dates():
+    starts = ["01/15/2020", "01/31/2021"]
+    as_of = date(2024, 3, 14)
+    np.testing.assert_array_equal(date_engine.loan_age_months(starts, as_of), [49, 37])
+    np.testing.assert_array_equal(date_engine.remaining_months(starts, [360, 180], as_of), [310, 142])
+
+    dates = date_engine.payment_dates(starts, [50, 38], 3)
+    assert dates.shape == (2, 3)
+    np.testing.assert_array_equal(
+        dates[1], np.array(["2024-03-31", "2024-04-30", "2024-05-31"], dtype="datetime64[D]")
+    )
@@ -0,0 +1,185 @@
+import numpy as np
+import pytest
+
+from mortgage_analyzer.engines.escrow_engine import (
+    EscrowAssumptions,
+    breakeven_month,
+    escrow_payment_matrix,
+    project_escrow,
+    total_payment_vector,
+)
+from mortgage_analyzer.models.mortgage_classes import NewMortgageScenario, RefinanceScenario
+
+"""
+Tests for the escrow engine: the array projection must follow a servicer's
+year-by-year escrow analysis, and the monthly payment vector must be made of
+the same principal, interest and extra principal as the amortization schedule.
+"""
+
+
+def reference_escrow(annual_tax, annual_ins, years, assumptions, initial_shortage_pmt=0.0):
+    # One analysis a year: project from last year's bills, top up the cushion,
+    # spread a shortage, refund or credit a surplus
+    monthly = []
+    previous = None
+    for year in range(years):
+        bills = annual_tax * (1 + assumptions.tax_growth) ** year + annual_ins * (1 + assumptions.ins_growth) ** year
+        if previous is None:
+            projected, deficiency = bills, 0.0
+        else:
+            last_bills, last_projected = previous
+            projected = last_bills
+            cushion_change = (projected - last_projected) * assumptions.cushion_months / 12
+            deficiency = (last_bills - last_projected) + cushion_change
+        shortage = max(deficiency, 0.0)
+        surplus = max(-deficiency, 0.0)
+        credit = surplus if surplus < assumptions.surplus_refund_threshold else 0.0
+
+        for month in range(12):
+            payment = projected / 12 - credit / 12
+            if month < assumptions.shortage_spread_months:
+                payment += shortage / assumptions.shortage_spread_months
+            if year == 0:
+                payment += initial_shortage_pmt
+            monthly.append(payment)
+        previous = (bills, projected)
+    return np.array(monthly)
+
+
+ASSUMPTIONS = [
+    EscrowAssumptions(),
+    EscrowAssumptions(tax_growth=0.06, ins_growth=0.10, cushion_months=0, shortage_spread_months=6),
+    # Falling bills leave surpluses: small ones credited, large ones refunded
+    EscrowAssumptions(tax_growth=-0.01, ins_growth=-0.03, cushion_months=1, surplus_refund_threshold=100.0),
+]
+
+
+@pytest.mark.parametrize("assumptions", ASSUMPTIONS, ids=["default", "fast growth", "falling bills"])
+def test_projection_matches_yearly_analysis(assumptions):
+    projection = project_escrow(5_000, 1_800, 10, assumptions, initial_shortage_pmt=25.0)
+    expected = reference_escrow(5_000, 1_800, 10, assumptions, initial_shortage_pmt=25.0)
+    np.testing.assert_allclose(projection.monthly_escrow, expected)
+    np.testing.assert_allclose(projection.analyses["monthly_escrow_pmt"], expected.reshape(10, 12).mean(axis=1))
+
+    # Each row of the matrix is its own projection
+    matrix = escrow_payment_matrix(
+        np.array([5_000, 3_000]), np.array([1_800, 900]), 100,
+        np.array([assumptions.tax_growth, 0.03]), np.array([assumptions.ins_growth, 0.05]),
+        assumptions, np.array([25.0, 0.0]),
+    )
+    other = EscrowAssumptions(0.03, 0.05, assumptions.cushion_months, assumptions.shortage_spread_months,
+                              assumptions.surplus_refund_threshold)
+    np.testing.assert_allclose(matrix[0], expected[:100])
+    np.testing.assert_allclose(matrix[1], reference_escrow(3_000, 900, 9, other)[:100])
+
+
+def test_shortage_is_spread_over_twelve_months():
+    projection = project_escrow(6_000, 2_400, 4)
+    # Year two still collects year one's bills; the year three analysis finds the
+    # 216 of growth under-collected plus two more months of it for the cushion
+    assert projection.analyses["shortage"].iloc[1] == 0
+    year_three = projection.analyses.iloc[2]
+    assert year_three["shortage"] == pytest.approx(216 * 14 / 12)
+    assert year_three["shortage_pmt"] == pytest.approx(year_three["shortage"] / 12)
+
+    monthly = projection.monthly_escrow
+    np.testing.assert_allclose(monthly[24:36], year_three["base_escrow_pmt"] + year_three["shortage_pmt"])
+    assert monthly[24:36].sum() == pytest.approx(year_three["projected_disbursements"] + year_three["shortage"])
+
+
+def test_flat_bills_have_no_shortage_or_surplus():
+    projection = project_escrow(4_800, 1_200, 5, EscrowAssumptions(tax_growth=0.0, ins_growth=0.0))
+    np.testing.assert_allclose(projection.monthly_escrow, 500.0)
+    assert (projection.analyses[["shortage", "surplus_refund", "surplus_credit"]] == 0).all().all()
+
+
+def test_surplus_refund_threshold():
+    rules = dict(tax_growth=0.0, cushion_months=1, surplus_refund_threshold=100.0)
+    # Insurance falling 5% leaves surpluses under the threshold, falling 15% over it
+    small = project_escrow(5_000, 1_800, 4, EscrowAssumptions(ins_growth=-0.05, **rules)).analyses.iloc[2:]
+    large = project_escrow(5_000, 1_800, 4, EscrowAssumptions(ins_growth=-0.15, **rules)).analyses.iloc[2:]
+
+    assert ((small["surplus_credit"] > 0) & (small["surplus_credit"] < 100) & (small["surplus_refund"] == 0)).all()
+    assert ((large["surplus_refund"] >= 100) & (large["surplus_credit"] == 0)).all()
+
+
+def test_rejects_bad_assumptions():
+    for bad in (dict(tax_growth=-1.0), dict(cushion_months=3), dict(shortage_spread_months=0),
+                dict(surplus_refund_threshold=-1.0)):
+        with pytest.raises(ValueError):
+            EscrowAssumptions(**bad)
+    with pytest.raises(ValueError, match="years"):
+        project_escrow(1_000, 1_000, 0)
+    with pytest.raises(ValueError, match="negative"):
+        project_escrow(-1, 1_000, 1)
+
+
+def test_breakeven_month():
+    current = np.full(24, 2_000.0)
+    new = np.full(24, 1_800.0)
+    assert breakeven_month(1_000, current, new) == 5
+    assert breakeven_month(200, current, new) == 1
+    assert breakeven_month(10_000, current, new) is None
+
+
+def scenarios():
+    return [
+        # $500 extra for two years: pays off years early, and the payment drops after month 24
+        NewMortgageScenario(
+            _rate=6.5, _years=30, _tax=6_000, _ins=1_800, _sqft=2_000, _price=500_000, _downpayment_amount=100_000,
+            _extra_principal=500, _prepay_periods=24,
+        ),
+        NewMortgageScenario(
+            _rate=6.5, _years=30, _tax=6_000, _ins=1_800, _sqft=2_000, _price=500_000, _downpayment_amount=100_000,
+            _extra_principal=500, _prepay_periods=24, _exact_cents=True,
+        ),
+        # Extra principal every month, with PMI
+        NewMortgageScenario(
+            _rate=5.0, _years=15, _tax=4_000, _ins=1_500, _sqft=1_800, _price=300_000, _downpayment_percent=0.05,
+            _extra_principal=300, _credit_score=720,
+        ),
+        RefinanceScenario(
+            _rate=5.5, _years=30, _tax=4_000, _ins=1_500, _sqft=2_000, _current_loan_balance=380_000,
+            _current_property_value=420_000, _cash_out_amount=0, _closing_cost_percentage=0.02, _discount_points=0,
+            _extra_principal=1_000, _prepay_periods=60,
+        ),
+    ]
+
+
+@pytest.mark.parametrize(
+    "mortgage", scenarios(), ids=["prepay window", "prepay window, exact cents", "extra every month", "refinance"]
+)
+def test_payment_is_principal_interest_pmi_and_escrow(mortgage):
+    months = 400
+    schedule = mortgage.amortization_schedule()
+    payoff = len(schedule)
+    assert payoff < months
+
+    payments = total_payment_vector(mortgage, months)
+    escrow = project_escrow(mortgage.tax, mortgage.ins, int(np.ceil(months / 12))).monthly_escrow[:months]
+    pmi = mortgage.pmi_schedule()
+
+    loan = payments[:payoff] - pmi - escrow[:payoff]
+    np.testing.assert_allclose(loan, schedule["principal"] + schedule["interest"] + schedule["principal_paydown"])
+    np.testing.assert_allclose(payments[payoff:], escrow[payoff:])
+
+    # The schedule pays extra principal only inside the prepay window, and so does the payment
+    prepay = mortgage.prepay_periods or payoff
+    paydown = schedule["principal_paydown"].to_numpy()
+    assert (paydown[:prepay - 1] == mortgage.extra_principal).all()
+    assert (paydown[prepay:] == 0).all()
+    assert schedule["balance"].iloc[-1] == 0
+
+
+def test_prepay_window_shortens_payoff():
+    with_window = scenarios()[0]
+    without_extra = with_window.with_extra_principal(0)
+    forever = with_window.with_changes(prepay_periods=0)
+
+    # Two years of extra principal pay off sooner than none, but later than extra every month
+    assert len(forever.amortization_schedule()) < len(with_window.amortization_schedule())
+    assert len(with_window.amortization_schedule()) < len(without_extra.amortization_schedule()) == 360
+
+    # Remaining balances agree with the schedule the payments come from
+    schedule = with_window.amortization_schedule()
+    assert with_window._calculate_remaining_balance_at_year(5) == pytest.approx(schedule["balance"].iloc[59], abs=0.01)
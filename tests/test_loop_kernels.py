@@ -0,0 +1,152 @@
+import random
+
+import pytest
+
+from mortgage_analyzer.engines import loop_kernels
+from mortgage_analyzer.models.mortgage_classes import NewMortgageScenario
+
+"""
+Parity tests for the loop kernels: each kernel backend must match the
+original per-period Python loops (kept below as the reference) exactly.
+"""
+
+
+def reference_schedule(loan_amount, monthly_rate, payment, extra_principal, periods, prepay_periods=0):
+    rows = []
+    remaining_balance = loan_amount
+    for period in range(1, periods + 1):
+        if remaining_balance <= 0:
+            break
+        interest_pmt = remaining_balance * monthly_rate
+        principal_pmt = min(payment - interest_pmt, remaining_balance)
+        extra = (
+            min(extra_principal, remaining_balance - principal_pmt)
+            if (remaining_balance > principal_pmt and (prepay_periods == 0 or period <= prepay_periods))
+            else 0
+        )
+        remaining_balance -= principal_pmt + extra
+        rows.append((principal_pmt, interest_pmt, extra, max(0, remaining_balance)))
+    return rows
+
+
+def reference_balance(loan_amount, monthly_rate, payment, extra_principal, months, prepay_periods=0):
+    remaining_balance = loan_amount
+    for month in range(months):
+        interest_pmt = remaining_balance * monthly_rate
+        principal_pmt = min(payment - interest_pmt, remaining_balance)
+        extra = (
+            min(extra_principal, remaining_balance - principal_pmt)
+            if (remaining_balance > principal_pmt and (prepay_periods == 0 or month < prepay_periods))
+            else 0
+        )
+        remaining_balance -= principal_pmt + extra
+    return max(0, remaining_balance)
+
+
+def reference_pmi_periods(loan_amount, target_balance, monthly_rate, payment, extra_principal, periods, prepay_periods):
+    current_balance = loan_amount
+    months = 0
+    while current_balance > target_balance and months < periods:
+        interest = current_balance * monthly_rate
+        principal_payment = min(payment - interest, current_balance)
+        extra = (
+            min(extra_principal, current_balance - principal_payment)
+            if (current_balance > principal_payment and (prepay_periods == 0 or months < prepay_periods))
+            else 0
+        )
+        current_balance -= principal_payment + extra
+        months += 1
+    return months if current_balance <= target_balance else 0
+
+
+def random_loans(n=50, seed=7):
+    rng = random.Random(seed)
+    loans = []
+    for _ in range(n):
+        rate = rng.choice([0.0, rng.uniform(1, 12)])
+        years = rng.choice([10, 15, 20, 30])
+        price = rng.uniform(100_000, 1_500_000)
+        downpayment = price * rng.uniform(0.03, 0.5)
+        extra = rng.choice([0.0, rng.uniform(50, 5_000)])
+        prepay = rng.choice([0, rng.randint(1, years * 12)])
+        loans.append((rate, years, price, downpayment, extra, prepay))
+    return loans
+
+
+# The compiled kernels and the plain Python functions they were compiled from
+BACKENDS = [pytest.param(lambda f: f, id=loop_kernels.BACKEND)]
+if loop_kernels.HAS_NUMBA:
+    BACKENDS.append(pytest.param(lambda f: f.py_func, id="python"))
+
+
+def loan_args(rate, years, price, downpayment, extra):
+    monthly_rate = rate / 100 / 12
+    loan_amount = price - downpayment
+    periods = years * 12
+    if monthly_rate == 0:
+        payment = loan_amount / periods
+    else:
+        payment = loan_amount * monthly_rate * (1 + monthly_rate) ** periods / ((1 + monthly_rate) ** periods - 1)
+    return loan_amount, monthly_rate, payment, extra, periods
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("loan", random_loans())
+def test_amortization_arrays_match_reference(backend, loan):
+    rate, years, price, downpayment, extra, _ = loan
+    args = loan_args(rate, years, price, downpayment, extra)
+
+    principal, interest, paydown, balance = backend(loop_kernels.amortization_arrays)(*args, 0)
+    expected = reference_schedule(*args)
+
+    assert len(balance) == len(expected)
+    assert list(zip(principal, interest, paydown, balance)) == expected
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("loan", random_loans())
+def test_balance_after_months_matches_reference(backend, loan):
+    rate, years, price, downpayment, extra, _ = loan
+    loan_amount, monthly_rate, payment, extra, periods = loan_args(rate, years, price, downpayment, extra)
+
+    for loan_year in (0, 1, 5, years // 2, years):
+        months = loan_year * 12
+        assert backend(loop_kernels.balance_after_months)(
+            loan_amount, monthly_rate, payment, extra, months, 0
+        ) == reference_balance(loan_amount, monthly_rate, payment, extra, months)
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("loan", random_loans())
+def test_months_until_balance_matches_reference(backend, loan):
+    rate, years, price, downpayment, extra, prepay = loan
+    loan_amount, monthly_rate, payment, extra, periods = loan_args(rate, years, price, downpayment, extra)
+    target = price * 0.8
+
+    assert backend(loop_kernels.months_until_balance)(
+        loan_amount, target, monthly_rate, payment, extra, periods, prepay
+    ) == reference_pmi_periods(loan_amount, target, monthly_rate, payment, extra, periods, prepay)
+
+
+@pytest.mark.parametrize("loan", random_loans(n=10))
+def test_mortgage_methods_match_reference(loan):
+    rate, years, price, downpayment, extra, prepay = loan
+    # Mortgage objects require a positive rate
+    mortgage = NewMortgageScenario(
+        _rate=rate or 3.0, _years=years, _tax=4000, _ins=1500, _sqft=2000,
+        _extra_principal=extra, _prepay_periods=prepay,
+        _price=price, _downpayment_amount=downpayment,
+    )
+    args = (mortgage.loan_amount, mortgage.monthly_interest, mortgage.principal_and_interest, extra, mortgage.periods_remaining)
+
+    schedule = mortgage.amortization_schedule()
+    expected = reference_schedule(*args, prepay)
+    assert len(schedule) == len(expected)
+    assert list(schedule["balance"]) == [round(row[3], 2) for row in expected]
+    assert list(schedule["month"]) == list(range(1, len(expected) + 1))
+
+    assert mortgage._calculate_remaining_balance_at_year(5) == reference_balance(*args[:4], 60, prepay)
+    if mortgage.loan_amount / mortgage.price > 0.8:
+        assert mortgage.pmi_periods_remaining() == reference_pmi_periods(
+            args[0], price * 0.8, *args[1:], prepay
+        )
@@ -0,0 +1,77 @@
+import contextlib
+import multiprocessing
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from mortgage_analyzer.engines.monte_carlo_engine import MonteCarloAssumptions, iter_simulation, run_simulation
+from mortgage_analyzer.models.mortgage_classes import NewMortgageScenario
+
+"""
+Tests for the Monte Carlo engine: blocks of paths and chunks of loans must
+give the same percentiles whatever the number of workers.
+"""
+
+
+def portfolio(count=7):
+    rng = np.random.default_rng(11)
+    return [
+        NewMortgageScenario(
+            _rate=float(rate), _years=int(years), _tax=4_000, _ins=1_500, _sqft=2_000, _price=float(price),
+            _downpayment_amount=float(price) * 0.2,
+        )
+        for rate, years, price in zip(
+            rng.uniform(4, 8, count), rng.choice([15, 30], count), rng.uniform(250_000, 600_000, count)
+        )
+    ]
+
+
+@contextlib.contextmanager
+def mp_context(method):
+    # Worker pools use the default start method; spawn and forkserver workers
+    # re-import the engine instead of inheriting the parent's memory
+    previous = multiprocessing.get_start_method(allow_none=True)
+    multiprocessing.set_start_method(method, force=True)
+    try:
+        yield
+    finally:
+        multiprocessing.set_start_method(previous, force=True)
+
+
+# Three blocks of paths and three chunks of loans per block
+SMALL_BLOCKS = dict(paths_per_block=400, loans_per_chunk=3)
+
+
+@pytest.mark.parametrize("start_method", multiprocessing.get_all_start_methods())
+def test_same_results_for_any_worker_count(start_method):
+    mortgages = portfolio()
+    in_process = run_simulation(mortgages, paths=1_000, seed=7, max_workers=1, **SMALL_BLOCKS)
+    with mp_context(start_method):
+        pooled = run_simulation(mortgages, paths=1_000, seed=7, max_workers=3, **SMALL_BLOCKS)
+
+    assert in_process.paths == pooled.paths == 1_000
+    pd.testing.assert_frame_equal(pooled.percentiles, in_process.percentiles)
+    pd.testing.assert_series_equal(pooled.prepaid_share, in_process.prepaid_share)
+
+    other_seed = run_simulation(mortgages, paths=1_000, seed=8, max_workers=1, **SMALL_BLOCKS)
+    assert not other_seed.percentiles.equals(in_process.percentiles)
+
+
+def test_portfolio_totals_follow_the_loans():
+    mortgages = portfolio()
+    assumptions = MonteCarloAssumptions(appreciation_vol=0.0, rate_vol=0.0, base_prepay=0.0, refi_sensitivity=0.0)
+    result = run_simulation(mortgages, paths=500, seed=1, assumptions=assumptions, max_workers=1, **SMALL_BLOCKS)
+
+    # No shocks and no prepayment: every path is the scheduled portfolio
+    frame = result.percentiles.set_index(["metric", "year"])
+    year = 5
+    expected_value = sum(m.estimate_value_at_year(year, 0.03) for m in mortgages)
+    expected_balance = sum(m._calculate_remaining_balance_at_year(year) for m in mortgages)
+    assert frame.loc[("value", year)].to_numpy() == pytest.approx(expected_value)
+    assert frame.loc[("balance", year)].to_numpy() == pytest.approx(expected_balance)
+    assert (result.prepaid_share == 0).all()
+
+    partial = list(iter_simulation(mortgages, paths=1_000, seed=1, max_workers=1, **SMALL_BLOCKS))
+    assert [r.paths for r in partial] == [400, 800, 1_000]
+    assert partial[-1].prepaid_share.is_monotonic_increasing
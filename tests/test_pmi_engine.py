@@ -0,0 +1,112 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from mortgage_analyzer.engines.escrow_engine import project_escrow, total_payment_vector
+from mortgage_analyzer.engines.pmi_engine import DEFAULT_PMI_TABLE, PMITable, pmi_payment_schedule
+from mortgage_analyzer.models.mortgage_classes import NewMortgageScenario, RefinanceScenario
+
+"""
+Tests for tiered PMI: rate card band edges, and schedules that step down
+through the LTV bands and stop at the removal month.
+"""
+
+
+@pytest.fixture
+def card():
+    # Two LTV bands (80-90], (90-97] and two FICO bands [620, 700), [700, ...)
+    rows = [
+        (90, 620, 25, 0.0080), (90, 700, 25, 0.0050), (97, 620, 25, 0.0120), (97, 700, 25, 0.0090),
+        (90, 620, 35, 0.0100), (90, 700, 35, 0.0070), (97, 620, 35, 0.0140), (97, 700, 35, 0.0110),
+    ]
+    return PMITable.from_frame(
+        pd.DataFrame(rows, columns=["ltv_max", "fico_min", "coverage", "annual_rate"]),
+        standard_coverage={90: 25, 97: 35},
+    )
+
+
+def test_band_edges(card):
+    # LTV bands are (low, high]; nothing at or below 80%; above the top band prices in it
+    ltv = [80.0, 80.01, 90.0, 90.01, 97.0, 99.0]
+    np.testing.assert_array_equal(card.annual_rate(ltv, 700), [0.0, 0.0050, 0.0050, 0.0110, 0.0110, 0.0110])
+
+    # FICO bands start at their edge; scores below the lowest band price in it
+    assert card.annual_rate(85.0, 699) == card.annual_rate(85.0, 620) == card.annual_rate(85.0, 580) == 0.0080
+    assert card.annual_rate(85.0, 700) == 0.0050
+
+    # Coverage rounds up to the next level priced
+    assert card.annual_rate(85.0, 700, coverage=30) == card.annual_rate(85.0, 700, coverage=35) == 0.0070
+
+
+def test_default_card_edges():
+    table = DEFAULT_PMI_TABLE
+    assert table.annual_rate(80.0, 760) == 0.0
+    assert table.annual_rate(85.0, 760) == pytest.approx(0.0015)
+    assert table.annual_rate(85.01, 760) == pytest.approx(0.0028)
+    assert table.annual_rate(97.0, 619) == pytest.approx(0.0186)
+    assert table.annual_rate(100.0, 500) == table.annual_rate(97.0, 620)
+
+
+def test_payment_schedule_steps_down_and_stops(card):
+    opening = np.array([300_000, 291_000, 285_000, 270_000, 260_000, 255_000, 240_000], dtype=float)
+    paid = pmi_payment_schedule(opening, 300_000 / 0.96, 650, removal_month=5, table=card)
+
+    ltv = opening / (300_000 / 0.96) * 100
+    expected = opening * np.where(ltv > 90, 0.0140, 0.0080) / 12
+    expected[5:] = 0.0
+    np.testing.assert_allclose(paid, expected)
+
+
+def tiered_scenarios():
+    common = dict(_rate=6.5, _years=30, _tax=4_000, _ins=1_500, _sqft=2_000)
+    return [
+        NewMortgageScenario(**common, _price=400_000, _downpayment_percent=0.03, _credit_score=700),
+        NewMortgageScenario(**common, _price=400_000, _downpayment_percent=0.05, _credit_score=610, _extra_principal=150),
+        RefinanceScenario(
+            **common, _current_loan_balance=368_000, _current_property_value=400_000, _credit_score=745,
+        ),
+    ]
+
+
+@pytest.mark.parametrize("mortgage", tiered_scenarios(), ids=["3% down", "5% down, extra", "refinance 92%"])
+def test_scenario_pmi_follows_the_balance(mortgage):
+    schedule = mortgage.amortization_schedule()
+    opening = np.concatenate(([mortgage.loan_amount], schedule["balance"].to_numpy()[:-1]))
+    removal = mortgage.pmi_periods_remaining()
+    pmi = mortgage.pmi_schedule()
+
+    assert len(pmi) == len(schedule) and pmi[0] == pytest.approx(mortgage.monthly_pmi)
+
+    # Each month priced from its own LTV band, so the premium steps down
+    ltv = opening / mortgage.price * 100
+    rate = DEFAULT_PMI_TABLE.annual_rate(ltv, mortgage.credit_score)
+    np.testing.assert_allclose(pmi[:removal], opening[:removal] * rate[:removal] / 12)
+    assert len(np.unique(rate[:removal])) > 1 and (np.diff(rate[:removal]) <= 0).all()
+
+    # Zero from the removal month, the first month opening at or below 80% LTV
+    assert pmi[removal - 1] > 0 and (pmi[removal:] == 0).all()
+    assert ltv[removal - 1] > 80 >= ltv[removal]
+
+
+def test_flat_pmi_without_credit_score():
+    mortgage = NewMortgageScenario(
+        _rate=6.5, _years=30, _tax=4_000, _ins=1_500, _sqft=2_000, _price=400_000, _downpayment_percent=0.1,
+    )
+    removal = mortgage.pmi_periods_remaining()
+    pmi = mortgage.pmi_schedule()
+    assert (pmi[:removal] == mortgage.monthly_pmi).all() and (pmi[removal:] == 0).all()
+
+
+@pytest.mark.parametrize("mortgage", tiered_scenarios(), ids=["3% down", "5% down, extra", "refinance 92%"])
+def test_total_payment_vector_uses_pmi_schedule(mortgage):
+    months = 400
+    payments = total_payment_vector(mortgage, months)
+    escrow = project_escrow(mortgage.tax, mortgage.ins, int(np.ceil(months / 12))).monthly_escrow[:months]
+
+    schedule = mortgage.amortization_schedule()
+    payoff = len(schedule)
+    pmi = np.zeros(months)
+    pmi[:payoff] = mortgage.pmi_schedule()
+    loan = np.zeros(months)
+    loan[:payoff] = schedule["principal"] + schedule["interest"] + schedule["principal_paydown"]
+    np.testing.assert_allclose(payments, loan + pmi + escrow)
@@ -0,0 +1,120 @@
+import numpy as np
+import pytest
+
+from mortgage_analyzer.engines import prepayment_engine
+from mortgage_analyzer.engines.prepayment_engine import CASH_FLOW_COLUMNS, LoanPool, project_loans, project_pool
+
+"""
+Parity tests for the prepayment engine: the closed-form survival arrays
+must match a month-by-month loop that re-amortizes the surviving balance,
+and the pool must be the sum of its loans.
+"""
+
+
+def loop_cash_flows(balance, rate, remaining, age, months, cpr=None, psa=None):
+    """Reference: one loan, one month at a time"""
+    r = rate / 1200
+    flows = {name: np.zeros(months) for name in CASH_FLOW_COLUMNS}
+    for month in range(min(remaining, months)):
+        if psa is not None:
+            annual = min(0.06 * psa / 100 * min(age + month + 1, 30) / 30, 1.0)
+        else:
+            annual = cpr
+        smm = 1 - (1 - annual) ** (1 / 12)
+
+        # Level payment re-amortized over the term left on the surviving balance
+        left = remaining - month
+        payment = balance * r / (1 - (1 + r) ** -left) if r else balance / left
+        interest = balance * r
+        scheduled = payment - interest
+        prepaid = (balance - scheduled) * smm
+
+        flows["beginning_balance"][month] = balance
+        flows["interest"][month] = interest
+        flows["scheduled_principal"][month] = scheduled
+        flows["prepayment"][month] = prepaid
+        balance -= scheduled + prepaid
+        flows["ending_balance"][month] = balance
+    flows["total_principal"] = flows["scheduled_principal"] + flows["prepayment"]
+    flows["cash_flow"] = flows["interest"] + flows["total_principal"]
+    return flows
+
+
+@pytest.fixture
+def pool():
+    rng = np.random.default_rng(4)
+    count = 12
+    rate = rng.uniform(3, 8, count)
+    rate[[2, 7]] = 0.0
+    remaining = rng.integers(12, 360, count)
+    remaining[[4, 9]] = 0
+    return LoanPool(
+        balance=rng.uniform(50_000, 500_000, count),
+        rate=rate,
+        remaining_months=remaining,
+        age_months=rng.choice([0, 5, 29, 30, 120], count),
+    )
+
+
+def assert_matches_loop(pool, flows, months, **speed):
+    for loan in range(len(pool)):
+        cpr = speed.get("cpr")
+        expected = loop_cash_flows(
+            pool.balance[loan], pool.rate[loan], int(pool.remaining_months[loan]), int(pool.age_months[loan]), months,
+            cpr=None if cpr is None else np.broadcast_to(cpr, len(pool))[loan], psa=speed.get("psa"),
+        )
+        for name in CASH_FLOW_COLUMNS:
+            np.testing.assert_allclose(flows[name][loan], expected[name], rtol=1e-9, atol=1e-6, err_msg=name)
+
+
+@pytest.mark.parametrize("psa", [0.0, 100.0, 250.0])
+def test_psa_matches_loop(pool, psa):
+    months = int(pool.remaining_months.max())
+    assert_matches_loop(pool, project_loans(pool, psa=psa), months, psa=psa)
+
+
+def test_per_loan_cpr_matches_loop(pool):
+    cpr = np.linspace(0.0, 0.3, len(pool))
+    months = int(pool.remaining_months.max())
+    assert_matches_loop(pool, project_loans(pool, cpr=cpr), months, cpr=cpr)
+    assert_matches_loop(pool, project_loans(pool, cpr=0.08), months, cpr=0.08)
+
+
+def test_finished_loans_have_no_cash_flows(pool):
+    flows = project_loans(pool, psa=100)
+    done = pool.remaining_months == 0
+    for name in CASH_FLOW_COLUMNS:
+        assert (flows[name][done] == 0).all()
+
+    # Every other loan pays down to zero by the end of its term
+    last = pool.remaining_months[~done] - 1
+    np.testing.assert_allclose(flows["ending_balance"][~done, last], 0.0, atol=1e-6)
+    np.testing.assert_allclose(flows["total_principal"][~done].sum(axis=1), pool.balance[~done])
+
+
+@pytest.mark.parametrize("speed", [{"psa": 150.0}, {"cpr": 0.12}, {"cpr": "per loan"}])
+def test_pool_is_sum_of_loans(pool, monkeypatch, speed):
+    if speed.get("cpr") == "per loan":
+        speed = {"cpr": np.linspace(0.02, 0.2, len(pool))}
+    # Chunks of five loans, so per-loan speeds are sliced across chunks
+    monkeypatch.setattr(prepayment_engine, "LOAN_CHUNK_ROWS", 5)
+
+    loans = project_loans(pool, **speed)
+    cash_flows = project_pool(pool, **speed)
+    for name in CASH_FLOW_COLUMNS:
+        np.testing.assert_allclose(cash_flows[name], loans[name].sum(axis=0), rtol=1e-10, atol=1e-6, err_msg=name)
+
+    if "cpr" in speed and np.ndim(speed["cpr"]) == 0:
+        # One speed for every loan is the pool's realized speed while any balance is left
+        live = cash_flows["beginning_balance"] > cash_flows["scheduled_principal"]
+        np.testing.assert_allclose(cash_flows.loc[live, "cpr"], 0.12)
+
+
+def test_speed_arguments():
+    pool = LoanPool(balance=[100_000], rate=[6.0], remaining_months=[360], age_months=[0])
+    with pytest.raises(ValueError, match="not both"):
+        project_loans(pool, cpr=0.1, psa=100)
+    with pytest.raises(ValueError, match="between 0 and 1"):
+        project_pool(pool, cpr=1.5)
+    with pytest.raises(ValueError, match="same length"):
+        LoanPool(balance=[1.0, 2.0], rate=[6.0], remaining_months=[360], age_months=[0])
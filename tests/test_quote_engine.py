@@ -0,0 +1,64 @@
+import random
+
+import numpy as np
+import pytest
+
+from mortgage_analyzer.engines import quote_engine
+from mortgage_analyzer.engines.amortization_engine import annuity_payment, balance_after
+from mortgage_analyzer.models.mortgage_classes import NewMortgageScenario
+
+"""
+Parity tests for the quote engine: table-backed quotes must agree with
+Mortgage.principal_and_interest and monthly_pmi to the cent, on and off
+the rate grid.
+"""
+
+
+def random_scenario(rng, credit_score):
+    price = rng.uniform(100_000, 3_000_000)
+    return NewMortgageScenario(
+        _price=price,
+        _downpayment_amount=price * rng.uniform(0.03, 0.3),
+        _sqft=2_000,
+        _rate=round(rng.uniform(0.5, 12), rng.choice([3, 5])),
+        _years=rng.choice([10, 15, 20, 30, 40]),
+        _tax=rng.uniform(0, 20_000),
+        _ins=rng.uniform(0, 5_000),
+        _credit_score=credit_score,
+    )
+
+
+@pytest.mark.parametrize("credit_score", [None, 640, 780])
+def test_quote_matches_mortgage(credit_score):
+    rng = random.Random(credit_score or 0)
+    for _ in range(200):
+        m = random_scenario(rng, credit_score)
+        quote = quote_engine.quote_payment(
+            m.loan_amount, m.rate, m.periods_remaining, m.tax, m.ins, m.price, m.credit_score, m.pmi_rate
+        )
+        assert quote["principal_and_interest"] == pytest.approx(m.principal_and_interest, abs=0.005)
+        assert quote["monthly_pmi"] == pytest.approx(m.monthly_pmi, abs=0.005)
+        expected_piti = m.principal_and_interest + m.monthly_pmi + m.monthly_tax + m.monthly_ins
+        assert quote["piti"] == pytest.approx(expected_piti, abs=0.005)
+
+
+def test_batch_factors_match_closed_form():
+    rng = np.random.default_rng(7)
+    loan = rng.uniform(10_000, 5_000_000, 5_000)
+    rate = np.round(rng.uniform(0, 15, 5_000), 3)
+    rate[::5] = rng.uniform(0, 25, 1_000)  # off the grid / past the table
+    months = rng.integers(1, 600, 5_000)
+
+    table = quote_engine.get_factor_table()
+    payment = annuity_payment(loan, rate / 100 / 12, months)
+    quotes = quote_engine.quote_payments(loan, rate, months)
+    np.testing.assert_allclose(quotes["principal_and_interest"], payment, rtol=0, atol=0.005)
+
+    elapsed = months // 3
+    balance = balance_after(loan, rate / 100 / 12, payment, elapsed)
+    np.testing.assert_allclose(loan * table.balance_factor(rate, months, elapsed), balance, rtol=0, atol=0.005)
+
+
+def test_rejects_empty_term():
+    with pytest.raises(ValueError):
+        quote_engine.quote_payments(100_000, 5.0, 0)
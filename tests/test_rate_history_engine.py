@@ -0,0 +1,86 @@
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from mortgage_analyzer.engines.rate_history_engine import RateHistory, load_rate_history, read_rate_history
+
+"""
+Tests for the rate history store: the memory-mapped binary must give back
+the CSV's weekly rates, and windowed statistics must match pandas.
+"""
+
+
+@pytest.fixture
+def history_csv(tmp_path):
+    rng = np.random.default_rng(0)
+    dates = pd.date_range("1990-01-04", periods=900, freq="7D")
+    thirty = np.clip(8 + np.cumsum(rng.normal(0, 0.08, len(dates))), 2, 18).round(2)
+    fifteen = (thirty - 0.6).round(2)
+    fifteen[:100] = np.nan
+
+    tape = pd.DataFrame({
+        "observation_date": dates.strftime("%Y-%m-%d"),
+        "MORTGAGE30US": thirty.astype(object),
+        "MORTGAGE15US": fifteen,
+    })
+    tape.loc[5, "MORTGAGE30US"] = "."
+    # A holiday week reported a day early, and two missing weeks
+    tape.loc[20, "observation_date"] = (dates[20] - pd.Timedelta(days=1)).strftime("%Y-%m-%d")
+    tape = tape.drop(index=[40, 41])
+
+    path = tmp_path / "pmms.csv"
+    tape.to_csv(path, index=False)
+    return path, pd.DataFrame({"date": dates, "mortgage30us": thirty, "mortgage15us": fifteen})
+
+
+def test_store_round_trips_weekly_grid(history_csv):
+    path, expected = history_csv
+    history = load_rate_history(str(path))
+    assert path.with_suffix(".npy").exists()
+    assert history.series == ("mortgage30us", "mortgage15us") and len(history) == 900
+
+    # Missing weeks carry the previous week's rate
+    expected.loc[5, "mortgage30us"] = expected.loc[4, "mortgage30us"]
+    expected.loc[[40, 41]] = expected.loc[[39, 39]].to_numpy()
+    expected["date"] = pd.date_range("1990-01-04", periods=900, freq="7D")
+    pd.testing.assert_frame_equal(history.window(), expected, check_dtype=False)
+    pd.testing.assert_frame_equal(read_rate_history(path), expected, check_dtype=False)
+
+    assert history.rate_at("01/10/1990") == expected.loc[0, "mortgage30us"]
+    np.testing.assert_array_equal(
+        history.rate_at(np.array(["1990-01-11", "2050-01-01"], dtype="datetime64[D]"), "mortgage15us"),
+        [np.nan, expected["mortgage15us"].iloc[-1]],
+    )
+    with pytest.raises(ValueError, match="starts on"):
+        history.index_of("01/01/1980")
+    assert history.series_for_term(15) == "mortgage15us" and history.series_for_term(20) == "mortgage15us"
+
+
+def test_window_stats_match_pandas(history_csv):
+    path, _ = history_csv
+    history = load_rate_history(str(path))
+    stats = history.window_stats(history.dates, weeks=26, series="mortgage15us")
+
+    rates = history.window(series="mortgage15us")["mortgage15us"]
+    rolling = rates.rolling(26, min_periods=1)
+    np.testing.assert_allclose(stats["mean"], rolling.mean(), atol=1e-9)
+    np.testing.assert_allclose(stats["std"], rolling.std(ddof=0), atol=1e-6)
+    np.testing.assert_allclose(stats["min"], rolling.min())
+    np.testing.assert_allclose(stats["max"], rolling.max())
+    np.testing.assert_allclose(
+        stats["percentile"], rolling.apply(lambda w: (w <= w.iloc[-1]).sum() / w.notna().sum(), raw=False)
+    )
+
+
+def test_pickles_as_path_and_reloads_changed_files(history_csv, tmp_path):
+    path, expected = history_csv
+    history = load_rate_history(str(path))
+    assert len(pickle.dumps(history)) < 500
+    assert pickle.loads(pickle.dumps(history)) is history
+
+    # Only the first year, as a new CSV written over the old one
+    expected.iloc[:52].assign(date=expected["date"].dt.strftime("%m/%d/%Y")).to_csv(path, index=False)
+    reloaded = load_rate_history(str(path))
+    assert isinstance(reloaded, RateHistory) and len(reloaded) == 52
@@ -0,0 +1,135 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from mortgage_analyzer.engines.rate_sheet_engine import RATE_SHEET_ENV_VAR, RateSheetIndex, load_rate_sheet
+
+"""
+Parity tests for the rate sheet index: every grid lookup must agree with a
+brute-force filter over the sheet's rows.
+"""
+
+PRODUCTS = ["Conventional", "FHA", "Jumbo"]
+
+
+def random_sheet(seed, rows=120):
+    rng = np.random.default_rng(seed)
+    ltv_min = rng.choice([0.0, 60.0, 70.0, 80.0, 85.0, 90.0], rows)
+    fico_min = rng.choice([580, 620, 660, 700, 740], rows)
+    return pd.DataFrame({
+        "product": rng.choice(PRODUCTS, rows),
+        "term": rng.choice([15, 30], rows),
+        # Overlapping bands of different widths
+        "ltv_min": ltv_min,
+        "ltv_max": ltv_min + rng.choice([5.0, 10.0, 15.0, 20.0, 37.0], rows),
+        "fico_min": fico_min,
+        "fico_max": np.minimum(fico_min + rng.choice([19, 39, 79, 270], rows), 850),
+        "lock_days": rng.choice([30, 45, 60], rows),
+        # Few distinct prices, so equally good rows are common
+        "rate": rng.choice(np.arange(5.5, 7.0, 0.25), rows),
+        "points": rng.choice([-1.0, -0.5, 0.0, 0.5, 1.0, 2.0], rows),
+    })
+
+
+def brute_force_best(columns, ltv, fico, term, product=None, lock_days=None, max_points=0.0):
+    """Reference: filter every row, lowest rate then fewest points; the later row wins a tie"""
+    match = (
+        (columns["ltv_min"] < ltv) & (ltv <= columns["ltv_max"])
+        & (columns["fico_min"] <= fico) & (fico <= columns["fico_max"])
+        & (columns["term"] == term)
+        & (columns["points"] <= max_points)
+    )
+    if product is not None:
+        match &= columns["product"] == product
+    if lock_days is not None:
+        match &= columns["lock_days"] == lock_days
+    rows = np.flatnonzero(match)
+    if not len(rows):
+        return None
+    return rows[np.lexsort((-rows, columns["points"][rows], columns["rate"][rows]))[0]]
+
+
+def query_points(sheet):
+    """LTVs and FICOs on, just off and between every band edge"""
+    ltv_edges = np.unique(np.concatenate([sheet["ltv_min"], sheet["ltv_max"]]))
+    ltvs = np.unique(np.concatenate([ltv_edges, ltv_edges + 0.01, ltv_edges - 0.01, [50.0, 77.5, 130.0]]))
+    fico_edges = np.unique(np.concatenate([sheet["fico_min"], sheet["fico_max"]]))
+    ficos = np.unique(np.concatenate([fico_edges, fico_edges - 1, fico_edges + 1, [500, 851]]))
+    return ltvs, ficos
+
+
+@pytest.mark.parametrize("seed, max_points", [(0, 0.0), (1, 1.0), (2, -0.5), (3, 5.0)])
+@pytest.mark.parametrize("product, lock_days", [(None, None), ("FHA", None), (None, 45), ("Jumbo", 30)])
+def test_best_rates_match_brute_force(seed, max_points, product, lock_days):
+    sheet = random_sheet(seed)
+    columns = {name: sheet[name].to_numpy() for name in sheet.columns}
+    index = RateSheetIndex(sheet, max_points=max_points)
+    ltvs, ficos = query_points(sheet)
+    ltv_grid, fico_grid = np.meshgrid(ltvs, ficos, indexing="ij")
+
+    for term in (15, 30):
+        rates = index.best_rates(ltv_grid, fico_grid, term, product, lock_days)
+        assert rates.shape == ltv_grid.shape
+        for i, ltv in enumerate(ltvs):
+            for j, fico in enumerate(ficos):
+                row = brute_force_best(columns, ltv, fico, term, product, lock_days, max_points)
+                quote = index.best_rate(ltv, fico, term, product, lock_days)
+                if row is None:
+                    assert quote is None and np.isnan(rates[i, j])
+                    continue
+                expected = sheet.iloc[row]
+                # The same row: its rate, points and bands, not just an equal rate
+                assert (quote.rate, quote.points) == (expected["rate"], expected["points"])
+                assert quote.ltv_band == (expected["ltv_min"], expected["ltv_max"])
+                assert quote.fico_band == (expected["fico_min"], expected["fico_max"])
+                assert (quote.product, quote.lock_days) == (expected["product"], expected["lock_days"])
+                assert rates[i, j] == expected["rate"]
+
+
+def test_band_edges_and_unknown_keys():
+    sheet = pd.DataFrame({
+        "term": [30, 30, 30],
+        "ltv_min": [0.0, 80.0, 80.0],
+        "ltv_max": [80.0, 95.0, 95.0],
+        "fico_min": [700, 700, 620],
+        "fico_max": [850, 850, 699],
+        "rate": [6.0, 6.5, 7.0],
+    })
+    index = RateSheetIndex(sheet)
+
+    # LTV bands are (low, high]; FICO bands are [low, high]
+    assert index.best_rate(80.0, 700, 30).rate == 6.0
+    assert index.best_rate(80.001, 700, 30).rate == 6.5
+    assert index.best_rate(95.0, 699, 30).rate == 7.0
+    assert index.best_rate(0.0, 760, 30) is None
+    assert index.best_rate(95.01, 760, 30) is None
+    assert index.best_rate(70.0, 619, 30) is None
+
+    assert index.best_rate(70.0, 760, 15) is None
+    assert index.best_rate(70.0, 760, 30, product="VA") is None
+    assert np.isnan(index.best_rates([70.0, 90.0], 760, 30, lock_days=60)).all()
+
+
+def test_reloads_when_the_file_changes(tmp_path, monkeypatch):
+    path = tmp_path / "sheet.csv"
+    sheet = random_sheet(5, rows=40)
+    sheet.to_csv(path, index=False)
+
+    monkeypatch.setenv(RATE_SHEET_ENV_VAR, str(path))
+    index = load_rate_sheet()
+    assert load_rate_sheet(str(path)) is index and len(index) == 40
+
+    # New prices; the modification time is moved on in case the edit lands in the same clock tick
+    sheet.assign(rate=sheet["rate"] + 0.25).to_csv(path, index=False)
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    reloaded = load_rate_sheet(str(path))
+    assert reloaded is not index
+    np.testing.assert_allclose(reloaded.rate, index.rate + 0.25)
+
+    # Fewer rows: the size changes too
+    sheet.iloc[:10].to_csv(path, index=False)
+    assert len(load_rate_sheet(str(path))) == 10
+    assert load_rate_sheet(str(path), max_points=1.0).max_points == 1.0
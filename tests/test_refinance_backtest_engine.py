@@ -0,0 +1,135 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from mortgage_analyzer.engines import refinance_backtest_engine
+from mortgage_analyzer.engines.rate_history_engine import load_rate_history
+from mortgage_analyzer.engines.refinance_backtest_engine import RefinanceAssumptions, backtest_refinance
+from mortgage_analyzer.models.mortgage_classes import CurrentMortgage, RefinanceScenario
+
+"""
+Parity tests for the refinance backtester: each candidate month must price
+the refinance like a RefinanceScenario and value it like a month-by-month loop.
+"""
+
+
+@pytest.fixture
+def history(tmp_path):
+    dates = pd.date_range("1995-01-05", "2024-12-26", freq="7D")
+    weeks = np.arange(len(dates))
+    thirty = (6 + 2 * np.sin(weeks / 150) + 0.3 * np.sin(weeks / 9)).round(2)
+    path = tmp_path / "pmms.csv"
+    pd.DataFrame({"date": dates.strftime("%m/%d/%Y"), "mortgage30": thirty, "mortgage15": thirty - 0.6}).to_csv(
+        path, index=False
+    )
+    return load_rate_history(str(path))
+
+
+def current_mortgage(start_date="03/15/2005", rate=6.5, years=30, original_loan=300_000):
+    return CurrentMortgage(
+        _rate=rate, _years=years, _tax=4_000, _ins=1_500, _sqft=2_000, _original_loan=original_loan,
+        _loan_amount=original_loan * 0.9, _start_date=start_date, _price_per_sqft=200, _monthly_pmi=0, _total_pmt=2_500,
+    )
+
+
+def loop_net_benefit(balance, old_rate, old_payment, remaining, new_loan, new_rate, new_payment, cash, months):
+    """Reference: run both loans month by month through the holding period"""
+    old_balance, new_balance, benefit = balance, new_loan, cash
+    for month in range(months):
+        if month < remaining:
+            paid = min(old_payment, old_balance * (1 + old_rate / 1200))
+            old_balance = old_balance * (1 + old_rate / 1200) - paid
+            benefit += paid
+        if month < 360:
+            paid = min(new_payment, new_balance * (1 + new_rate / 1200))
+            new_balance = new_balance * (1 + new_rate / 1200) - paid
+            benefit -= paid
+    return benefit + old_balance - new_balance
+
+
+@pytest.mark.parametrize("holding_years", [None, 5])
+def test_candidates_match_refinance_scenario(history, holding_years):
+    mortgage = current_mortgage()
+    assumptions = RefinanceAssumptions(
+        closing_cost_percentage=0.03, cash_out_amount=15_000, discount_points=0.5, rate_spread=0.25,
+        holding_years=holding_years,
+    )
+    result = backtest_refinance(mortgage, history, assumptions)
+    outcomes = result.outcomes
+
+    # Every month from the first payment through the end of the history
+    assert outcomes["month"].tolist() == list(range(1, len(outcomes) + 1))
+    assert outcomes["date"].iloc[-1] <= pd.Timestamp(history.end) + pd.Timedelta(days=6)
+
+    for _, row in outcomes.iloc[::37].iterrows():
+        assert row["market_rate"] == history.rate_at(np.datetime64(row["date"].date()), "mortgage30")
+        scenario = RefinanceScenario(
+            _rate=row["new_rate"], _years=30, _tax=4_000, _ins=1_500, _sqft=2_000,
+            _current_loan_balance=row["balance"], _current_property_value=500_000,
+            _cash_out_amount=15_000, _closing_cost_percentage=0.03, _discount_points=0.5,
+        )
+        assert row["new_loan"] == pytest.approx(scenario.loan_amount)
+        assert row["closing_costs"] == pytest.approx(scenario.closing_costs)
+        assert row["new_payment"] == pytest.approx(scenario.principal_and_interest)
+
+        remaining = 360 - row["month"]
+        months = remaining if holding_years is None else holding_years * 12
+        expected = loop_net_benefit(
+            row["balance"], 6.5, row["old_payment"], remaining, row["new_loan"], row["new_rate"],
+            row["new_payment"], 15_000 - row["closing_costs"], months,
+        )
+        assert row["net_benefit"] == pytest.approx(expected, abs=0.01)
+
+
+def test_breakeven_months(history):
+    result = backtest_refinance(current_mortgage(rate=9.0), history, RefinanceAssumptions(cash_out_amount=1_000))
+    outcomes = result.outcomes
+    saving = outcomes[outcomes["monthly_savings"] > 0]
+    needed = np.ceil((saving["closing_costs"] - 1_000) / saving["monthly_savings"])
+    np.testing.assert_array_equal(saving["breakeven_months"], needed)
+    assert outcomes.loc[outcomes["monthly_savings"] <= 0, "breakeven_months"].isna().all()
+
+    covered = backtest_refinance(current_mortgage(), history, RefinanceAssumptions(cash_out_amount=50_000))
+    assert (covered.outcomes["breakeven_months"] == 0).all()
+
+
+def test_many_loans_rank_and_distribute(history, monkeypatch):
+    rng = np.random.default_rng(5)
+    mortgages = [
+        current_mortgage(f"{month:02d}/01/{year}", rate=float(rate), years=int(years))
+        for month, year, rate, years in zip(
+            rng.integers(1, 13, 12), rng.integers(1990, 2023, 12), rng.uniform(4, 9, 12), rng.choice([15, 30], 12)
+        )
+    ]
+    in_process = backtest_refinance(mortgages, history, max_workers=1)
+
+    # Chunks of five loans spread over two worker processes give the same rows
+    monkeypatch.setattr(refinance_backtest_engine, "BACKTEST_CHUNK_LOANS", 5)
+    pooled = backtest_refinance(mortgages, history, max_workers=2)
+    pd.testing.assert_frame_equal(pooled.outcomes, in_process.outcomes)
+
+    best = in_process.best()
+    assert best["loan"].tolist() == sorted(in_process.outcomes["loan"].unique())
+    top = in_process.outcomes.groupby("loan")["net_benefit"].max()
+    np.testing.assert_allclose(best.set_index("loan")["net_benefit"], top)
+    assert in_process.ranked(top=5)["net_benefit"].is_monotonic_decreasing
+
+    overall = in_process.distribution().iloc[0]
+    assert overall["months"] == len(in_process)
+    assert overall["p5"] <= overall["p50"] <= overall["p95"]
+    assert overall["share_beneficial"] == pytest.approx((in_process.outcomes["net_benefit"] > 0).mean())
+    by_loan = in_process.distribution(by_loan=True)
+    assert by_loan["months"].sum() == len(in_process)
+
+
+def test_assumptions_follow_refinance_scenario():
+    scenario = RefinanceScenario(
+        _rate=5.0, _years=15, _tax=3_000, _ins=1_200, _sqft=2_000, _current_loan_balance=200_000,
+        _current_property_value=300_000, _cash_out_amount=20_000, _closing_cost_percentage=0.02, _discount_points=1.0,
+    )
+    assumptions = RefinanceAssumptions.from_refinance(scenario, rate_spread=0.5)
+    assert (assumptions.years, assumptions.cash_out_amount, assumptions.discount_points) == (15, 20_000, 1.0)
+    assert assumptions.closing_cost_percentage == 0.02 and assumptions.rate_spread == 0.5
+
+    with pytest.raises(ValueError, match="unreasonably high"):
+        RefinanceAssumptions(closing_cost_percentage=0.2)
@@ -0,0 +1,104 @@
+import numpy as np
+import pytest
+
+from mortgage_analyzer.engines.escrow_engine import total_payment_vector
+from mortgage_analyzer.engines.rent_vs_buy_engine import RentVsBuyAssumptions, analyze_rent_vs_buy, solve_irr
+from mortgage_analyzer.models.mortgage_classes import CurrentMortgage, NewMortgageScenario
+
+"""
+Tests for the rent vs. buy engine: IRRs must be roots of the cash flows'
+NPV, and the batched holding-period matrix must match building each
+holding period's cash flows on its own.
+"""
+
+
+def purchase(**changes):
+    terms = dict(
+        _rate=6.0, _years=30, _tax=6_000, _ins=1_800, _sqft=2_000, _price=500_000, _downpayment_amount=100_000,
+        _extra_principal=300, _prepay_periods=60,
+    )
+    terms.update(changes)
+    return NewMortgageScenario(**terms)
+
+
+def npv_at(cash_flows, rate):
+    return (np.asarray(cash_flows) * (1 + rate) ** -np.arange(len(cash_flows))).sum()
+
+
+def test_irr_is_a_root_of_npv():
+    rng = np.random.default_rng(5)
+    # An outlay followed by mixed inflows and outflows that net positive
+    flows = np.column_stack((-rng.uniform(1_000, 50_000, 40), rng.normal(300, 400, (40, 120))))
+    flows[:, -1] += rng.uniform(0, 60_000, 40)
+
+    irr = solve_irr(flows)
+    assert np.isfinite(irr).all()
+    for row, rate in zip(flows, irr):
+        assert abs(npv_at(row, rate)) < 1e-6 * np.abs(row).sum()
+
+
+def test_irr_of_a_level_annuity_and_no_root():
+    payment = 1_000 * 0.01 / (1 - 1.01 ** -12)
+    assert solve_irr([-1_000] + [payment] * 12)[0] == pytest.approx(0.01, abs=1e-10)
+    # No sign change, no IRR
+    assert np.isnan(solve_irr([[100, 50, 25], [-100, -50, -25]])).all()
+
+
+def reference_cash_flows(mortgage, assumptions, years):
+    # Buy-minus-rent cash flows for one holding period, month by month
+    months = years * 12
+    monthly_return = (1 + assumptions.investment_return) ** (1 / 12) - 1
+    payments = total_payment_vector(mortgage, months, assumptions.escrow)
+    balances = mortgage.amortization_schedule()["balance"].to_numpy()
+
+    flows = [-mortgage.initial_investment]
+    for month in range(1, months + 1):
+        year = (month - 1) // 12
+        value = mortgage.price * (1 + assumptions.appreciation) ** year
+        own = payments[month - 1] + value * assumptions.maintenance_pct / 12
+        rent = assumptions.monthly_rent * (1 + assumptions.rent_growth) ** year
+        flows.append(rent - own)
+
+    balance = balances[months - 1] if months <= len(balances) else 0.0
+    sale = mortgage.estimate_value_at_year(years, assumptions.appreciation)
+    flows[-1] += sale * (1 - assumptions.selling_cost_pct) - balance
+    return np.array(flows), monthly_return
+
+
+@pytest.mark.parametrize("mortgage", [purchase(), purchase(_years=15, _extra_principal=0, _prepay_periods=0)])
+def test_matches_each_holding_period_on_its_own(mortgage):
+    assumptions = RentVsBuyAssumptions(monthly_rent=2_800, rent_growth=0.04, investment_return=0.07)
+    holding = [1, 3, 7, 15, 20]
+    analysis = analyze_rent_vs_buy(mortgage, assumptions, holding)
+    summary = analysis.summary.set_index("holding_years")
+
+    for years in holding:
+        flows, monthly_return = reference_cash_flows(mortgage, assumptions, years)
+        row = summary.loc[years]
+        assert row["npv"] == pytest.approx(npv_at(flows, monthly_return), rel=1e-9, abs=1e-6)
+        assert row["irr"] == pytest.approx((1 + solve_irr([flows])[0]) ** 12 - 1, rel=1e-6)
+        assert row["better_choice"] == ("Buy" if row["npv"] > 0 else "Rent")
+
+        # Wealth difference is the cash flows' value at the sale date
+        future_value = row["npv"] * (1 + monthly_return) ** (years * 12)
+        assert row["wealth_difference"] == pytest.approx(future_value, rel=1e-9, abs=1e-4)
+
+    # Buying beats renting exactly when its IRR beats the investment return
+    np.testing.assert_array_equal(summary["npv"] > 0, summary["irr"] > assumptions.investment_return)
+    ahead = summary.index[summary["npv"] > 0]
+    assert analysis.breakeven_years == (int(ahead[0]) if len(ahead) else None)
+
+
+def test_rejects_bad_inputs():
+    assumptions = RentVsBuyAssumptions(monthly_rent=2_500)
+    with pytest.raises(ValueError, match="Holding periods"):
+        analyze_rent_vs_buy(purchase(), assumptions, [0, 5])
+    current = CurrentMortgage(
+        _rate=7.0, _years=30, _tax=4_000, _ins=1_500, _sqft=2_000, _original_loan=400_000, _loan_amount=380_000,
+        _start_date="01/01/2022", _price_per_sqft=250, _monthly_pmi=0, _total_pmt=3_500,
+    )
+    with pytest.raises(ValueError, match="purchase scenario"):
+        analyze_rent_vs_buy(current, assumptions)
+    for bad in (dict(monthly_rent=0), dict(investment_return=-1), dict(selling_cost_pct=0.2), dict(maintenance_pct=-0.01)):
+        with pytest.raises(ValueError):
+            RentVsBuyAssumptions(**{"monthly_rent": 2_500, **bad})
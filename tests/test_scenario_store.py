@@ -0,0 +1,32 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from mortgage_analyzer.models.mortgage_classes import NewMortgageScenario
+from mortgage_analyzer.utils.scenario_store import ScenarioStore
+
+"""
+Tests for the scenario store shared by every Streamlit session thread.
+"""
+
+
+def scenario(rate):
+    return NewMortgageScenario(
+        _rate=rate, _years=30, _tax=4_000, _ins=1_500, _sqft=2_000, _price=400_000, _downpayment_amount=80_000
+    )
+
+
+def test_threads_share_one_store(tmp_path):
+    store = ScenarioStore(str(tmp_path / "scenarios.db"))
+
+    def session(worker):
+        borrower = f"borrower {worker}"
+        for i in range(100):
+            scenario_id = store.save_scenario(borrower, scenario(4 + i / 100), label=f"{worker}-{i}")
+            store.list_scenarios(borrower, limit=5)
+            kind, loaded, _ = store.load_scenario(scenario_id)
+            assert kind == "new" and loaded.rate == 4 + i / 100
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(session, range(8)))
+
+    assert sum(store.count_scenarios(f"borrower {worker}") for worker in range(8)) == 800
+    store.close()
@@ -0,0 +1,97 @@
+import dataclasses
+import pickle
+import subprocess
+import sys
+
+import pytest
+
+from mortgage_analyzer.models.mortgage_classes import CurrentMortgage, NewMortgageScenario, RefinanceScenario
+
+"""
+Scenario value semantics: scenarios are frozen and hash by content,
+and with_* variants equal a full build with the same inputs.
+"""
+
+
+def new_scenario(**changes):
+    values = dict(_rate=6.5, _years=30, _tax=4_000, _ins=1_500, _sqft=2_000, _price=400_000, _downpayment_amount=80_000)
+    values.update(changes)
+    return NewMortgageScenario(**values)
+
+
+def current_mortgage(**changes):
+    values = dict(
+        _rate=7.0, _years=30, _tax=4_000, _ins=1_500, _sqft=2_000, _original_loan=350_000, _loan_amount=330_000,
+        _start_date="01/01/2022", _price_per_sqft=220, _monthly_pmi=0, _total_pmt=3_000,
+    )
+    values.update(changes)
+    return CurrentMortgage(**values)
+
+
+def test_frozen_and_hashable():
+    scenario = new_scenario()
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        scenario._rate = 5.0
+    assert not hasattr(scenario, "__dict__")
+
+    assert scenario == new_scenario(_tax=4_000.0) and hash(scenario) == hash(new_scenario(_tax=4_000.0))
+    assert scenario != new_scenario(_rate=6.0)
+    assert len({scenario, new_scenario(), new_scenario(_rate=6.0)}) == 2
+
+    restored = pickle.loads(pickle.dumps(scenario))
+    assert restored == scenario and hash(restored) == hash(scenario)
+
+
+def test_hash_is_the_same_in_every_process():
+    code = (
+        "from mortgage_analyzer.models.mortgage_classes import NewMortgageScenario\n"
+        "print(hash(NewMortgageScenario(_rate=6.5, _years=30, _tax=4000, _ins=1500, _sqft=2000,"
+        " _price=400000, _downpayment_amount=80000)))"
+    )
+    # String hashing is salted per process, so this fails if the hash leans on it
+    other_process = subprocess.check_output([sys.executable, "-c", code], text=True).strip()
+    assert other_process == str(hash(new_scenario()))
+
+
+@pytest.mark.parametrize(
+    "build, changes",
+    [
+        (new_scenario, {"rate": 5.25}),
+        (new_scenario, {"price": 500_000}),
+        (new_scenario, {"downpayment_percent": 0.1}),
+        # Percent takes precedence over amount, as in the constructor
+        (new_scenario, {"downpayment_percent": 0.1, "downpayment_amount": 100_000}),
+        (new_scenario, {"extra_principal": 200.0, "prepay_periods": 60}),
+        (current_mortgage, {"years": 15, "original_loan": 400_000}),
+    ],
+)
+def test_with_changes_matches_full_build(build, changes):
+    base = build()
+    derived = base.with_changes(**changes)
+    rebuilt = dataclasses.replace(base, **{f"_{name}": value for name, value in changes.items()})
+
+    assert derived == rebuilt and hash(derived) == hash(rebuilt)
+    assert derived.principal_and_interest == rebuilt.principal_and_interest
+    assert base == build()
+
+
+def test_with_changes_validates():
+    scenario = new_scenario()
+    assert scenario.with_rate(5.0).rate == 5.0
+    assert scenario.with_years(15).periods_remaining == 180
+    assert scenario.with_extra_principal(100.0).extra_principal == 100.0
+    assert scenario.with_changes(downpayment_percent=0.1, downpayment_amount=100_000).downpayment_percent == 0.1
+    assert scenario.with_changes(downpayment_amount=100_000).downpayment_percent == 0.25
+
+    with pytest.raises(ValueError, match="unreasonably high"):
+        scenario.with_rate(30.0)
+    with pytest.raises(ValueError, match="cannot exceed original loan"):
+        current_mortgage().with_changes(original_loan=300_000)
+    with pytest.raises(TypeError):
+        scenario.with_changes(closing_cost_percentage=0.02)
+
+    refinance = RefinanceScenario(
+        _rate=5.0, _years=30, _tax=3_000, _ins=1_200, _sqft=2_000,
+        _current_loan_balance=200_000, _current_property_value=300_000,
+    )
+    assert refinance.with_changes(cash_out_amount=20_000).loan_amount == 220_000
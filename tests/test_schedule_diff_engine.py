@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+
+from mortgage_analyzer.engines.escrow_engine import EscrowAssumptions, breakeven_month, total_payment_vector
+from mortgage_analyzer.engines.schedule_diff_engine import align_schedules
+from mortgage_analyzer.models.mortgage_classes import NewMortgageScenario
+
+"""
+Parity tests for the schedule diff engine: aligned schedules must agree
+with each scenario's own schedule, equity estimate and break-even.
+"""
+
+
+def scenario(rate, years, extra=0.0):
+    return NewMortgageScenario(
+        _price=400_000,
+        _downpayment_amount=80_000,
+        _sqft=2_000,
+        _rate=rate,
+        _years=years,
+        _tax=4_000,
+        _ins=1_500,
+        _extra_principal=extra,
+    )
+
+
+@pytest.fixture
+def mortgages():
+    return {"thirty": scenario(6.5, 30), "fifteen": scenario(5.75, 15, extra=250.0)}
+
+
+def test_aligned_matches_schedules(mortgages):
+    aligned = align_schedules(mortgages)
+    assert aligned.months == max(len(m.amortization_schedule()) for m in mortgages.values())
+
+    for row, mortgage in enumerate(mortgages.values()):
+        schedule = mortgage.amortization_schedule()
+        paid = len(schedule)
+        assert aligned.balance[row, 0] == mortgage.loan_amount
+        np.testing.assert_allclose(aligned.balance[row, 1:paid + 1], schedule["balance"])
+        assert not aligned.balance[row, paid + 1:].any()
+        assert aligned.totals()["total_interest"].iloc[row] == pytest.approx(schedule["interest"].sum())
+
+
+def test_equity_matches_estimate(mortgages):
+    aligned = align_schedules(mortgages, months=30 * 12)
+    for row, mortgage in enumerate(mortgages.values()):
+        for year in (0, 5, 10, 20, 30):
+            assert aligned.equity[row, year * 12] == pytest.approx(mortgage.estimate_equity_at_year(year), abs=0.01)
+
+
+def test_diff_and_breakeven(mortgages):
+    escrow = EscrowAssumptions(tax_growth=0.02, ins_growth=0.04)
+    aligned = align_schedules(mortgages, months=360, escrow_assumptions=escrow)
+    base, other = mortgages["thirty"], mortgages["fifteen"]
+
+    diff = aligned.diff("thirty", "fifteen")
+    expected = np.cumsum(total_payment_vector(other, 360, escrow) - total_payment_vector(base, 360, escrow))
+    assert diff.loc[0, "cumulative_payment"] == 0
+    np.testing.assert_allclose(diff["cumulative_payment"].to_numpy()[1:], expected)
+
+    for upfront_cost in (0.0, 5_000.0, 50_000.0):
+        assert aligned.breakeven_month("fifteen", "thirty", upfront_cost) == breakeven_month(
+            upfront_cost, total_payment_vector(other, 360, escrow), total_payment_vector(base, 360, escrow)
+        )
+
+    with pytest.raises(ValueError):
+        aligned.diff("thirty", "missing")
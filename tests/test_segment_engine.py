@@ -0,0 +1,119 @@
+import numpy as np
+import pytest
+
+from mortgage_analyzer.engines.segment_engine import (
+    AMORTIZING,
+    INTEREST_ONLY,
+    NEGATIVE_AMORTIZATION,
+    Segment,
+    interest_only_segments,
+    segment_schedule,
+)
+from mortgage_analyzer.models.mortgage_classes import NewMortgageScenario
+
+"""
+Parity tests for the segment engine: closed-form segment schedules must
+agree month by month with a plain loop that applies the same payment rules.
+"""
+
+
+def loop_schedule(principal, segments):
+    """Reference: one month at a time, recasting when a payment would pass the cap"""
+    term = sum(int(s.months) for s in segments)
+    balance, month, recast_month = principal, 0, 0
+    payments, balances = [], []
+
+    def amortizing(balance, r, periods):
+        return balance * r / (1 - (1 + r) ** -periods) if r else balance / periods
+
+    for seg in segments:
+        r = seg.rate / 1200
+        payment, recast = None, False
+        for _ in range(int(seg.months)):
+            if seg.kind == INTEREST_ONLY:
+                payment = balance * r
+            elif seg.kind == AMORTIZING:
+                payment = payment or amortizing(balance, r, term - month)
+            elif not recast:
+                payment = seg.payment
+                if payment < balance * r and balance * (1 + r) - payment > seg.cap * principal:
+                    recast, recast_month = True, recast_month or month + 1
+                    payment = amortizing(balance, r, term - month)
+            paid = min(payment, balance * (1 + r))
+            balance = balance * (1 + r) - paid
+            payments.append(paid)
+            balances.append(balance)
+            month += 1
+    return np.array(payments), np.array(balances), recast_month
+
+
+CASES = {
+    "fully amortizing": [Segment(AMORTIZING, 360, 6.5)],
+    "interest only": interest_only_segments(6.5, 30, 10),
+    "recast at cap": [
+        Segment(NEGATIVE_AMORTIZATION, 60, 7.0, payment=1_200, cap=1.10),
+        Segment(AMORTIZING, 300, 7.0),
+    ],
+    "option arm": [
+        Segment(NEGATIVE_AMORTIZATION, 60, 7.0, payment=1_700, cap=1.25),
+        Segment(INTEREST_ONLY, 24, 6.0),
+        Segment(AMORTIZING, 276, 7.5),
+    ],
+    "payment above interest": [Segment(NEGATIVE_AMORTIZATION, 60, 7.0, payment=5_000), Segment(AMORTIZING, 300, 7.0)],
+}
+
+
+@pytest.mark.parametrize("name", list(CASES))
+def test_matches_month_by_month_loop(name):
+    segments = CASES[name]
+    payments, balances, recast_month = loop_schedule(300_000, segments)
+    schedule = segment_schedule(300_000, segments)
+
+    np.testing.assert_allclose(schedule.payment[0], payments, atol=1e-6)
+    np.testing.assert_allclose(schedule.balance[0], balances, atol=1e-6)
+    assert schedule.recast_month[0] == recast_month
+    assert schedule.balloon[0] == pytest.approx(0, abs=1e-6)
+
+
+def test_amortizing_segment_matches_mortgage_schedule():
+    mortgage = NewMortgageScenario(
+        _rate=6.25, _years=30, _tax=4_000, _ins=1_500, _sqft=2_000, _price=400_000, _downpayment_amount=80_000
+    )
+    frame = segment_schedule(mortgage.loan_amount, [Segment(AMORTIZING, 360, mortgage.rate)]).frame()
+    expected = mortgage.amortization_schedule()
+    for column in ["month", "payment", "principal", "interest", "balance"]:
+        np.testing.assert_allclose(frame[column], expected[column], atol=0.011)
+
+
+def test_batch_rows_match_single_loans():
+    rng = np.random.default_rng(3)
+    principal = rng.uniform(150_000, 450_000, 40)
+    io_months = rng.choice([0, 60, 120], 40)
+    rates = rng.uniform(4.0, 8.0, 40)
+    segments = [
+        Segment(NEGATIVE_AMORTIZATION, io_months, rates, payment=principal * 0.004, cap=1.15),
+        Segment(AMORTIZING, 360 - io_months, rates + 0.5),
+    ]
+    batch = segment_schedule(principal, segments)
+    assert batch.payment.shape == (40, 360) and (batch.segment[io_months == 0, 0] == 1).all()
+
+    for row in range(0, 40, 7):
+        single = segment_schedule(
+            principal[row],
+            [
+                Segment(NEGATIVE_AMORTIZATION, io_months[row], rates[row], payment=principal[row] * 0.004, cap=1.15),
+                Segment(AMORTIZING, 360 - io_months[row], rates[row] + 0.5),
+            ],
+        )
+        np.testing.assert_allclose(batch.balance[row], single.balance[0])
+        assert batch.summary().iloc[row]["recast_month"] == single.recast_month[0]
+
+
+def test_final_negative_amortization_segment_leaves_balloon():
+    schedule = segment_schedule(200_000, [Segment(NEGATIVE_AMORTIZATION, 24, 6.0, payment=500, cap=1.5)])
+    assert schedule.summary().loc[0, "peak_balance"] == schedule.balloon[0] > 200_000
+
+    with pytest.raises(ValueError, match="need a payment"):
+        Segment(NEGATIVE_AMORTIZATION, 12, 6.0)
+    with pytest.raises(ValueError, match="Unknown segment kind"):
+        Segment("balloon", 12, 6.0)
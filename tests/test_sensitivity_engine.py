@@ -0,0 +1,88 @@
+import numpy as np
+import pytest
+
+from mortgage_analyzer.engines.escrow_engine import breakeven_month, total_payment_vector
+from mortgage_analyzer.engines.sensitivity_engine import tornado_analysis
+from mortgage_analyzer.models.mortgage_classes import CurrentMortgage, NewMortgageScenario, RefinanceScenario
+
+"""
+Parity tests for the sensitivity engine: the unperturbed case must agree
+with the payment vectors and break-even the Comparison page uses.
+"""
+
+
+def current_mortgage(**changes):
+    terms = dict(
+        _rate=7.0, _years=30, _tax=4_000, _ins=1_500, _sqft=2_000, _original_loan=400_000, _loan_amount=380_000,
+        _start_date="01/01/2022", _price_per_sqft=250, _monthly_pmi=0, _total_pmt=3_500,
+    )
+    terms.update(changes)
+    return CurrentMortgage(**terms)
+
+
+def refinance(**changes):
+    terms = dict(
+        _rate=5.5, _years=30, _tax=4_000, _ins=1_500, _sqft=2_000, _current_loan_balance=380_000,
+        _current_property_value=500_000, _cash_out_amount=0, _closing_cost_percentage=0.02, _discount_points=0,
+    )
+    terms.update(changes)
+    return RefinanceScenario(**terms)
+
+
+def base_outputs(current, scenario):
+    tornado = tornado_analysis(current, scenario)
+    return tornado.groupby("output")["base_output"].first()
+
+
+CASES = {
+    # Total payment above P&I + escrow: a $399.60 shortage payment in year one
+    "escrow shortage": (current_mortgage(), refinance()),
+    "prepay window": (
+        current_mortgage(_extra_principal=200, _prepay_periods=24, _total_pmt=3_100.40),
+        refinance(),
+    ),
+    "tiered pmi": (
+        current_mortgage(_monthly_pmi=150, _total_pmt=3_650),
+        refinance(_current_property_value=420_000, _credit_score=700, _extra_principal=300, _prepay_periods=36),
+    ),
+    "flat pmi, small saving": (
+        current_mortgage(_rate=6.0, _total_pmt=3_200),
+        refinance(_rate=5.6, _current_property_value=440_000, _discount_points=1.0),
+    ),
+}
+
+
+@pytest.mark.parametrize("name", list(CASES))
+def test_base_case_matches_payment_vectors(name):
+    current, scenario = CASES[name]
+    months = max(current.periods_remaining, scenario.periods_remaining)
+    current_payments = total_payment_vector(current, months)
+    new_payments = total_payment_vector(scenario, months)
+
+    base = base_outputs(current, scenario)
+    # The payment vectors are built from schedules rounded to the cent
+    assert base["monthly_savings"] == pytest.approx(current_payments[0] - new_payments[0], abs=0.02)
+
+    expected = breakeven_month(
+        scenario.closing_costs,
+        current_payments[:scenario.periods_remaining],
+        new_payments[:scenario.periods_remaining],
+    )
+    assert base["breakeven_months"] == expected
+
+
+def test_new_purchase_breakeven_counts_equity_and_down_payment():
+    current = current_mortgage(_loan_amount=300_000, _total_pmt=3_200)
+    scenario = NewMortgageScenario(
+        _rate=5.0, _years=30, _tax=4_000, _ins=1_500, _sqft=2_000, _price=600_000, _downpayment_amount=250_000,
+        _credit_score=760,
+    )
+    months = max(current.periods_remaining, scenario.periods_remaining)
+    current_payments = total_payment_vector(current, months)
+    new_payments = total_payment_vector(scenario, months)
+
+    # Selling frees the current equity; the down payment and closing costs are spent
+    cash_needed = scenario.downpayment_amount + scenario.price * 0.03 - (current.price - current.loan_amount)
+    base = base_outputs(current, scenario)
+    assert base["breakeven_months"] == breakeven_month(cash_needed, current_payments, new_payments)
+    assert cash_needed > 0 and not np.isnan(base["breakeven_months"])